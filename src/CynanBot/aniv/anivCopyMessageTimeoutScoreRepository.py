@@ -8,8 +8,7 @@ from CynanBot.aniv.anivCopyMessageTimeoutScoreRepositoryInterface import \
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.users.userIdsRepositoryInterface import \
     UserIdsRepositoryInterface
 
@@ -33,7 +32,7 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def __createDefaultScore(
         self,
@@ -69,10 +68,6 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
             twitchChannelId = twitchChannelId
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def getScore(
         self,
         chatterUserId: str,
@@ -86,7 +81,7 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT anivcopymessagetimeoutscores.mostrecentdodge, anivcopymessagetimeoutscores.mostrecenttimeout, anivcopymessagetimeoutscores.dodgescore, anivcopymessagetimeoutscores.timeoutscore, userids.username FROM anivcopymessagetimeoutscores
@@ -202,46 +197,36 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         await self.__saveScoreToDatabase(score)
         return score
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.getDatabaseType():
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
-                            mostrecentdodge text DEFAULT NULL,
-                            mostrecenttimeout text DEFAULT NULL,
-                            dodgescore int DEFAULT 0 NOT NULL,
-                            timeoutscore int DEFAULT 0 NOT NULL,
-                            chatteruserid text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
-                            mostrecentdodge TEXT DEFAULT NULL,
-                            mostrecenttimeout TEXT DEFAULT NULL,
-                            dodgescore INTEGER NOT NULL DEFAULT 0,
-                            timeoutscore INTEGER NOT NULL DEFAULT 0,
-                            chatteruserid TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'anivcopymessagetimeoutscores',
+            psqlStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
+                        mostrecentdodge text DEFAULT NULL,
+                        mostrecenttimeout text DEFAULT NULL,
+                        dodgescore int DEFAULT 0 NOT NULL,
+                        timeoutscore int DEFAULT 0 NOT NULL,
+                        chatteruserid text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                '''
+            ],
+            sqliteStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
+                        mostrecentdodge TEXT DEFAULT NULL,
+                        mostrecenttimeout TEXT DEFAULT NULL,
+                        dodgescore INTEGER NOT NULL DEFAULT 0,
+                        timeoutscore INTEGER NOT NULL DEFAULT 0,
+                        chatteruserid TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                '''
+            ]
+        )
 
     async def __saveScoreToDatabase(self, score: AnivCopyMessageTimeoutScore):
         if not isinstance(score, AnivCopyMessageTimeoutScore):
@@ -255,7 +240,7 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         if score.mostRecentTimeout is not None:
             mostRecentTimeout = score.mostRecentTimeout.isoformat()
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO anivcopymessagetimeoutscores (mostrecentdodge, mostrecenttimeout, dodgescore, timeoutscore, chatteruserid, twitchchannelid)
@@ -7,8 +7,7 @@ from CynanBot.aniv.mostRecentAnivMessageRepositoryInterface import \
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 
 
@@ -31,9 +30,10 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, MostRecentAnivMessage | None] = dict()
 
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
+
     async def clearCaches(self):
         self.__cache.clear()
         self.__timber.log('MostRecentAnivMessageRepository', 'Caches cleared')
@@ -44,7 +44,7 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
 
         self.__cache.pop(twitchChannelId, None)
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 DELETE FROM mostrecentanivmessages
@@ -69,15 +69,11 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
 
         return message
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def __getFromDatabase(self, twitchChannelId: str) -> MostRecentAnivMessage | None:
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT datetime, message FROM mostrecentanivmessages
@@ -103,15 +99,10 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
         else:
             return None
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'mostrecentanivmessages',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentanivmessages (
                         datetime text NOT NULL,
@@ -119,9 +110,8 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
                         twitchchannelid text NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentanivmessages (
                         datetime TEXT NOT NULL,
@@ -129,9 +119,8 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
                         twitchchannelid TEXT NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            ]
+        )
 
     async def __saveMessage(self, message: str, twitchChannelId: str):
         if not utils.isValidStr(message):
@@ -146,7 +135,7 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
 
         self.__cache[twitchChannelId] = anivMessage
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO mostrecentanivmessages (datetime, message, twitchchannelid)
@@ -42,6 +42,6 @@ class SuperTriviaGamePointRedemption(AbsChannelPointRedemption):
         if startNewSuperTriviaGameAction is None:
             return False
 
-        self.__triviaGameMachine.submitAction(startNewSuperTriviaGameAction)
+        await self.__triviaGameMachine.submitAction(startNewSuperTriviaGameAction)
         self.__timber.log('TriviaGameRedemption', f'Redeemed super trivia game for {twitchChannelPointsMessage.getUserName()}:{twitchChannelPointsMessage.getUserId()} in {twitchChannel.getTwitchChannelName()}')
         return True
@@ -44,6 +44,6 @@ class TriviaGamePointRedemption(AbsChannelPointRedemption):
         if startNewTriviaGameAction is None:
             return False
 
-        self.__triviaGameMachine.submitAction(startNewTriviaGameAction)
+        await self.__triviaGameMachine.submitAction(startNewTriviaGameAction)
         self.__timber.log('TriviaGameRedemption', f'Redeemed trivia game for {twitchChannelPointsMessage.getUserName()}:{twitchChannelPointsMessage.getUserId()} in {twitchChannel.getTwitchChannelName()}')
         return True
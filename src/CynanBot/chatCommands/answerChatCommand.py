@@ -54,7 +54,7 @@ class AnswerChatCommand(AbsChatCommand):
 
         answer = ' '.join(splits[1:])
 
-        self.__triviaGameMachine.submitAction(CheckAnswerTriviaAction(
+        await self.__triviaGameMachine.submitAction(CheckAnswerTriviaAction(
             actionId = await self.__triviaIdGenerator.generateActionId(),
             answer = answer,
             twitchChannel = user.getHandle(),
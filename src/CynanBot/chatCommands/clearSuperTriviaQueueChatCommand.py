@@ -61,7 +61,7 @@ class ClearSuperTriviaQueueChatCommand(AbsChatCommand):
 
         actionId = await self.__triviaIdGenerator.generateActionId()
 
-        self.__triviaGameMachine.submitAction(ClearSuperTriviaQueueTriviaAction(
+        await self.__triviaGameMachine.submitAction(ClearSuperTriviaQueueTriviaAction(
             actionId = actionId,
             twitchChannel = user.getHandle(),
             twitchChannelId = twitchChannelId
@@ -54,7 +54,7 @@ class SuperAnswerChatCommand(AbsChatCommand):
 
         answer = ' '.join(splits[1:])
 
-        self.__triviaGameMachine.submitAction(CheckSuperAnswerTriviaAction(
+        await self.__triviaGameMachine.submitAction(CheckSuperAnswerTriviaAction(
             actionId = await self.__triviaIdGenerator.generateActionId(),
             answer = answer,
             twitchChannel = user.getHandle(),
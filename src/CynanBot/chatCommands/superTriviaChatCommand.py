@@ -103,5 +103,5 @@ class SuperTriviaChatCommand(AbsChatCommand):
         if startNewSuperTriviaGameAction is None:
             return
 
-        self.__triviaGameMachine.submitAction(startNewSuperTriviaGameAction)
+        await self.__triviaGameMachine.submitAction(startNewSuperTriviaGameAction)
         self.__timber.log('SuperTriviaChatCommand', f'Handled !supertrivia command for {ctx.getAuthorName()}:{ctx.getAuthorId()} in {user.getHandle()}')
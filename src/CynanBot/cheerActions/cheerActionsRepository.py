@@ -13,8 +13,7 @@ from CynanBot.cheerActions.exceptions import (
     CheerActionAlreadyExistsException, TimeoutDurationSecondsTooLongException,
     TooManyCheerActionsException)
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 
 
@@ -43,9 +42,10 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__maximumPerUser: int = maximumPerUser
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, list[CheerAction] | None] = dict()
 
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
+
     async def addAction(
         self,
         bitRequirement: CheerActionBitRequirement,
@@ -93,7 +93,7 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
                 userId = userId
             )
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO cheeractions (actionid, bitrequirement, streamstatusrequirement, actiontype, amount, durationseconds, userid)
@@ -135,7 +135,7 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             self.__timber.log('CheerActionsRepository', f'Attempted to delete cheer action ID \"{actionId}\", but it does not exist in the database')
             return None
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 DELETE FROM cheeractions
@@ -176,7 +176,7 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         if actions is not None:
             return actions
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT cheeractions.actionid, cheeractions.bitrequirement, cheeractions.streamstatusrequirement, cheeractions.actiontype, cheeractions.amount, cheeractions.durationseconds, cheeractions.userid, userids.username FROM cheeractions
@@ -206,51 +206,35 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         self.__cache[userId] = actions
         return actions
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.getDatabaseType():
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cheeractions (
-                            actionid public.citext NOT NULL,
-                            bitrequirement text NOT NULL,
-                            streamstatusrequirement text NOT NULL,
-                            actiontype text NOT NULL,
-                            amount integer NOT NULL,
-                            durationseconds integer NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (actionid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cheeractions (
-                            actionid TEXT NOT NULL COLLATE NOCASE,
-                            bitrequirement TEXT NOT NULL,
-                            streamstatusrequirement TEXT NOT NULL,
-                            actiontype TEXT NOT NULL,
-                            amount INTEGER NOT NULL,
-                            durationseconds INTEGER NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (actionid, userid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'cheeractions',
+            psqlStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS cheeractions (
+                        actionid public.citext NOT NULL,
+                        bitrequirement text NOT NULL,
+                        streamstatusrequirement text NOT NULL,
+                        actiontype text NOT NULL,
+                        amount integer NOT NULL,
+                        durationseconds integer NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (actionid, userid)
+                    )
+                '''
+            ],
+            sqliteStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS cheeractions (
+                        actionid TEXT NOT NULL COLLATE NOCASE,
+                        bitrequirement TEXT NOT NULL,
+                        streamstatusrequirement TEXT NOT NULL,
+                        actiontype TEXT NOT NULL,
+                        amount INTEGER NOT NULL,
+                        durationseconds INTEGER NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (actionid, userid)
+                    )
+                '''
+            ]
+        )
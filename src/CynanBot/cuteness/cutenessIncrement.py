@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class CutenessIncrement():
+    incrementAmount: int
+    userId: str
+    userName: str
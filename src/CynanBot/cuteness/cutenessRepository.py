@@ -1,8 +1,11 @@
+from typing import Any
+
 import CynanBot.misc.utils as utils
 from CynanBot.cuteness.cutenessChampionsResult import CutenessChampionsResult
 from CynanBot.cuteness.cutenessDate import CutenessDate
 from CynanBot.cuteness.cutenessHistoryEntry import CutenessHistoryEntry
 from CynanBot.cuteness.cutenessHistoryResult import CutenessHistoryResult
+from CynanBot.cuteness.cutenessIncrement import CutenessIncrement
 from CynanBot.cuteness.cutenessLeaderboardEntry import CutenessLeaderboardEntry
 from CynanBot.cuteness.cutenessLeaderboardHistoryResult import \
     CutenessLeaderboardHistoryResult
@@ -12,8 +15,7 @@ from CynanBot.cuteness.cutenessRepositoryInterface import \
     CutenessRepositoryInterface
 from CynanBot.cuteness.cutenessResult import CutenessResult
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.users.userIdsRepositoryInterface import \
     UserIdsRepositoryInterface
 
@@ -51,7 +53,7 @@ class CutenessRepository(CutenessRepositoryInterface):
         self.__historySize: int = historySize
         self.__leaderboardSize: int = leaderboardSize
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def fetchCuteness(
         self,
@@ -73,7 +75,7 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         cutenessDate = CutenessDate()
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
@@ -113,7 +115,7 @@ class CutenessRepository(CutenessRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT cuteness.userid, userids.username, SUM(cuteness.cuteness) AS totalcuteness FROM cuteness
@@ -172,7 +174,7 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         await self.__userIdsRepository.setUser(userId = userId, userName = userName)
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT cuteness, utcyearandmonth FROM cuteness
@@ -270,49 +272,107 @@ class CutenessRepository(CutenessRepositoryInterface):
         elif not utils.isValidStr(userName):
             raise TypeError(f'userName argument is malformed: \"{userName}\"')
 
-        await self.__userIdsRepository.setUser(userId = userId, userName = userName)
+        results = await self.fetchCutenessesIncrementedBy(
+            increments = [ CutenessIncrement(
+                incrementAmount = incrementAmount,
+                userId = userId,
+                userName = userName
+            ) ],
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId
+        )
 
-        cutenessDate = CutenessDate()
+        return results[0]
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness FROM cuteness
-                WHERE twitchchannelid = $1 AND userid = $2 AND utcyearandmonth = $3
-                LIMIT 1
-            ''',
-            twitchChannelId, userId, cutenessDate.getDatabaseString()
-        )
+    async def fetchCutenessesIncrementedBy(
+        self,
+        increments: list[CutenessIncrement],
+        twitchChannel: str,
+        twitchChannelId: str
+    ) -> list[CutenessResult]:
+        if not isinstance(increments, list):
+            raise TypeError(f'increments argument is malformed: \"{increments}\"')
+        elif not utils.isValidStr(twitchChannel):
+            raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        oldCuteness = 0
+        userIds: set[str] = set()
 
-        if record is not None and len(record) >= 1:
-            oldCuteness = record[0]
+        for increment in increments:
+            if not isinstance(increment, CutenessIncrement):
+                raise TypeError(f'increments argument contains a malformed value: \"{increment}\"')
+            elif not utils.isValidInt(increment.incrementAmount):
+                raise TypeError(f'incrementAmount value is malformed: \"{increment.incrementAmount}\"')
+            elif increment.incrementAmount < utils.getLongMinSafeSize() or increment.incrementAmount > utils.getLongMaxSafeSize():
+                raise ValueError(f'incrementAmount value is out of bounds: {increment.incrementAmount}')
+            elif not utils.isValidStr(increment.userId):
+                raise TypeError(f'userId value is malformed: \"{increment.userId}\"')
+            elif not utils.isValidStr(increment.userName):
+                raise TypeError(f'userName value is malformed: \"{increment.userName}\"')
+            elif increment.userId in userIds:
+                raise ValueError(f'increments argument contains the same userId more than once: \"{increment.userId}\"')
 
-        newCuteness = oldCuteness + incrementAmount
+            userIds.add(increment.userId)
 
-        if newCuteness < 0:
-            newCuteness = 0
-        elif newCuteness > utils.getLongMaxSafeSize():
-            raise OverflowError(f'New cuteness ({newCuteness}) would be too large ({oldCuteness=}) ({incrementAmount=})')
+        if len(increments) == 0:
+            return list()
 
-        await connection.execute(
-            '''
-                INSERT INTO cuteness (cuteness, twitchchannelid, userid, utcyearandmonth)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (twitchchannelid, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
-            ''',
-            newCuteness, twitchChannelId, userId, cutenessDate.getDatabaseString()
-        )
+        await self.__userIdsRepository.setUsers({ increment.userId: increment.userName for increment in increments })
 
-        await connection.close()
+        cutenessDate = CutenessDate()
+        results: list[CutenessResult] = list()
+        records: list[tuple[Any, ...]] = list()
+        userIdPlaceholders = ', '.join(f'${index + 3}' for index in range(len(increments)))
 
-        return CutenessResult(
-            cutenessDate = cutenessDate,
-            cuteness = newCuteness,
-            userId = userId,
-            userName = userName
-        )
+        connection = await self.__backingDatabase.getConnection()
+
+        try:
+            async with connection.transaction():
+                oldCutenessRecords = await connection.fetchRows(
+                    f'''
+                        SELECT userid, cuteness FROM cuteness
+                        WHERE twitchchannelid = $1 AND utcyearandmonth = $2 AND userid IN ({userIdPlaceholders})
+                    ''',
+                    twitchChannelId, cutenessDate.getDatabaseString(), *[ increment.userId for increment in increments ]
+                )
+
+                oldCutenesses: dict[str, int] = dict()
+
+                if oldCutenessRecords is not None:
+                    for oldCutenessRecord in oldCutenessRecords:
+                        oldCutenesses[oldCutenessRecord[0]] = oldCutenessRecord[1]
+
+                for increment in increments:
+                    oldCuteness = oldCutenesses.get(increment.userId, 0)
+                    newCuteness = oldCuteness + increment.incrementAmount
+
+                    if newCuteness < 0:
+                        newCuteness = 0
+                    elif newCuteness > utils.getLongMaxSafeSize():
+                        raise OverflowError(f'New cuteness ({newCuteness}) would be too large ({oldCuteness=}) ({increment=})')
+
+                    records.append((newCuteness, twitchChannelId, increment.userId, cutenessDate.getDatabaseString()))
+
+                    results.append(CutenessResult(
+                        cutenessDate = cutenessDate,
+                        cuteness = newCuteness,
+                        userId = increment.userId,
+                        userName = increment.userName
+                    ))
+
+                await connection.executeMany(
+                    '''
+                        INSERT INTO cuteness (cuteness, twitchchannelid, userid, utcyearandmonth)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannelid, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
+                    ''',
+                    records
+                )
+        finally:
+            await connection.close()
+
+        return results
 
     async def fetchCutenessLeaderboard(
         self,
@@ -327,7 +387,7 @@ class CutenessRepository(CutenessRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         cutenessDate = CutenessDate()
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
@@ -395,7 +455,7 @@ class CutenessRepository(CutenessRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT DISTINCT utcyearandmonth FROM cuteness
@@ -417,7 +477,10 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         for record in records:
             cutenessDate = CutenessDate(record[0])
-            monthRecords = await connection.fetchRows(
+            entries: list[CutenessLeaderboardEntry] = list()
+            rank = 1
+
+            async for monthRecord in connection.iterateRows(
                 '''
                     SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
                     INNER JOIN userids ON cuteness.userid = userids.userid
@@ -426,15 +489,7 @@ class CutenessRepository(CutenessRepositoryInterface):
                     LIMIT $4
                 ''',
                 twitchChannelId, twitchChannelId, cutenessDate.getDatabaseString(), self.__historyLeaderboardSize
-            )
-
-            if monthRecords is None or len(monthRecords) == 0:
-                continue
-
-            entries: list[CutenessLeaderboardEntry] = list()
-            rank = 1
-
-            for monthRecord in monthRecords:
+            ):
                 entries.append(CutenessLeaderboardEntry(
                     cuteness = monthRecord[0],
                     rank = rank,
@@ -443,6 +498,9 @@ class CutenessRepository(CutenessRepositoryInterface):
                 ))
                 rank = rank + 1
 
+            if len(entries) == 0:
+                continue
+
             leaderboards.append(CutenessLeaderboardResult(
                 cutenessDate = cutenessDate,
                 entries = entries
@@ -456,19 +514,10 @@ class CutenessRepository(CutenessRepositoryInterface):
             leaderboards = leaderboards
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'cuteness',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS cuteness (
                         cuteness bigint DEFAULT 0 NOT NULL,
@@ -478,9 +527,8 @@ class CutenessRepository(CutenessRepositoryInterface):
                         PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS cuteness (
                         cuteness INTEGER NOT NULL DEFAULT 0,
@@ -490,8 +538,5 @@ class CutenessRepository(CutenessRepositoryInterface):
                         PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from CynanBot.cuteness.cutenessChampionsResult import CutenessChampionsResult
 from CynanBot.cuteness.cutenessHistoryResult import CutenessHistoryResult
+from CynanBot.cuteness.cutenessIncrement import CutenessIncrement
 from CynanBot.cuteness.cutenessLeaderboardHistoryResult import \
     CutenessLeaderboardHistoryResult
 from CynanBot.cuteness.cutenessLeaderboardResult import \
@@ -50,6 +51,15 @@ class CutenessRepositoryInterface(ABC):
     ) -> CutenessResult:
         pass
 
+    @abstractmethod
+    async def fetchCutenessesIncrementedBy(
+        self,
+        increments: list[CutenessIncrement],
+        twitchChannel: str,
+        twitchChannelId: str
+    ) -> list[CutenessResult]:
+        pass
+
     @abstractmethod
     async def fetchCutenessLeaderboard(
         self,
@@ -0,0 +1,130 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from CynanBot.authRepository import AuthRepository
+from CynanBot.cuteness.cutenessIncrement import CutenessIncrement
+from CynanBot.cuteness.cutenessRepository import CutenessRepository
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.network.aioHttpClientProvider import AioHttpClientProvider
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.storage.jsonStaticReader import JsonStaticReader
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchApiService import TwitchApiService
+from CynanBot.twitch.api.twitchJsonMapper import TwitchJsonMapper
+from CynanBot.twitch.twitchAnonymousUserIdProvider import \
+    TwitchAnonymousUserIdProvider
+from CynanBot.twitch.websocket.twitchWebsocketJsonMapper import \
+    TwitchWebsocketJsonMapper
+from CynanBot.users.userIdsRepository import UserIdsRepository
+
+
+class TestCutenessRepository():
+
+    def __createRepository(self, backingDatabase: BackingDatabase) -> CutenessRepository:
+        eventLoop = asyncio.get_event_loop()
+        timber = TimberStub()
+        timeZoneRepository = TimeZoneRepository()
+        twitchJsonMapper = TwitchJsonMapper(
+            timber = timber,
+            timeZoneRepository = timeZoneRepository
+        )
+
+        return CutenessRepository(
+            backingDatabase = backingDatabase,
+            userIdsRepository = UserIdsRepository(
+                backingDatabase = backingDatabase,
+                timber = timber,
+                timeZoneRepository = timeZoneRepository,
+                twitchAnonymousUserIdProvider = TwitchAnonymousUserIdProvider(),
+                twitchApiService = TwitchApiService(
+                    networkClientProvider = AioHttpClientProvider(
+                        eventLoop = eventLoop,
+                        timber = timber
+                    ),
+                    timber = timber,
+                    timeZoneRepository = timeZoneRepository,
+                    twitchCredentialsProvider = AuthRepository(
+                        authJsonReader = JsonStaticReader(dict())
+                    ),
+                    twitchJsonMapper = twitchJsonMapper,
+                    twitchWebsocketJsonMapper = TwitchWebsocketJsonMapper(
+                        timber = timber,
+                        twitchJsonMapper = twitchJsonMapper
+                    )
+                )
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessesIncrementedBy(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+
+        result = await repository.fetchCutenessIncrementedBy(
+            incrementAmount = 5,
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'c',
+            userId = '1',
+            userName = 'alice'
+        )
+
+        assert result.cuteness == 5
+
+        # a user that was just seen for the first time must be visible to queries that join against userids
+        result = await repository.fetchCuteness(
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'c',
+            userId = '1',
+            userName = 'alice'
+        )
+
+        assert result.cuteness == 5
+
+        results = await repository.fetchCutenessesIncrementedBy(
+            increments = [
+                CutenessIncrement(incrementAmount = 2, userId = '1', userName = 'alice'),
+                CutenessIncrement(incrementAmount = 3, userId = '2', userName = 'bob'),
+                CutenessIncrement(incrementAmount = -4, userId = '3', userName = 'carol')
+            ],
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'c'
+        )
+
+        assert [ (result.userId, result.cuteness) for result in results ] == [ ('1', 7), ('2', 3), ('3', 0) ]
+
+        result = await repository.fetchCuteness(
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'c',
+            userId = '2',
+            userName = 'bob'
+        )
+
+        assert result.cuteness == 3
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessesIncrementedBy_withEmptyList(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+
+        results = await repository.fetchCutenessesIncrementedBy(
+            increments = list(),
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'c'
+        )
+
+        assert len(results) == 0
+
+        await backingDatabase.close()
@@ -162,6 +162,7 @@ from CynanBot.soundPlayerManager.soundPlayerSettingsRepositoryInterface import \
     SoundPlayerSettingsRepositoryInterface
 from CynanBot.starWars.starWarsQuotesRepositoryInterface import \
     StarWarsQuotesRepositoryInterface
+from CynanBot.storage.backingDatabase import BackingDatabase
 from CynanBot.streamAlertsManager.streamAlertsManagerInterface import \
     StreamAlertsManagerInterface
 from CynanBot.supStreamer.supStreamerRepositoryInterface import \
@@ -228,10 +229,14 @@ from CynanBot.twitch.absTwitchChannelPointRedemptionHandler import \
     AbsTwitchChannelPointRedemptionHandler
 from CynanBot.twitch.absTwitchCheerHandler import AbsTwitchCheerHandler
 from CynanBot.twitch.absTwitchFollowHandler import AbsTwitchFollowHandler
+from CynanBot.twitch.absTwitchModerationHandler import \
+    AbsTwitchModerationHandler
 from CynanBot.twitch.absTwitchPollHandler import AbsTwitchPollHandler
 from CynanBot.twitch.absTwitchPredictionHandler import \
     AbsTwitchPredictionHandler
 from CynanBot.twitch.absTwitchRaidHandler import AbsTwitchRaidHandler
+from CynanBot.twitch.absTwitchStreamStatusHandler import \
+    AbsTwitchStreamStatusHandler
 from CynanBot.twitch.absTwitchSubscriptionHandler import \
     AbsTwitchSubscriptionHandler
 from CynanBot.twitch.api.twitchApiServiceInterface import \
@@ -253,16 +258,22 @@ from CynanBot.twitch.configuration.twitchConfiguration import \
     TwitchConfiguration
 from CynanBot.twitch.configuration.twitchFollowHandler import \
     TwitchFollowHandler
+from CynanBot.twitch.configuration.twitchModerationHandler import \
+    TwitchModerationHandler
 from CynanBot.twitch.configuration.twitchPollHandler import TwitchPollHandler
 from CynanBot.twitch.configuration.twitchPredictionHandler import \
     TwitchPredictionHandler
 from CynanBot.twitch.configuration.twitchRaidHandler import TwitchRaidHandler
+from CynanBot.twitch.configuration.twitchStreamStatusHandler import \
+    TwitchStreamStatusHandler
 from CynanBot.twitch.configuration.twitchSubscriptionHandler import \
     TwitchSubscriptionHandler
 from CynanBot.twitch.followingStatus.twitchFollowingStatusRepositoryInterface import \
     TwitchFollowingStatusRepositoryInterface
 from CynanBot.twitch.isLiveOnTwitchRepositoryInterface import \
     IsLiveOnTwitchRepositoryInterface
+from CynanBot.twitch.timeout.twitchModerationRosterRepositoryInterface import \
+    TwitchModerationRosterRepositoryInterface
 from CynanBot.twitch.timeout.twitchTimeoutRemodHelperInterface import \
     TwitchTimeoutRemodHelperInterface
 from CynanBot.twitch.twitchChannelJoinHelperInterface import \
@@ -311,6 +322,7 @@ class CynanBot(
         anivSettingsRepository: AnivSettingsRepositoryInterface | None,
         authRepository: AuthRepository,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
+        backingDatabase: BackingDatabase,
         bannedTriviaGameControllersRepository: BannedTriviaGameControllersRepositoryInterface | None,
         bannedWordsRepository: BannedWordsRepositoryInterface | None,
         channelPointSoundHelper: ChannelPointSoundHelperInterface | None,
@@ -365,6 +377,7 @@ class CynanBot(
         twitchChannelJoinHelper: TwitchChannelJoinHelperInterface,
         twitchConfiguration: TwitchConfiguration,
         twitchFollowingStatusRepository: TwitchFollowingStatusRepositoryInterface | None,
+        twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface | None,
         twitchPredictionWebsocketUtils: TwitchPredictionWebsocketUtilsInterface | None,
         twitchTimeoutRemodHelper: TwitchTimeoutRemodHelperInterface | None,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
@@ -402,6 +415,8 @@ class CynanBot(
             raise TypeError(f'authRepository argument is malformed: \"{authRepository}\"')
         elif not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
+            raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif bannedTriviaGameControllersRepository is not None and not isinstance(bannedTriviaGameControllersRepository, BannedTriviaGameControllersRepositoryInterface):
             raise TypeError(f'bannedTriviaGameControllersRepository argument is malformed: \"{bannedTriviaGameControllersRepository}\"')
         elif bannedWordsRepository is not None and not isinstance(bannedWordsRepository, BannedWordsRepositoryInterface):
@@ -508,6 +523,8 @@ class CynanBot(
             raise TypeError(f'twitchConfiguration argument is malformed: \"{twitchConfiguration}\"')
         elif twitchFollowingStatusRepository is not None and not isinstance(twitchFollowingStatusRepository, TwitchFollowingStatusRepositoryInterface):
             raise TypeError(f'twitchFollowingStatusRepository argument is malformed: \"{twitchFollowingStatusRepository}\"')
+        elif twitchModerationRosterRepository is not None and not isinstance(twitchModerationRosterRepository, TwitchModerationRosterRepositoryInterface):
+            raise TypeError(f'twitchModerationRosterRepository argument is malformed: \"{twitchModerationRosterRepository}\"')
         elif twitchPredictionWebsocketUtils is not None and not isinstance(twitchPredictionWebsocketUtils, TwitchPredictionWebsocketUtilsInterface):
             raise TypeError(f'twitchPredictionWebsocketUtils argument is malformed: \"{twitchPredictionWebsocketUtils}\"')
         elif twitchTimeoutRemodHelper is not None and not isinstance(twitchTimeoutRemodHelper, TwitchTimeoutRemodHelperInterface):
@@ -536,12 +553,15 @@ class CynanBot(
             raise TypeError(f'wordOfTheDayRepository argument is malformed: \"{wordOfTheDayRepository}\"')
 
         self.__authRepository: AuthRepository = authRepository
+        self.__backingDatabase: BackingDatabase = backingDatabase
         self.__chatActionsManager: ChatActionsManagerInterface | None = chatActionsManager
         self.__chatLogger: ChatLoggerInterface = chatLogger
         self.__cheerActionHelper: CheerActionHelperInterface | None = cheerActionHelper
         self.__generalSettingsRepository: GeneralSettingsRepository = generalSettingsRepository
+        self.__isLiveOnTwitchRepository: IsLiveOnTwitchRepositoryInterface | None = isLiveOnTwitchRepository
         self.__modifyUserDataHelper: ModifyUserDataHelper = modifyUserDataHelper
         self.__mostRecentAnivMessageTimeoutHelper: MostRecentAnivMessageTimeoutHelperInterface | None = mostRecentAnivMessageTimeoutHelper
+        self.__mostRecentChatsRepository: MostRecentChatsRepositoryInterface | None = mostRecentChatsRepository
         self.__recurringActionsMachine: RecurringActionsMachineInterface | None = recurringActionsMachine
         self.__sentMessageLogger: SentMessageLoggerInterface = sentMessageLogger
         self.__streamAlertsManager: StreamAlertsManagerInterface | None = streamAlertsManager
@@ -554,6 +574,7 @@ class CynanBot(
         self.__twitchChannelJoinHelper: TwitchChannelJoinHelperInterface = twitchChannelJoinHelper
         self.__twitchConfiguration: TwitchConfiguration = twitchConfiguration
         self.__twitchFollowingStatusRepository: TwitchFollowingStatusRepositoryInterface | None = twitchFollowingStatusRepository
+        self.__twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface | None = twitchModerationRosterRepository
         self.__twitchPredictionWebsocketUtils: TwitchPredictionWebsocketUtilsInterface | None = twitchPredictionWebsocketUtils
         self.__twitchTimeoutRemodHelper: TwitchTimeoutRemodHelperInterface | None = twitchTimeoutRemodHelper
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
@@ -748,6 +769,16 @@ class CynanBot(
 
         self.__timber.log('CynanBot', f'Finished initialization of {self.__authRepository.getAll().requireTwitchHandle()}')
 
+    async def close(self):
+        # twitchio closes the event loop as soon as this finishes, so this is the last chance to clean up
+        try:
+            await super().close()
+        finally:
+            if self.__mostRecentChatsRepository is not None:
+                await self.__mostRecentChatsRepository.flush()
+
+            await self.__backingDatabase.close()
+
     async def event_channel_join_failure(self, channel: str):
         userId = await self.__userIdsRepository.fetchUserId(channel)
         user: UserInterface | None = None
@@ -921,6 +952,11 @@ class CynanBot(
                 twitchFollowingStatusRepository = self.__twitchFollowingStatusRepository
             )
 
+            moderationHandler: AbsTwitchModerationHandler | None = TwitchModerationHandler(
+                timber = self.__timber,
+                twitchModerationRosterRepository = self.__twitchModerationRosterRepository
+            )
+
             pollHandler: AbsTwitchPollHandler | None = TwitchPollHandler(
                 streamAlertsManager = self.__streamAlertsManager,
                 timber = self.__timber
@@ -939,6 +975,11 @@ class CynanBot(
                 timber = self.__timber
             )
 
+            streamStatusHandler: AbsTwitchStreamStatusHandler | None = TwitchStreamStatusHandler(
+                isLiveOnTwitchRepository = self.__isLiveOnTwitchRepository,
+                timber = self.__timber
+            )
+
             subscriptionHandler: AbsTwitchSubscriptionHandler | None = TwitchSubscriptionHandler(
                 streamAlertsManager = self.__streamAlertsManager,
                 timber = self.__timber,
@@ -953,15 +994,23 @@ class CynanBot(
                 channelPointRedemptionHandler = channelPointRedemptionHandler,
                 cheerHandler = cheerHandler,
                 followHandler = followHandler,
+                moderationHandler = moderationHandler,
                 pollHandler = pollHandler,
                 predictionHandler = predictionHandler,
                 raidHandler = raidHandler,
+                streamStatusHandler = streamStatusHandler,
                 subscriptionHandler = subscriptionHandler,
                 timber = self.__timber,
                 userIdsRepository = self.__userIdsRepository,
                 usersRepository = self.__usersRepository
             ))
 
+            if self.__isLiveOnTwitchRepository is not None:
+                self.__twitchWebsocketClient.addSubscriptionsListener(self.__isLiveOnTwitchRepository)
+
+            if self.__twitchModerationRosterRepository is not None:
+                self.__twitchWebsocketClient.addSubscriptionsListener(self.__twitchModerationRosterRepository)
+
             self.__twitchWebsocketClient.start()
 
     async def __handleJoinChannelsEvent(self, event: JoinChannelsEvent):
@@ -6,7 +6,7 @@ from CynanBot.funtoon.funtoonTokensRepositoryInterface import \
     FuntoonTokensRepositoryInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
 from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.storage.jsonReaderInterface import JsonReaderInterface
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.users.userIdsRepositoryInterface import \
@@ -36,9 +36,10 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__seedFileReader: JsonReaderInterface | None = seedFileReader
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, str | None] = dict()
 
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
+
     async def clearCaches(self):
         self.__cache.clear()
         self.__timber.log('FuntoonTokensRepository', 'Caches cleared')
@@ -78,10 +79,6 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
 
         self.__timber.log('FuntoonTokensRepository', f'Finished reading in seed file \"{seedFileReader}\"')
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def getToken(
         self,
         twitchChannelId: str
@@ -111,36 +108,31 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__cache[twitchChannelId] = token
         return token
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    async def __getDatabaseConnection(self) -> DatabaseConnection:
+        # the seed file is consumed lazily, the first time that the database is actually needed
+        await self.__consumeSeedFile()
+        return await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'funtoontokens',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS funtoontokens (
                         token text DEFAULT NULL,
                         twitchchannelid text NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS funtoontokens (
                         token TEXT DEFAULT NULL,
                         twitchchannelid TEXT NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
-        await self.__consumeSeedFile()
+            ]
+        )
 
     async def requireToken(
         self,
@@ -2,6 +2,7 @@ from typing import Any
 
 import CynanBot.misc.utils as utils
 from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkRecordReplayMode import NetworkRecordReplayMode
 from CynanBot.storage.databaseType import DatabaseType
 
 
@@ -13,9 +14,23 @@ class GeneralSettingsRepositorySnapshot():
 
         self.__jsonContents: dict[str, Any] = jsonContents
 
+    def getDatabaseSlowQueryThresholdMillis(self) -> int:
+        return utils.getIntFromDict(self.__jsonContents, 'databaseSlowQueryThresholdMillis', 250)
+
     def getEventSubPort(self) -> int:
         return utils.getIntFromDict(self.__jsonContents, 'eventSubPort', 33239)
 
+    def getNetworkFixtureDirectory(self) -> str:
+        return utils.getStrFromDict(self.__jsonContents, 'networkFixtureDirectory', 'networkFixtures')
+
+    def getNetworkRecordReplayMode(self) -> NetworkRecordReplayMode | None:
+        networkRecordReplayMode = self.__jsonContents.get('networkRecordReplayMode', None)
+
+        if utils.isValidStr(networkRecordReplayMode):
+            return NetworkRecordReplayMode.fromStr(networkRecordReplayMode)
+        else:
+            return None
+
     def getRaidLinkMessagingDelay(self) -> int:
         return utils.getIntFromDict(self.__jsonContents, 'raidLinkMessagingDelay', 60)
 
@@ -66,6 +81,9 @@ class GeneralSettingsRepositorySnapshot():
     def isCommandsChatCommandEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'commandsChatCommandEnabled', True)
 
+    def isDatabaseInstrumentationEnabled(self) -> bool:
+        return utils.getBoolFromDict(self.__jsonContents, 'databaseInstrumentationEnabled', False)
+
     def isDebugLoggingEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'debugLoggingEnabled', True)
 
@@ -96,6 +114,15 @@ class GeneralSettingsRepositorySnapshot():
     def isJishoEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'jishoEnabled', True)
 
+    def isNetworkCircuitBreakerEnabled(self) -> bool:
+        return utils.getBoolFromDict(self.__jsonContents, 'networkCircuitBreakerEnabled', True)
+
+    def isNetworkInstrumentationEnabled(self) -> bool:
+        return utils.getBoolFromDict(self.__jsonContents, 'networkInstrumentationEnabled', False)
+
+    def isNetworkResponseCacheEnabled(self) -> bool:
+        return utils.getBoolFromDict(self.__jsonContents, 'networkResponseCacheEnabled', False)
+
     def isPersistAllUsersEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'persistAllUsersEnabled', False)
 
@@ -5,6 +5,7 @@ import CynanBot.misc.utils as utils
 from CynanBot.jisho.jishoApiServiceInterface import JishoApiServiceInterface
 from CynanBot.jisho.jishoJsonMapperInterface import JishoJsonMapperInterface
 from CynanBot.jisho.jishoResponse import JishoResponse
+from CynanBot.misc.singleFlight import SingleFlight
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.timber.timberInterface import TimberInterface
@@ -29,11 +30,20 @@ class JishoApiService(JishoApiServiceInterface):
         self.__networkClientProvider: NetworkClientProvider = networkClientProvider
         self.__timber: TimberInterface = timber
 
+        self.__singleFlight: SingleFlight[JishoResponse] = SingleFlight()
+
     async def search(self, keyword: str) -> JishoResponse:
         if not utils.isValidStr(keyword):
             raise TypeError(f'keyword argument is malformed: \"{keyword}\"')
 
         keyword = utils.cleanStr(keyword)
+
+        return await self.__singleFlight.run(
+            key = keyword,
+            function = lambda: self.__search(keyword)
+        )
+
+    async def __search(self, keyword: str) -> JishoResponse:
         encodedQuery = quote(keyword)
         clientSession = await self.__networkClientProvider.get()
 
@@ -14,13 +14,14 @@ class BackgroundTaskHelper(BackgroundTaskHelperInterface):
         self.__eventLoop: AbstractEventLoop = eventLoop
         self.__backgroundTasks: set[Task] = set()
 
-    def createTask(self, coro: Coroutine):
+    def createTask(self, coro: Coroutine) -> Task:
         if not isinstance(coro, Coroutine):
             raise TypeError(f'coro argument is malformed: \"{coro}\"')
 
         task = self.__eventLoop.create_task(coro)
         self.__backgroundTasks.add(task)
         task.add_done_callback(self.__backgroundTasks.discard)
+        return task
 
     def getEventLoop(self) -> AbstractEventLoop:
         return self.__eventLoop
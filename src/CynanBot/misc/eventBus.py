@@ -0,0 +1,103 @@
+import asyncio
+import traceback
+from asyncio import Task
+from typing import Awaitable, Callable, Generic, TypeVar
+
+import CynanBot.misc.utils as utils
+from CynanBot.misc.backgroundTaskHelperInterface import \
+    BackgroundTaskHelperInterface
+from CynanBot.timber.timberInterface import TimberInterface
+
+T = TypeVar('T')
+
+
+class EventBus(Generic[T]):
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        timber: TimberInterface,
+        name: str,
+        publishTimeoutSeconds: float = 3,
+        maxSize: int = 1024
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidStr(name):
+            raise TypeError(f'name argument is malformed: \"{name}\"')
+        elif not utils.isValidNum(publishTimeoutSeconds):
+            raise TypeError(f'publishTimeoutSeconds argument is malformed: \"{publishTimeoutSeconds}\"')
+        elif publishTimeoutSeconds < 0.1 or publishTimeoutSeconds > 60:
+            raise ValueError(f'publishTimeoutSeconds argument is out of bounds: {publishTimeoutSeconds}')
+        elif not utils.isValidInt(maxSize):
+            raise TypeError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 1 or maxSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
+
+        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
+        self.__timber: TimberInterface = timber
+        self.__name: str = name
+        self.__publishTimeoutSeconds: float = publishTimeoutSeconds
+
+        self.__isStarted: bool = False
+        self.__consumerTask: Task | None = None
+        self.__queue: asyncio.Queue[T] = asyncio.Queue(maxsize = maxSize)
+
+    def getSize(self) -> int:
+        return self.__queue.qsize()
+
+    async def join(self):
+        # waits until every item published so far has been consumed
+        await self.__queue.join()
+
+    async def publish(self, item: T):
+        # waits for room if the consumer has fallen behind, rather than growing without bound
+        try:
+            await asyncio.wait_for(self.__queue.put(item), timeout = self.__publishTimeoutSeconds)
+        except asyncio.TimeoutError as e:
+            self.__timber.log('EventBus', f'Timed out when publishing a new item into the \"{self.__name}\" event bus ({item=}) (queue size: {self.__queue.qsize()}): {e}', e, traceback.format_exc())
+
+    def publishNowait(self, item: T):
+        try:
+            self.__queue.put_nowait(item)
+        except asyncio.QueueFull as e:
+            self.__timber.log('EventBus', f'Encountered QueueFull when publishing a new item into the \"{self.__name}\" event bus ({item=}) (queue size: {self.__queue.qsize()}): {e}', e, traceback.format_exc())
+
+    def start(self, consumer: Callable[[T], Awaitable[None]]):
+        if not callable(consumer):
+            raise TypeError(f'consumer argument is malformed: \"{consumer}\"')
+
+        if self.__isStarted:
+            self.__timber.log('EventBus', f'Not starting the \"{self.__name}\" event bus as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__consumerTask = self.__backgroundTaskHelper.createTask(self.__startConsumerLoop(consumer))
+
+    async def stop(self):
+        consumerTask = self.__consumerTask
+
+        if consumerTask is None:
+            return
+
+        self.__consumerTask = None
+        self.__isStarted = False
+        consumerTask.cancel()
+
+        try:
+            await consumerTask
+        except asyncio.CancelledError:
+            pass
+
+    async def __startConsumerLoop(self, consumer: Callable[[T], Awaitable[None]]):
+        while True:
+            item = await self.__queue.get()
+
+            try:
+                await consumer(item)
+            except Exception as e:
+                self.__timber.log('EventBus', f'Encountered unknown Exception when consuming an item from the \"{self.__name}\" event bus ({item=}) (queue size: {self.__queue.qsize()}): {e}', e, traceback.format_exc())
+            finally:
+                self.__queue.task_done()
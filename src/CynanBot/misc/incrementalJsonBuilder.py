@@ -1,72 +1,103 @@
 import json
-from typing import Any
-
-import CynanBot.misc.utils as utils
+import re
+from typing import Any, Pattern
 
 
 class IncrementalJsonBuilder():
 
     def __init__(self):
-        self.__jsonString: str | None = None
+        self.__depth: int = 0
+        self.__isEscapingNext: bool = False
+        self.__inString: str | None = None
+        self.__pendingJsonStrings: list[str] = list()
+
+        self.__outsideOfStringRegEx: Pattern = re.compile(r'[{}"\'\\]')
+        self.__insideOfStringRegExes: dict[str, Pattern] = {
+            '"': re.compile(r'["\\]'),
+            '\'': re.compile(r'[\'\\]')
+        }
 
     async def buildDictionariesOrAppendInternalJsonCache(
         self,
         jsonString: str | None
     ) -> list[dict[Any, Any]] | None:
-        if not utils.isValidStr(jsonString):
+        if jsonString is None or len(jsonString) == 0:
             return None
 
-        if self.__jsonString is None:
-            self.__jsonString = jsonString
-        else:
-            self.__jsonString += jsonString
+        # scan state is kept between calls, so that each character is only ever looked at once,
+        # no matter how many fragments a JSON structure arrives in
+        dictionaries: list[dict[Any, Any]] = list()
+        length = len(jsonString)
+        startIndex = 0
+        index = 0
 
-        if self.__jsonString[0] != '{':
-            raise RuntimeError(f'Invalid internal JSON string state: \"{self.__jsonString}\"')
+        if self.__isEscapingNext:
+            self.__isEscapingNext = False
+            index = 1
 
-        inString: str | None = None
-        skipNext = False
-        depth = 0
-        index = 0
-        dictionaries: list[dict[Any, Any]] = list()
+        while index < length:
+            if self.__depth == 0:
+                if jsonString[index].isspace():
+                    # whitespace in between JSON structures is meaningless, but whitespace within one is kept
+                    index += 1
+                    continue
+                elif jsonString[index] != '{':
+                    self.__reset()
+                    raise RuntimeError(f'Invalid JSON string state at index {index}: \"{jsonString}\"')
 
-        for i in range(len(self.__jsonString)):
-            if skipNext:
-                skipNext = False
+                startIndex = index
+                self.__depth = 1
+                index += 1
                 continue
 
-            c = self.__jsonString[i]
+            inString = self.__inString
+
+            if inString is None:
+                match = self.__outsideOfStringRegEx.search(jsonString, index)
+            else:
+                match = self.__insideOfStringRegExes[inString].search(jsonString, index)
+
+            if match is None:
+                break
+
+            index = match.start()
+            c = jsonString[index]
 
             if c == '\\':
-                skipNext = True
-            elif c == inString:
-                # if we're in a string (inString is not None) and we've found a matching end,
-                # then exit the string
-                inString = None
-            elif not inString and (c == "'" or c == '"'):
-                # if we aren't in a string and we find the start of a string, mark it
-                inString = c
-            elif inString:
-                # we're processing a character in a string, so we don't care about it
-                pass
+                if index + 1 >= length:
+                    self.__isEscapingNext = True
+
+                index += 2
+                continue
+            elif inString is not None:
+                # the only other character that can match within a string is its closing quote
+                self.__inString = None
+            elif c == '"' or c == '\'':
+                self.__inString = c
             elif c == '{':
-                # mark that we're entering a new object
-                depth += 1
-            elif c == '}':
-                # exit out of the last object, then if we're outside all objects, we're done
-                depth -= 1
-
-                if depth == 0:
-                    jsonStringToParse = self.__jsonString[index:i + 1]
-                    index = i + 1
+                self.__depth += 1
+            else:
+                self.__depth -= 1
+
+                if self.__depth == 0:
+                    self.__pendingJsonStrings.append(jsonString[startIndex:index + 1])
+                    jsonStringToParse = ''.join(self.__pendingJsonStrings)
+                    self.__pendingJsonStrings.clear()
+                    startIndex = index + 1
                     dictionaries.append(json.loads(jsonStringToParse))
 
-        if index >= len(self.__jsonString):
-            self.__jsonString = None
-        else:
-            self.__jsonString = self.__jsonString[index:]
+            index += 1
+
+        if self.__depth > 0:
+            self.__pendingJsonStrings.append(jsonString[startIndex:])
 
         if len(dictionaries) == 0:
             return None
         else:
             return dictionaries
+
+    def __reset(self):
+        self.__depth = 0
+        self.__isEscapingNext = False
+        self.__inString = None
+        self.__pendingJsonStrings.clear()
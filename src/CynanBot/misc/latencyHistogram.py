@@ -0,0 +1,89 @@
+import bisect
+
+import CynanBot.misc.utils as utils
+
+
+class LatencyHistogram():
+
+    DEFAULT_BUCKET_BOUNDARIES_SECONDS: tuple[float, ...] = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+    )
+
+    def __init__(
+        self,
+        bucketBoundariesSeconds: tuple[float, ...] = DEFAULT_BUCKET_BOUNDARIES_SECONDS
+    ):
+        if not isinstance(bucketBoundariesSeconds, tuple) or len(bucketBoundariesSeconds) == 0:
+            raise TypeError(f'bucketBoundariesSeconds argument is malformed: \"{bucketBoundariesSeconds}\"')
+        elif list(bucketBoundariesSeconds) != sorted(bucketBoundariesSeconds):
+            raise ValueError(f'bucketBoundariesSeconds argument must be sorted: \"{bucketBoundariesSeconds}\"')
+
+        self.__bucketBoundariesSeconds: tuple[float, ...] = bucketBoundariesSeconds
+
+        # the final bucket holds every value that is larger than the largest boundary
+        self.__bucketCounts: list[int] = [ 0 ] * (len(bucketBoundariesSeconds) + 1)
+        self.__count: int = 0
+        self.__maxSeconds: float = 0
+        self.__totalSeconds: float = 0
+
+    def getAverageSeconds(self) -> float:
+        if self.__count == 0:
+            return 0
+
+        return self.__totalSeconds / self.__count
+
+    def getBucketCounts(self) -> list[tuple[float | None, int]]:
+        buckets: list[tuple[float | None, int]] = list()
+
+        for index, boundary in enumerate(self.__bucketBoundariesSeconds):
+            buckets.append((boundary, self.__bucketCounts[index]))
+
+        buckets.append((None, self.__bucketCounts[-1]))
+        return buckets
+
+    def getCount(self) -> int:
+        return self.__count
+
+    def getMaxSeconds(self) -> float:
+        return self.__maxSeconds
+
+    def getPercentileSeconds(self, percentile: float) -> float:
+        if not utils.isValidNum(percentile):
+            raise TypeError(f'percentile argument is malformed: \"{percentile}\"')
+        elif percentile < 0 or percentile > 100:
+            raise ValueError(f'percentile argument is out of bounds: {percentile}')
+
+        if self.__count == 0:
+            return 0
+
+        rank = max(1, round(self.__count * percentile / 100))
+        seen = 0
+
+        for index, bucketCount in enumerate(self.__bucketCounts):
+            seen = seen + bucketCount
+
+            if seen >= rank:
+                if index >= len(self.__bucketBoundariesSeconds):
+                    return self.__maxSeconds
+                else:
+                    # a bucket's upper boundary is a pessimistic estimate, so never report more than the max
+                    return min(self.__bucketBoundariesSeconds[index], self.__maxSeconds)
+
+        return self.__maxSeconds
+
+    def getTotalSeconds(self) -> float:
+        return self.__totalSeconds
+
+    def record(self, seconds: float):
+        if not utils.isValidNum(seconds):
+            raise TypeError(f'seconds argument is malformed: \"{seconds}\"')
+        elif seconds < 0:
+            raise ValueError(f'seconds argument is out of bounds: {seconds}')
+
+        index = bisect.bisect_left(self.__bucketBoundariesSeconds, seconds)
+        self.__bucketCounts[index] = self.__bucketCounts[index] + 1
+        self.__count = self.__count + 1
+        self.__totalSeconds = self.__totalSeconds + seconds
+
+        if seconds > self.__maxSeconds:
+            self.__maxSeconds = seconds
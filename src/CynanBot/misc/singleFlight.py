@@ -0,0 +1,35 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+import CynanBot.misc.utils as utils
+
+T = TypeVar('T')
+
+
+class SingleFlight(Generic[T]):
+
+    def __init__(self):
+        self.__inFlight: dict[str, asyncio.Future[T]] = dict()
+
+    def getInFlightCount(self) -> int:
+        return len(self.__inFlight)
+
+    def __removeInFlight(self, key: str, future: asyncio.Future[T]):
+        if self.__inFlight.get(key, None) is future:
+            del self.__inFlight[key]
+
+    async def run(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        if not utils.isValidStr(key):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+        elif not callable(function):
+            raise TypeError(f'function argument is malformed: \"{function}\"')
+
+        future = self.__inFlight.get(key, None)
+
+        if future is None:
+            future = asyncio.ensure_future(function())
+            self.__inFlight[key] = future
+            future.add_done_callback(lambda finishedFuture: self.__removeInFlight(key, finishedFuture))
+
+        # shielded so that one impatient caller being cancelled doesn't cancel the call for everyone else
+        return await asyncio.shield(future)
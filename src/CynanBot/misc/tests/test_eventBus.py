@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from CynanBot.misc.backgroundTaskHelper import BackgroundTaskHelper
+from CynanBot.misc.eventBus import EventBus
+from CynanBot.timber.timberStub import TimberStub
+
+
+class TestEventBus():
+
+    def __createEventBus(self, maxSize: int = 1024) -> EventBus[int]:
+        return EventBus(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            timber = TimberStub(),
+            name = 'test',
+            maxSize = maxSize
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_beforeStart_isConsumedInOrder(self):
+        eventBus = self.__createEventBus()
+        consumed: list[int] = list()
+
+        async def consumer(item: int):
+            consumed.append(item)
+
+        await eventBus.publish(1)
+        eventBus.publishNowait(2)
+        eventBus.start(consumer)
+        await eventBus.publish(3)
+
+        await eventBus.join()
+        assert consumed == [ 1, 2, 3 ]
+        assert eventBus.getSize() == 0
+        await eventBus.stop()
+
+    @pytest.mark.asyncio
+    async def test_publish_withFailingConsumer_keepsConsuming(self):
+        eventBus = self.__createEventBus()
+        consumed: list[int] = list()
+
+        async def consumer(item: int):
+            if item == 1:
+                raise RuntimeError()
+
+            consumed.append(item)
+
+        eventBus.start(consumer)
+        await eventBus.publish(1)
+        await eventBus.publish(2)
+        await eventBus.join()
+        assert consumed == [ 2 ]
+        await eventBus.stop()
+
+    @pytest.mark.asyncio
+    async def test_publishNowait_whenFull_dropsItem(self):
+        eventBus = self.__createEventBus(maxSize = 2)
+        eventBus.publishNowait(1)
+        eventBus.publishNowait(2)
+        eventBus.publishNowait(3)
+        assert eventBus.getSize() == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_stopsConsuming(self):
+        eventBus = self.__createEventBus()
+        consumed: list[int] = list()
+
+        async def consumer(item: int):
+            consumed.append(item)
+
+        eventBus.start(consumer)
+        await eventBus.publish(1)
+        await eventBus.join()
+        await eventBus.stop()
+
+        await eventBus.publish(2)
+        await asyncio.sleep(0.01)
+        assert consumed == [ 1 ]
+        assert eventBus.getSize() == 1
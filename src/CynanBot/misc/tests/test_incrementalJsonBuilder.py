@@ -33,12 +33,42 @@ class TestIncrementalJsonBuilder():
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_buildDictionariesOrAppendInternalJsonCache_withInvalidJsonStructure_recovers(self):
+        builder = IncrementalJsonBuilder()
+
+        with pytest.raises(RuntimeError):
+            await builder.buildDictionariesOrAppendInternalJsonCache('{}x')
+
+        result = await builder.buildDictionariesOrAppendInternalJsonCache('{\"a\":1}')
+        assert result == [ { 'a': 1 } ]
+
     @pytest.mark.asyncio
     async def test_buildDictionariesOrAppendInternalJsonCache_withNone(self):
         builder = IncrementalJsonBuilder()
         result = await builder.buildDictionariesOrAppendInternalJsonCache(None)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_buildDictionariesOrAppendInternalJsonCache_withSingleCharacterFragments(self):
+        builder = IncrementalJsonBuilder()
+        jsonString = '{\"text\":\"a \\\"quoted\\\" {brace} and \\\\\",\"inner\":{\"emote\":\"}\"}}{\"b\":[1,2]}'
+        results: list[dict[Any, Any]] = list()
+
+        for c in jsonString:
+            result = await builder.buildDictionariesOrAppendInternalJsonCache(c)
+
+            if result is not None:
+                results.extend(result)
+
+        assert results == [
+            {
+                'text': 'a \"quoted\" {brace} and \\',
+                'inner': { 'emote': '}' }
+            },
+            { 'b': [ 1, 2 ] }
+        ]
+
     @pytest.mark.asyncio
     async def test_buildDictionariesOrAppendInternalJsonCache_withThreeIncrementalJsonStructures(self):
         builder = IncrementalJsonBuilder()
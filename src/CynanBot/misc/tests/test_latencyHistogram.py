@@ -0,0 +1,54 @@
+import pytest
+
+from CynanBot.misc.latencyHistogram import LatencyHistogram
+
+
+class TestLatencyHistogram():
+
+    def test_constructor_withUnsortedBoundaries(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram((0.5, 0.1))
+
+    def test_getPercentileSeconds(self):
+        histogram = LatencyHistogram((0.01, 0.1, 1))
+
+        for _ in range(90):
+            histogram.record(0.005)
+
+        for _ in range(10):
+            histogram.record(0.5)
+
+        assert histogram.getCount() == 100
+        assert histogram.getPercentileSeconds(50) == 0.01
+        assert histogram.getPercentileSeconds(90) == 0.01
+        assert histogram.getPercentileSeconds(95) == 0.5
+        assert histogram.getMaxSeconds() == 0.5
+
+    def test_getPercentileSeconds_withOverflowBucket(self):
+        histogram = LatencyHistogram((0.01, 0.1))
+        histogram.record(3)
+
+        assert histogram.getPercentileSeconds(99) == 3
+        assert histogram.getBucketCounts() == [ (0.01, 0), (0.1, 0), (None, 1) ]
+
+    def test_getPercentileSeconds_whenEmpty(self):
+        histogram = LatencyHistogram()
+        assert histogram.getPercentileSeconds(99) == 0
+        assert histogram.getAverageSeconds() == 0
+
+    def test_record(self):
+        histogram = LatencyHistogram((0.01, 0.1))
+        histogram.record(0.01)
+        histogram.record(0.02)
+        histogram.record(0.2)
+
+        assert histogram.getCount() == 3
+        assert histogram.getBucketCounts() == [ (0.01, 1), (0.1, 1), (None, 1) ]
+        assert histogram.getTotalSeconds() == pytest.approx(0.23)
+        assert histogram.getAverageSeconds() == pytest.approx(0.23 / 3)
+
+    def test_record_withNegativeSeconds(self):
+        histogram = LatencyHistogram()
+
+        with pytest.raises(ValueError):
+            histogram.record(-1)
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from CynanBot.misc.singleFlight import SingleFlight
+
+
+class TestSingleFlight():
+
+    @pytest.mark.asyncio
+    async def test_run_withConcurrentCallers(self):
+        singleFlight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls = calls + 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*[ singleFlight.run('key', fetch) for _ in range(5) ])
+
+        assert results == [ 42 ] * 5
+        assert calls == 1
+        assert singleFlight.getInFlightCount() == 0
+
+        assert await singleFlight.run('key', fetch) == 42
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_run_withDifferentKeys(self):
+        singleFlight: SingleFlight[str] = SingleFlight()
+
+        async def echo(value: str) -> str:
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            singleFlight.run('a', lambda: echo('a')),
+            singleFlight.run('b', lambda: echo('b'))
+        )
+
+        assert results == [ 'a', 'b' ]
+
+    @pytest.mark.asyncio
+    async def test_run_withException(self):
+        singleFlight: SingleFlight[int] = SingleFlight()
+
+        async def fail() -> int:
+            await asyncio.sleep(0.01)
+            raise RuntimeError('oops')
+
+        results = await asyncio.gather(
+            singleFlight.run('key', fail),
+            singleFlight.run('key', fail),
+            return_exceptions = True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert singleFlight.getInFlightCount() == 0
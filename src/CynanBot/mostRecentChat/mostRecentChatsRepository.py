@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import traceback
 from collections import defaultdict
 from datetime import datetime
 
@@ -8,12 +10,13 @@ from lru import LRU
 import CynanBot.misc.utils as utils
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
+from CynanBot.misc.backgroundTaskHelperInterface import \
+    BackgroundTaskHelperInterface
 from CynanBot.mostRecentChat.mostRecentChat import MostRecentChat
 from CynanBot.mostRecentChat.mostRecentChatsRepositoryInterface import \
     MostRecentChatsRepositoryInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 
 
@@ -21,12 +24,16 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
 
     def __init__(
         self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
-        cacheSize: int = 100
+        cacheSize: int = 100,
+        flushSleepTimeSeconds: float = 5
     ):
-        if not isinstance(backingDatabase, BackingDatabase):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
@@ -36,18 +43,66 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
             raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
         elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
             raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
+        elif not utils.isValidNum(flushSleepTimeSeconds):
+            raise TypeError(f'flushSleepTimeSeconds argument is malformed: \"{flushSleepTimeSeconds}\"')
+        elif flushSleepTimeSeconds < 1 or flushSleepTimeSeconds > 60:
+            raise ValueError(f'flushSleepTimeSeconds argument is out of bounds: {flushSleepTimeSeconds}')
 
+        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
+        self.__flushSleepTimeSeconds: float = flushSleepTimeSeconds
 
-        self.__isDatabaseReady: bool = False
         self.__caches: dict[str, LRU[str, MostRecentChat | None]] = defaultdict(lambda: LRU(cacheSize))
+        self.__flushLock: asyncio.Lock = asyncio.Lock()
+        self.__isStarted: bool = False
+        self.__pendingWrites: dict[tuple[str, str], MostRecentChat] = dict()
+
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def clearCaches(self):
         self.__caches.clear()
         self.__timber.log('MostRecentChatsRepository', 'Caches cleared')
 
+    async def flush(self):
+        async with self.__flushLock:
+            if len(self.__pendingWrites) == 0:
+                return
+
+            pendingWrites = self.__pendingWrites
+            self.__pendingWrites = dict()
+
+            records: list[tuple[str, str, str]] = list()
+
+            for mostRecentChat in pendingWrites.values():
+                records.append((
+                    mostRecentChat.userId,
+                    mostRecentChat.mostRecentChat.isoformat(),
+                    mostRecentChat.twitchChannelId
+                ))
+
+            try:
+                connection = await self.__backingDatabase.getConnection()
+
+                try:
+                    await connection.executeMany(
+                        '''
+                            INSERT INTO mostrecentchats (chatteruserid, mostrecentchat, twitchchannelid)
+                            VALUES ($1, $2, $3)
+                            ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentchat = EXCLUDED.mostrecentchat
+                        ''',
+                        records
+                    )
+                finally:
+                    await connection.close()
+            except Exception as e:
+                self.__timber.log('MostRecentChatsRepository', f'Encountered unknown Exception when flushing {len(records)} most recent chat(s), will retry: {e}', e, traceback.format_exc())
+
+                # any chat that arrived during the failed flush is newer, so it wins
+                pendingWrites.update(self.__pendingWrites)
+                self.__pendingWrites = pendingWrites
+
     async def get(
         self,
         chatterUserId: str,
@@ -63,7 +118,13 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         if chatterUserId in cache:
             return cache[chatterUserId]
 
-        connection = await self.__getDatabaseConnection()
+        pendingWrite = self.__pendingWrites.get((twitchChannelId, chatterUserId), None)
+
+        if pendingWrite is not None:
+            cache[chatterUserId] = pendingWrite
+            return pendingWrite
+
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT mostrecentchat FROM mostrecentchats
@@ -86,19 +147,10 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         cache[chatterUserId] = mostRecentChat
         return mostRecentChat
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'mostrecentchats',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentchats (
                         chatteruserid text NOT NULL,
@@ -107,9 +159,8 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
                         PRIMARY KEY (chatteruserid, twitchchannelid)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentchats (
                         chatteruserid TEXT NOT NULL,
@@ -118,11 +169,8 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
                         PRIMARY KEY (chatteruserid, twitchchannelid)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def set(
         self,
@@ -134,22 +182,25 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        mostRecentChat = datetime.now(self.__timeZoneRepository.getDefault())
-
-        self.__caches[twitchChannelId][chatterUserId] = MostRecentChat(
-            mostRecentChat = mostRecentChat,
+        mostRecentChat = MostRecentChat(
+            mostRecentChat = datetime.now(self.__timeZoneRepository.getDefault()),
             twitchChannelId = twitchChannelId,
             userId = chatterUserId
         )
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO mostrecentchats (chatteruserid, mostrecentchat, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentchat = EXCLUDED.mostrecentchat
-            ''',
-            chatterUserId, mostRecentChat.isoformat(), twitchChannelId
-        )
+        self.__caches[twitchChannelId][chatterUserId] = mostRecentChat
+        self.__pendingWrites[(twitchChannelId, chatterUserId)] = mostRecentChat
 
-        await connection.close()
+    def start(self):
+        if self.__isStarted:
+            self.__timber.log('MostRecentChatsRepository', 'Not starting MostRecentChatsRepository as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__timber.log('MostRecentChatsRepository', 'Starting MostRecentChatsRepository...')
+        self.__backgroundTaskHelper.createTask(self.__startFlushLoop())
+
+    async def __startFlushLoop(self):
+        while True:
+            await asyncio.sleep(self.__flushSleepTimeSeconds)
+            await self.flush()
@@ -6,6 +6,10 @@ from CynanBot.mostRecentChat.mostRecentChat import MostRecentChat
 
 class MostRecentChatsRepositoryInterface(Clearable):
 
+    @abstractmethod
+    async def flush(self):
+        pass
+
     @abstractmethod
     async def get(
         self,
@@ -21,3 +25,7 @@ class MostRecentChatsRepositoryInterface(Clearable):
         twitchChannelId: str
     ):
         pass
+
+    @abstractmethod
+    def start(self):
+        pass
@@ -0,0 +1,63 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.misc.backgroundTaskHelper import BackgroundTaskHelper
+from CynanBot.mostRecentChat.mostRecentChatsRepository import \
+    MostRecentChatsRepository
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.timber.timberStub import TimberStub
+
+
+class TestMostRecentChatsRepository():
+
+    def __createRepository(self, backingDatabase: BackingDatabase) -> MostRecentChatsRepository:
+        return MostRecentChatsRepository(
+            backgroundTaskHelper = BackgroundTaskHelper(
+                eventLoop = asyncio.get_event_loop()
+            ),
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            timeZoneRepository = TimeZoneRepository(),
+            flushSleepTimeSeconds = 60
+        )
+
+    async def __countRows(self, backingDatabase: BackingDatabase) -> int:
+        connection = await backingDatabase.getConnection()
+        record = await connection.fetchRow('SELECT COUNT(*) FROM mostrecentchats')
+        await connection.close()
+
+        assert record is not None
+        return record[0]
+
+    @pytest.mark.asyncio
+    async def test_set_isWrittenOnFlush(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+
+        for _ in range(5):
+            await repository.set('alice', 'channel1')
+            await repository.set('bob', 'channel1')
+
+        await repository.set('alice', 'channel2')
+        latest = await repository.get('alice', 'channel1')
+        assert await self.__countRows(backingDatabase) == 0
+
+        await repository.clearCaches()
+        assert await repository.get('alice', 'channel1') == latest
+
+        await repository.flush()
+        assert await self.__countRows(backingDatabase) == 3
+
+        reloadedRepository = self.__createRepository(backingDatabase)
+        assert await reloadedRepository.get('alice', 'channel1') == latest
+        assert await reloadedRepository.get('carol', 'channel1') is None
+
+        await backingDatabase.close()
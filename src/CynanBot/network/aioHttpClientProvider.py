@@ -7,6 +7,8 @@ from CynanBot.network.aioHttpHandle import AioHttpHandle
 from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.network.networkClientType import NetworkClientType
 from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkMetricsTrackerInterface import \
+    NetworkMetricsTrackerInterface
 from CynanBot.timber.timberInterface import TimberInterface
 
 
@@ -16,20 +18,42 @@ class AioHttpClientProvider(NetworkClientProvider):
         self,
         eventLoop: AbstractEventLoop,
         timber: TimberInterface,
-        timeoutSeconds: int = 8
+        networkMetricsTracker: NetworkMetricsTrackerInterface | None = None,
+        timeoutSeconds: int = 8,
+        connectionLimit: int = 100,
+        connectionLimitPerHost: int = 10,
+        dnsCacheTimeToLiveSeconds: int = 300
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif networkMetricsTracker is not None and not isinstance(networkMetricsTracker, NetworkMetricsTrackerInterface):
+            raise TypeError(f'networkMetricsTracker argument is malformed: \"{networkMetricsTracker}\"')
         elif not utils.isValidInt(timeoutSeconds):
             raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
         elif timeoutSeconds < 3 or timeoutSeconds > 16:
             raise ValueError(f'timeoutSeconds argument is out of bounds: {timeoutSeconds}')
+        elif not utils.isValidInt(connectionLimit):
+            raise TypeError(f'connectionLimit argument is malformed: \"{connectionLimit}\"')
+        elif connectionLimit < 1 or connectionLimit > 1000:
+            raise ValueError(f'connectionLimit argument is out of bounds: {connectionLimit}')
+        elif not utils.isValidInt(connectionLimitPerHost):
+            raise TypeError(f'connectionLimitPerHost argument is malformed: \"{connectionLimitPerHost}\"')
+        elif connectionLimitPerHost < 1 or connectionLimitPerHost > connectionLimit:
+            raise ValueError(f'connectionLimitPerHost argument is out of bounds: {connectionLimitPerHost}')
+        elif not utils.isValidInt(dnsCacheTimeToLiveSeconds):
+            raise TypeError(f'dnsCacheTimeToLiveSeconds argument is malformed: \"{dnsCacheTimeToLiveSeconds}\"')
+        elif dnsCacheTimeToLiveSeconds < 0 or dnsCacheTimeToLiveSeconds > 86400:
+            raise ValueError(f'dnsCacheTimeToLiveSeconds argument is out of bounds: {dnsCacheTimeToLiveSeconds}')
 
         self.__eventLoop: AbstractEventLoop = eventLoop
         self.__timber: TimberInterface = timber
+        self.__networkMetricsTracker: NetworkMetricsTrackerInterface | None = networkMetricsTracker
         self.__timeoutSeconds: int = timeoutSeconds
+        self.__connectionLimit: int = connectionLimit
+        self.__connectionLimitPerHost: int = connectionLimitPerHost
+        self.__dnsCacheTimeToLiveSeconds: int = dnsCacheTimeToLiveSeconds
 
         self.__clientSession: aiohttp.ClientSession | None = None
 
@@ -37,8 +61,17 @@ class AioHttpClientProvider(NetworkClientProvider):
         clientSession = self.__clientSession
 
         if clientSession is None:
+            connector = aiohttp.TCPConnector(
+                loop = self.__eventLoop,
+                limit = self.__connectionLimit,
+                limit_per_host = self.__connectionLimitPerHost,
+                ttl_dns_cache = self.__dnsCacheTimeToLiveSeconds,
+                use_dns_cache = self.__dnsCacheTimeToLiveSeconds > 0
+            )
+
             clientSession = aiohttp.ClientSession(
                 loop = self.__eventLoop,
+                connector = connector,
                 cookie_jar = aiohttp.DummyCookieJar(),
                 timeout = aiohttp.ClientTimeout(total = self.__timeoutSeconds)
             )
@@ -47,7 +80,8 @@ class AioHttpClientProvider(NetworkClientProvider):
 
         return AioHttpHandle(
             clientSession = clientSession,
-            timber = self.__timber
+            timber = self.__timber,
+            networkMetricsTracker = self.__networkMetricsTracker
         )
 
     def getNetworkClientType(self) -> NetworkClientType:
@@ -1,3 +1,4 @@
+import time
 from typing import Any
 
 import aiohttp
@@ -6,6 +7,8 @@ from CynanBot.network.aioHttpResponse import AioHttpResponse
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.network.networkClientType import NetworkClientType
 from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkMetricsTrackerInterface import \
+    NetworkMetricsTrackerInterface
 from CynanBot.network.networkResponse import NetworkResponse
 from CynanBot.timber.timberInterface import TimberInterface
 
@@ -15,15 +18,19 @@ class AioHttpHandle(NetworkHandle):
     def __init__(
         self,
         clientSession: aiohttp.ClientSession,
-        timber: TimberInterface
+        timber: TimberInterface,
+        networkMetricsTracker: NetworkMetricsTrackerInterface | None = None
     ):
         if not isinstance(clientSession, aiohttp.ClientSession):
             raise TypeError(f'clientSession argument is malformed: \"{clientSession}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif networkMetricsTracker is not None and not isinstance(networkMetricsTracker, NetworkMetricsTrackerInterface):
+            raise TypeError(f'networkMetricsTracker argument is malformed: \"{networkMetricsTracker}\"')
 
         self.__clientSession: aiohttp.ClientSession = clientSession
         self.__timber: TimberInterface = timber
+        self.__networkMetricsTracker: NetworkMetricsTrackerInterface | None = networkMetricsTracker
 
     async def delete(
         self,
@@ -31,6 +38,7 @@ class AioHttpHandle(NetworkHandle):
         headers: dict[str, Any] | None = None
     ) -> NetworkResponse:
         response: aiohttp.ClientResponse | None = None
+        start = time.perf_counter()
 
         try:
             response = await self.__clientSession.delete(
@@ -38,6 +46,7 @@ class AioHttpHandle(NetworkHandle):
                 headers = headers
             )
         except Exception as e:
+            self.__recordMetrics(method = 'DELETE', url = url, statusCode = None, bytesTransferred = 0, start = start, isTimeout = isinstance(e, TimeoutError))
             self.__timber.log('AioHttpHandle', f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\": {e}', e)
             raise GenericNetworkException(f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\": {e}')
 
@@ -45,6 +54,8 @@ class AioHttpHandle(NetworkHandle):
             self.__timber.log('AioHttpHandle', f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\"')
             raise GenericNetworkException(f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\"')
 
+        self.__recordMetrics(method = 'DELETE', url = url, statusCode = response.status, bytesTransferred = response.content_length or 0, start = start)
+
         return AioHttpResponse(
             response = response,
             url = url,
@@ -57,6 +68,7 @@ class AioHttpHandle(NetworkHandle):
         headers: dict[str, Any] | None = None
     ) -> NetworkResponse:
         response: aiohttp.ClientResponse | None = None
+        start = time.perf_counter()
 
         try:
             response = await self.__clientSession.get(
@@ -64,6 +76,7 @@ class AioHttpHandle(NetworkHandle):
                 headers = headers
             )
         except Exception as e:
+            self.__recordMetrics(method = 'GET', url = url, statusCode = None, bytesTransferred = 0, start = start, isTimeout = isinstance(e, TimeoutError))
             self.__timber.log('AioHttpHandle', f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\": {e}', e)
             raise GenericNetworkException(f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\": {e}')
 
@@ -71,6 +84,8 @@ class AioHttpHandle(NetworkHandle):
             self.__timber.log('AioHttpHandle', f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\"')
             raise GenericNetworkException(f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\"')
 
+        self.__recordMetrics(method = 'GET', url = url, statusCode = response.status, bytesTransferred = response.content_length or 0, start = start)
+
         return AioHttpResponse(
             response = response,
             url = url,
@@ -87,6 +102,7 @@ class AioHttpHandle(NetworkHandle):
         json: dict[str, Any] | None = None
     ) -> NetworkResponse:
         response: aiohttp.ClientResponse | None = None
+        start = time.perf_counter()
 
         try:
             response = await self.__clientSession.post(
@@ -95,6 +111,7 @@ class AioHttpHandle(NetworkHandle):
                 json = json
             )
         except Exception as e:
+            self.__recordMetrics(method = 'POST', url = url, statusCode = None, bytesTransferred = 0, start = start, isTimeout = isinstance(e, TimeoutError))
             self.__timber.log('AioHttpHandle', f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\": {e}', e)
             raise GenericNetworkException(f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\": {e}')
 
@@ -102,8 +119,33 @@ class AioHttpHandle(NetworkHandle):
             self.__timber.log('AioHttpHandle', f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\"')
             raise GenericNetworkException(f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\"')
 
+        self.__recordMetrics(method = 'POST', url = url, statusCode = response.status, bytesTransferred = response.content_length or 0, start = start)
+
         return AioHttpResponse(
             response = response,
             url = url,
             timber = self.__timber
         )
+
+    def __recordMetrics(
+        self,
+        method: str,
+        url: str,
+        statusCode: int | None,
+        bytesTransferred: int,
+        start: float,
+        isTimeout: bool = False
+    ):
+        networkMetricsTracker = self.__networkMetricsTracker
+
+        if networkMetricsTracker is None:
+            return
+
+        networkMetricsTracker.recordRequest(
+            method = method,
+            url = url,
+            statusCode = statusCode,
+            bytesTransferred = bytesTransferred,
+            seconds = time.perf_counter() - start,
+            isTimeout = isTimeout
+        )
@@ -42,6 +42,10 @@ class AioHttpResponse(NetworkResponse):
     def getNetworkClientType(self) -> NetworkClientType:
         return NetworkClientType.AIOHTTP
 
+    def getHeaders(self) -> dict[str, str]:
+        self.__requireNotClosed()
+        return { key.lower(): value for key, value in self.__response.headers.items() }
+
     def getStatusCode(self) -> int:
         self.__requireNotClosed()
         return self.__response.status
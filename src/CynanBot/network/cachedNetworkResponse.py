@@ -0,0 +1,84 @@
+import json
+from json import JSONDecodeError
+from typing import Any
+
+import xmltodict
+
+from CynanBot.network.exceptions import NetworkResponseIsClosedException
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class CachedNetworkResponse(NetworkResponse):
+
+    def __init__(
+        self,
+        entry: NetworkResponseCacheEntry,
+        timber: TimberInterface
+    ):
+        if not isinstance(entry, NetworkResponseCacheEntry):
+            raise TypeError(f'entry argument is malformed: \"{entry}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+
+        self.__entry: NetworkResponseCacheEntry = entry
+        self.__timber: TimberInterface = timber
+
+        self.__isClosed: bool = False
+
+    async def close(self):
+        self.__isClosed = True
+
+    def getHeaders(self) -> dict[str, str]:
+        self.__requireNotClosed()
+        return dict(self.__entry.headers)
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return self.__entry.networkClientType
+
+    def getStatusCode(self) -> int:
+        self.__requireNotClosed()
+        return self.__entry.statusCode
+
+    def getUrl(self) -> str:
+        return self.__entry.url
+
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    async def json(self) -> dict[str, Any] | list[Any] | None:
+        self.__requireNotClosed()
+
+        try:
+            return json.loads(self.__entry.body)
+        except (JSONDecodeError, UnicodeDecodeError) as e:
+            self.__timber.log('CachedNetworkResponse', f'Unable to decode response into JSON for url \"{self.__entry.url}\"', e)
+            return None
+
+    async def read(self) -> bytes:
+        self.__requireNotClosed()
+        return self.__entry.body
+
+    def __requireNotClosed(self):
+        if self.__isClosed:
+            raise NetworkResponseIsClosedException(f'This response has already been closed! ({self.getNetworkClientType()})')
+
+    def toDictionary(self) -> dict[str, Any]:
+        return {
+            'isClosed': self.__isClosed,
+            'networkClientType': self.getNetworkClientType(),
+            'statusCode': self.__entry.statusCode,
+            'url': self.__entry.url
+        }
+
+    async def xml(self) -> dict[str, Any] | list[Any] | None:
+        self.__requireNotClosed()
+
+        try:
+            return xmltodict.parse(self.__entry.body)
+        except Exception as e:
+            self.__timber.log('CachedNetworkResponse', f'Unable to decode response into XML for url \"{self.__entry.url}\"', e)
+            return None
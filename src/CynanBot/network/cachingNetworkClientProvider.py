@@ -0,0 +1,37 @@
+from CynanBot.network.cachingNetworkHandle import CachingNetworkHandle
+from CynanBot.network.networkClientProvider import NetworkClientProvider
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkResponseCacheInterface import \
+    NetworkResponseCacheInterface
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class CachingNetworkClientProvider(NetworkClientProvider):
+
+    def __init__(
+        self,
+        networkClientProvider: NetworkClientProvider,
+        networkResponseCache: NetworkResponseCacheInterface,
+        timber: TimberInterface
+    ):
+        if not isinstance(networkClientProvider, NetworkClientProvider):
+            raise TypeError(f'networkClientProvider argument is malformed: \"{networkClientProvider}\"')
+        elif not isinstance(networkResponseCache, NetworkResponseCacheInterface):
+            raise TypeError(f'networkResponseCache argument is malformed: \"{networkResponseCache}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+
+        self.__networkClientProvider: NetworkClientProvider = networkClientProvider
+        self.__networkResponseCache: NetworkResponseCacheInterface = networkResponseCache
+        self.__timber: TimberInterface = timber
+
+    async def get(self) -> NetworkHandle:
+        return CachingNetworkHandle(
+            networkHandle = await self.__networkClientProvider.get(),
+            networkResponseCache = self.__networkResponseCache,
+            timber = self.__timber
+        )
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return self.__networkClientProvider.getNetworkClientType()
@@ -0,0 +1,200 @@
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import CynanBot.misc.utils as utils
+from CynanBot.network.cachedNetworkResponse import CachedNetworkResponse
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+from CynanBot.network.networkResponseCacheInterface import \
+    NetworkResponseCacheInterface
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class CachingNetworkHandle(NetworkHandle):
+
+    def __init__(
+        self,
+        networkHandle: NetworkHandle,
+        networkResponseCache: NetworkResponseCacheInterface,
+        timber: TimberInterface,
+        maxBodySizeBytes: int = 1048576
+    ):
+        if not isinstance(networkHandle, NetworkHandle):
+            raise TypeError(f'networkHandle argument is malformed: \"{networkHandle}\"')
+        elif not isinstance(networkResponseCache, NetworkResponseCacheInterface):
+            raise TypeError(f'networkResponseCache argument is malformed: \"{networkResponseCache}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(maxBodySizeBytes):
+            raise TypeError(f'maxBodySizeBytes argument is malformed: \"{maxBodySizeBytes}\"')
+        elif maxBodySizeBytes < 1 or maxBodySizeBytes > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBodySizeBytes argument is out of bounds: {maxBodySizeBytes}')
+
+        self.__networkHandle: NetworkHandle = networkHandle
+        self.__networkResponseCache: NetworkResponseCacheInterface = networkResponseCache
+        self.__timber: TimberInterface = timber
+        self.__maxBodySizeBytes: int = maxBodySizeBytes
+
+    def __createCacheEntry(
+        self,
+        body: bytes,
+        responseHeaders: dict[str, str],
+        statusCode: int,
+        url: str
+    ) -> NetworkResponseCacheEntry | None:
+        cacheControl = self.__parseCacheControl(responseHeaders.get('cache-control', None))
+
+        if 'no-store' in cacheControl:
+            return None
+
+        expiresAt: float | None = None
+        maxAge = utils.safeStrToInt(cacheControl.get('max-age', None))
+
+        if 'no-cache' in cacheControl:
+            expiresAt = None
+        elif maxAge is not None:
+            expiresAt = time.time() + maxAge
+        elif 'expires' in responseHeaders:
+            try:
+                expiresAt = parsedate_to_datetime(responseHeaders['expires']).timestamp()
+            except (TypeError, ValueError):
+                expiresAt = None
+
+        entry = NetworkResponseCacheEntry(
+            body = body,
+            expiresAt = expiresAt,
+            headers = responseHeaders,
+            networkClientType = self.getNetworkClientType(),
+            statusCode = statusCode,
+            url = url
+        )
+
+        # a response that is never fresh and can't be revalidated is pointless to keep
+        if not entry.isFresh(time.time()) and not entry.hasValidators():
+            return None
+
+        return entry
+
+    async def delete(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        await self.__networkResponseCache.remove(url, headers)
+        return await self.__networkHandle.delete(url, headers)
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        entry = await self.__networkResponseCache.get(url, headers)
+
+        if entry is not None and entry.isFresh(time.time()):
+            return CachedNetworkResponse(
+                entry = entry,
+                timber = self.__timber
+            )
+
+        requestHeaders = headers
+
+        if entry is not None and entry.hasValidators():
+            requestHeaders = dict(headers) if headers is not None else dict()
+            eTag = entry.getETag()
+            lastModified = entry.getLastModified()
+
+            if eTag is not None:
+                requestHeaders['If-None-Match'] = eTag
+
+            if lastModified is not None:
+                requestHeaders['If-Modified-Since'] = lastModified
+
+        response = await self.__networkHandle.get(url, requestHeaders)
+        statusCode = response.getStatusCode()
+
+        if entry is not None and statusCode == 304:
+            responseHeaders = dict(entry.headers)
+            responseHeaders.update(response.getHeaders())
+            await response.close()
+
+            refreshedEntry = self.__createCacheEntry(
+                body = entry.body,
+                responseHeaders = responseHeaders,
+                statusCode = entry.statusCode,
+                url = url
+            )
+
+            if refreshedEntry is None:
+                await self.__networkResponseCache.remove(url, headers)
+                refreshedEntry = entry
+            else:
+                await self.__networkResponseCache.put(headers, refreshedEntry)
+
+            return CachedNetworkResponse(
+                entry = refreshedEntry,
+                timber = self.__timber
+            )
+        elif statusCode != 200:
+            return response
+
+        responseHeaders = response.getHeaders()
+        contentLength = utils.safeStrToInt(responseHeaders.get('content-length', None))
+
+        if contentLength is not None and contentLength > self.__maxBodySizeBytes:
+            return response
+
+        body = await response.read()
+        await response.close()
+
+        newEntry = self.__createCacheEntry(
+            body = body,
+            responseHeaders = responseHeaders,
+            statusCode = statusCode,
+            url = url
+        )
+
+        if newEntry is None or len(body) > self.__maxBodySizeBytes:
+            newEntry = NetworkResponseCacheEntry(
+                body = body,
+                expiresAt = None,
+                headers = responseHeaders,
+                networkClientType = self.getNetworkClientType(),
+                statusCode = statusCode,
+                url = url
+            )
+        else:
+            await self.__networkResponseCache.put(headers, newEntry)
+
+        return CachedNetworkResponse(
+            entry = newEntry,
+            timber = self.__timber
+        )
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return self.__networkHandle.getNetworkClientType()
+
+    def __parseCacheControl(self, cacheControl: str | None) -> dict[str, str | None]:
+        directives: dict[str, str | None] = dict()
+
+        if not utils.isValidStr(cacheControl):
+            return directives
+
+        for directive in cacheControl.split(','):
+            name, _, value = directive.strip().partition('=')
+
+            if utils.isValidStr(name):
+                directives[name.lower()] = value.strip('"') if utils.isValidStr(value) else None
+
+        return directives
+
+    async def post(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__networkHandle.post(url, headers, json)
@@ -0,0 +1,204 @@
+import traceback
+from collections import deque
+from datetime import datetime, timedelta
+
+import CynanBot.misc.utils as utils
+from CynanBot.location.timeZoneRepositoryInterface import \
+    TimeZoneRepositoryInterface
+from CynanBot.network.circuitBreakerEventListener import \
+    CircuitBreakerEventListener
+from CynanBot.network.circuitBreakerInterface import CircuitBreakerInterface
+from CynanBot.network.circuitBreakerState import CircuitBreakerState
+from CynanBot.network.exceptions import CircuitBreakerOpenException
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class CircuitBreaker(CircuitBreakerInterface):
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        timeZoneRepository: TimeZoneRepositoryInterface,
+        failureRateThreshold: float = 0.5,
+        minimumCalls: int = 5,
+        slowCallThresholdSeconds: float = 6,
+        windowSize: int = 20,
+        maxOpenTimeDelta: timedelta = timedelta(minutes = 5),
+        openTimeDelta: timedelta = timedelta(seconds = 30)
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
+            raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+        elif not utils.isValidNum(failureRateThreshold):
+            raise TypeError(f'failureRateThreshold argument is malformed: \"{failureRateThreshold}\"')
+        elif failureRateThreshold <= 0 or failureRateThreshold > 1:
+            raise ValueError(f'failureRateThreshold argument is out of bounds: {failureRateThreshold}')
+        elif not utils.isValidInt(minimumCalls):
+            raise TypeError(f'minimumCalls argument is malformed: \"{minimumCalls}\"')
+        elif minimumCalls < 1 or minimumCalls > 100:
+            raise ValueError(f'minimumCalls argument is out of bounds: {minimumCalls}')
+        elif not utils.isValidNum(slowCallThresholdSeconds):
+            raise TypeError(f'slowCallThresholdSeconds argument is malformed: \"{slowCallThresholdSeconds}\"')
+        elif slowCallThresholdSeconds <= 0 or slowCallThresholdSeconds > 60:
+            raise ValueError(f'slowCallThresholdSeconds argument is out of bounds: {slowCallThresholdSeconds}')
+        elif not utils.isValidInt(windowSize):
+            raise TypeError(f'windowSize argument is malformed: \"{windowSize}\"')
+        elif windowSize < minimumCalls or windowSize > 1000:
+            raise ValueError(f'windowSize argument is out of bounds: {windowSize}')
+        elif not isinstance(maxOpenTimeDelta, timedelta):
+            raise TypeError(f'maxOpenTimeDelta argument is malformed: \"{maxOpenTimeDelta}\"')
+        elif not isinstance(openTimeDelta, timedelta):
+            raise TypeError(f'openTimeDelta argument is malformed: \"{openTimeDelta}\"')
+        elif openTimeDelta <= timedelta() or openTimeDelta > maxOpenTimeDelta:
+            raise ValueError(f'openTimeDelta argument is out of bounds: {openTimeDelta}')
+
+        self.__timber: TimberInterface = timber
+        self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
+        self.__failureRateThreshold: float = failureRateThreshold
+        self.__minimumCalls: int = minimumCalls
+        self.__slowCallThresholdSeconds: float = slowCallThresholdSeconds
+        self.__windowSize: int = windowSize
+        self.__maxOpenTimeDelta: timedelta = maxOpenTimeDelta
+        self.__openTimeDelta: timedelta = openTimeDelta
+
+        self.__eventListener: CircuitBreakerEventListener | None = None
+        self.__halfOpenTrialTimes: dict[str, datetime] = dict()
+        self.__openCounts: dict[str, int] = dict()
+        self.__openUntil: dict[str, datetime] = dict()
+        self.__outcomes: dict[str, deque[bool]] = dict()
+        self.__states: dict[str, CircuitBreakerState] = dict()
+
+    async def beforeRequest(self, host: str):
+        if not utils.isValidStr(host):
+            raise TypeError(f'host argument is malformed: \"{host}\"')
+
+        state = self.getState(host)
+
+        if state is CircuitBreakerState.CLOSED:
+            return
+
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+
+        if state is CircuitBreakerState.OPEN:
+            openUntil = self.__openUntil[host]
+
+            if now < openUntil:
+                raise CircuitBreakerOpenException(
+                    message = f'Circuit breaker for \"{host}\" is open until {openUntil}',
+                    host = host
+                )
+
+            await self.__setState(host, CircuitBreakerState.HALF_OPEN)
+
+        # only a single trial request is let through while half open, everything else keeps failing fast
+        # (unless that trial seemingly never finished, in which case another one is allowed)
+        trialTime = self.__halfOpenTrialTimes.get(host, None)
+
+        if trialTime is not None and now - trialTime < self.__openTimeDelta:
+            raise CircuitBreakerOpenException(
+                message = f'Circuit breaker for \"{host}\" is half open and already has a trial request in flight',
+                host = host
+            )
+
+        self.__halfOpenTrialTimes[host] = now
+
+    def getFailureRate(self, host: str) -> float:
+        if not utils.isValidStr(host):
+            raise TypeError(f'host argument is malformed: \"{host}\"')
+
+        outcomes = self.__outcomes.get(host, None)
+
+        if outcomes is None or len(outcomes) == 0:
+            return 0
+
+        failures = sum(1 for isSuccess in outcomes if not isSuccess)
+        return failures / len(outcomes)
+
+    def getState(self, host: str) -> CircuitBreakerState:
+        if not utils.isValidStr(host):
+            raise TypeError(f'host argument is malformed: \"{host}\"')
+
+        return self.__states.get(host, CircuitBreakerState.CLOSED)
+
+    async def __open(self, host: str):
+        openCount = self.__openCounts.get(host, 0) + 1
+        self.__openCounts[host] = openCount
+
+        # a host that keeps failing its trial requests is left alone for longer each time
+        openTimeDelta = min(self.__openTimeDelta * (2 ** (openCount - 1)), self.__maxOpenTimeDelta)
+        self.__openUntil[host] = datetime.now(self.__timeZoneRepository.getDefault()) + openTimeDelta
+
+        self.__timber.log('CircuitBreaker', f'Opening circuit breaker for \"{host}\" ({openTimeDelta=}) ({openCount=}) (failureRate={self.getFailureRate(host)})')
+        await self.__setState(host, CircuitBreakerState.OPEN)
+
+    async def __recordOutcome(self, host: str, isSuccess: bool):
+        state = self.getState(host)
+
+        if state is CircuitBreakerState.OPEN:
+            # this request was started before the circuit breaker opened
+            return
+        elif state is CircuitBreakerState.HALF_OPEN:
+            self.__halfOpenTrialTimes.pop(host, None)
+
+            if isSuccess:
+                self.__timber.log('CircuitBreaker', f'Closing circuit breaker for \"{host}\" after a successful trial request')
+                self.__outcomes.pop(host, None)
+                self.__openCounts.pop(host, None)
+                await self.__setState(host, CircuitBreakerState.CLOSED)
+            else:
+                await self.__open(host)
+
+            return
+
+        outcomes = self.__outcomes.get(host, None)
+
+        if outcomes is None:
+            outcomes = deque(maxlen = self.__windowSize)
+            self.__outcomes[host] = outcomes
+
+        outcomes.append(isSuccess)
+
+        if len(outcomes) >= self.__minimumCalls and self.getFailureRate(host) >= self.__failureRateThreshold:
+            await self.__open(host)
+            outcomes.clear()
+
+    async def recordFailure(self, host: str, seconds: float):
+        if not utils.isValidStr(host):
+            raise TypeError(f'host argument is malformed: \"{host}\"')
+        elif not utils.isValidNum(seconds):
+            raise TypeError(f'seconds argument is malformed: \"{seconds}\"')
+
+        await self.__recordOutcome(host, isSuccess = False)
+
+    async def recordSuccess(self, host: str, seconds: float):
+        if not utils.isValidStr(host):
+            raise TypeError(f'host argument is malformed: \"{host}\"')
+        elif not utils.isValidNum(seconds):
+            raise TypeError(f'seconds argument is malformed: \"{seconds}\"')
+
+        # a host that answers too slowly is costing users just as much time as one that errors
+        await self.__recordOutcome(host, isSuccess = seconds < self.__slowCallThresholdSeconds)
+
+    def setEventListener(self, listener: CircuitBreakerEventListener | None):
+        if listener is not None and not isinstance(listener, CircuitBreakerEventListener):
+            raise TypeError(f'listener argument is malformed: \"{listener}\"')
+
+        self.__eventListener = listener
+
+    async def __setState(self, host: str, state: CircuitBreakerState):
+        self.__states[host] = state
+        eventListener = self.__eventListener
+
+        if eventListener is None:
+            return
+
+        openUntil: datetime | None = None
+
+        if state is CircuitBreakerState.OPEN:
+            openUntil = self.__openUntil.get(host, None)
+
+        try:
+            await eventListener.onCircuitBreakerStateChanged(host, state, openUntil)
+        except Exception as e:
+            self.__timber.log('CircuitBreaker', f'Encountered unknown Exception when notifying event listener of state change ({host=}) ({state=}): {e}', e, traceback.format_exc())
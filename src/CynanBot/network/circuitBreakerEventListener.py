@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from CynanBot.network.circuitBreakerState import CircuitBreakerState
+
+
+class CircuitBreakerEventListener(ABC):
+
+    @abstractmethod
+    async def onCircuitBreakerStateChanged(
+        self,
+        host: str,
+        state: CircuitBreakerState,
+        openUntil: datetime | None
+    ):
+        pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+from CynanBot.network.circuitBreakerEventListener import \
+    CircuitBreakerEventListener
+from CynanBot.network.circuitBreakerState import CircuitBreakerState
+
+
+class CircuitBreakerInterface(ABC):
+
+    @abstractmethod
+    async def beforeRequest(self, host: str):
+        pass
+
+    @abstractmethod
+    def getFailureRate(self, host: str) -> float:
+        pass
+
+    @abstractmethod
+    def getState(self, host: str) -> CircuitBreakerState:
+        pass
+
+    @abstractmethod
+    async def recordFailure(self, host: str, seconds: float):
+        pass
+
+    @abstractmethod
+    async def recordSuccess(self, host: str, seconds: float):
+        pass
+
+    @abstractmethod
+    def setEventListener(self, listener: CircuitBreakerEventListener | None):
+        pass
@@ -0,0 +1,37 @@
+from CynanBot.network.circuitBreakerInterface import CircuitBreakerInterface
+from CynanBot.network.circuitBreakerNetworkHandle import \
+    CircuitBreakerNetworkHandle
+from CynanBot.network.networkClientProvider import NetworkClientProvider
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class CircuitBreakerNetworkClientProvider(NetworkClientProvider):
+
+    def __init__(
+        self,
+        circuitBreaker: CircuitBreakerInterface,
+        networkClientProvider: NetworkClientProvider,
+        timber: TimberInterface
+    ):
+        if not isinstance(circuitBreaker, CircuitBreakerInterface):
+            raise TypeError(f'circuitBreaker argument is malformed: \"{circuitBreaker}\"')
+        elif not isinstance(networkClientProvider, NetworkClientProvider):
+            raise TypeError(f'networkClientProvider argument is malformed: \"{networkClientProvider}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+
+        self.__circuitBreaker: CircuitBreakerInterface = circuitBreaker
+        self.__networkClientProvider: NetworkClientProvider = networkClientProvider
+        self.__timber: TimberInterface = timber
+
+    async def get(self) -> NetworkHandle:
+        return CircuitBreakerNetworkHandle(
+            circuitBreaker = self.__circuitBreaker,
+            networkHandle = await self.__networkClientProvider.get(),
+            timber = self.__timber
+        )
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return self.__networkClientProvider.getNetworkClientType()
@@ -0,0 +1,149 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlparse
+
+import CynanBot.misc.utils as utils
+from CynanBot.network.circuitBreakerInterface import CircuitBreakerInterface
+from CynanBot.network.circuitBreakerState import CircuitBreakerState
+from CynanBot.network.exceptions import (CircuitBreakerOpenException,
+                                         GenericNetworkException)
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class CircuitBreakerNetworkHandle(NetworkHandle):
+
+    def __init__(
+        self,
+        circuitBreaker: CircuitBreakerInterface,
+        networkHandle: NetworkHandle,
+        timber: TimberInterface,
+        maxRetryCount: int = 2,
+        retryBackoffSeconds: float = 0.25
+    ):
+        if not isinstance(circuitBreaker, CircuitBreakerInterface):
+            raise TypeError(f'circuitBreaker argument is malformed: \"{circuitBreaker}\"')
+        elif not isinstance(networkHandle, NetworkHandle):
+            raise TypeError(f'networkHandle argument is malformed: \"{networkHandle}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(maxRetryCount):
+            raise TypeError(f'maxRetryCount argument is malformed: \"{maxRetryCount}\"')
+        elif maxRetryCount < 0 or maxRetryCount > 5:
+            raise ValueError(f'maxRetryCount argument is out of bounds: {maxRetryCount}')
+        elif not utils.isValidNum(retryBackoffSeconds):
+            raise TypeError(f'retryBackoffSeconds argument is malformed: \"{retryBackoffSeconds}\"')
+        elif retryBackoffSeconds < 0 or retryBackoffSeconds > 5:
+            raise ValueError(f'retryBackoffSeconds argument is out of bounds: {retryBackoffSeconds}')
+
+        self.__circuitBreaker: CircuitBreakerInterface = circuitBreaker
+        self.__networkHandle: NetworkHandle = networkHandle
+        self.__timber: TimberInterface = timber
+        self.__maxRetryCount: int = maxRetryCount
+        self.__retryBackoffSeconds: float = retryBackoffSeconds
+
+    def __computeBackoffSeconds(self, host: str, retryCount: int) -> float:
+        # back off harder the worse this host has been doing recently, and jitter so that
+        # concurrent callers don't all come back at the same instant
+        backoffSeconds = self.__retryBackoffSeconds * (2 ** (retryCount - 1))
+        backoffSeconds = backoffSeconds * (1 + self.__circuitBreaker.getFailureRate(host))
+        return random.uniform(backoffSeconds / 2, backoffSeconds)
+
+    async def delete(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            url = url,
+            isRetryable = False,
+            function = lambda: self.__networkHandle.delete(url, headers)
+        )
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            url = url,
+            isRetryable = True,
+            function = lambda: self.__networkHandle.get(url, headers)
+        )
+
+    def __getHost(self, url: str) -> str:
+        host = urlparse(url).hostname
+
+        if utils.isValidStr(host):
+            return host.lower()
+        else:
+            return url
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return self.__networkHandle.getNetworkClientType()
+
+    def __isFailureStatusCode(self, statusCode: int) -> bool:
+        # a 429 means that the host is up but is rate limiting us, which is for the caller to deal with
+        # (Helix requests, for example, already get queued up again by the Twitch API request scheduler)
+        return statusCode >= 500
+
+    async def post(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            url = url,
+            isRetryable = False,
+            function = lambda: self.__networkHandle.post(url, headers, json)
+        )
+
+    async def __request(
+        self,
+        url: str,
+        isRetryable: bool,
+        function: Callable[[], Awaitable[NetworkResponse]]
+    ) -> NetworkResponse:
+        host = self.__getHost(url)
+        retryCount = 0
+
+        while True:
+            await self.__circuitBreaker.beforeRequest(host)
+            start = time.perf_counter()
+
+            try:
+                response = await function()
+            except CircuitBreakerOpenException:
+                raise
+            except GenericNetworkException as e:
+                await self.__circuitBreaker.recordFailure(host, time.perf_counter() - start)
+
+                if not self.__shouldRetry(host, isRetryable, retryCount):
+                    raise e
+            else:
+                seconds = time.perf_counter() - start
+                statusCode = response.getStatusCode()
+
+                if not self.__isFailureStatusCode(statusCode):
+                    await self.__circuitBreaker.recordSuccess(host, seconds)
+                    return response
+
+                await self.__circuitBreaker.recordFailure(host, seconds)
+
+                if not self.__shouldRetry(host, isRetryable, retryCount):
+                    return response
+
+                await response.close()
+
+            retryCount = retryCount + 1
+            backoffSeconds = self.__computeBackoffSeconds(host, retryCount)
+            self.__timber.log('CircuitBreakerNetworkHandle', f'Retrying request to \"{host}\" ({retryCount=}) ({backoffSeconds=})')
+            await asyncio.sleep(backoffSeconds)
+
+    def __shouldRetry(self, host: str, isRetryable: bool, retryCount: int) -> bool:
+        return isRetryable and retryCount < self.__maxRetryCount and self.__circuitBreaker.getState(host) is CircuitBreakerState.CLOSED
@@ -0,0 +1,10 @@
+from enum import auto
+
+from CynanBot.misc.enumWithToFromStr import EnumWithToFromStr
+
+
+class CircuitBreakerState(EnumWithToFromStr):
+
+    CLOSED = auto()
+    HALF_OPEN = auto()
+    OPEN = auto()
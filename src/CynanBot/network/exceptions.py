@@ -19,3 +19,14 @@ class NetworkResponseIsClosedException(Exception):
 
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class CircuitBreakerOpenException(GenericNetworkException):
+
+    def __init__(self, message: str, host: str):
+        super().__init__(message)
+
+        self.__host: str = host
+
+    def getHost(self) -> str:
+        return self.__host
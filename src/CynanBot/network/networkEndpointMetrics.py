@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class NetworkEndpointMetrics():
+    averageSeconds: float
+    maxSeconds: float
+    p50Seconds: float
+    p95Seconds: float
+    totalSeconds: float
+    statusCodeCounts: dict[int, int]
+    bytesTransferred: int
+    callCount: int
+    errorCount: int
+    timeoutCount: int
+    host: str
+    method: str
+    route: str
@@ -0,0 +1,256 @@
+import asyncio
+import base64
+import hashlib
+import json
+import traceback
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiofiles
+import aiofiles.os
+import aiofiles.ospath
+
+import CynanBot.misc.utils as utils
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkFixtureRepositoryInterface import \
+    NetworkFixtureRepositoryInterface
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class NetworkFixtureRepository(NetworkFixtureRepositoryInterface):
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        fixtureDirectory: str = 'networkFixtures'
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidStr(fixtureDirectory):
+            raise TypeError(f'fixtureDirectory argument is malformed: \"{fixtureDirectory}\"')
+
+        self.__timber: TimberInterface = timber
+        self.__fixtureDirectory: str = fixtureDirectory
+
+        self.__credentialParameterNames: frozenset[str] = frozenset({
+            'access_token', 'api_key', 'apikey', 'appid', 'auth_key', 'client_secret',
+            'code', 'id_token', 'key', 'password', 'refresh_token', 'token'
+        })
+
+        self.__credentialHeaderNames: frozenset[str] = frozenset({
+            'authorization', 'cookie', 'proxy-authorization', 'set-cookie', 'x-api-key'
+        })
+
+        self.__lock: asyncio.Lock = asyncio.Lock()
+        self.__fixtures: dict[str, list[NetworkResponseCacheEntry]] = dict()
+        self.__replayIndexes: dict[str, int] = dict()
+
+    def __createKey(
+        self,
+        method: str,
+        url: str,
+        requestJson: dict[str, Any] | None
+    ) -> str:
+        # request headers are deliberately left out, as they mostly carry credentials that differ between machines
+        keyParts: list[str] = [ method.upper(), self.__redactUrl(url) ]
+
+        if requestJson is not None:
+            keyParts.append(json.dumps(self.__redactJson(requestJson), sort_keys = True))
+
+        return hashlib.sha256('\n'.join(keyParts).encode('utf-8')).hexdigest()
+
+    def __getFixtureFile(self, key: str) -> str:
+        return f'{self.__fixtureDirectory}/{key}.json'
+
+    def __isCredentialParameter(self, name: str) -> bool:
+        return name.lower() in self.__credentialParameterNames
+
+    async def __readFixture(self, key: str) -> list[NetworkResponseCacheEntry]:
+        fixtureFile = self.__getFixtureFile(key)
+
+        if not await aiofiles.ospath.exists(fixtureFile):
+            return list()
+
+        try:
+            async with aiofiles.open(fixtureFile, mode = 'r', encoding = 'utf-8') as file:
+                data = await file.read()
+
+            jsonContents: dict[str, Any] = json.loads(data)
+            url = utils.getStrFromDict(jsonContents, 'url')
+            entries: list[NetworkResponseCacheEntry] = list()
+
+            for responseJson in jsonContents['responses']:
+                entries.append(NetworkResponseCacheEntry(
+                    body = base64.b64decode(utils.getStrFromDict(responseJson, 'body', clean = False, fallback = '')),
+                    expiresAt = None,
+                    headers = responseJson['headers'],
+                    networkClientType = NetworkClientType.fromStr(utils.getStrFromDict(responseJson, 'networkClientType')),
+                    statusCode = utils.getIntFromDict(responseJson, 'statusCode'),
+                    url = url
+                ))
+
+            return entries
+        except Exception as e:
+            self.__timber.log('NetworkFixtureRepository', f'Unable to read network fixture from \"{fixtureFile}\": {e}', e, traceback.format_exc())
+            return list()
+
+    async def record(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None,
+        entry: NetworkResponseCacheEntry
+    ):
+        if not utils.isValidStr(method):
+            raise TypeError(f'method argument is malformed: \"{method}\"')
+        elif not utils.isValidStr(url):
+            raise TypeError(f'url argument is malformed: \"{url}\"')
+        elif json is not None and not isinstance(json, dict):
+            raise TypeError(f'json argument is malformed: \"{json}\"')
+        elif not isinstance(entry, NetworkResponseCacheEntry):
+            raise TypeError(f'entry argument is malformed: \"{entry}\"')
+
+        key = self.__createKey(method, url, json)
+
+        async with self.__lock:
+            # each recording session starts the fixture over, rather than appending to a previous session's
+            entries = self.__fixtures.get(key, None)
+
+            if entries is None:
+                entries = list()
+                self.__fixtures[key] = entries
+
+            entries.append(entry)
+            await self.__writeFixture(key, method, url, json, entries)
+
+    def __redactBody(self, body: bytes) -> bytes:
+        try:
+            bodyJson = json.loads(body)
+        except ValueError:
+            return body
+
+        redactedBodyJson = self.__redactJson(bodyJson)
+
+        if redactedBodyJson == bodyJson:
+            return body
+
+        return json.dumps(redactedBodyJson).encode('utf-8')
+
+    def __redactHeaders(self, headers: dict[str, Any]) -> dict[str, Any]:
+        redactedHeaders: dict[str, Any] = dict()
+
+        for name, value in headers.items():
+            if name.lower() in self.__credentialHeaderNames:
+                redactedHeaders[name] = 'REDACTED'
+            else:
+                redactedHeaders[name] = value
+
+        return redactedHeaders
+
+    def __redactJson(self, jsonContents: Any) -> Any:
+        if isinstance(jsonContents, list):
+            return [ self.__redactJson(value) for value in jsonContents ]
+        elif not isinstance(jsonContents, dict):
+            return jsonContents
+
+        redactedJson: dict[str, Any] = dict()
+
+        for name, value in jsonContents.items():
+            if isinstance(name, str) and self.__isCredentialParameter(name):
+                redactedJson[name] = 'REDACTED'
+            else:
+                redactedJson[name] = self.__redactJson(value)
+
+        return redactedJson
+
+    def __redactUrl(self, url: str) -> str:
+        # fixtures get shared and committed, so API keys and the like must never make it into one
+        splitUrl = urlsplit(url)
+
+        if not utils.isValidStr(splitUrl.query):
+            return url
+
+        queryParameters = parse_qsl(splitUrl.query, keep_blank_values = True)
+
+        if not any(self.__isCredentialParameter(name) for name, _ in queryParameters):
+            return url
+
+        redactedQueryParameters: list[tuple[str, str]] = list()
+
+        for name, value in queryParameters:
+            if self.__isCredentialParameter(name):
+                redactedQueryParameters.append((name, 'REDACTED'))
+            else:
+                redactedQueryParameters.append((name, value))
+
+        return urlunsplit(splitUrl._replace(query = urlencode(redactedQueryParameters)))
+
+    async def replay(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None
+    ) -> NetworkResponseCacheEntry | None:
+        if not utils.isValidStr(method):
+            raise TypeError(f'method argument is malformed: \"{method}\"')
+        elif not utils.isValidStr(url):
+            raise TypeError(f'url argument is malformed: \"{url}\"')
+        elif json is not None and not isinstance(json, dict):
+            raise TypeError(f'json argument is malformed: \"{json}\"')
+
+        key = self.__createKey(method, url, json)
+
+        async with self.__lock:
+            entries = self.__fixtures.get(key, None)
+
+            if entries is None:
+                entries = await self.__readFixture(key)
+                self.__fixtures[key] = entries
+
+            if len(entries) == 0:
+                return None
+
+            # an endpoint that was recorded multiple times (such as a random trivia question) plays its responses back in order
+            replayIndex = self.__replayIndexes.get(key, 0)
+            self.__replayIndexes[key] = (replayIndex + 1) % len(entries)
+            return entries[replayIndex]
+
+    async def __writeFixture(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        requestJson: dict[str, Any] | None,
+        entries: list[NetworkResponseCacheEntry]
+    ):
+        fixtureFile = self.__getFixtureFile(key)
+        responsesJson: list[dict[str, Any]] = list()
+
+        for entry in entries:
+            responsesJson.append({
+                'body': base64.b64encode(self.__redactBody(entry.body)).decode('ascii'),
+                'headers': self.__redactHeaders(entry.headers),
+                'networkClientType': entry.networkClientType.toStr(),
+                'statusCode': entry.statusCode
+            })
+
+        if requestJson is not None:
+            requestJson = self.__redactJson(requestJson)
+
+        jsonContents: dict[str, Any] = {
+            'method': method.upper(),
+            'requestJson': requestJson,
+            'responses': responsesJson,
+            'url': self.__redactUrl(url)
+        }
+
+        try:
+            if not await aiofiles.ospath.exists(self.__fixtureDirectory):
+                await aiofiles.os.makedirs(self.__fixtureDirectory, exist_ok = True)
+
+            async with aiofiles.open(fixtureFile, mode = 'w', encoding = 'utf-8') as file:
+                await file.write(json.dumps(jsonContents, indent = 4, sort_keys = True))
+        except Exception as e:
+            self.__timber.log('NetworkFixtureRepository', f'Unable to write network fixture to \"{fixtureFile}\": {e}', e, traceback.format_exc())
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+
+
+class NetworkFixtureRepositoryInterface(ABC):
+
+    @abstractmethod
+    async def record(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None,
+        entry: NetworkResponseCacheEntry
+    ):
+        pass
+
+    @abstractmethod
+    async def replay(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None
+    ) -> NetworkResponseCacheEntry | None:
+        pass
@@ -0,0 +1,183 @@
+import asyncio
+import re
+from collections import defaultdict
+from typing import Pattern
+from urllib.parse import urlparse
+
+import CynanBot.misc.utils as utils
+from CynanBot.misc.backgroundTaskHelperInterface import \
+    BackgroundTaskHelperInterface
+from CynanBot.misc.latencyHistogram import LatencyHistogram
+from CynanBot.network.networkEndpointMetrics import NetworkEndpointMetrics
+from CynanBot.network.networkMetricsTrackerInterface import \
+    NetworkMetricsTrackerInterface
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class NetworkMetricsTracker(NetworkMetricsTrackerInterface):
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        timber: TimberInterface,
+        maxRoutesPerHost: int = 32,
+        summarySleepTimeSeconds: float = 900,
+        summarySize: int = 10
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(maxRoutesPerHost):
+            raise TypeError(f'maxRoutesPerHost argument is malformed: \"{maxRoutesPerHost}\"')
+        elif maxRoutesPerHost < 1 or maxRoutesPerHost > 1024:
+            raise ValueError(f'maxRoutesPerHost argument is out of bounds: {maxRoutesPerHost}')
+        elif not utils.isValidNum(summarySleepTimeSeconds):
+            raise TypeError(f'summarySleepTimeSeconds argument is malformed: \"{summarySleepTimeSeconds}\"')
+        elif summarySleepTimeSeconds < 30 or summarySleepTimeSeconds > 86400:
+            raise ValueError(f'summarySleepTimeSeconds argument is out of bounds: {summarySleepTimeSeconds}')
+        elif not utils.isValidInt(summarySize):
+            raise TypeError(f'summarySize argument is malformed: \"{summarySize}\"')
+        elif summarySize < 1 or summarySize > 100:
+            raise ValueError(f'summarySize argument is out of bounds: {summarySize}')
+
+        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
+        self.__timber: TimberInterface = timber
+        self.__maxRoutesPerHost: int = maxRoutesPerHost
+        self.__summarySleepTimeSeconds: float = summarySleepTimeSeconds
+        self.__summarySize: int = summarySize
+
+        self.__isStarted: bool = False
+        self.__bytesTransferred: dict[tuple[str, str, str], int] = defaultdict(lambda: 0)
+        self.__errorCounts: dict[tuple[str, str, str], int] = defaultdict(lambda: 0)
+        self.__histograms: dict[tuple[str, str, str], LatencyHistogram] = dict()
+        self.__hostRouteCounts: dict[str, int] = defaultdict(lambda: 0)
+        self.__statusCodeCounts: dict[tuple[str, str, str], dict[int, int]] = defaultdict(lambda: defaultdict(lambda: 0))
+        self.__timeoutCounts: dict[tuple[str, str, str], int] = defaultdict(lambda: 0)
+
+        self.__idSegmentRegEx: Pattern = re.compile(r'^(\d+|[0-9a-f]{8}-[0-9a-f-]{27,}|(?=[a-z]*\d)[a-z0-9_\-]{16,})$', re.IGNORECASE)
+
+    def getEndpointMetrics(self) -> list[NetworkEndpointMetrics]:
+        metrics: list[NetworkEndpointMetrics] = list()
+
+        for key, histogram in self.__histograms.items():
+            host, method, route = key
+
+            metrics.append(NetworkEndpointMetrics(
+                averageSeconds = histogram.getAverageSeconds(),
+                maxSeconds = histogram.getMaxSeconds(),
+                p50Seconds = histogram.getPercentileSeconds(50),
+                p95Seconds = histogram.getPercentileSeconds(95),
+                totalSeconds = histogram.getTotalSeconds(),
+                statusCodeCounts = dict(self.__statusCodeCounts[key]),
+                bytesTransferred = self.__bytesTransferred[key],
+                callCount = histogram.getCount(),
+                errorCount = self.__errorCounts[key],
+                timeoutCount = self.__timeoutCounts[key],
+                host = host,
+                method = method,
+                route = route
+            ))
+
+        metrics.sort(key = lambda metric: metric.totalSeconds, reverse = True)
+        return metrics
+
+    def __logSummary(self):
+        endpointMetrics = self.getEndpointMetrics()
+
+        if len(endpointMetrics) == 0:
+            return
+
+        totalCalls = sum(metric.callCount for metric in endpointMetrics)
+        self.__timber.log('NetworkMetricsTracker', f'Network summary: {totalCalls} request(s) across {len(endpointMetrics)} distinct endpoint(s), top {min(self.__summarySize, len(endpointMetrics))} by total time:')
+
+        for metric in endpointMetrics[:self.__summarySize]:
+            self.__timber.log('NetworkMetricsTracker', f'{metric.method} {metric.host}{metric.route} — {metric.callCount} request(s), total {metric.totalSeconds * 1000:.1f}ms, avg {metric.averageSeconds * 1000:.1f}ms, p95 {metric.p95Seconds * 1000:.1f}ms, max {metric.maxSeconds * 1000:.1f}ms, {metric.bytesTransferred} byte(s), {metric.errorCount} error(s), {metric.timeoutCount} timeout(s), status codes {metric.statusCodeCounts}')
+
+    def __normalizeRoute(self, path: str) -> str:
+        # user IDs, message IDs, and the like would otherwise turn every request into its own endpoint
+        segments: list[str] = list()
+
+        for segment in path.split('/'):
+            if self.__idSegmentRegEx.fullmatch(segment) is None:
+                segments.append(segment)
+            else:
+                segments.append('{id}')
+
+        route = '/'.join(segments)
+
+        if utils.isValidStr(route):
+            return route
+        else:
+            return '/'
+
+    def recordRequest(
+        self,
+        method: str,
+        url: str,
+        statusCode: int | None,
+        bytesTransferred: int,
+        seconds: float,
+        isTimeout: bool
+    ):
+        if not utils.isValidStr(method):
+            raise TypeError(f'method argument is malformed: \"{method}\"')
+        elif not utils.isValidStr(url):
+            raise TypeError(f'url argument is malformed: \"{url}\"')
+        elif statusCode is not None and not utils.isValidInt(statusCode):
+            raise TypeError(f'statusCode argument is malformed: \"{statusCode}\"')
+        elif not utils.isValidInt(bytesTransferred):
+            raise TypeError(f'bytesTransferred argument is malformed: \"{bytesTransferred}\"')
+        elif not utils.isValidNum(seconds):
+            raise TypeError(f'seconds argument is malformed: \"{seconds}\"')
+        elif not utils.isValidBool(isTimeout):
+            raise TypeError(f'isTimeout argument is malformed: \"{isTimeout}\"')
+
+        parsedUrl = urlparse(url)
+        host = parsedUrl.hostname
+
+        if not utils.isValidStr(host):
+            host = 'unknown'
+
+        host = host.lower()
+        key = (host, method.upper(), self.__normalizeRoute(parsedUrl.path))
+        histogram = self.__histograms.get(key, None)
+
+        if histogram is None:
+            # name segments (Pokémon, usernames, and so on) can't be told apart from static ones, so
+            # routes past the per host limit share a single endpoint rather than growing without bound
+            if self.__hostRouteCounts[host] >= self.__maxRoutesPerHost:
+                key = (host, key[1], '/{other}')
+                histogram = self.__histograms.get(key, None)
+            else:
+                self.__hostRouteCounts[host] = self.__hostRouteCounts[host] + 1
+
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.__histograms[key] = histogram
+
+        histogram.record(seconds)
+        self.__bytesTransferred[key] = self.__bytesTransferred[key] + max(0, bytesTransferred)
+
+        if statusCode is None:
+            self.__errorCounts[key] = self.__errorCounts[key] + 1
+        else:
+            statusCodeCounts = self.__statusCodeCounts[key]
+            statusCodeCounts[statusCode] = statusCodeCounts[statusCode] + 1
+
+        if isTimeout:
+            self.__timeoutCounts[key] = self.__timeoutCounts[key] + 1
+
+    def start(self):
+        if self.__isStarted:
+            self.__timber.log('NetworkMetricsTracker', 'Not starting NetworkMetricsTracker as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__timber.log('NetworkMetricsTracker', 'Starting NetworkMetricsTracker...')
+        self.__backgroundTaskHelper.createTask(self.__startSummaryLoop())
+
+    async def __startSummaryLoop(self):
+        while True:
+            await asyncio.sleep(self.__summarySleepTimeSeconds)
+            self.__logSummary()
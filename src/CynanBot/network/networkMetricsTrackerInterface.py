@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from CynanBot.network.networkEndpointMetrics import NetworkEndpointMetrics
+
+
+class NetworkMetricsTrackerInterface(ABC):
+
+    @abstractmethod
+    def getEndpointMetrics(self) -> list[NetworkEndpointMetrics]:
+        pass
+
+    @abstractmethod
+    def recordRequest(
+        self,
+        method: str,
+        url: str,
+        statusCode: int | None,
+        bytesTransferred: int,
+        seconds: float,
+        isTimeout: bool
+    ):
+        pass
+
+    @abstractmethod
+    def start(self):
+        pass
@@ -0,0 +1,9 @@
+from enum import auto
+
+from CynanBot.misc.enumWithToFromStr import EnumWithToFromStr
+
+
+class NetworkRecordReplayMode(EnumWithToFromStr):
+
+    RECORD = auto()
+    REPLAY = auto()
@@ -14,6 +14,10 @@ class NetworkResponse(ABC):
     def getNetworkClientType(self) -> NetworkClientType:
         pass
 
+    @abstractmethod
+    def getHeaders(self) -> dict[str, str]:
+        pass
+
     @abstractmethod
     def getStatusCode(self) -> int:
         pass
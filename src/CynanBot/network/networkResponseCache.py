@@ -0,0 +1,245 @@
+import asyncio
+import base64
+import hashlib
+import json
+import time
+import traceback
+from datetime import timedelta
+from typing import Any
+
+import aiofiles
+import aiofiles.os
+import aiofiles.ospath
+from lru import LRU
+
+import CynanBot.misc.utils as utils
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+from CynanBot.network.networkResponseCacheInterface import \
+    NetworkResponseCacheInterface
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class NetworkResponseCache(NetworkResponseCacheInterface):
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        cacheDirectory: str | None = 'networkResponseCache',
+        maxDiskCacheEntries: int = 1024,
+        memoryCacheSize: int = 256,
+        diskCacheTimeToLive: timedelta = timedelta(days = 7)
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif cacheDirectory is not None and not utils.isValidStr(cacheDirectory):
+            raise TypeError(f'cacheDirectory argument is malformed: \"{cacheDirectory}\"')
+        elif not utils.isValidInt(maxDiskCacheEntries):
+            raise TypeError(f'maxDiskCacheEntries argument is malformed: \"{maxDiskCacheEntries}\"')
+        elif maxDiskCacheEntries < 4 or maxDiskCacheEntries > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxDiskCacheEntries argument is out of bounds: {maxDiskCacheEntries}')
+        elif not utils.isValidInt(memoryCacheSize):
+            raise TypeError(f'memoryCacheSize argument is malformed: \"{memoryCacheSize}\"')
+        elif memoryCacheSize < 1 or memoryCacheSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'memoryCacheSize argument is out of bounds: {memoryCacheSize}')
+        elif not isinstance(diskCacheTimeToLive, timedelta):
+            raise TypeError(f'diskCacheTimeToLive argument is malformed: \"{diskCacheTimeToLive}\"')
+
+        self.__timber: TimberInterface = timber
+        self.__cacheDirectory: str | None = cacheDirectory
+        self.__maxDiskCacheEntries: int = maxDiskCacheEntries
+        self.__diskCacheTimeToLive: timedelta = diskCacheTimeToLive
+
+        self.__credentialHeaderNames: frozenset[str] = frozenset({ 'authorization', 'x-api-key' })
+        self.__diskCacheEntryCount: int | None = None
+        self.__pruneLock: asyncio.Lock = asyncio.Lock()
+
+        self.__memoryCache: LRU[str, NetworkResponseCacheEntry] = LRU(memoryCacheSize)
+
+    async def clearCaches(self):
+        self.__memoryCache.clear()
+        self.__timber.log('NetworkResponseCache', 'Caches cleared')
+
+    def __createKey(self, url: str, headers: dict[str, Any] | None) -> str:
+        # responses such as Twitch's depend on the access token, so request headers are part of the key
+        keyParts: list[str] = [ url ]
+
+        if headers is not None:
+            for key in sorted(headers.keys(), key = lambda key: key.lower()):
+                value = str(headers[key])
+
+                if key.lower() in self.__credentialHeaderNames:
+                    # never let a raw credential end up in the key material
+                    value = hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+                keyParts.append(f'{key.lower()}:{value}')
+
+        return hashlib.sha256('\n'.join(keyParts).encode('utf-8')).hexdigest()
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, Any] | None
+    ) -> NetworkResponseCacheEntry | None:
+        if not utils.isValidStr(url):
+            raise TypeError(f'url argument is malformed: \"{url}\"')
+        elif headers is not None and not isinstance(headers, dict):
+            raise TypeError(f'headers argument is malformed: \"{headers}\"')
+
+        key = self.__createKey(url, headers)
+        entry = self.__memoryCache.get(key, None)
+
+        if entry is not None:
+            return entry
+
+        entry = await self.__readFromDisk(key, url)
+
+        if entry is not None:
+            self.__memoryCache[key] = entry
+
+        return entry
+
+    def __getCacheFile(self, key: str) -> str | None:
+        if self.__cacheDirectory is None:
+            return None
+
+        return f'{self.__cacheDirectory}/{key}.json'
+
+    async def put(
+        self,
+        headers: dict[str, Any] | None,
+        entry: NetworkResponseCacheEntry
+    ):
+        if headers is not None and not isinstance(headers, dict):
+            raise TypeError(f'headers argument is malformed: \"{headers}\"')
+        elif not isinstance(entry, NetworkResponseCacheEntry):
+            raise TypeError(f'entry argument is malformed: \"{entry}\"')
+
+        key = self.__createKey(entry.url, headers)
+        self.__memoryCache[key] = entry
+        await self.__writeToDisk(key, entry)
+
+    async def __pruneDisk(self, cacheDirectory: str):
+        async with self.__pruneLock:
+            now = time.time()
+            timeToLiveSeconds = self.__diskCacheTimeToLive.total_seconds()
+            cacheFiles: list[tuple[float, str]] = list()
+
+            for fileName in await aiofiles.os.listdir(cacheDirectory):
+                if not fileName.endswith('.json'):
+                    continue
+
+                cacheFile = f'{cacheDirectory}/{fileName}'
+                modifiedAt = await aiofiles.ospath.getmtime(cacheFile)
+
+                if modifiedAt + timeToLiveSeconds < now:
+                    await aiofiles.os.remove(cacheFile)
+                else:
+                    cacheFiles.append((modifiedAt, cacheFile))
+
+            # evict down to three quarters of the limit so that pruning doesn't run on every write
+            cacheFiles.sort()
+            evictionCount = 0
+
+            if len(cacheFiles) > self.__maxDiskCacheEntries:
+                evictionCount = len(cacheFiles) - (self.__maxDiskCacheEntries * 3) // 4
+
+            for _, cacheFile in cacheFiles[:evictionCount]:
+                await aiofiles.os.remove(cacheFile)
+
+            self.__diskCacheEntryCount = len(cacheFiles) - evictionCount
+
+            if evictionCount >= 1:
+                self.__timber.log('NetworkResponseCache', f'Evicted {evictionCount} cached network response(s) from disk')
+
+    async def __readFromDisk(self, key: str, url: str) -> NetworkResponseCacheEntry | None:
+        cacheFile = self.__getCacheFile(key)
+
+        if cacheFile is None or not await aiofiles.ospath.exists(cacheFile):
+            return None
+
+        try:
+            if await aiofiles.ospath.getmtime(cacheFile) + self.__diskCacheTimeToLive.total_seconds() < time.time():
+                await self.__removeFromDisk(cacheFile)
+                return None
+
+            async with aiofiles.open(cacheFile, mode = 'r', encoding = 'utf-8') as file:
+                data = await file.read()
+
+            jsonContents: dict[str, Any] = json.loads(data)
+            expiresAt: float | None = jsonContents.get('expiresAt', None)
+
+            return NetworkResponseCacheEntry(
+                body = base64.b64decode(utils.getStrFromDict(jsonContents, 'body', clean = False, fallback = '')),
+                expiresAt = expiresAt,
+                headers = jsonContents['headers'],
+                networkClientType = NetworkClientType.fromStr(utils.getStrFromDict(jsonContents, 'networkClientType')),
+                statusCode = utils.getIntFromDict(jsonContents, 'statusCode'),
+                url = url
+            )
+        except Exception as e:
+            self.__timber.log('NetworkResponseCache', f'Unable to read cached network response from \"{cacheFile}\": {e}', e, traceback.format_exc())
+            return None
+
+    async def remove(
+        self,
+        url: str,
+        headers: dict[str, Any] | None
+    ):
+        if not utils.isValidStr(url):
+            raise TypeError(f'url argument is malformed: \"{url}\"')
+        elif headers is not None and not isinstance(headers, dict):
+            raise TypeError(f'headers argument is malformed: \"{headers}\"')
+
+        key = self.__createKey(url, headers)
+
+        if key in self.__memoryCache:
+            del self.__memoryCache[key]
+
+        cacheFile = self.__getCacheFile(key)
+
+        if cacheFile is not None and await aiofiles.ospath.exists(cacheFile):
+            await self.__removeFromDisk(cacheFile)
+
+    async def __removeFromDisk(self, cacheFile: str):
+        await aiofiles.os.remove(cacheFile)
+
+        if self.__diskCacheEntryCount is not None:
+            self.__diskCacheEntryCount = max(0, self.__diskCacheEntryCount - 1)
+
+    async def __writeToDisk(self, key: str, entry: NetworkResponseCacheEntry):
+        cacheDirectory = self.__cacheDirectory
+        cacheFile = self.__getCacheFile(key)
+
+        if cacheDirectory is None or cacheFile is None:
+            return
+
+        # the url is not persisted as its query parameters can contain credentials
+        jsonContents: dict[str, Any] = {
+            'body': base64.b64encode(entry.body).decode('ascii'),
+            'expiresAt': entry.expiresAt,
+            'headers': entry.headers,
+            'networkClientType': entry.networkClientType.toStr(),
+            'statusCode': entry.statusCode
+        }
+
+        try:
+            if not await aiofiles.ospath.exists(cacheDirectory):
+                await aiofiles.os.makedirs(cacheDirectory, exist_ok = True)
+
+            if self.__diskCacheEntryCount is None:
+                await self.__pruneDisk(cacheDirectory)
+
+            isNewFile = not await aiofiles.ospath.exists(cacheFile)
+
+            async with aiofiles.open(cacheFile, mode = 'w', encoding = 'utf-8') as file:
+                await file.write(json.dumps(jsonContents))
+
+            if isNewFile and self.__diskCacheEntryCount is not None:
+                self.__diskCacheEntryCount += 1
+
+                if self.__diskCacheEntryCount > self.__maxDiskCacheEntries:
+                    await self.__pruneDisk(cacheDirectory)
+        except Exception as e:
+            self.__timber.log('NetworkResponseCache', f'Unable to write cached network response to \"{cacheFile}\": {e}', e, traceback.format_exc())
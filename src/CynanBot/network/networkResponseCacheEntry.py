@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from CynanBot.network.networkClientType import NetworkClientType
+
+
+@dataclass(frozen = True)
+class NetworkResponseCacheEntry():
+    body: bytes
+    expiresAt: float | None
+    headers: dict[str, str]
+    networkClientType: NetworkClientType
+    statusCode: int
+    url: str
+
+    def getETag(self) -> str | None:
+        return self.headers.get('etag', None)
+
+    def getLastModified(self) -> str | None:
+        return self.headers.get('last-modified', None)
+
+    def hasValidators(self) -> bool:
+        return self.getETag() is not None or self.getLastModified() is not None
+
+    def isFresh(self, now: float) -> bool:
+        return self.expiresAt is not None and now < self.expiresAt
@@ -0,0 +1,33 @@
+from abc import abstractmethod
+from typing import Any
+
+from CynanBot.misc.clearable import Clearable
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+
+
+class NetworkResponseCacheInterface(Clearable):
+
+    @abstractmethod
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, Any] | None
+    ) -> NetworkResponseCacheEntry | None:
+        pass
+
+    @abstractmethod
+    async def put(
+        self,
+        headers: dict[str, Any] | None,
+        entry: NetworkResponseCacheEntry
+    ):
+        pass
+
+    @abstractmethod
+    async def remove(
+        self,
+        url: str,
+        headers: dict[str, Any] | None
+    ):
+        pass
@@ -0,0 +1,84 @@
+import random
+
+import CynanBot.misc.utils as utils
+from CynanBot.network.networkClientProvider import NetworkClientProvider
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkFixtureRepositoryInterface import \
+    NetworkFixtureRepositoryInterface
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkRecordReplayMode import NetworkRecordReplayMode
+from CynanBot.network.recordReplayNetworkHandle import \
+    RecordReplayNetworkHandle
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class RecordReplayNetworkClientProvider(NetworkClientProvider):
+
+    def __init__(
+        self,
+        networkClientProvider: NetworkClientProvider | None,
+        networkFixtureRepository: NetworkFixtureRepositoryInterface,
+        networkRecordReplayMode: NetworkRecordReplayMode,
+        timber: TimberInterface,
+        networkClientType: NetworkClientType = NetworkClientType.AIOHTTP,
+        errorRate: float = 0,
+        latencySeconds: float = 0,
+        randomSeed: int | None = None
+    ):
+        if networkClientProvider is not None and not isinstance(networkClientProvider, NetworkClientProvider):
+            raise TypeError(f'networkClientProvider argument is malformed: \"{networkClientProvider}\"')
+        elif not isinstance(networkFixtureRepository, NetworkFixtureRepositoryInterface):
+            raise TypeError(f'networkFixtureRepository argument is malformed: \"{networkFixtureRepository}\"')
+        elif not isinstance(networkRecordReplayMode, NetworkRecordReplayMode):
+            raise TypeError(f'networkRecordReplayMode argument is malformed: \"{networkRecordReplayMode}\"')
+        elif networkRecordReplayMode is NetworkRecordReplayMode.RECORD and networkClientProvider is None:
+            raise ValueError(f'networkClientProvider argument can\'t be None when recording ({networkClientProvider=})')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(networkClientType, NetworkClientType):
+            raise TypeError(f'networkClientType argument is malformed: \"{networkClientType}\"')
+        elif not utils.isValidNum(errorRate):
+            raise TypeError(f'errorRate argument is malformed: \"{errorRate}\"')
+        elif errorRate < 0 or errorRate > 1:
+            raise ValueError(f'errorRate argument is out of bounds: {errorRate}')
+        elif not utils.isValidNum(latencySeconds):
+            raise TypeError(f'latencySeconds argument is malformed: \"{latencySeconds}\"')
+        elif latencySeconds < 0 or latencySeconds > 60:
+            raise ValueError(f'latencySeconds argument is out of bounds: {latencySeconds}')
+        elif randomSeed is not None and not utils.isValidInt(randomSeed):
+            raise TypeError(f'randomSeed argument is malformed: \"{randomSeed}\"')
+
+        self.__networkClientProvider: NetworkClientProvider | None = networkClientProvider
+        self.__networkFixtureRepository: NetworkFixtureRepositoryInterface = networkFixtureRepository
+        self.__networkRecordReplayMode: NetworkRecordReplayMode = networkRecordReplayMode
+        self.__timber: TimberInterface = timber
+        self.__networkClientType: NetworkClientType = networkClientType
+        self.__errorRate: float = errorRate
+        self.__latencySeconds: float = latencySeconds
+
+        self.__random: random.Random = random.Random(randomSeed)
+
+    async def get(self) -> NetworkHandle:
+        networkHandle: NetworkHandle | None = None
+
+        if self.__networkRecordReplayMode is NetworkRecordReplayMode.RECORD and self.__networkClientProvider is not None:
+            networkHandle = await self.__networkClientProvider.get()
+
+        return RecordReplayNetworkHandle(
+            networkFixtureRepository = self.__networkFixtureRepository,
+            networkHandle = networkHandle,
+            networkRecordReplayMode = self.__networkRecordReplayMode,
+            randomGenerator = self.__random,
+            timber = self.__timber,
+            networkClientType = self.getNetworkClientType(),
+            errorRate = self.__errorRate,
+            latencySeconds = self.__latencySeconds
+        )
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        networkClientProvider = self.__networkClientProvider
+
+        if networkClientProvider is None:
+            return self.__networkClientType
+        else:
+            return networkClientProvider.getNetworkClientType()
@@ -0,0 +1,166 @@
+import asyncio
+import random
+from typing import Any, Awaitable, Callable
+
+import CynanBot.misc.utils as utils
+from CynanBot.network.cachedNetworkResponse import CachedNetworkResponse
+from CynanBot.network.exceptions import GenericNetworkException
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkFixtureRepositoryInterface import \
+    NetworkFixtureRepositoryInterface
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkRecordReplayMode import NetworkRecordReplayMode
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class RecordReplayNetworkHandle(NetworkHandle):
+
+    def __init__(
+        self,
+        networkFixtureRepository: NetworkFixtureRepositoryInterface,
+        networkHandle: NetworkHandle | None,
+        networkRecordReplayMode: NetworkRecordReplayMode,
+        randomGenerator: random.Random,
+        timber: TimberInterface,
+        networkClientType: NetworkClientType,
+        errorRate: float,
+        latencySeconds: float
+    ):
+        if not isinstance(networkFixtureRepository, NetworkFixtureRepositoryInterface):
+            raise TypeError(f'networkFixtureRepository argument is malformed: \"{networkFixtureRepository}\"')
+        elif networkHandle is not None and not isinstance(networkHandle, NetworkHandle):
+            raise TypeError(f'networkHandle argument is malformed: \"{networkHandle}\"')
+        elif not isinstance(networkRecordReplayMode, NetworkRecordReplayMode):
+            raise TypeError(f'networkRecordReplayMode argument is malformed: \"{networkRecordReplayMode}\"')
+        elif networkRecordReplayMode is NetworkRecordReplayMode.RECORD and networkHandle is None:
+            raise ValueError(f'networkHandle argument can\'t be None when recording ({networkHandle=})')
+        elif not isinstance(randomGenerator, random.Random):
+            raise TypeError(f'randomGenerator argument is malformed: \"{randomGenerator}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(networkClientType, NetworkClientType):
+            raise TypeError(f'networkClientType argument is malformed: \"{networkClientType}\"')
+        elif not utils.isValidNum(errorRate):
+            raise TypeError(f'errorRate argument is malformed: \"{errorRate}\"')
+        elif not utils.isValidNum(latencySeconds):
+            raise TypeError(f'latencySeconds argument is malformed: \"{latencySeconds}\"')
+
+        self.__networkFixtureRepository: NetworkFixtureRepositoryInterface = networkFixtureRepository
+        self.__networkHandle: NetworkHandle | None = networkHandle
+        self.__networkRecordReplayMode: NetworkRecordReplayMode = networkRecordReplayMode
+        self.__random: random.Random = randomGenerator
+        self.__timber: TimberInterface = timber
+        self.__networkClientType: NetworkClientType = networkClientType
+        self.__errorRate: float = errorRate
+        self.__latencySeconds: float = latencySeconds
+
+    async def delete(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            method = 'DELETE',
+            url = url,
+            json = None,
+            function = lambda networkHandle: networkHandle.delete(url, headers)
+        )
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            method = 'GET',
+            url = url,
+            json = None,
+            function = lambda networkHandle: networkHandle.get(url, headers)
+        )
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return self.__networkClientType
+
+    async def post(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            method = 'POST',
+            url = url,
+            json = json,
+            function = lambda networkHandle: networkHandle.post(url, headers, json)
+        )
+
+    async def __record(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None,
+        function: Callable[[NetworkHandle], Awaitable[NetworkResponse]]
+    ) -> NetworkResponse:
+        networkHandle = self.__networkHandle
+
+        if networkHandle is None:
+            raise RuntimeError(f'networkHandle is None, so unable to record ({method=}) ({url=})')
+
+        response = await function(networkHandle)
+        body = await response.read()
+
+        entry = NetworkResponseCacheEntry(
+            body = body,
+            expiresAt = None,
+            headers = response.getHeaders(),
+            networkClientType = response.getNetworkClientType(),
+            statusCode = response.getStatusCode(),
+            url = url
+        )
+
+        await response.close()
+        await self.__networkFixtureRepository.record(method, url, json, entry)
+
+        return CachedNetworkResponse(
+            entry = entry,
+            timber = self.__timber
+        )
+
+    async def __replay(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None
+    ) -> NetworkResponse:
+        # the same random instance is shared by every handle, so a seeded replay injects the same latency and errors each run
+        if self.__latencySeconds > 0:
+            await asyncio.sleep(self.__random.uniform(self.__latencySeconds / 2, self.__latencySeconds * 1.5))
+
+        if self.__errorRate > 0 and self.__random.random() < self.__errorRate:
+            raise GenericNetworkException(f'Injected network error when replaying ({method=}) ({url=}) ({self.__errorRate=})')
+
+        entry = await self.__networkFixtureRepository.replay(method, url, json)
+
+        if entry is None:
+            self.__timber.log('RecordReplayNetworkHandle', f'No recorded network fixture is available ({method=}) ({url=})')
+            raise GenericNetworkException(f'No recorded network fixture is available ({method=}) ({url=})')
+
+        return CachedNetworkResponse(
+            entry = entry,
+            timber = self.__timber
+        )
+
+    async def __request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None,
+        function: Callable[[NetworkHandle], Awaitable[NetworkResponse]]
+    ) -> NetworkResponse:
+        if self.__networkRecordReplayMode is NetworkRecordReplayMode.RECORD:
+            return await self.__record(method, url, json, function)
+        else:
+            return await self.__replay(method, url, json)
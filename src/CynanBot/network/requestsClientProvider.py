@@ -1,7 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
 import CynanBot.misc.utils as utils
 from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.network.networkClientType import NetworkClientType
 from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkMetricsTrackerInterface import \
+    NetworkMetricsTrackerInterface
 from CynanBot.network.requestsHandle import RequestsHandle
 from CynanBot.timber.timberInterface import TimberInterface
 
@@ -11,23 +18,69 @@ class RequestsClientProvider(NetworkClientProvider):
     def __init__(
         self,
         timber: TimberInterface,
-        timeoutSeconds: int = 8
+        networkMetricsTracker: NetworkMetricsTrackerInterface | None = None,
+        timeoutSeconds: int = 8,
+        maxWorkers: int = 8
     ):
         if not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif networkMetricsTracker is not None and not isinstance(networkMetricsTracker, NetworkMetricsTrackerInterface):
+            raise TypeError(f'networkMetricsTracker argument is malformed: \"{networkMetricsTracker}\"')
         elif not utils.isValidInt(timeoutSeconds):
             raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
         elif timeoutSeconds < 3 or timeoutSeconds > 16:
             raise ValueError(f'timeoutSeconds argument is out of bounds: {timeoutSeconds}')
+        elif not utils.isValidInt(maxWorkers):
+            raise TypeError(f'maxWorkers argument is malformed: \"{maxWorkers}\"')
+        elif maxWorkers < 1 or maxWorkers > 64:
+            raise ValueError(f'maxWorkers argument is out of bounds: {maxWorkers}')
 
         self.__timber: TimberInterface = timber
+        self.__networkMetricsTracker: NetworkMetricsTrackerInterface | None = networkMetricsTracker
         self.__timeoutSeconds: int = timeoutSeconds
+        self.__maxWorkers: int = maxWorkers
+
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__session: requests.Session | None = None
 
     async def get(self) -> NetworkHandle:
         return RequestsHandle(
+            executor = self.__getExecutor(),
+            session = self.__getSession(),
             timber = self.__timber,
+            networkMetricsTracker = self.__networkMetricsTracker,
             timeoutSeconds = self.__timeoutSeconds
         )
 
+    def __getExecutor(self) -> ThreadPoolExecutor:
+        executor = self.__executor
+
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers = self.__maxWorkers,
+                thread_name_prefix = 'RequestsClientProvider'
+            )
+
+            self.__executor = executor
+
+        return executor
+
     def getNetworkClientType(self) -> NetworkClientType:
         return NetworkClientType.REQUESTS
+
+    def __getSession(self) -> requests.Session:
+        session = self.__session
+
+        if session is None:
+            # one connection per worker thread lets every in-flight request reuse a kept-alive connection
+            adapter = HTTPAdapter(
+                pool_connections = self.__maxWorkers,
+                pool_maxsize = self.__maxWorkers
+            )
+
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.__session = session
+
+        return session
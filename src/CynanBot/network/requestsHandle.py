@@ -1,3 +1,7 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
 
 import requests
@@ -7,6 +11,8 @@ import CynanBot.misc.utils as utils
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.network.networkClientType import NetworkClientType
 from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkMetricsTrackerInterface import \
+    NetworkMetricsTrackerInterface
 from CynanBot.network.networkResponse import NetworkResponse
 from CynanBot.network.requestsResponse import RequestsResponse
 from CynanBot.timber.timberInterface import TimberInterface
@@ -16,17 +22,29 @@ class RequestsHandle(NetworkHandle):
 
     def __init__(
         self,
+        executor: ThreadPoolExecutor,
+        session: requests.Session,
         timber: TimberInterface,
+        networkMetricsTracker: NetworkMetricsTrackerInterface | None = None,
         timeoutSeconds: int = 8
     ):
-        if not isinstance(timber, TimberInterface):
+        if not isinstance(executor, ThreadPoolExecutor):
+            raise TypeError(f'executor argument is malformed: \"{executor}\"')
+        elif not isinstance(session, requests.Session):
+            raise TypeError(f'session argument is malformed: \"{session}\"')
+        elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif networkMetricsTracker is not None and not isinstance(networkMetricsTracker, NetworkMetricsTrackerInterface):
+            raise TypeError(f'networkMetricsTracker argument is malformed: \"{networkMetricsTracker}\"')
         elif not utils.isValidInt(timeoutSeconds):
             raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
         elif timeoutSeconds < 3 or timeoutSeconds > 16:
             raise ValueError(f'timeoutSeconds argument is out of bounds: {timeoutSeconds}')
 
+        self.__executor: ThreadPoolExecutor = executor
+        self.__session: requests.Session = session
         self.__timber: TimberInterface = timber
+        self.__networkMetricsTracker: NetworkMetricsTrackerInterface | None = networkMetricsTracker
         self.__timeoutSeconds: int = timeoutSeconds
 
     async def delete(
@@ -35,14 +53,17 @@ class RequestsHandle(NetworkHandle):
         headers: dict[str, Any] | None = None
     ) -> NetworkResponse:
         response: Response | None = None
+        start = time.perf_counter()
 
         try:
-            response = requests.delete(
+            response = await self.__runInExecutor(partial(
+                self.__session.delete,
                 url = url,
                 headers = headers,
                 timeout = self.__timeoutSeconds
-            )
+            ))
         except Exception as e:
+            self.__recordMetrics(method = 'DELETE', url = url, statusCode = None, bytesTransferred = 0, start = start, isTimeout = isinstance(e, requests.exceptions.Timeout))
             self.__timber.log('RequestsHandle', f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\": {e}', e)
             raise GenericNetworkException(f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\": {e}')
 
@@ -50,6 +71,8 @@ class RequestsHandle(NetworkHandle):
             self.__timber.log('RequestsHandle', f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\"')
             raise GenericNetworkException(f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\"')
 
+        self.__recordMetrics(method = 'DELETE', url = url, statusCode = response.status_code, bytesTransferred = len(response.content), start = start)
+
         return RequestsResponse(
             response = response,
             url = url,
@@ -62,14 +85,17 @@ class RequestsHandle(NetworkHandle):
         headers: dict[str, Any] | None = None
     ) -> NetworkResponse:
         response: Response | None = None
+        start = time.perf_counter()
 
         try:
-            response = requests.get(
+            response = await self.__runInExecutor(partial(
+                self.__session.get,
                 url = url,
                 headers = headers,
                 timeout = self.__timeoutSeconds
-            )
+            ))
         except Exception as e:
+            self.__recordMetrics(method = 'GET', url = url, statusCode = None, bytesTransferred = 0, start = start, isTimeout = isinstance(e, requests.exceptions.Timeout))
             self.__timber.log('RequestsHandle', f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\": {e}', e)
             raise GenericNetworkException(f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\": {e}')
 
@@ -77,6 +103,8 @@ class RequestsHandle(NetworkHandle):
             self.__timber.log('RequestsHandle', f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\"')
             raise GenericNetworkException(f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP GET \"{url}\" with headers \"{headers}\"')
 
+        self.__recordMetrics(method = 'GET', url = url, statusCode = response.status_code, bytesTransferred = len(response.content), start = start)
+
         return RequestsResponse(
             response = response,
             url = url,
@@ -93,15 +121,18 @@ class RequestsHandle(NetworkHandle):
         json: dict[str, Any] | None = None
     ) -> NetworkResponse:
         response: Response | None = None
+        start = time.perf_counter()
 
         try:
-            response = requests.post(
+            response = await self.__runInExecutor(partial(
+                self.__session.post,
                 url = url,
                 headers = headers,
                 json = json,
                 timeout = self.__timeoutSeconds
-            )
+            ))
         except Exception as e:
+            self.__recordMetrics(method = 'POST', url = url, statusCode = None, bytesTransferred = 0, start = start, isTimeout = isinstance(e, requests.exceptions.Timeout))
             self.__timber.log('RequestsHandle', f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\": {e}', e)
             raise GenericNetworkException(f'Encountered network error (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\": {e}')
 
@@ -109,8 +140,37 @@ class RequestsHandle(NetworkHandle):
             self.__timber.log('RequestsHandle', f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\"')
             raise GenericNetworkException(f'Received no response (via {self.getNetworkClientType()}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\"')
 
+        self.__recordMetrics(method = 'POST', url = url, statusCode = response.status_code, bytesTransferred = len(response.content), start = start)
+
         return RequestsResponse(
             response = response,
             url = url,
             timber = self.__timber
         )
+
+    def __recordMetrics(
+        self,
+        method: str,
+        url: str,
+        statusCode: int | None,
+        bytesTransferred: int,
+        start: float,
+        isTimeout: bool = False
+    ):
+        networkMetricsTracker = self.__networkMetricsTracker
+
+        if networkMetricsTracker is None:
+            return
+
+        networkMetricsTracker.recordRequest(
+            method = method,
+            url = url,
+            statusCode = statusCode,
+            bytesTransferred = bytesTransferred,
+            seconds = time.perf_counter() - start,
+            isTimeout = isTimeout
+        )
+
+    async def __runInExecutor(self, request: partial[Response]) -> Response:
+        # the requests library is blocking, so it must never run directly on the event loop
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, request)
@@ -0,0 +1,44 @@
+from typing import Any
+
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkResponse import NetworkResponse
+
+
+class FakeNetworkResponse(NetworkResponse):
+
+    def __init__(self, body: bytes, headers: dict[str, str], statusCode: int, url: str):
+        self.__body: bytes = body
+        self.__headers: dict[str, str] = headers
+        self.__statusCode: int = statusCode
+        self.__url: str = url
+        self.__isClosed: bool = False
+
+    async def close(self):
+        self.__isClosed = True
+
+    def getHeaders(self) -> dict[str, str]:
+        return self.__headers
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.AIOHTTP
+
+    def getStatusCode(self) -> int:
+        return self.__statusCode
+
+    def getUrl(self) -> str:
+        return self.__url
+
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    async def json(self) -> dict[str, Any] | list[Any] | None:
+        return None
+
+    async def read(self) -> bytes:
+        return self.__body
+
+    def toDictionary(self) -> dict[str, Any]:
+        return dict()
+
+    async def xml(self) -> dict[str, Any] | list[Any] | None:
+        return None
@@ -0,0 +1,97 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from CynanBot.network.cachingNetworkHandle import CachingNetworkHandle
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.network.networkResponseCache import NetworkResponseCache
+from CynanBot.network.tests.fakeNetworkResponse import FakeNetworkResponse
+from CynanBot.timber.timberStub import TimberStub
+
+
+class FakeNetworkHandle(NetworkHandle):
+
+    def __init__(self, responseHeaders: dict[str, str]):
+        self.responseHeaders: dict[str, str] = responseHeaders
+        self.requests: list[dict[str, Any] | None] = list()
+
+    async def delete(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        raise NotImplementedError()
+
+    async def get(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        self.requests.append(headers)
+
+        if headers is not None and 'If-None-Match' in headers and headers['If-None-Match'] == self.responseHeaders.get('etag', None):
+            return FakeNetworkResponse(b'', dict(), 304, url)
+
+        return FakeNetworkResponse(b'{"hello": "world"}', self.responseHeaders, 200, url)
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.AIOHTTP
+
+    async def post(self, url: str, headers: dict[str, Any] | None = None, json: dict[str, Any] | None = None) -> NetworkResponse:
+        raise NotImplementedError()
+
+
+class TestCachingNetworkHandle():
+
+    url: str = 'https://pokeapi.co/api/v2/pokemon/pikachu'
+
+    def __createHandle(self, fakeNetworkHandle: FakeNetworkHandle, tmp_path: Path) -> CachingNetworkHandle:
+        timber = TimberStub()
+
+        return CachingNetworkHandle(
+            networkHandle = fakeNetworkHandle,
+            networkResponseCache = NetworkResponseCache(
+                timber = timber,
+                cacheDirectory = str(tmp_path)
+            ),
+            timber = timber
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_withETag_revalidates(self, tmp_path: Path):
+        fakeNetworkHandle = FakeNetworkHandle({ 'etag': '"abc"' })
+        handle = self.__createHandle(fakeNetworkHandle, tmp_path)
+
+        for _ in range(3):
+            response = await handle.get(self.url)
+            assert response.getStatusCode() == 200
+            assert await response.json() == { 'hello': 'world' }
+            await response.close()
+
+        assert fakeNetworkHandle.requests == [ None, { 'If-None-Match': '"abc"' }, { 'If-None-Match': '"abc"' } ]
+
+    @pytest.mark.asyncio
+    async def test_get_withMaxAge_isServedFromCache(self, tmp_path: Path):
+        fakeNetworkHandle = FakeNetworkHandle({ 'cache-control': 'public, max-age=60' })
+        handle = self.__createHandle(fakeNetworkHandle, tmp_path)
+
+        for _ in range(3):
+            response = await handle.get(self.url, { 'Client-Id': 'abc' })
+            assert await response.json() == { 'hello': 'world' }
+
+        assert len(fakeNetworkHandle.requests) == 1
+
+        # a new cache pointed at the same directory is served from disk
+        reloadedHandle = self.__createHandle(fakeNetworkHandle, tmp_path)
+        response = await reloadedHandle.get(self.url, { 'Client-Id': 'abc' })
+        assert await response.read() == b'{"hello": "world"}'
+        assert len(fakeNetworkHandle.requests) == 1
+
+        await reloadedHandle.get(self.url, { 'Client-Id': 'xyz' })
+        assert len(fakeNetworkHandle.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_withNoStore_isNotCached(self, tmp_path: Path):
+        fakeNetworkHandle = FakeNetworkHandle({ 'cache-control': 'no-store', 'etag': '"abc"' })
+        handle = self.__createHandle(fakeNetworkHandle, tmp_path)
+
+        for _ in range(2):
+            response = await handle.get(self.url)
+            assert await response.json() == { 'hello': 'world' }
+
+        assert fakeNetworkHandle.requests == [ None, None ]
@@ -0,0 +1,210 @@
+import asyncio
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.network.circuitBreaker import CircuitBreaker
+from CynanBot.network.circuitBreakerNetworkHandle import \
+    CircuitBreakerNetworkHandle
+from CynanBot.network.circuitBreakerState import CircuitBreakerState
+from CynanBot.network.exceptions import (CircuitBreakerOpenException,
+                                         GenericNetworkException)
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.network.tests.fakeNetworkResponse import FakeNetworkResponse
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.trivia.questions.triviaSource import TriviaSource
+from CynanBot.trivia.triviaSourceInstabilityHelper import \
+    TriviaSourceInstabilityHelper
+
+
+class FlakyNetworkHandle(NetworkHandle):
+
+    def __init__(self, statusCodes: list[int | None]):
+        self.statusCodes: list[int | None] = statusCodes
+        self.requestCount: int = 0
+
+    async def delete(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        return await self.get(url, headers)
+
+    async def get(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        statusCode = self.statusCodes[min(self.requestCount, len(self.statusCodes) - 1)]
+        self.requestCount = self.requestCount + 1
+
+        if statusCode is None:
+            raise GenericNetworkException('connection refused')
+
+        return FakeNetworkResponse(b'', dict(), statusCode, url)
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.AIOHTTP
+
+    async def post(self, url: str, headers: dict[str, Any] | None = None, json: dict[str, Any] | None = None) -> NetworkResponse:
+        return await self.get(url, headers)
+
+
+class TestCircuitBreaker():
+
+    def __createCircuitBreaker(self) -> CircuitBreaker:
+        return CircuitBreaker(
+            timber = TimberStub(),
+            timeZoneRepository = TimeZoneRepository(),
+            minimumCalls = 4,
+            windowSize = 10,
+            openTimeDelta = timedelta(milliseconds = 50)
+        )
+
+    @pytest.mark.asyncio
+    async def test_beforeRequest_whenHalfOpen_allowsOneTrial(self):
+        circuitBreaker = self.__createCircuitBreaker()
+
+        for _ in range(4):
+            await circuitBreaker.recordFailure('example.com', 0.1)
+
+        await asyncio.sleep(0.06)
+        await circuitBreaker.beforeRequest('example.com')
+        assert circuitBreaker.getState('example.com') is CircuitBreakerState.HALF_OPEN
+
+        with pytest.raises(CircuitBreakerOpenException):
+            await circuitBreaker.beforeRequest('example.com')
+
+        await circuitBreaker.recordSuccess('example.com', 0.1)
+        assert circuitBreaker.getState('example.com') is CircuitBreakerState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_recordFailure_opensCircuit(self):
+        circuitBreaker = self.__createCircuitBreaker()
+
+        await circuitBreaker.recordSuccess('example.com', 0.1)
+        await circuitBreaker.recordSuccess('example.com', 0.1)
+        await circuitBreaker.recordFailure('example.com', 0.1)
+        assert circuitBreaker.getState('example.com') is CircuitBreakerState.CLOSED
+
+        await circuitBreaker.recordFailure('example.com', 0.1)
+        assert circuitBreaker.getState('example.com') is CircuitBreakerState.OPEN
+        assert circuitBreaker.getState('example.org') is CircuitBreakerState.CLOSED
+
+        with pytest.raises(CircuitBreakerOpenException):
+            await circuitBreaker.beforeRequest('example.com')
+
+        await circuitBreaker.beforeRequest('example.org')
+
+    @pytest.mark.asyncio
+    async def test_recordSuccess_withSlowCalls_opensCircuit(self):
+        circuitBreaker = self.__createCircuitBreaker()
+
+        for _ in range(4):
+            await circuitBreaker.recordSuccess('example.com', 30)
+
+        assert circuitBreaker.getState('example.com') is CircuitBreakerState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_get_retriesThenFailsFast(self):
+        circuitBreaker = self.__createCircuitBreaker()
+        flakyNetworkHandle = FlakyNetworkHandle([ None ])
+
+        networkHandle = CircuitBreakerNetworkHandle(
+            circuitBreaker = circuitBreaker,
+            networkHandle = flakyNetworkHandle,
+            timber = TimberStub(),
+            maxRetryCount = 2,
+            retryBackoffSeconds = 0
+        )
+
+        with pytest.raises(GenericNetworkException):
+            await networkHandle.get('https://example.com/a')
+
+        assert flakyNetworkHandle.requestCount == 3
+
+        with pytest.raises(GenericNetworkException):
+            await networkHandle.get('https://example.com/b')
+
+        assert circuitBreaker.getState('example.com') is CircuitBreakerState.OPEN
+        requestCount = flakyNetworkHandle.requestCount
+
+        with pytest.raises(CircuitBreakerOpenException):
+            await networkHandle.get('https://example.com/c')
+
+        assert flakyNetworkHandle.requestCount == requestCount
+
+    @pytest.mark.asyncio
+    async def test_get_withRateLimit_isNotFailureOrRetried(self):
+        circuitBreaker = self.__createCircuitBreaker()
+        flakyNetworkHandle = FlakyNetworkHandle([ 429 ])
+
+        networkHandle = CircuitBreakerNetworkHandle(
+            circuitBreaker = circuitBreaker,
+            networkHandle = flakyNetworkHandle,
+            timber = TimberStub(),
+            retryBackoffSeconds = 0
+        )
+
+        for _ in range(5):
+            response = await networkHandle.get('https://api.twitch.tv/helix/users')
+            assert response.getStatusCode() == 429
+
+        assert flakyNetworkHandle.requestCount == 5
+        assert circuitBreaker.getState('api.twitch.tv') is CircuitBreakerState.CLOSED
+        assert circuitBreaker.getFailureRate('api.twitch.tv') == 0
+
+    @pytest.mark.asyncio
+    async def test_get_withServerErrorThenSuccess(self):
+        flakyNetworkHandle = FlakyNetworkHandle([ 503, 200 ])
+
+        networkHandle = CircuitBreakerNetworkHandle(
+            circuitBreaker = self.__createCircuitBreaker(),
+            networkHandle = flakyNetworkHandle,
+            timber = TimberStub(),
+            retryBackoffSeconds = 0
+        )
+
+        response = await networkHandle.get('https://example.com')
+        assert response.getStatusCode() == 200
+        assert flakyNetworkHandle.requestCount == 2
+
+    @pytest.mark.asyncio
+    async def test_post_doesNotRetry(self):
+        flakyNetworkHandle = FlakyNetworkHandle([ 503, 200 ])
+
+        networkHandle = CircuitBreakerNetworkHandle(
+            circuitBreaker = self.__createCircuitBreaker(),
+            networkHandle = flakyNetworkHandle,
+            timber = TimberStub(),
+            retryBackoffSeconds = 0
+        )
+
+        response = await networkHandle.post('https://example.com')
+        assert response.getStatusCode() == 503
+        assert flakyNetworkHandle.requestCount == 1
+
+    @pytest.mark.asyncio
+    async def test_setEventListener_withTriviaSourceInstabilityHelper(self):
+        circuitBreaker = self.__createCircuitBreaker()
+
+        triviaSourceInstabilityHelper = TriviaSourceInstabilityHelper(
+            timber = TimberStub(),
+            timeZoneRepository = TimeZoneRepository()
+        )
+
+        circuitBreaker.setEventListener(triviaSourceInstabilityHelper)
+
+        for _ in range(4):
+            await circuitBreaker.recordFailure('opentdb.com', 0.1)
+
+        assert triviaSourceInstabilityHelper.isCircuitOpen(TriviaSource.OPEN_TRIVIA_DATABASE)
+        assert triviaSourceInstabilityHelper[TriviaSource.OPEN_TRIVIA_DATABASE] == 0
+        assert not triviaSourceInstabilityHelper.isCircuitOpen(TriviaSource.QUIZ_API)
+
+        # the source must recover without anything else having made a request to it
+        await asyncio.sleep(0.06)
+        assert not triviaSourceInstabilityHelper.isCircuitOpen(TriviaSource.OPEN_TRIVIA_DATABASE)
+
+        await circuitBreaker.beforeRequest('opentdb.com')
+        assert circuitBreaker.getState('opentdb.com') is CircuitBreakerState.HALF_OPEN
+        assert not triviaSourceInstabilityHelper.isCircuitOpen(TriviaSource.OPEN_TRIVIA_DATABASE)
+
+        await circuitBreaker.recordFailure('opentdb.com', 0.1)
+        assert triviaSourceInstabilityHelper.isCircuitOpen(TriviaSource.OPEN_TRIVIA_DATABASE)
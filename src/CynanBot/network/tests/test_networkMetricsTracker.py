@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from CynanBot.misc.backgroundTaskHelper import BackgroundTaskHelper
+from CynanBot.network.networkMetricsTracker import NetworkMetricsTracker
+from CynanBot.timber.timberStub import TimberStub
+
+
+class TestNetworkMetricsTracker():
+
+    def __createNetworkMetricsTracker(self) -> NetworkMetricsTracker:
+        return NetworkMetricsTracker(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.new_event_loop()),
+            timber = TimberStub()
+        )
+
+    def test_getEndpointMetrics_whenEmpty(self):
+        networkMetricsTracker = self.__createNetworkMetricsTracker()
+        assert networkMetricsTracker.getEndpointMetrics() == list()
+
+    def test_recordRequest(self):
+        networkMetricsTracker = self.__createNetworkMetricsTracker()
+        networkMetricsTracker.recordRequest('GET', 'https://api.twitch.tv/helix/users?login=smashingt', 200, 100, 0.2, False)
+        networkMetricsTracker.recordRequest('GET', 'https://api.twitch.tv/helix/users?id=12345', 200, 50, 0.1, False)
+        networkMetricsTracker.recordRequest('GET', 'https://api.twitch.tv/helix/users', 429, 10, 0.05, False)
+        networkMetricsTracker.recordRequest('GET', 'https://pokeapi.co/api/v2/move/33/', None, 0, 8, True)
+
+        metrics = networkMetricsTracker.getEndpointMetrics()
+        assert len(metrics) == 2
+
+        pokeApiMetrics = metrics[0]
+        assert pokeApiMetrics.host == 'pokeapi.co'
+        assert pokeApiMetrics.route == '/api/v2/move/{id}/'
+        assert pokeApiMetrics.errorCount == 1
+        assert pokeApiMetrics.timeoutCount == 1
+        assert pokeApiMetrics.statusCodeCounts == dict()
+
+        twitchMetrics = metrics[1]
+        assert twitchMetrics.host == 'api.twitch.tv'
+        assert twitchMetrics.method == 'GET'
+        assert twitchMetrics.route == '/helix/users'
+        assert twitchMetrics.callCount == 3
+        assert twitchMetrics.bytesTransferred == 160
+        assert twitchMetrics.errorCount == 0
+        assert twitchMetrics.statusCodeCounts == { 200: 2, 429: 1 }
+        assert twitchMetrics.totalSeconds == pytest.approx(0.35)
+
+    def test_recordRequest_withIdRouteSegments(self):
+        networkMetricsTracker = self.__createNetworkMetricsTracker()
+        networkMetricsTracker.recordRequest('delete', 'https://api.twitch.tv/helix/eventsub/subscriptions/f1c2a387-161a-49f9-a165-0f21d7a4e1c4', 204, 0, 0.1, False)
+        networkMetricsTracker.recordRequest('DELETE', 'https://api.twitch.tv/helix/eventsub/subscriptions/a2b3c4d5-161a-49f9-a165-0f21d7a4e1c4', 204, 0, 0.1, False)
+
+        metrics = networkMetricsTracker.getEndpointMetrics()
+        assert len(metrics) == 1
+        assert metrics[0].method == 'DELETE'
+        assert metrics[0].route == '/helix/eventsub/subscriptions/{id}'
+        assert metrics[0].statusCodeCounts == { 204: 2 }
+
+    def test_recordRequest_withTooManyRoutes(self):
+        networkMetricsTracker = NetworkMetricsTracker(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.new_event_loop()),
+            timber = TimberStub(),
+            maxRoutesPerHost = 2
+        )
+
+        networkMetricsTracker.recordRequest('GET', 'https://pokeapi.co/api/v2/pokemon/pikachu', 200, 0, 0.1, False)
+        networkMetricsTracker.recordRequest('GET', 'https://pokeapi.co/api/v2/pokemon/eevee', 200, 0, 0.1, False)
+        networkMetricsTracker.recordRequest('GET', 'https://pokeapi.co/api/v2/pokemon/snorlax', 200, 0, 0.1, False)
+        networkMetricsTracker.recordRequest('GET', 'https://pokeapi.co/api/v2/pokemon/mew', 200, 0, 0.1, False)
+        networkMetricsTracker.recordRequest('GET', 'https://pokeapi.co/api/v2/pokemon/pikachu', 200, 0, 0.1, False)
+        networkMetricsTracker.recordRequest('GET', 'https://api.twitch.tv/helix/users', 200, 0, 0.1, False)
+
+        metrics = networkMetricsTracker.getEndpointMetrics()
+        routes = { (metric.host, metric.route): metric.callCount for metric in metrics }
+
+        assert routes == {
+            ('pokeapi.co', '/api/v2/pokemon/pikachu'): 2,
+            ('pokeapi.co', '/api/v2/pokemon/eevee'): 1,
+            ('pokeapi.co', '/{other}'): 2,
+            ('api.twitch.tv', '/helix/users'): 1
+        }
+
+    def test_recordRequest_withNegativeSeconds(self):
+        networkMetricsTracker = self.__createNetworkMetricsTracker()
+
+        with pytest.raises(ValueError):
+            networkMetricsTracker.recordRequest('GET', 'https://example.com', 200, 0, -1, False)
@@ -0,0 +1,101 @@
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkResponseCache import NetworkResponseCache
+from CynanBot.network.networkResponseCacheEntry import \
+    NetworkResponseCacheEntry
+from CynanBot.timber.timberStub import TimberStub
+
+
+class TestNetworkResponseCache():
+
+    def __createEntry(self, url: str) -> NetworkResponseCacheEntry:
+        return NetworkResponseCacheEntry(
+            body = b'{"hello": "world"}',
+            expiresAt = time.time() + 60,
+            headers = { 'etag': '"abc"' },
+            networkClientType = NetworkClientType.AIOHTTP,
+            statusCode = 200,
+            url = url
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_withDifferentAuthorization_isNotShared(self, tmp_path: Path):
+        cache = NetworkResponseCache(
+            timber = TimberStub(),
+            cacheDirectory = str(tmp_path)
+        )
+
+        url = 'https://api.twitch.tv/helix/users'
+        entry = self.__createEntry(url)
+        await cache.put({ 'Authorization': 'Bearer abc' }, entry)
+
+        assert await cache.get(url, { 'Authorization': 'Bearer abc' }) == entry
+        assert await cache.get(url, { 'Authorization': 'Bearer xyz' }) is None
+        assert await cache.get(url, None) is None
+
+    @pytest.mark.asyncio
+    async def test_get_withExpiredDiskEntry_returnsNone(self, tmp_path: Path):
+        cache = NetworkResponseCache(
+            timber = TimberStub(),
+            cacheDirectory = str(tmp_path),
+            diskCacheTimeToLive = timedelta(hours = 1)
+        )
+
+        url = 'https://pokeapi.co/api/v2/pokemon/pikachu'
+        await cache.put(None, self.__createEntry(url))
+        await cache.clearCaches()
+
+        cacheFiles = list(tmp_path.iterdir())
+        assert len(cacheFiles) == 1
+
+        twoHoursAgo = time.time() - 7200
+        os.utime(cacheFiles[0], (twoHoursAgo, twoHoursAgo))
+
+        assert await cache.get(url, None) is None
+        assert len(list(tmp_path.iterdir())) == 0
+
+    @pytest.mark.asyncio
+    async def test_put_withCredentialInUrl_isNotWrittenToDisk(self, tmp_path: Path):
+        cache = NetworkResponseCache(
+            timber = TimberStub(),
+            cacheDirectory = str(tmp_path)
+        )
+
+        url = 'https://api.openweathermap.org/data/3.0/onecall?lat=1&lon=2&appid=secret'
+        await cache.put(None, self.__createEntry(url))
+
+        cacheFiles = list(tmp_path.iterdir())
+        assert len(cacheFiles) == 1
+        assert 'secret' not in cacheFiles[0].read_text(encoding = 'utf-8')
+
+        await cache.clearCaches()
+        entry = await cache.get(url, None)
+        assert entry is not None
+        assert entry.url == url
+
+    @pytest.mark.asyncio
+    async def test_put_overMaxDiskCacheEntries_evictsOldest(self, tmp_path: Path):
+        cache = NetworkResponseCache(
+            timber = TimberStub(),
+            cacheDirectory = str(tmp_path),
+            maxDiskCacheEntries = 8
+        )
+
+        for index in range(9):
+            await cache.put(None, self.__createEntry(f'https://pokeapi.co/api/v2/pokemon/{index}'))
+
+            cacheFile = sorted(tmp_path.iterdir(), key = lambda path: path.stat().st_mtime)[-1]
+            modifiedAt = time.time() - 100 + index
+            os.utime(cacheFile, (modifiedAt, modifiedAt))
+
+        assert len(list(tmp_path.iterdir())) == 6
+
+        await cache.clearCaches()
+        assert await cache.get('https://pokeapi.co/api/v2/pokemon/0', None) is None
+        assert await cache.get('https://pokeapi.co/api/v2/pokemon/8', None) is not None
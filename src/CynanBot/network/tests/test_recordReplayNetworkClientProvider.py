@@ -0,0 +1,182 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from CynanBot.network.exceptions import GenericNetworkException
+from CynanBot.network.networkClientProvider import NetworkClientProvider
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkFixtureRepository import NetworkFixtureRepository
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkRecordReplayMode import NetworkRecordReplayMode
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.network.recordReplayNetworkClientProvider import \
+    RecordReplayNetworkClientProvider
+from CynanBot.network.tests.fakeNetworkResponse import FakeNetworkResponse
+from CynanBot.timber.timberStub import TimberStub
+
+
+class CountingNetworkHandle(NetworkHandle):
+
+    def __init__(self):
+        self.requestCount: int = 0
+
+    async def delete(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        return await self.get(url, headers)
+
+    async def get(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        self.requestCount = self.requestCount + 1
+        body = f'{{"count":{self.requestCount}}}'.encode('utf-8')
+        return FakeNetworkResponse(body, { 'content-type': 'application/json' }, 200, url)
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.REQUESTS
+
+    async def post(self, url: str, headers: dict[str, Any] | None = None, json: dict[str, Any] | None = None) -> NetworkResponse:
+        return await self.get(url, headers)
+
+
+class TokenNetworkHandle(CountingNetworkHandle):
+
+    async def post(self, url: str, headers: dict[str, Any] | None = None, json: dict[str, Any] | None = None) -> NetworkResponse:
+        self.requestCount = self.requestCount + 1
+        body = b'{"access_token": "hunter1", "expires_in": 14400, "refresh_token": "hunter2", "scope": ["chat:read"]}'
+        return FakeNetworkResponse(body, { 'content-type': 'application/json', 'set-cookie': 'session=hunter3' }, 200, url)
+
+
+class CountingNetworkClientProvider(NetworkClientProvider):
+
+    def __init__(self, networkHandle: CountingNetworkHandle | None = None):
+        if networkHandle is None:
+            networkHandle = CountingNetworkHandle()
+
+        self.networkHandle: CountingNetworkHandle = networkHandle
+
+    async def get(self) -> NetworkHandle:
+        return self.networkHandle
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.REQUESTS
+
+
+class TestRecordReplayNetworkClientProvider():
+
+    timber = TimberStub()
+
+    def __createProvider(
+        self,
+        tmp_path: Path,
+        networkClientProvider: NetworkClientProvider | None,
+        networkRecordReplayMode: NetworkRecordReplayMode,
+        errorRate: float = 0
+    ) -> RecordReplayNetworkClientProvider:
+        return RecordReplayNetworkClientProvider(
+            networkClientProvider = networkClientProvider,
+            networkFixtureRepository = NetworkFixtureRepository(
+                timber = self.timber,
+                fixtureDirectory = str(tmp_path)
+            ),
+            networkRecordReplayMode = networkRecordReplayMode,
+            timber = self.timber,
+            errorRate = errorRate,
+            randomSeed = 7
+        )
+
+    def test_constructor_withRecordModeAndNoNetworkClientProvider(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            self.__createProvider(tmp_path, None, NetworkRecordReplayMode.RECORD)
+
+    @pytest.mark.asyncio
+    async def test_recordThenReplay(self, tmp_path: Path):
+        countingNetworkClientProvider = CountingNetworkClientProvider()
+        recorder = self.__createProvider(tmp_path, countingNetworkClientProvider, NetworkRecordReplayMode.RECORD)
+        recordingHandle = await recorder.get()
+
+        for _ in range(2):
+            response = await recordingHandle.get('https://opentdb.com/api.php?amount=1')
+            await response.close()
+
+        response = await recordingHandle.post('https://example.com/translate', json = { 'text': 'hello' })
+        await response.close()
+
+        assert countingNetworkClientProvider.networkHandle.requestCount == 3
+
+        replayer = self.__createProvider(tmp_path, None, NetworkRecordReplayMode.REPLAY)
+        replayingHandle = await replayer.get()
+        assert replayer.getNetworkClientType() is NetworkClientType.AIOHTTP
+
+        replayedCounts: list[Any] = list()
+        for _ in range(3):
+            response = await replayingHandle.get('https://opentdb.com/api.php?amount=1')
+            assert response.getNetworkClientType() is NetworkClientType.AIOHTTP
+            assert response.getHeaders() == { 'content-type': 'application/json' }
+            replayedCounts.append(await response.json())
+
+        assert replayedCounts == [ { 'count': 1 }, { 'count': 2 }, { 'count': 1 } ]
+
+        response = await replayingHandle.post('https://example.com/translate', json = { 'text': 'hello' })
+        assert await response.json() == { 'count': 3 }
+
+        with pytest.raises(GenericNetworkException):
+            await replayingHandle.post('https://example.com/translate', json = { 'text': 'goodbye' })
+
+        assert countingNetworkClientProvider.networkHandle.requestCount == 3
+
+    @pytest.mark.asyncio
+    async def test_recordThenReplay_withCredentials_areRedacted(self, tmp_path: Path):
+        countingNetworkClientProvider = CountingNetworkClientProvider()
+        recorder = self.__createProvider(tmp_path, countingNetworkClientProvider, NetworkRecordReplayMode.RECORD)
+        recordingHandle = await recorder.get()
+
+        response = await recordingHandle.get('https://api.openweathermap.org/data/3.0/onecall?lat=1&lon=2&appid=secret1')
+        await response.close()
+
+        response = await recordingHandle.post('https://example.com/translate', json = { 'apiKey': 'secret2', 'text': 'hello' })
+        await response.close()
+
+        for fixtureFile in tmp_path.iterdir():
+            assert 'secret' not in fixtureFile.read_text()
+
+        replayer = self.__createProvider(tmp_path, None, NetworkRecordReplayMode.REPLAY)
+        replayingHandle = await replayer.get()
+
+        response = await replayingHandle.get('https://api.openweathermap.org/data/3.0/onecall?lat=1&lon=2&appid=other')
+        assert await response.json() == { 'count': 1 }
+
+        response = await replayingHandle.post('https://example.com/translate', json = { 'apiKey': 'other', 'text': 'hello' })
+        assert await response.json() == { 'count': 2 }
+
+    @pytest.mark.asyncio
+    async def test_recordThenReplay_withTokenResponse_isRedacted(self, tmp_path: Path):
+        countingNetworkClientProvider = CountingNetworkClientProvider(TokenNetworkHandle())
+        recorder = self.__createProvider(tmp_path, countingNetworkClientProvider, NetworkRecordReplayMode.RECORD)
+        recordingHandle = await recorder.get()
+
+        url = 'https://id.twitch.tv/oauth2/token?client_id=abc&client_secret=hunter4&grant_type=refresh_token&refresh_token=hunter5'
+        response = await recordingHandle.post(url)
+        await response.close()
+
+        fixtureFiles = list(tmp_path.iterdir())
+        assert len(fixtureFiles) == 1
+        assert 'hunter' not in fixtureFiles[0].read_text()
+
+        replayer = self.__createProvider(tmp_path, None, NetworkRecordReplayMode.REPLAY)
+        response = await (await replayer.get()).post(url)
+
+        assert response.getHeaders() == { 'content-type': 'application/json', 'set-cookie': 'REDACTED' }
+        assert await response.json() == {
+            'access_token': 'REDACTED',
+            'expires_in': 14400,
+            'refresh_token': 'REDACTED',
+            'scope': [ 'chat:read' ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_replay_withErrorRate(self, tmp_path: Path):
+        recorder = self.__createProvider(tmp_path, CountingNetworkClientProvider(), NetworkRecordReplayMode.RECORD)
+        await (await recorder.get()).get('https://example.com')
+
+        replayer = self.__createProvider(tmp_path, None, NetworkRecordReplayMode.REPLAY, errorRate = 1)
+
+        with pytest.raises(GenericNetworkException):
+            await (await replayer.get()).get('https://example.com')
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from CynanBot.network.requestsClientProvider import RequestsClientProvider
+from CynanBot.timber.timberStub import TimberStub
+
+
+class SlowRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        time.sleep(0.25)
+        body = b'{"hello": "world"}'
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        pass
+
+
+class TestRequestsClientProvider():
+
+    @pytest.mark.asyncio
+    async def test_get_doesNotBlockEventLoop(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), SlowRequestHandler)
+        threading.Thread(target = server.serve_forever, daemon = True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}/'
+
+        networkClientProvider = RequestsClientProvider(
+            timber = TimberStub()
+        )
+
+        async def fetch() -> dict:
+            networkHandle = await networkClientProvider.get()
+            response = await networkHandle.get(url)
+            jsonResponse = await response.json()
+            await response.close()
+            assert isinstance(jsonResponse, dict)
+            return jsonResponse
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                ticks = ticks + 1
+
+        start = time.perf_counter()
+
+        try:
+            results = await asyncio.gather(fetch(), fetch(), fetch(), tick())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert results[:3] == [ { 'hello': 'world' } ] * 3
+        assert ticks == 10
+        assert time.perf_counter() - start < 0.7
@@ -4,6 +4,7 @@ import traceback
 from typing import Any, Pattern
 
 import CynanBot.misc.utils as utils
+from CynanBot.misc.singleFlight import SingleFlight
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.pkmn.pokepediaContestType import PokepediaContestType
@@ -47,6 +48,10 @@ class PokepediaRepository():
 
         self.__pokeApiIdRegEx: Pattern = re.compile(r'^.+\/(\d+)\/$', re.IGNORECASE)
 
+        self.__machineSingleFlight: SingleFlight[PokepediaMachine] = SingleFlight()
+        self.__moveSingleFlight: SingleFlight[PokepediaMove] = SingleFlight()
+        self.__pokemonSingleFlight: SingleFlight[PokepediaPokemon] = SingleFlight()
+
     async def __buildMachineFromJsonResponse(self, jsonResponse: dict[str, Any]) -> PokepediaMachine:
         if not utils.hasItems(jsonResponse):
             raise ValueError(f'jsonResponse argument is malformed: \"{jsonResponse}\"')
@@ -131,6 +136,12 @@ class PokepediaRepository():
         if not utils.isValidInt(machineId):
             raise ValueError(f'machineId argument is malformed: \"{machineId}\"')
 
+        return await self.__machineSingleFlight.run(
+            key = str(machineId),
+            function = lambda: self.__fetchMachine(machineId)
+        )
+
+    async def __fetchMachine(self, machineId: int) -> PokepediaMachine:
         clientSession = await self.__networkClientProvider.get()
 
         try:
@@ -156,6 +167,12 @@ class PokepediaRepository():
         if not utils.isValidInt(moveId):
             raise ValueError(f'moveId argument is malformed: \"{moveId}\"')
 
+        return await self.__moveSingleFlight.run(
+            key = f'id:{moveId}',
+            function = lambda: self.__fetchMove(moveId)
+        )
+
+    async def __fetchMove(self, moveId: int) -> PokepediaMove:
         clientSession = await self.__networkClientProvider.get()
 
         try:
@@ -497,6 +514,13 @@ class PokepediaRepository():
 
         name = utils.cleanStr(name)
         name = name.replace(' ', '-')
+
+        return await self.__moveSingleFlight.run(
+            key = f'name:{name}',
+            function = lambda: self.__searchMoves(name)
+        )
+
+    async def __searchMoves(self, name: str) -> PokepediaMove:
         self.__timber.log('PokepediaRepository', f'Searching PokeAPI for move \"{name}\"...')
         clientSession = await self.__networkClientProvider.get()
 
@@ -525,6 +549,13 @@ class PokepediaRepository():
 
         name = utils.cleanStr(name)
         name = name.replace(' ', '-')
+
+        return await self.__pokemonSingleFlight.run(
+            key = name,
+            function = lambda: self.__searchPokemon(name)
+        )
+
+    async def __searchPokemon(self, name: str) -> PokepediaPokemon:
         self.__timber.log('PokepediaRepository', f'Searching PokeAPI for Pokemon \"{name}\"...')
         clientSession = await self.__networkClientProvider.get()
 
@@ -10,8 +10,7 @@ from CynanBot.recurringActions.mostRecentRecurringActionRepositoryInterface impo
 from CynanBot.recurringActions.recurringAction import RecurringAction
 from CynanBot.recurringActions.recurringActionType import RecurringActionType
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 
 
@@ -34,11 +33,7 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
-        self.__isDatabaseReady: bool = False
-
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def getMostRecentRecurringAction(
         self,
@@ -50,7 +45,7 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT actiontype, datetime FROM mostrecentrecurringaction
@@ -75,15 +70,10 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
             twitchChannelId = twitchChannelId
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'mostrecentrecurringaction',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
                         actiontype text NOT NULL,
@@ -91,9 +81,8 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
                         twitchchannelid text NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
                         actiontype TEXT NOT NULL,
@@ -101,11 +90,8 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
                         twitchchannelid TEXT NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def setMostRecentRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -113,7 +99,7 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
 
         nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO mostrecentrecurringaction (actiontype, datetime, twitchchannelid)
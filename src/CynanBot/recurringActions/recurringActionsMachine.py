@@ -1,9 +1,7 @@
 import asyncio
-import queue
 import random
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 
 import CynanBot.misc.utils as utils
 from CynanBot.language.wordOfTheDayRepositoryInterface import \
@@ -15,6 +13,7 @@ from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.misc.backgroundTaskHelperInterface import \
     BackgroundTaskHelperInterface
+from CynanBot.misc.eventBus import EventBus
 from CynanBot.recurringActions.mostRecentRecurringActionRepositoryInterface import \
     MostRecentRecurringActionRepositoryInterface
 from CynanBot.recurringActions.recurringAction import RecurringAction
@@ -71,7 +70,6 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         usersRepository: UsersRepositoryInterface,
         weatherRepository: WeatherRepositoryInterface | None,
         wordOfTheDayRepository: WordOfTheDayRepositoryInterface,
-        queueSleepTimeSeconds: float = 3,
         refreshSleepTimeSeconds: float = 90,
         queueTimeoutSeconds: int = 3,
         superTriviaCountdownSeconds: int = 5,
@@ -103,10 +101,6 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
             raise TypeError(f'weatherRepository argument is malformed: \"{weatherRepository}\"')
         elif not isinstance(wordOfTheDayRepository, WordOfTheDayRepositoryInterface):
             raise TypeError(f'wordOfTheDayRepository argument is malformed: \"{wordOfTheDayRepository}\"')
-        elif not utils.isValidNum(queueSleepTimeSeconds):
-            raise TypeError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
-        elif queueSleepTimeSeconds < 1 or queueSleepTimeSeconds > 15:
-            raise ValueError(f'queueSleepTimeSeconds argument is out of bounds: {queueSleepTimeSeconds}')
         elif not utils.isValidNum(refreshSleepTimeSeconds):
             raise TypeError(f'refreshSleepTimeSeconds argument is malformed: \"{refreshSleepTimeSeconds}\"')
         elif refreshSleepTimeSeconds < 30 or refreshSleepTimeSeconds > 600:
@@ -135,15 +129,18 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         self.__usersRepository: UsersRepositoryInterface = usersRepository
         self.__weatherRepository: WeatherRepositoryInterface | None = weatherRepository
         self.__wordOfTheDayRepository: WordOfTheDayRepositoryInterface = wordOfTheDayRepository
-        self.__queueSleepTimeSeconds: float = queueSleepTimeSeconds
         self.__refreshSleepTimeSeconds: float = refreshSleepTimeSeconds
-        self.__queueTimeoutSeconds: int = queueTimeoutSeconds
         self.__superTriviaCountdownSeconds: int = superTriviaCountdownSeconds
         self.__cooldown: timedelta = cooldown
 
         self.__isStarted: bool = False
         self.__eventListener: RecurringActionEventListener | None = None
-        self.__eventQueue: SimpleQueue[RecurringEvent] = SimpleQueue()
+        self.__eventBus: EventBus[RecurringEvent] = EventBus(
+            backgroundTaskHelper = backgroundTaskHelper,
+            timber = timber,
+            name = 'RecurringActionsMachine event',
+            publishTimeoutSeconds = queueTimeoutSeconds
+        )
 
     async def __fetchViableUsers(self) -> list[UserInterface]:
         users = await self.__usersRepository.getUsersAsync()
@@ -213,6 +210,15 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
 
         return action
 
+    async def __onEvent(self, event: RecurringEvent):
+        eventListener = self.__eventListener
+
+        if eventListener is None:
+            self.__timber.log('RecurringActionsMachine', f'Dropping event as there is no event listener ({event=})')
+            return
+
+        await eventListener.onNewRecurringActionEvent(event)
+
     async def __processRecurringAction(
         self,
         user: UserInterface,
@@ -270,7 +276,7 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         # delay to allow users to prepare for an incoming trivia question
         await asyncio.sleep(self.__superTriviaCountdownSeconds)
 
-        self.__triviaGameMachine.submitAction(newTriviaGame)
+        await self.__triviaGameMachine.submitAction(newTriviaGame)
         return True
 
     async def __processWeatherRecurringAction(
@@ -398,27 +404,6 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
 
         self.__eventListener = listener
 
-    async def __startEventLoop(self):
-        while True:
-            eventListener = self.__eventListener
-
-            if eventListener is not None:
-                events: list[RecurringEvent] = list()
-
-                try:
-                    while not self.__eventQueue.empty():
-                        events.append(self.__eventQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('RecurringActionsMachine', f'Encountered queue.Empty when building up events list (queue size: {self.__eventQueue.qsize()}) (events size: {len(events)}): {e}', e, traceback.format_exc())
-
-                for event in events:
-                    try:
-                        await eventListener.onNewRecurringActionEvent(event)
-                    except Exception as e:
-                        self.__timber.log('RecurringActionsMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) (event=\"{event}\"): {e}', e, traceback.format_exc())
-
-            await asyncio.sleep(self.__queueSleepTimeSeconds)
-
     def startMachine(self):
         if self.__isStarted:
             self.__timber.log('RecurringActionsMachine', 'Not starting RecurringActionsMachine as it has already been started')
@@ -427,13 +412,10 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         self.__isStarted = True
         self.__timber.log('RecurringActionsMachine', 'Starting RecurringActionsMachine...')
         self.__backgroundTaskHelper.createTask(self.__startActionRefreshLoop())
-        self.__backgroundTaskHelper.createTask(self.__startEventLoop())
+        self.__eventBus.start(self.__onEvent)
 
     async def __submitEvent(self, event: RecurringEvent):
         if not isinstance(event, RecurringEvent):
             raise TypeError(f'event argument is malformed: \"{event}\"')
 
-        try:
-            self.__eventQueue.put(event, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('RecurringActionsMachine', f'Encountered queue.Full when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+        await self.__eventBus.publish(event)
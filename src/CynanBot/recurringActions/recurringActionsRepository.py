@@ -14,8 +14,7 @@ from CynanBot.recurringActions.weatherRecurringAction import \
 from CynanBot.recurringActions.wordOfTheDayRecurringAction import \
     WordOfTheDayRecurringAction
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 
 
@@ -38,7 +37,7 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         self.__recurringActionsJsonParser: RecurringActionsJsonParserInterface = recurringActionsJsonParser
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def getAllRecurringActions(
         self,
@@ -78,10 +77,6 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
 
         return recurringActions
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def __getRecurringAction(
         self,
         actionType: RecurringActionType,
@@ -92,7 +87,7 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT configurationjson, isenabled, minutesbetween FROM recurringactions
@@ -187,15 +182,10 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
             twitchChannelId = twitchChannelId
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'recurringactions',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS recurringactions (
                         actiontype text NOT NULL,
@@ -206,9 +196,8 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
                         PRIMARY KEY (actiontype, twitchchannelid)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS recurringactions (
                         actiontype TEXT NOT NULL,
@@ -219,11 +208,8 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
                         PRIMARY KEY (actiontype, twitchchannelid)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def setRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -250,7 +236,7 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
 
         isEnabled = utils.boolToNum(action.isEnabled())
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO recurringactions (actiontype, configurationjson, isenabled, minutesbetween, twitchchannelid)
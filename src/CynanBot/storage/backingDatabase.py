@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 
 from CynanBot.storage.databaseConnection import DatabaseConnection
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.storage.databaseType import DatabaseType
 
 
 class BackingDatabase(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def getConnection(self) -> DatabaseConnection:
         pass
@@ -13,3 +18,11 @@ class BackingDatabase(ABC):
     @abstractmethod
     def getDatabaseType(self) -> DatabaseType:
         pass
+
+    @abstractmethod
+    async def initializeSchemas(self):
+        pass
+
+    @abstractmethod
+    def registerSchema(self, schema: DatabaseSchema):
+        pass
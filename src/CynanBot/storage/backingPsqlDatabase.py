@@ -1,3 +1,4 @@
+import asyncio
 import traceback
 from asyncio import AbstractEventLoop
 
@@ -5,6 +6,8 @@ import asyncpg
 
 from CynanBot.storage.backingDatabase import BackingDatabase
 from CynanBot.storage.databaseConnection import DatabaseConnection
+from CynanBot.storage.databaseSchema import DatabaseSchema
+from CynanBot.storage.databaseSchemaRegistry import DatabaseSchemaRegistry
 from CynanBot.storage.databaseType import DatabaseType
 from CynanBot.storage.psqlCredentialsProvider import PsqlCredentialsProvider
 from CynanBot.storage.psqlDatabaseConnection import PsqlDatabaseConnection
@@ -31,6 +34,29 @@ class BackingPsqlDatabase(BackingDatabase):
         self.__timber: TimberInterface = timber
 
         self.__connectionPool: asyncpg.Pool | None = None
+        self.__connectionPoolLock: asyncio.Lock = asyncio.Lock()
+        self.__schemaRegistry: DatabaseSchemaRegistry = DatabaseSchemaRegistry()
+
+    async def __acquireConnection(self) -> DatabaseConnection:
+        connectionPool = self.__connectionPool
+
+        if connectionPool is None:
+            connectionPool = await self.__createConnectionPool()
+
+        connection = await connectionPool.acquire()
+
+        return PsqlDatabaseConnection(
+            connection = connection,
+            pool = connectionPool
+        )
+
+    async def close(self):
+        async with self.__connectionPoolLock:
+            connectionPool = self.__connectionPool
+            self.__connectionPool = None
+
+        if connectionPool is not None:
+            await connectionPool.close()
 
     async def __createCollations(self, databaseConnection: DatabaseConnection):
         if not isinstance(databaseConnection, DatabaseConnection):
@@ -38,12 +64,14 @@ class BackingPsqlDatabase(BackingDatabase):
 
         await databaseConnection.execute('CREATE EXTENSION IF NOT EXISTS citext')
 
-    async def getConnection(self) -> DatabaseConnection:
-        connectionPoolCreated = False
-        connectionPool = self.__connectionPool
+    async def __createConnectionPool(self) -> asyncpg.Pool:
+        # concurrent callers (such as schema initialization) must not each create their own pool
+        async with self.__connectionPoolLock:
+            connectionPool = self.__connectionPool
+
+            if connectionPool is not None:
+                return connectionPool
 
-        if connectionPool is None:
-            connectionPoolCreated = True
             databaseName = await self.__psqlCredentialsProvider.requireDatabaseName()
             maxConnections = await self.__psqlCredentialsProvider.requireMaxConnections()
             password = await self.__psqlCredentialsProvider.getPassword()
@@ -57,26 +85,36 @@ class BackingPsqlDatabase(BackingDatabase):
                 user = user
             )
 
-            self.__connectionPool = connectionPool
+            if not isinstance(connectionPool, asyncpg.Pool):
+                # this scenario should definitely be impossible, but the Python type checking was
+                # getting angry without this check
+                exception = RuntimeError(f'Failed to instantiate asyncpg.Pool: \"{connectionPool}\"')
+                self.__timber.log('BackingPsqlDatabase', f'Failed to instantiate asyncpg.Pool: \"{connectionPool}\" ({exception=})', exception, traceback.format_exc())
+                raise exception
 
-        if not isinstance(connectionPool, asyncpg.Pool):
-            # this scenario should definitely be impossible, but the Python type checking was
-            # getting angry without this check
-            exception = RuntimeError(f'Failed to instantiate asyncpg.Pool: \"{connectionPool}\"')
-            self.__timber.log('BackingPsqlDatabase', f'Failed to instantiate asyncpg.Pool: \"{connectionPool}\" ({exception=})', exception, traceback.format_exc())
-            raise exception
+            databaseConnection: DatabaseConnection = PsqlDatabaseConnection(
+                connection = await connectionPool.acquire(),
+                pool = connectionPool
+            )
 
-        connection = await connectionPool.acquire()
+            await self.__createCollations(databaseConnection)
+            await databaseConnection.close()
+            self.__connectionPool = connectionPool
 
-        databaseConnection: DatabaseConnection = PsqlDatabaseConnection(
-            connection = connection,
-            pool = connectionPool
-        )
+            return connectionPool
 
-        if connectionPoolCreated:
-            await self.__createCollations(databaseConnection)
+    async def getConnection(self) -> DatabaseConnection:
+        if self.__schemaRegistry.hasPendingSchemas():
+            # this only happens if schemas were registered after (or without) startup initialization
+            await self.initializeSchemas()
 
-        return databaseConnection
+        return await self.__acquireConnection()
 
     def getDatabaseType(self) -> DatabaseType:
         return DatabaseType.POSTGRESQL
+
+    async def initializeSchemas(self):
+        await self.__schemaRegistry.createPendingSchemas(self.__acquireConnection)
+
+    def registerSchema(self, schema: DatabaseSchema):
+        self.__schemaRegistry.register(schema)
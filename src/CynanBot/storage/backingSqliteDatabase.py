@@ -1,11 +1,12 @@
 from asyncio import AbstractEventLoop
 
-import aiosqlite
-
 import CynanBot.misc.utils as utils
 from CynanBot.storage.backingDatabase import BackingDatabase
 from CynanBot.storage.databaseConnection import DatabaseConnection
+from CynanBot.storage.databaseSchema import DatabaseSchema
+from CynanBot.storage.databaseSchemaRegistry import DatabaseSchemaRegistry
 from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.sqliteConnectionPool import SqliteConnectionPool
 from CynanBot.storage.sqliteDatabaseConnection import SqliteDatabaseConnection
 
 
@@ -14,21 +15,49 @@ class BackingSqliteDatabase(BackingDatabase):
     def __init__(
         self,
         eventLoop: AbstractEventLoop,
-        backingDatabaseFile: str = 'database.sqlite'
+        backingDatabaseFile: str = 'database.sqlite',
+        maxConnections: int = 4
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
         elif not utils.isValidStr(backingDatabaseFile):
             raise TypeError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
+        elif not utils.isValidInt(maxConnections):
+            raise TypeError(f'maxConnections argument is malformed: \"{maxConnections}\"')
+        elif maxConnections < 1 or maxConnections > 64:
+            raise ValueError(f'maxConnections argument is out of bounds: {maxConnections}')
+
+        self.__connectionPool: SqliteConnectionPool = SqliteConnectionPool(
+            eventLoop = eventLoop,
+            backingDatabaseFile = backingDatabaseFile,
+            maxConnections = maxConnections
+        )
+
+        self.__schemaRegistry: DatabaseSchemaRegistry = DatabaseSchemaRegistry()
+
+    async def __acquireConnection(self) -> DatabaseConnection:
+        connection = await self.__connectionPool.acquire()
 
-        self.__eventLoop: AbstractEventLoop = eventLoop
-        self.__backingDatabaseFile: str = backingDatabaseFile
+        return SqliteDatabaseConnection(
+            connection = connection,
+            pool = self.__connectionPool
+        )
+
+    async def close(self):
+        await self.__connectionPool.close()
 
     async def getConnection(self) -> DatabaseConnection:
-        return SqliteDatabaseConnection(await aiosqlite.connect(
-            database = self.__backingDatabaseFile,
-            loop = self.__eventLoop
-        ))
+        if self.__schemaRegistry.hasPendingSchemas():
+            # this only happens if schemas were registered after (or without) startup initialization
+            await self.initializeSchemas()
+
+        return await self.__acquireConnection()
 
     def getDatabaseType(self) -> DatabaseType:
         return DatabaseType.SQLITE
+
+    async def initializeSchemas(self):
+        await self.__schemaRegistry.createPendingSchemas(self.__acquireConnection)
+
+    def registerSchema(self, schema: DatabaseSchema):
+        self.__schemaRegistry.register(schema)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import AbstractAsyncContextManager
+from typing import Any, AsyncIterator
 
 from CynanBot.storage.databaseType import DatabaseType
 
@@ -18,6 +19,10 @@ class DatabaseConnection(ABC):
     async def execute(self, query: str, *args: Any | None):
         pass
 
+    @abstractmethod
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        pass
+
     @abstractmethod
     async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
         pass
@@ -33,3 +38,11 @@ class DatabaseConnection(ABC):
     @abstractmethod
     def isClosed(self) -> bool:
         pass
+
+    @abstractmethod
+    def iterateRows(self, query: str, *args: Any | None, chunkSize: int = 100) -> AsyncIterator[list[Any]]:
+        pass
+
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        pass
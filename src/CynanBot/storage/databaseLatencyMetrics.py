@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class DatabaseLatencyMetrics():
+    averageSeconds: float
+    maxSeconds: float
+    p50Seconds: float
+    p95Seconds: float
+    totalSeconds: float
+    callCount: int
+    query: str | None
+    tag: str
@@ -0,0 +1,165 @@
+import asyncio
+
+import CynanBot.misc.utils as utils
+from CynanBot.misc.backgroundTaskHelperInterface import \
+    BackgroundTaskHelperInterface
+from CynanBot.misc.latencyHistogram import LatencyHistogram
+from CynanBot.storage.databaseLatencyMetrics import DatabaseLatencyMetrics
+from CynanBot.storage.databaseMetricsTrackerInterface import \
+    DatabaseMetricsTrackerInterface
+from CynanBot.timber.timberInterface import TimberInterface
+
+
+class DatabaseMetricsTracker(DatabaseMetricsTrackerInterface):
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        timber: TimberInterface,
+        slowQueryThresholdSeconds: float = 0.25,
+        summarySleepTimeSeconds: float = 900,
+        summarySize: int = 10
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidNum(slowQueryThresholdSeconds):
+            raise TypeError(f'slowQueryThresholdSeconds argument is malformed: \"{slowQueryThresholdSeconds}\"')
+        elif slowQueryThresholdSeconds < 0 or slowQueryThresholdSeconds > 60:
+            raise ValueError(f'slowQueryThresholdSeconds argument is out of bounds: {slowQueryThresholdSeconds}')
+        elif not utils.isValidNum(summarySleepTimeSeconds):
+            raise TypeError(f'summarySleepTimeSeconds argument is malformed: \"{summarySleepTimeSeconds}\"')
+        elif summarySleepTimeSeconds < 30 or summarySleepTimeSeconds > 86400:
+            raise ValueError(f'summarySleepTimeSeconds argument is out of bounds: {summarySleepTimeSeconds}')
+        elif not utils.isValidInt(summarySize):
+            raise TypeError(f'summarySize argument is malformed: \"{summarySize}\"')
+        elif summarySize < 1 or summarySize > 100:
+            raise ValueError(f'summarySize argument is out of bounds: {summarySize}')
+
+        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
+        self.__timber: TimberInterface = timber
+        self.__slowQueryThresholdSeconds: float = slowQueryThresholdSeconds
+        self.__summarySleepTimeSeconds: float = summarySleepTimeSeconds
+        self.__summarySize: int = summarySize
+
+        self.__isStarted: bool = False
+        self.__normalizedQueries: dict[str, str] = dict()
+        self.__poolWaitHistograms: dict[str, LatencyHistogram] = dict()
+        self.__queryHistograms: dict[tuple[str, str], LatencyHistogram] = dict()
+
+    def __createLatencyMetrics(
+        self,
+        histogram: LatencyHistogram,
+        query: str | None,
+        tag: str
+    ) -> DatabaseLatencyMetrics:
+        return DatabaseLatencyMetrics(
+            averageSeconds = histogram.getAverageSeconds(),
+            maxSeconds = histogram.getMaxSeconds(),
+            p50Seconds = histogram.getPercentileSeconds(50),
+            p95Seconds = histogram.getPercentileSeconds(95),
+            totalSeconds = histogram.getTotalSeconds(),
+            callCount = histogram.getCount(),
+            query = query,
+            tag = tag
+        )
+
+    def getPoolWaitMetrics(self) -> list[DatabaseLatencyMetrics]:
+        metrics: list[DatabaseLatencyMetrics] = list()
+
+        for tag, histogram in self.__poolWaitHistograms.items():
+            metrics.append(self.__createLatencyMetrics(
+                histogram = histogram,
+                query = None,
+                tag = tag
+            ))
+
+        metrics.sort(key = lambda metric: metric.totalSeconds, reverse = True)
+        return metrics
+
+    def getQueryMetrics(self) -> list[DatabaseLatencyMetrics]:
+        metrics: list[DatabaseLatencyMetrics] = list()
+
+        for (tag, query), histogram in self.__queryHistograms.items():
+            metrics.append(self.__createLatencyMetrics(
+                histogram = histogram,
+                query = query,
+                tag = tag
+            ))
+
+        metrics.sort(key = lambda metric: metric.totalSeconds, reverse = True)
+        return metrics
+
+    def __logSummary(self):
+        queryMetrics = self.getQueryMetrics()
+
+        if len(queryMetrics) == 0:
+            return
+
+        totalCalls = sum(metric.callCount for metric in queryMetrics)
+        self.__timber.log('DatabaseMetricsTracker', f'Database summary: {totalCalls} call(s) across {len(queryMetrics)} distinct quer(ies), top {min(self.__summarySize, len(queryMetrics))} by total time:')
+
+        for metric in queryMetrics[:self.__summarySize]:
+            self.__timber.log('DatabaseMetricsTracker', f'{metric.tag} — {metric.callCount} call(s), total {metric.totalSeconds * 1000:.1f}ms, avg {metric.averageSeconds * 1000:.1f}ms, p95 {metric.p95Seconds * 1000:.1f}ms, max {metric.maxSeconds * 1000:.1f}ms — {metric.query}')
+
+        for metric in self.getPoolWaitMetrics()[:self.__summarySize]:
+            self.__timber.log('DatabaseMetricsTracker', f'{metric.tag} — pool wait — {metric.callCount} acquisition(s), avg {metric.averageSeconds * 1000:.1f}ms, p95 {metric.p95Seconds * 1000:.1f}ms, max {metric.maxSeconds * 1000:.1f}ms')
+
+    def __normalizeQuery(self, query: str) -> str:
+        normalizedQuery = self.__normalizedQueries.get(query, None)
+
+        if normalizedQuery is None:
+            normalizedQuery = ' '.join(query.split())
+            self.__normalizedQueries[query] = normalizedQuery
+
+        return normalizedQuery
+
+    def recordPoolWait(self, tag: str, seconds: float):
+        if not utils.isValidStr(tag):
+            raise TypeError(f'tag argument is malformed: \"{tag}\"')
+        elif not utils.isValidNum(seconds):
+            raise TypeError(f'seconds argument is malformed: \"{seconds}\"')
+
+        histogram = self.__poolWaitHistograms.get(tag, None)
+
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.__poolWaitHistograms[tag] = histogram
+
+        histogram.record(seconds)
+
+    def recordQuery(self, tag: str, query: str, seconds: float):
+        if not utils.isValidStr(tag):
+            raise TypeError(f'tag argument is malformed: \"{tag}\"')
+        elif not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not utils.isValidNum(seconds):
+            raise TypeError(f'seconds argument is malformed: \"{seconds}\"')
+
+        normalizedQuery = self.__normalizeQuery(query)
+        key = (tag, normalizedQuery)
+        histogram = self.__queryHistograms.get(key, None)
+
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.__queryHistograms[key] = histogram
+
+        histogram.record(seconds)
+
+        if seconds >= self.__slowQueryThresholdSeconds:
+            self.__timber.log('DatabaseMetricsTracker', f'Slow query from {tag} took {seconds * 1000:.1f}ms (threshold is {self.__slowQueryThresholdSeconds * 1000:.1f}ms): {normalizedQuery}')
+
+    def start(self):
+        if self.__isStarted:
+            self.__timber.log('DatabaseMetricsTracker', 'Not starting DatabaseMetricsTracker as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__timber.log('DatabaseMetricsTracker', 'Starting DatabaseMetricsTracker...')
+        self.__backgroundTaskHelper.createTask(self.__startSummaryLoop())
+
+    async def __startSummaryLoop(self):
+        while True:
+            await asyncio.sleep(self.__summarySleepTimeSeconds)
+            self.__logSummary()
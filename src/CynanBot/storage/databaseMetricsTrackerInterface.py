@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from CynanBot.storage.databaseLatencyMetrics import DatabaseLatencyMetrics
+
+
+class DatabaseMetricsTrackerInterface(ABC):
+
+    @abstractmethod
+    def getPoolWaitMetrics(self) -> list[DatabaseLatencyMetrics]:
+        pass
+
+    @abstractmethod
+    def getQueryMetrics(self) -> list[DatabaseLatencyMetrics]:
+        pass
+
+    @abstractmethod
+    def recordPoolWait(self, tag: str, seconds: float):
+        pass
+
+    @abstractmethod
+    def recordQuery(self, tag: str, query: str, seconds: float):
+        pass
+
+    @abstractmethod
+    def start(self):
+        pass
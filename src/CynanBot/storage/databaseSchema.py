@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class DatabaseSchema():
+    psqlStatements: list[str]
+    sqliteStatements: list[str]
+    name: str
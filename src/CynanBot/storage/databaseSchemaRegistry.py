@@ -0,0 +1,74 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import CynanBot.misc.utils as utils
+from CynanBot.storage.databaseConnection import DatabaseConnection
+from CynanBot.storage.databaseSchema import DatabaseSchema
+from CynanBot.storage.databaseType import DatabaseType
+
+
+class DatabaseSchemaRegistry():
+
+    def __init__(self):
+        self.__createdSchemaNames: set[str] = set()
+        self.__pendingSchemas: dict[str, DatabaseSchema] = dict()
+        self.__lock: asyncio.Lock = asyncio.Lock()
+
+    async def __createSchema(
+        self,
+        connectionProvider: Callable[[], Awaitable[DatabaseConnection]],
+        schema: DatabaseSchema
+    ):
+        connection = await connectionProvider()
+
+        try:
+            match connection.getDatabaseType():
+                case DatabaseType.POSTGRESQL:
+                    statements = schema.psqlStatements
+
+                case DatabaseType.SQLITE:
+                    statements = schema.sqliteStatements
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create schema \"{schema.name}\": \"{connection.getDatabaseType()}\"')
+
+            for statement in statements:
+                await connection.createTableIfNotExists(statement)
+        finally:
+            await connection.close()
+
+    async def createPendingSchemas(
+        self,
+        connectionProvider: Callable[[], Awaitable[DatabaseConnection]]
+    ) -> int:
+        if not callable(connectionProvider):
+            raise TypeError(f'connectionProvider argument is malformed: \"{connectionProvider}\"')
+
+        async with self.__lock:
+            schemas = list(self.__pendingSchemas.values())
+
+            if len(schemas) == 0:
+                return 0
+
+            # every schema gets its own connection, so these can all run at the same time
+            await asyncio.gather(*[ self.__createSchema(connectionProvider, schema) for schema in schemas ])
+
+            for schema in schemas:
+                self.__pendingSchemas.pop(schema.name, None)
+                self.__createdSchemaNames.add(schema.name)
+
+            return len(schemas)
+
+    def hasPendingSchemas(self) -> bool:
+        return len(self.__pendingSchemas) >= 1
+
+    def register(self, schema: DatabaseSchema):
+        if not isinstance(schema, DatabaseSchema):
+            raise TypeError(f'schema argument is malformed: \"{schema}\"')
+        elif not utils.isValidStr(schema.name):
+            raise TypeError(f'schema name is malformed: \"{schema.name}\"')
+
+        if schema.name in self.__createdSchemaNames:
+            return
+
+        self.__pendingSchemas[schema.name] = schema
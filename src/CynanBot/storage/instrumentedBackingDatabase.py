@@ -0,0 +1,65 @@
+import time
+
+import CynanBot.misc.utils as utils
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.databaseConnection import DatabaseConnection
+from CynanBot.storage.databaseMetricsTrackerInterface import \
+    DatabaseMetricsTrackerInterface
+from CynanBot.storage.databaseSchema import DatabaseSchema
+from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.instrumentedDatabaseConnection import \
+    InstrumentedDatabaseConnection
+
+
+class InstrumentedBackingDatabase(BackingDatabase):
+
+    def __init__(
+        self,
+        backingDatabase: BackingDatabase,
+        databaseMetricsTracker: DatabaseMetricsTrackerInterface,
+        tag: str
+    ):
+        if not isinstance(backingDatabase, BackingDatabase):
+            raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
+        elif not isinstance(databaseMetricsTracker, DatabaseMetricsTrackerInterface):
+            raise TypeError(f'databaseMetricsTracker argument is malformed: \"{databaseMetricsTracker}\"')
+        elif not utils.isValidStr(tag):
+            raise TypeError(f'tag argument is malformed: \"{tag}\"')
+
+        self.__backingDatabase: BackingDatabase = backingDatabase
+        self.__databaseMetricsTracker: DatabaseMetricsTrackerInterface = databaseMetricsTracker
+        self.__tag: str = tag
+
+    async def close(self):
+        await self.__backingDatabase.close()
+
+    async def getConnection(self) -> DatabaseConnection:
+        start = time.perf_counter()
+        connection = await self.__backingDatabase.getConnection()
+
+        self.__databaseMetricsTracker.recordPoolWait(
+            tag = self.__tag,
+            seconds = time.perf_counter() - start
+        )
+
+        return InstrumentedDatabaseConnection(
+            connection = connection,
+            databaseMetricsTracker = self.__databaseMetricsTracker,
+            tag = self.__tag
+        )
+
+    def getDatabaseType(self) -> DatabaseType:
+        return self.__backingDatabase.getDatabaseType()
+
+    async def initializeSchemas(self):
+        await self.__backingDatabase.initializeSchemas()
+
+    def registerSchema(self, schema: DatabaseSchema):
+        self.__backingDatabase.registerSchema(schema)
+
+    def withTag(self, tag: str) -> 'InstrumentedBackingDatabase':
+        return InstrumentedBackingDatabase(
+            backingDatabase = self.__backingDatabase,
+            databaseMetricsTracker = self.__databaseMetricsTracker,
+            tag = tag
+        )
@@ -0,0 +1,112 @@
+import time
+from contextlib import AbstractAsyncContextManager
+from typing import Any, AsyncIterator
+
+import CynanBot.misc.utils as utils
+from CynanBot.storage.databaseConnection import DatabaseConnection
+from CynanBot.storage.databaseMetricsTrackerInterface import \
+    DatabaseMetricsTrackerInterface
+from CynanBot.storage.databaseType import DatabaseType
+
+
+class InstrumentedDatabaseConnection(DatabaseConnection):
+
+    def __init__(
+        self,
+        connection: DatabaseConnection,
+        databaseMetricsTracker: DatabaseMetricsTrackerInterface,
+        tag: str
+    ):
+        if not isinstance(connection, DatabaseConnection):
+            raise TypeError(f'connection argument is malformed: \"{connection}\"')
+        elif not isinstance(databaseMetricsTracker, DatabaseMetricsTrackerInterface):
+            raise TypeError(f'databaseMetricsTracker argument is malformed: \"{databaseMetricsTracker}\"')
+        elif not utils.isValidStr(tag):
+            raise TypeError(f'tag argument is malformed: \"{tag}\"')
+
+        self.__connection: DatabaseConnection = connection
+        self.__databaseMetricsTracker: DatabaseMetricsTrackerInterface = databaseMetricsTracker
+        self.__tag: str = tag
+
+    async def close(self):
+        await self.__connection.close()
+
+    async def createTableIfNotExists(self, query: str, *args: Any | None):
+        start = time.perf_counter()
+
+        try:
+            await self.__connection.createTableIfNotExists(query, *args)
+        finally:
+            self.__record(query, start)
+
+    async def execute(self, query: str, *args: Any | None):
+        start = time.perf_counter()
+
+        try:
+            await self.__connection.execute(query, *args)
+        finally:
+            self.__record(query, start)
+
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        start = time.perf_counter()
+
+        try:
+            await self.__connection.executeMany(query, records)
+        finally:
+            self.__record(query, start)
+
+    async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
+        start = time.perf_counter()
+
+        try:
+            return await self.__connection.fetchRow(query, *args)
+        finally:
+            self.__record(query, start)
+
+    async def fetchRows(self, query: str, *args: Any | None) -> list[list[Any]] | None:
+        start = time.perf_counter()
+
+        try:
+            return await self.__connection.fetchRows(query, *args)
+        finally:
+            self.__record(query, start)
+
+    def getDatabaseType(self) -> DatabaseType:
+        return self.__connection.getDatabaseType()
+
+    def isClosed(self) -> bool:
+        return self.__connection.isClosed()
+
+    async def iterateRows(self, query: str, *args: Any | None, chunkSize: int = 100) -> AsyncIterator[list[Any]]:
+        # only time spent inside the database counts, not time spent by the caller consuming rows
+        elapsed: float = 0
+        iterator = self.__connection.iterateRows(query, *args, chunkSize = chunkSize).__aiter__()
+
+        try:
+            while True:
+                start = time.perf_counter()
+
+                try:
+                    row = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    elapsed = elapsed + (time.perf_counter() - start)
+
+                yield row
+        finally:
+            self.__databaseMetricsTracker.recordQuery(
+                tag = self.__tag,
+                query = query,
+                seconds = elapsed
+            )
+
+    def __record(self, query: str, start: float):
+        self.__databaseMetricsTracker.recordQuery(
+            tag = self.__tag,
+            query = query,
+            seconds = time.perf_counter() - start
+        )
+
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        return self.__connection.transaction()
@@ -1,4 +1,5 @@
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 import asyncpg
 
@@ -20,6 +21,7 @@ class PsqlDatabaseConnection(DatabaseConnection):
         self.__pool: asyncpg.Pool = pool
 
         self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
 
     async def close(self):
         if self.isClosed():
@@ -45,8 +47,26 @@ class PsqlDatabaseConnection(DatabaseConnection):
 
         self.__requireNotClosed()
 
-        async with self.__connection.transaction():
+        if self.__isInTransaction:
             await self.__connection.execute(query, *args)
+        else:
+            async with self.__connection.transaction():
+                await self.__connection.execute(query, *args)
+
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        if not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not isinstance(records, list):
+            raise TypeError(f'records argument is malformed: \"{records}\"')
+
+        self.__requireNotClosed()
+
+        if len(records) == 0:
+            return
+
+        # asyncpg's executemany() pipelines every record in a single round trip, and is atomic
+        # on its own, so there's no need for an explicit transaction here
+        await self.__connection.executemany(query, records)
 
     async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
         if not utils.isValidStr(query):
@@ -83,6 +103,38 @@ class PsqlDatabaseConnection(DatabaseConnection):
     def isClosed(self) -> bool:
         return self.__isClosed
 
+    async def iterateRows(self, query: str, *args: Any | None, chunkSize: int = 100) -> AsyncIterator[list[Any]]:
+        if not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not utils.isValidInt(chunkSize):
+            raise TypeError(f'chunkSize argument is malformed: \"{chunkSize}\"')
+        elif chunkSize < 1 or chunkSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'chunkSize argument is out of bounds: {chunkSize}')
+
+        self.__requireNotClosed()
+
+        # asyncpg server-side cursors can only exist within a transaction
+        async with self.transaction():
+            async for record in self.__connection.cursor(query, *args, prefetch = chunkSize):
+                yield list(record)
+
     def __requireNotClosed(self):
         if self.isClosed():
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.getDatabaseType()})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # nested transactions just join the transaction that is already open
+            yield
+            return
+
+        async with self.__connection.transaction():
+            self.__isInTransaction = True
+
+            try:
+                yield
+            finally:
+                self.__isInTransaction = False
@@ -0,0 +1,132 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from collections import deque
+
+import aiosqlite
+
+import CynanBot.misc.utils as utils
+
+
+class SqliteConnectionPool():
+
+    def __init__(
+        self,
+        eventLoop: AbstractEventLoop,
+        backingDatabaseFile: str,
+        maxConnections: int = 4,
+        busyTimeoutMillis: int = 5000
+    ):
+        if not isinstance(eventLoop, AbstractEventLoop):
+            raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
+        elif not utils.isValidStr(backingDatabaseFile):
+            raise TypeError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
+        elif not utils.isValidInt(maxConnections):
+            raise TypeError(f'maxConnections argument is malformed: \"{maxConnections}\"')
+        elif maxConnections < 1 or maxConnections > 64:
+            raise ValueError(f'maxConnections argument is out of bounds: {maxConnections}')
+        elif not utils.isValidInt(busyTimeoutMillis):
+            raise TypeError(f'busyTimeoutMillis argument is malformed: \"{busyTimeoutMillis}\"')
+        elif busyTimeoutMillis < 0 or busyTimeoutMillis > utils.getIntMaxSafeSize():
+            raise ValueError(f'busyTimeoutMillis argument is out of bounds: {busyTimeoutMillis}')
+
+        self.__eventLoop: AbstractEventLoop = eventLoop
+        self.__backingDatabaseFile: str = backingDatabaseFile
+        self.__maxConnections: int = maxConnections
+        self.__busyTimeoutMillis: int = busyTimeoutMillis
+
+        self.__isClosed: bool = False
+        self.__connectionCount: int = 0
+        self.__idleConnections: deque[aiosqlite.Connection] = deque()
+        self.__waiters: deque[asyncio.Future[aiosqlite.Connection]] = deque()
+
+    async def acquire(self) -> aiosqlite.Connection:
+        if self.__isClosed:
+            raise RuntimeError(f'This SqliteConnectionPool has already been closed! ({self.__backingDatabaseFile=})')
+
+        if len(self.__idleConnections) >= 1:
+            # idle connections only ever exist while nobody is waiting, as release() hands them straight to waiters
+            return self.__idleConnections.popleft()
+        elif self.__connectionCount < self.__maxConnections:
+            # increment before awaiting so that concurrent callers can't overshoot the limit
+            self.__connectionCount += 1
+
+            try:
+                return await self.__openConnection()
+            except Exception as e:
+                self.__connectionCount -= 1
+                raise e
+
+        waiter: asyncio.Future[aiosqlite.Connection] = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+
+        try:
+            return await waiter
+        except asyncio.CancelledError as e:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # this waiter was handed a connection just as it was cancelled, so pass it along
+                await self.release(waiter.result())
+            elif waiter in self.__waiters:
+                self.__waiters.remove(waiter)
+
+            raise e
+
+    async def close(self):
+        if self.__isClosed:
+            return
+
+        self.__isClosed = True
+
+        while len(self.__waiters) >= 1:
+            waiter = self.__waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_exception(RuntimeError(f'This SqliteConnectionPool was closed while waiting for a connection ({self.__backingDatabaseFile=})'))
+
+        while len(self.__idleConnections) >= 1:
+            connection = self.__idleConnections.popleft()
+            self.__connectionCount -= 1
+            await connection.close()
+
+    def getMaxConnections(self) -> int:
+        return self.__maxConnections
+
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    async def __openConnection(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(
+            database = self.__backingDatabaseFile,
+            loop = self.__eventLoop
+        )
+
+        # WAL lets readers proceed while a single writer is active, which is what allows several
+        # pooled connections to share the same database file without constantly locking each other
+        await connection.execute('PRAGMA journal_mode = WAL')
+        await connection.execute('PRAGMA synchronous = NORMAL')
+        await connection.execute(f'PRAGMA busy_timeout = {self.__busyTimeoutMillis}')
+        await connection.execute('PRAGMA temp_store = MEMORY')
+
+        return connection
+
+    async def release(self, connection: aiosqlite.Connection):
+        if not isinstance(connection, aiosqlite.Connection):
+            raise TypeError(f'connection argument is malformed: \"{connection}\"')
+
+        if connection.in_transaction:
+            # never hand a connection with uncommitted work over to the next borrower
+            await connection.rollback()
+
+        if self.__isClosed:
+            self.__connectionCount -= 1
+            await connection.close()
+            return
+
+        # hand the connection straight to the longest waiting caller, so that new callers can't cut in line
+        while len(self.__waiters) >= 1:
+            waiter = self.__waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(connection)
+                return
+
+        self.__idleConnections.append(connection)
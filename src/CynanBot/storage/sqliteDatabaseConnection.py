@@ -1,5 +1,6 @@
 import sqlite3
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 import aiosqlite
 
@@ -8,23 +9,29 @@ from CynanBot.storage.databaseConnection import DatabaseConnection
 from CynanBot.storage.databaseType import DatabaseType
 from CynanBot.storage.exceptions import (DatabaseConnectionIsClosedException,
                                          DatabaseOperationalError)
+from CynanBot.storage.sqliteConnectionPool import SqliteConnectionPool
 
 
 class SqliteDatabaseConnection(DatabaseConnection):
 
-    def __init__(self, connection: aiosqlite.Connection):
+    def __init__(self, connection: aiosqlite.Connection, pool: SqliteConnectionPool):
         if not isinstance(connection, aiosqlite.Connection):
             raise TypeError(f'connection argument is malformed: \"{connection}\"')
+        elif not isinstance(pool, SqliteConnectionPool):
+            raise TypeError(f'pool argument is malformed: \"{pool}\"')
 
         self.__connection: aiosqlite.Connection = connection
+        self.__pool: SqliteConnectionPool = pool
+
         self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
 
     async def close(self):
         if self.__isClosed:
             return
 
         self.__isClosed = True
-        await self.__connection.close()
+        await self.__pool.release(self.__connection)
 
     async def createTableIfNotExists(self, query: str, *args: Any | None):
         if not utils.isValidStr(query):
@@ -41,9 +48,28 @@ class SqliteDatabaseConnection(DatabaseConnection):
 
         self.__requireNotClosed()
         cursor = await self.__connection.execute(query, args)
-        await self.__connection.commit()
+
+        if not self.__isInTransaction:
+            await self.__connection.commit()
+
         await cursor.close()
 
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        if not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not isinstance(records, list):
+            raise TypeError(f'records argument is malformed: \"{records}\"')
+
+        self.__requireNotClosed()
+
+        if len(records) == 0:
+            return
+
+        await self.__connection.executemany(query, records)
+
+        if not self.__isInTransaction:
+            await self.__connection.commit()
+
     async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
         if not utils.isValidStr(query):
             raise TypeError(f'query argument is malformed: \"{query}\"')
@@ -98,6 +124,57 @@ class SqliteDatabaseConnection(DatabaseConnection):
     def isClosed(self) -> bool:
         return self.__isClosed
 
+    async def iterateRows(self, query: str, *args: Any | None, chunkSize: int = 100) -> AsyncIterator[list[Any]]:
+        if not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not utils.isValidInt(chunkSize):
+            raise TypeError(f'chunkSize argument is malformed: \"{chunkSize}\"')
+        elif chunkSize < 1 or chunkSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'chunkSize argument is out of bounds: {chunkSize}')
+
+        self.__requireNotClosed()
+
+        try:
+            cursor = await self.__connection.execute(query, args)
+        except sqlite3.OperationalError as e:
+            raise DatabaseOperationalError(f'Encountered sqlite3 OperationalError when calling `iterateRows()`: {e}')
+
+        try:
+            while True:
+                rows = await cursor.fetchmany(chunkSize)
+
+                if rows is None or len(rows) == 0:
+                    break
+
+                for row in rows:
+                    yield list(row)
+        finally:
+            await cursor.close()
+
     def __requireNotClosed(self):
         if self.__isClosed:
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.getDatabaseType()})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # nested transactions just join the transaction that is already open
+            yield
+            return
+
+        self.__isInTransaction = True
+
+        try:
+            # IMMEDIATE grabs the write lock up front, which prevents other pooled connections
+            # from deadlocking against this one when a read is later upgraded into a write
+            await self.__connection.execute('BEGIN IMMEDIATE')
+            yield
+        except BaseException as e:
+            await self.__connection.rollback()
+            raise e
+        else:
+            await self.__connection.commit()
+        finally:
+            self.__isInTransaction = False
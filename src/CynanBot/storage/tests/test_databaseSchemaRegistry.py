@@ -0,0 +1,71 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.storage.databaseSchema import DatabaseSchema
+from CynanBot.storage.databaseSchemaRegistry import DatabaseSchemaRegistry
+
+
+class TestDatabaseSchemaRegistry():
+
+    def __createBackingDatabase(self, tmp_path: Path) -> BackingDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+    def __createSchema(self, name: str) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = name,
+            psqlStatements = [ f'CREATE TABLE IF NOT EXISTS {name} (value text NOT NULL)' ],
+            sqliteStatements = [
+                f'CREATE TABLE IF NOT EXISTS {name} (value TEXT NOT NULL)',
+                f'CREATE INDEX IF NOT EXISTS {name}_value ON {name} (value)'
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_getConnection_createsPendingSchemas(self, tmp_path: Path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        backingDatabase.registerSchema(self.__createSchema('apples'))
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('INSERT INTO apples (value) VALUES ($1)', 'fuji')
+        row = await connection.fetchRow('SELECT COUNT(*) FROM apples')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert row == [ 1 ]
+
+    @pytest.mark.asyncio
+    async def test_initializeSchemas_createsAllSchemas(self, tmp_path: Path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        names = [ 'apples', 'bananas', 'cherries', 'dates', 'elderberries' ]
+
+        for name in names:
+            backingDatabase.registerSchema(self.__createSchema(name))
+
+        await backingDatabase.initializeSchemas()
+
+        connection = await backingDatabase.getConnection()
+        rows = await connection.fetchRows('SELECT name FROM sqlite_master WHERE type = $1 ORDER BY name ASC', 'table')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert rows == [ [ name ] for name in names ]
+
+    def test_register_marksSchemaAsPending(self):
+        registry = DatabaseSchemaRegistry()
+        assert not registry.hasPendingSchemas()
+
+        registry.register(self.__createSchema('apples'))
+        assert registry.hasPendingSchemas()
+
+    def test_register_withNone(self):
+        registry = DatabaseSchemaRegistry()
+
+        with pytest.raises(TypeError):
+            registry.register(None) # type: ignore
@@ -0,0 +1,72 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from CynanBot.misc.backgroundTaskHelper import BackgroundTaskHelper
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.storage.databaseMetricsTracker import DatabaseMetricsTracker
+from CynanBot.storage.databaseMetricsTrackerInterface import \
+    DatabaseMetricsTrackerInterface
+from CynanBot.storage.instrumentedBackingDatabase import \
+    InstrumentedBackingDatabase
+from CynanBot.timber.timberStub import TimberStub
+
+
+class TestInstrumentedBackingDatabase():
+
+    def __createTracker(self) -> DatabaseMetricsTrackerInterface:
+        return DatabaseMetricsTracker(
+            backgroundTaskHelper = BackgroundTaskHelper(
+                eventLoop = asyncio.get_event_loop()
+            ),
+            timber = TimberStub()
+        )
+
+    async def __runQueries(self, backingDatabase: InstrumentedBackingDatabase):
+        connection = await backingDatabase.getConnection()
+        await connection.execute('CREATE TABLE IF NOT EXISTS fruits (name TEXT NOT NULL)')
+        await connection.executeMany('INSERT INTO fruits (name) VALUES ($1)', [ ('apple', ), ('banana', ) ])
+        await connection.fetchRows('SELECT name   FROM fruits\n    ORDER BY name ASC')
+        await connection.fetchRows('SELECT name FROM fruits ORDER BY name ASC')
+
+        rows: list[list[str]] = list()
+        async for row in connection.iterateRows('SELECT name FROM fruits', chunkSize = 1):
+            rows.append(row)
+
+        await connection.close()
+        assert rows == [ [ 'apple' ], [ 'banana' ] ]
+
+    @pytest.mark.asyncio
+    async def test_getConnection_recordsQueriesByTag(self, tmp_path: Path):
+        tracker = self.__createTracker()
+        backingDatabase = InstrumentedBackingDatabase(
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = asyncio.get_event_loop(),
+                backingDatabaseFile = str(tmp_path / 'test.sqlite')
+            ),
+            databaseMetricsTracker = tracker,
+            tag = 'BackingDatabase'
+        )
+
+        await self.__runQueries(backingDatabase.withTag('FruitsRepository'))
+        await backingDatabase.close()
+
+        queryMetrics = tracker.getQueryMetrics()
+        callCounts = { metric.query: metric.callCount for metric in queryMetrics }
+        assert callCounts['SELECT name FROM fruits ORDER BY name ASC'] == 2
+        assert callCounts['SELECT name FROM fruits'] == 1
+        assert len(queryMetrics) == 4
+        assert all(metric.tag == 'FruitsRepository' for metric in queryMetrics)
+
+        poolWaitMetrics = tracker.getPoolWaitMetrics()
+        assert len(poolWaitMetrics) == 1
+        assert poolWaitMetrics[0].callCount == 1
+        assert poolWaitMetrics[0].query is None
+        assert poolWaitMetrics[0].tag == 'FruitsRepository'
+
+    def test_recordQuery_withNegativeSeconds(self):
+        tracker = self.__createTracker()
+
+        with pytest.raises(ValueError):
+            tracker.recordQuery('tag', 'SELECT 1', -1)
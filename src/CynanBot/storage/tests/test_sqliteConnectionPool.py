@@ -0,0 +1,126 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from CynanBot.storage.sqliteConnectionPool import SqliteConnectionPool
+
+
+class TestSqliteConnectionPool():
+
+    def __createPool(self, tmp_path: Path, maxConnections: int = 2) -> SqliteConnectionPool:
+        return SqliteConnectionPool(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite'),
+            maxConnections = maxConnections
+        )
+
+    @pytest.mark.asyncio
+    async def test_acquire_reusesReleasedConnection(self, tmp_path: Path):
+        pool = self.__createPool(tmp_path)
+
+        connection = await pool.acquire()
+        await pool.release(connection)
+
+        assert await pool.acquire() is connection
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_usesWalJournalMode(self, tmp_path: Path):
+        pool = self.__createPool(tmp_path)
+
+        connection = await pool.acquire()
+        cursor = await connection.execute('PRAGMA journal_mode')
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        assert row is not None
+        assert row[0] == 'wal'
+
+        await pool.release(connection)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_waitsWhenExhausted(self, tmp_path: Path):
+        pool = self.__createPool(tmp_path, maxConnections = 1)
+
+        connection = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await pool.release(connection)
+        assert await waiter is connection
+
+        await pool.release(connection)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_handsReleasedConnectionToWaitersInOrder(self, tmp_path: Path):
+        pool = self.__createPool(tmp_path, maxConnections = 1)
+
+        connection = await pool.acquire()
+        waiter1 = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        waiter2 = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+
+        await pool.release(connection)
+        latecomer = asyncio.create_task(pool.acquire())
+        assert await waiter1 is connection
+        await asyncio.sleep(0.05)
+        assert not waiter2.done()
+        assert not latecomer.done()
+
+        await pool.release(connection)
+        assert await waiter2 is connection
+
+        await pool.release(connection)
+        assert await latecomer is connection
+
+        await pool.release(connection)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_withCancelledWaiter_skipsIt(self, tmp_path: Path):
+        pool = self.__createPool(tmp_path, maxConnections = 1)
+
+        connection = await pool.acquire()
+        waiter1 = asyncio.create_task(pool.acquire())
+        waiter2 = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        waiter1.cancel()
+        await asyncio.sleep(0)
+
+        await pool.release(connection)
+        assert await waiter2 is connection
+
+        await pool.release(connection)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_failsWaiters(self, tmp_path: Path):
+        pool = self.__createPool(tmp_path, maxConnections = 1)
+
+        connection = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        await pool.close()
+
+        with pytest.raises(RuntimeError):
+            await waiter
+
+        await pool.release(connection)
+
+    @pytest.mark.asyncio
+    async def test_acquire_afterClose(self, tmp_path: Path):
+        pool = self.__createPool(tmp_path)
+        await pool.close()
+        assert pool.isClosed()
+
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+
+    def test_constructor_withMaxConnectionsOutOfBounds(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            self.__createPool(tmp_path, maxConnections = 0)
@@ -0,0 +1,109 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.storage.databaseConnection import DatabaseConnection
+
+
+class TestSqliteDatabaseConnection():
+
+    async def __createConnection(self, tmp_path: Path) -> tuple[BackingDatabase, DatabaseConnection]:
+        backingDatabase: BackingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('CREATE TABLE IF NOT EXISTS things (name TEXT NOT NULL PRIMARY KEY, amount INTEGER NOT NULL)')
+        return backingDatabase, connection
+
+    @pytest.mark.asyncio
+    async def test_executeMany(self, tmp_path: Path):
+        backingDatabase, connection = await self.__createConnection(tmp_path)
+
+        await connection.executeMany(
+            'INSERT INTO things (name, amount) VALUES ($1, $2)',
+            [ ('a', 1), ('b', 2), ('c', 3) ]
+        )
+
+        rows = await connection.fetchRows('SELECT name, amount FROM things ORDER BY name ASC')
+        assert rows == [ [ 'a', 1 ], [ 'b', 2 ], [ 'c', 3 ] ]
+
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_executeMany_withEmptyList(self, tmp_path: Path):
+        backingDatabase, connection = await self.__createConnection(tmp_path)
+        await connection.executeMany('INSERT INTO things (name, amount) VALUES ($1, $2)', list())
+
+        rows = await connection.fetchRows('SELECT name, amount FROM things')
+        assert rows == list()
+
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_commits(self, tmp_path: Path):
+        backingDatabase, connection = await self.__createConnection(tmp_path)
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO things (name, amount) VALUES ($1, $2)', 'a', 1)
+            await connection.executeMany('INSERT INTO things (name, amount) VALUES ($1, $2)', [ ('b', 2) ])
+
+        row = await connection.fetchRow('SELECT COUNT(*) FROM things')
+        assert row == [ 2 ]
+
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_rollsBackOnException(self, tmp_path: Path):
+        backingDatabase, connection = await self.__createConnection(tmp_path)
+
+        with pytest.raises(RuntimeError):
+            async with connection.transaction():
+                await connection.execute('INSERT INTO things (name, amount) VALUES ($1, $2)', 'a', 1)
+                raise RuntimeError()
+
+        row = await connection.fetchRow('SELECT COUNT(*) FROM things')
+        assert row == [ 0 ]
+
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_iterateRows(self, tmp_path: Path):
+        backingDatabase, connection = await self.__createConnection(tmp_path)
+
+        await connection.executeMany(
+            'INSERT INTO things (name, amount) VALUES ($1, $2)',
+            [ (f'thing{index:03}', index) for index in range(250) ]
+        )
+
+        amounts: list[int] = list()
+
+        async for row in connection.iterateRows('SELECT name, amount FROM things ORDER BY amount ASC', chunkSize = 32):
+            assert isinstance(row, list)
+            amounts.append(row[1])
+
+        assert amounts == list(range(250))
+
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_iterateRows_withNoResults(self, tmp_path: Path):
+        backingDatabase, connection = await self.__createConnection(tmp_path)
+        rows: list[list] = list()
+
+        async for row in connection.iterateRows('SELECT name, amount FROM things WHERE amount >= $1', 1):
+            rows.append(row)
+
+        assert len(rows) == 0
+
+        await connection.close()
+        await backingDatabase.close()
@@ -1,11 +1,9 @@
 import asyncio
-import queue
-import traceback
-from queue import SimpleQueue
 
 import CynanBot.misc.utils as utils
 from CynanBot.misc.backgroundTaskHelperInterface import \
     BackgroundTaskHelperInterface
+from CynanBot.misc.eventBus import EventBus
 from CynanBot.soundPlayerManager.soundPlayerManagerInterface import \
     SoundPlayerManagerInterface
 from CynanBot.streamAlertsManager.currentStreamAlert import CurrentStreamAlert
@@ -50,17 +48,29 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
         elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 3:
             raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
 
-        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__soundPlayerManager: SoundPlayerManagerInterface | None = soundPlayerManager
         self.__streamAlertsSettingsRepository: StreamAlertsSettingsRepositoryInterface = streamAlertsSettingsRepository
         self.__timber: TimberInterface = timber
         self.__ttsManager: TtsManagerInterface | None = ttsManager
         self.__queueSleepTimeSeconds: float = queueSleepTimeSeconds
-        self.__queueTimeoutSeconds: float = queueTimeoutSeconds
 
         self.__isStarted: bool = False
         self.__currentAlert: CurrentStreamAlert | None = None
-        self.__alertQueue: SimpleQueue[StreamAlert] = SimpleQueue()
+        self.__alertEventBus: EventBus[StreamAlert] = EventBus(
+            backgroundTaskHelper = backgroundTaskHelper,
+            timber = timber,
+            name = 'StreamAlertsManager alert',
+            publishTimeoutSeconds = queueTimeoutSeconds
+        )
+
+    async def __onAlert(self, alert: StreamAlert):
+        # alerts are played one at a time, as this doesn't return until the current alert has finished playing
+        self.__currentAlert = CurrentStreamAlert(alert)
+
+        while await self.__processCurrentAlert():
+            await asyncio.sleep(self.__queueSleepTimeSeconds)
+
+        await asyncio.sleep(await self.__streamAlertsSettingsRepository.getAlertsDelayBetweenSeconds())
 
     async def __processCurrentAlert(self) -> bool:
         currentAlert = self.__currentAlert
@@ -105,32 +115,10 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
 
         self.__isStarted = True
         self.__timber.log('StreamAlertsManager', 'Starting StreamAlertsManager...')
-        self.__backgroundTaskHelper.createTask(self.__startAlertLoop())
-
-    async def __startAlertLoop(self):
-        while True:
-            if await self.__processCurrentAlert():
-                await asyncio.sleep(self.__queueSleepTimeSeconds)
-                continue
-
-            newAlert: StreamAlert | None = None
-
-            if not self.__alertQueue.empty():
-                try:
-                    newAlert = self.__alertQueue.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('StreamAlertsManager', f'Encountered queue.Empty when grabbing alert from queue (queue size: {self.__alertQueue.qsize()}): {e}', e, traceback.format_exc())
-
-            if newAlert is not None:
-                self.__currentAlert = CurrentStreamAlert(newAlert)
-
-            await asyncio.sleep(await self.__streamAlertsSettingsRepository.getAlertsDelayBetweenSeconds())
+        self.__alertEventBus.start(self.__onAlert)
 
     def submitAlert(self, alert: StreamAlert):
         if not isinstance(alert, StreamAlert):
             raise TypeError(f'alert argument is malformed: \"{alert}\"')
 
-        try:
-            self.__alertQueue.put(alert, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('StreamAlertsManager', f'Encountered queue.Full when submitting a new alert ({alert}) into the alert queue (queue size: {self.__alertQueue.qsize()}): {e}', e, traceback.format_exc())
+        self.__alertEventBus.publishNowait(alert)
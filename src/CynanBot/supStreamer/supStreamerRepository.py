@@ -9,8 +9,7 @@ import CynanBot.misc.utils as utils
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.supStreamer.supStreamerChatter import SupStreamerChatter
 from CynanBot.supStreamer.supStreamerRepositoryInterface import \
     SupStreamerRepositoryInterface
@@ -41,9 +40,10 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
-        self.__isDatabaseReady: bool = False
         self.__caches: dict[str, LRU[str, SupStreamerChatter | None]] = defaultdict(lambda: LRU(cacheSize))
 
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
+
     async def clearCaches(self):
         self.__caches.clear()
         self.__timber.log('SupStreamerRepository', 'Caches cleared')
@@ -63,7 +63,7 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         if chatterUserId in cache:
             return cache[chatterUserId]
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT mostrecentsup FROM supstreamerchatters
@@ -86,19 +86,10 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         cache[chatterUserId] = supStreamerChatter
         return supStreamerChatter
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'supstreamerchatters',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS supstreamerchatters (
                         chatteruserid text NOT NULL,
@@ -107,9 +98,8 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
                         PRIMARY KEY (chatteruserid, twitchchannelid)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS supstreamerchatters (
                         chatteruserid TEXT NOT NULL,
@@ -118,11 +108,8 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
                         PRIMARY KEY (chatteruserid, twitchchannelid)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def set(
         self,
@@ -142,7 +129,7 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
             userId = chatterUserId
         )
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO supstreamerchatters (chatteruserid, mostrecentsup, twitchchannelid)
@@ -17,6 +17,10 @@ class AbsTriviaAction(ABC):
     def actionId(self) -> str:
         return self.__actionId
 
+    @abstractmethod
+    def getTwitchChannelId(self) -> str:
+        pass
+
     @property
     @abstractmethod
     def triviaActionType(self) -> TriviaActionType:
@@ -3,8 +3,7 @@ from typing import Any
 
 import CynanBot.misc.utils as utils
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.storage.exceptions import DatabaseOperationalError
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.additionalAnswers.additionalTriviaAnswer import \
@@ -61,7 +60,7 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def addAdditionalTriviaAnswer(
         self,
@@ -136,7 +135,7 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
                 triviaSource = triviaSource
             )
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         exception: DatabaseOperationalError | None = None
 
         try:
@@ -222,7 +221,7 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             self.__timber.log('AdditionalTriviaAnswersRepository', f'Attempted to delete additional answers for {triviaSource.toStr()}:{triviaId}, but there were none')
             return None
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 DELETE FROM additionaltriviaanswers
@@ -252,7 +251,7 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         if not await self.__triviaSettingsRepository.areAdditionalTriviaAnswersEnabled():
             return None
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records: list[list[Any]] | None = None
 
         try:
@@ -291,47 +290,31 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             triviaSource = triviaSource
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.getDatabaseType():
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                            additionalanswer public.citext NOT NULL,
-                            triviaid text NOT NULL,
-                            triviasource text NOT NULL,
-                            triviatype text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                            additionalanswer TEXT NOT NULL COLLATE NOCASE,
-                            triviaid TEXT NOT NULL,
-                            triviasource TEXT NOT NULL,
-                            triviatype TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'additionaltriviaanswers',
+            psqlStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                        additionalanswer public.citext NOT NULL,
+                        triviaid text NOT NULL,
+                        triviasource text NOT NULL,
+                        triviatype text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
+                    )
+                '''
+            ],
+            sqliteStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                        additionalanswer TEXT NOT NULL COLLATE NOCASE,
+                        triviaid TEXT NOT NULL,
+                        triviasource TEXT NOT NULL,
+                        triviatype TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
+                    )
+                '''
+            ]
+        )
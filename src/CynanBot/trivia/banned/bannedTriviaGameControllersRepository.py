@@ -4,8 +4,7 @@ import CynanBot.misc.utils as utils
 from CynanBot.administratorProviderInterface import \
     AdministratorProviderInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.banned.addBannedTriviaGameControllerResult import \
     AddBannedTriviaGameControllerResult
@@ -48,7 +47,7 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def addBannedController(self, userName: str) -> AddBannedTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -66,7 +65,7 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
             self.__timber.log('BannedTriviaGameControllersRepository', f'Retrieved no userId from UserIdsRepository when trying to add \"{userName}\" as a banned trivia game controller: {e}', e, traceback.format_exc())
             return AddBannedTriviaGameControllerResult.ERROR
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT COUNT(1) FROM bannedtriviagamecontrollers
@@ -99,7 +98,7 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         return AddBannedTriviaGameControllerResult.ADDED
 
     async def getBannedControllers(self) -> list[BannedTriviaGameController]:
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT bannedtriviagamecontrollers.userid, userids.username FROM bannedtriviagamecontrollers
@@ -125,37 +124,24 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
 
         return controllers
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'bannedtriviagamecontrollers',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
                         userid text NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
                         userid TEXT NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def removeBannedController(self, userName: str) -> RemoveBannedTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -1,7 +1,6 @@
 import CynanBot.misc.utils as utils
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.banned.bannedTriviaIdsRepositoryInterface import \
     BannedTriviaIdsRepositoryInterface
@@ -26,7 +25,7 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def ban(
         self,
@@ -49,7 +48,7 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
 
         self.__timber.log('BannedTriviaIdsRepository', f'Banning trivia question (triviaId=\"{triviaId}\", userId=\"{userId}\", triviaSource=\"{triviaSource}\")...')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO bannedtriviaids (triviaid, triviasource, userid)
@@ -63,10 +62,6 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
 
         return BanTriviaQuestionResult.BANNED
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def getInfo(
         self,
         triviaId: str,
@@ -77,7 +72,7 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         elif not isinstance(triviaSource, TriviaSource):
             raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT bannedtriviaids.triviaid, bannedtriviaids.triviasource, bannedtriviaids.userid, userids.username FROM bannedtriviaids
@@ -100,15 +95,10 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
             triviaSource = TriviaSource.fromStr(record[1])
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'bannedtriviaids',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviaids (
                         triviaid public.citext NOT NULL,
@@ -117,9 +107,8 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
                         PRIMARY KEY (triviaid, triviasource)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviaids (
                         triviaid TEXT NOT NULL COLLATE NOCASE,
@@ -128,11 +117,8 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
                         PRIMARY KEY (triviaid, triviasource)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def isBanned(self, triviaId: str, triviaSource: TriviaSource) -> bool:
         if not utils.isValidStr(triviaId):
@@ -169,7 +155,7 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
 
         self.__timber.log('BannedTriviaIdsRepository', f'Unbanning trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")...')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 DELETE FROM bannedtriviaids
@@ -1,7 +1,6 @@
 import CynanBot.misc.utils as utils
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.trivia.emotes.triviaEmoteRepositoryInterface import \
     TriviaEmoteRepositoryInterface
 
@@ -13,17 +12,14 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
-        self.__isDatabaseReady: bool = False
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def getEmoteIndexFor(self, twitchChannelId: str) -> int | None:
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT emoteindex FROM triviaemotes
@@ -41,35 +37,26 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
         await connection.close()
         return emoteIndex
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'triviaemotes',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviaemotes (
                         emoteindex smallint DEFAULT 0 NOT NULL,
                         twitchchannelid text NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviaemotes (
                         emoteindex INTEGER NOT NULL DEFAULT 0,
                         twitchchannelid TEXT NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def setEmoteIndexFor(self, emoteIndex: int, twitchChannelId: str):
         if not utils.isValidInt(emoteIndex):
@@ -79,7 +66,7 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO triviaemotes (emoteindex, twitchchannelid)
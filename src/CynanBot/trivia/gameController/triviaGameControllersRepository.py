@@ -2,8 +2,7 @@ import traceback
 
 import CynanBot.misc.utils as utils
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.gameController.addTriviaGameControllerResult import \
     AddTriviaGameControllerResult
@@ -42,7 +41,7 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def addController(
         self,
@@ -68,7 +67,7 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
             self.__timber.log('TriviaGameControllersRepository', f'Unable to find userId when trying to add a trivia game controller ({twitchChannelId=}) ({userName=}): {e}', e, traceback.format_exc())
             return AddTriviaGameControllerResult.ERROR
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT COUNT(1) FROM triviagamecontrollers
@@ -111,7 +110,7 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT triviagamecontrollers.twitchchannelid, triviagamecontrollers.userid, userids.username FROM triviagamecontrollers
@@ -139,19 +138,10 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
         controllers.sort(key = lambda controller: controller.userName.casefold())
         return controllers
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'triviagamecontrollers',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviagamecontrollers (
                         twitchchannelid text NOT NULL,
@@ -159,9 +149,8 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
                         PRIMARY KEY (twitchchannelid, userid)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviagamecontrollers (
                         twitchchannelid TEXT NOT NULL,
@@ -169,11 +158,8 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
                         PRIMARY KEY (twitchchannelid, userid)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def removeController(
         self,
@@ -4,8 +4,7 @@ import CynanBot.misc.utils as utils
 from CynanBot.administratorProviderInterface import \
     AdministratorProviderInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.gameController.addTriviaGameControllerResult import \
     AddTriviaGameControllerResult
@@ -48,7 +47,7 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def addController(self, userName: str) -> AddTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -66,7 +65,7 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
             self.__timber.log('TriviaGameGlobalControllersRepository', f'Unable to find userId when trying to add a trivia game global controller ({userName=}): {e}', e, traceback.format_exc())
             return AddTriviaGameControllerResult.ERROR
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT COUNT(1) FROM triviagameglobalcontrollers
@@ -100,7 +99,7 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
         return AddTriviaGameControllerResult.ADDED
 
     async def getControllers(self) -> list[TriviaGameGlobalController]:
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT triviagameglobalcontrollers.userid, userids.username FROM triviagameglobalcontrollers
@@ -124,37 +123,24 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
         controllers.sort(key = lambda controller: controller.userName.casefold())
         return controllers
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'triviagameglobalcontrollers',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
                         userid text NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
                         userid TEXT NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def removeController(self, userName: str) -> RemoveTriviaGameControllerResult:
         if not utils.isValidStr(userName):
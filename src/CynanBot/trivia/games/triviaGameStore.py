@@ -1,3 +1,8 @@
+import heapq
+from datetime import datetime
+from itertools import count
+from typing import Iterator
+
 import CynanBot.misc.utils as utils
 from CynanBot.trivia.games.absTriviaGameState import AbsTriviaGameState
 from CynanBot.trivia.games.superTriviaGameState import SuperTriviaGameState
@@ -10,8 +15,12 @@ from CynanBot.trivia.triviaExceptions import UnknownTriviaGameTypeException
 class TriviaGameStore(TriviaGameStoreInterface):
 
     def __init__(self):
-        self.__normalGameStates: list[TriviaGameState] = list()
-        self.__superGameStates: list[SuperTriviaGameState] = list()
+        self.__normalGameStates: dict[str, dict[str, TriviaGameState]] = dict()
+        self.__superGameStates: dict[str, SuperTriviaGameState] = dict()
+
+        # ordered by end time, entries for games that have since been removed are discarded lazily
+        self.__endTimeHeap: list[tuple[datetime, int, AbsTriviaGameState]] = list()
+        self.__endTimeHeapCounter: Iterator[int] = count()
 
     async def add(self, state: AbsTriviaGameState):
         if not isinstance(state, AbsTriviaGameState):
@@ -24,17 +33,25 @@ class TriviaGameStore(TriviaGameStoreInterface):
         else:
             raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType: \"{state.getTriviaGameType()}\"')
 
+        self.__pushEndTime(state)
+
     async def __addNormalGame(self, state: TriviaGameState):
         if not isinstance(state, TriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        self.__normalGameStates.append(state)
+        channelGameStates = self.__normalGameStates.get(state.getTwitchChannelId())
+
+        if channelGameStates is None:
+            channelGameStates = dict()
+            self.__normalGameStates[state.getTwitchChannelId()] = channelGameStates
+
+        channelGameStates[state.getUserId()] = state
 
     async def __addSuperGame(self, state: SuperTriviaGameState):
         if not isinstance(state, SuperTriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        self.__superGameStates.append(state)
+        self.__superGameStates[state.getTwitchChannelId()] = state
 
     async def getAll(self) -> list[AbsTriviaGameState]:
         normalGames = await self.getNormalGames()
@@ -46,6 +63,35 @@ class TriviaGameStore(TriviaGameStoreInterface):
 
         return allGames
 
+    async def getExpiredGames(self, now: datetime) -> list[AbsTriviaGameState]:
+        if not isinstance(now, datetime):
+            raise TypeError(f'now argument is malformed: \"{now}\"')
+
+        expiredGames: list[AbsTriviaGameState] = list()
+
+        while len(self.__endTimeHeap) >= 1 and self.__endTimeHeap[0][0] <= now:
+            state = heapq.heappop(self.__endTimeHeap)[2]
+
+            if self.__isStored(state):
+                expiredGames.append(state)
+
+        # expired games stay in the heap until they're actually removed, so that they'll be returned again if removing them fails
+        for state in expiredGames:
+            self.__pushEndTime(state)
+
+        return expiredGames
+
+    async def getNextEndTime(self) -> datetime | None:
+        while len(self.__endTimeHeap) >= 1:
+            endTime, _, state = self.__endTimeHeap[0]
+
+            if self.__isStored(state):
+                return endTime
+
+            heapq.heappop(self.__endTimeHeap)
+
+        return None
+
     async def getNormalGame(
         self,
         twitchChannelId: str,
@@ -56,40 +102,44 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
+        channelGameStates = self.__normalGameStates.get(twitchChannelId)
 
-        for state in normalGames:
-            if twitchChannelId == state.getTwitchChannelId() and userId == state.getUserId():
-                return state
+        if channelGameStates is None:
+            return None
 
-        return None
+        return channelGameStates.get(userId)
 
     async def getNormalGames(self) -> list[TriviaGameState]:
-        return utils.copyList(self.__normalGameStates)
+        normalGames: list[TriviaGameState] = list()
+
+        for channelGameStates in self.__normalGameStates.values():
+            normalGames.extend(channelGameStates.values())
+
+        return normalGames
 
     async def getSuperGame(self, twitchChannelId: str) -> SuperTriviaGameState | None:
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        superGames = await self.getSuperGames()
-
-        for state in superGames:
-            if twitchChannelId == state.getTwitchChannelId():
-                return state
-
-        return None
+        return self.__superGameStates.get(twitchChannelId)
 
     async def getSuperGames(self) -> list[SuperTriviaGameState]:
-        return utils.copyList(self.__superGameStates)
+        return list(self.__superGameStates.values())
 
     async def getTwitchChannelIdsWithActiveSuperGames(self) -> list[str]:
-        superGames = await self.getSuperGames()
-        twitchChannelIds: set[str] = set()
+        return list(self.__superGameStates.keys())
 
-        for state in superGames:
-            twitchChannelIds.add(state.getTwitchChannelId())
+    def __isStored(self, state: AbsTriviaGameState) -> bool:
+        if isinstance(state, TriviaGameState):
+            channelGameStates = self.__normalGameStates.get(state.getTwitchChannelId())
+            return channelGameStates is not None and channelGameStates.get(state.getUserId()) is state
+        elif isinstance(state, SuperTriviaGameState):
+            return self.__superGameStates.get(state.getTwitchChannelId()) is state
+        else:
+            return False
 
-        return list(twitchChannelIds)
+    def __pushEndTime(self, state: AbsTriviaGameState):
+        heapq.heappush(self.__endTimeHeap, (state.getEndTime(), next(self.__endTimeHeapCounter), state))
 
     async def removeNormalGame(
         self,
@@ -101,24 +151,18 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
+        channelGameStates = self.__normalGameStates.get(twitchChannelId)
 
-        for index, state in enumerate(normalGames):
-            if twitchChannelId == state.getTwitchChannelId() and userId == state.getUserId():
-                del self.__normalGameStates[index]
-                return True
+        if channelGameStates is None or channelGameStates.pop(userId, None) is None:
+            return False
 
-        return False
+        if len(channelGameStates) == 0:
+            del self.__normalGameStates[twitchChannelId]
+
+        return True
 
     async def removeSuperGame(self, twitchChannelId: str) -> bool:
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        superGames = await self.getSuperGames()
-
-        for index, state in enumerate(superGames):
-            if twitchChannelId == state.getTwitchChannelId():
-                del self.__superGameStates[index]
-                return True
-
-        return False
+        return self.__superGameStates.pop(twitchChannelId, None) is not None
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from CynanBot.trivia.games.absTriviaGameState import AbsTriviaGameState
 from CynanBot.trivia.games.superTriviaGameState import SuperTriviaGameState
@@ -15,6 +16,14 @@ class TriviaGameStoreInterface(ABC):
     async def getAll(self) -> list[AbsTriviaGameState]:
         pass
 
+    @abstractmethod
+    async def getExpiredGames(self, now: datetime) -> list[AbsTriviaGameState]:
+        pass
+
+    @abstractmethod
+    async def getNextEndTime(self) -> datetime | None:
+        pass
+
     @abstractmethod
     async def getNormalGame(
         self,
@@ -1,7 +1,6 @@
 import CynanBot.misc.utils as utils
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.trivia.score.triviaScoreRepositoryInterface import \
     TriviaScoreRepositoryInterface
 from CynanBot.trivia.score.triviaScoreResult import TriviaScoreResult
@@ -15,7 +14,7 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
 
         self.__backingDatabase: BackingDatabase = backingDatabase
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def fetchTriviaScore(
         self,
@@ -30,7 +29,7 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid FROM triviascores
@@ -74,10 +73,6 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
             userId = userId
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def incrementSuperTriviaWins(
         self,
         twitchChannel: str,
@@ -219,15 +214,10 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
 
         return newResult
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'triviascores',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviascores (
                         streak integer DEFAULT 0 NOT NULL,
@@ -239,9 +229,8 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
                         PRIMARY KEY (twitchchannelid, userid)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviascores (
                         streak INTEGER NOT NULL DEFAULT 0,
@@ -253,11 +242,8 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
                         PRIMARY KEY (twitchchannelid, userid)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def __updateTriviaScore(
         self,
@@ -28,6 +28,17 @@ from CynanBot.trivia.triviaSettingsRepositoryInterface import \
     TriviaSettingsRepositoryInterface
 
 
+class CountingTriviaSettingsRepository(TriviaSettingsRepository):
+
+    def __init__(self):
+        super().__init__(settingsJsonReader = JsonStaticReader(dict()))
+        self.levenshteinThresholdGrowthRateReads: int = 0
+
+    async def getLevenshteinThresholdGrowthRate(self) -> int:
+        self.levenshteinThresholdGrowthRateReads = self.levenshteinThresholdGrowthRateReads + 1
+        return await super().getLevenshteinThresholdGrowthRate()
+
+
 class TestTriviaAnswerChecker():
 
     timber: TimberInterface = TimberStub()
@@ -212,6 +223,42 @@ class TestTriviaAnswerChecker():
         result = await self.triviaAnswerChecker.checkAnswer('nouth korea', question)
         assert result is TriviaAnswerCheckResult.INCORRECT
 
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withQuestionAnswerQuestion_compilesAnswerMatcherOnce(self):
+        triviaSettingsRepository = CountingTriviaSettingsRepository()
+        triviaAnswerChecker: TriviaAnswerCheckerInterface = TriviaAnswerChecker(
+            timber = self.timber,
+            triviaAnswerCompiler = self.triviaAnswerCompiler,
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        question: AbsTriviaQuestion = QuestionAnswerTriviaQuestion(
+            correctAnswers = [ 'Saint Louis Cardinals', 'Cardinals' ],
+            cleanedCorrectAnswers = [ 'saint louis cardinals', 'cardinals' ],
+            category = 'Test Category',
+            categoryId = None,
+            originalCorrectAnswers = [ 'Saint Louis Cardinals', 'Cardinals' ],
+            question = 'This baseball team plays at Busch Stadium.',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.J_SERVICE,
+        )
+
+        result = await triviaAnswerChecker.checkAnswer('st louis cardinals', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await triviaAnswerChecker.checkAnswer('saintlouis cardinal', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await triviaAnswerChecker.checkAnswer('cardinal', question)
+        assert result is TriviaAnswerCheckResult.CORRECT
+
+        result = await triviaAnswerChecker.checkAnswer('saint louis blues', question)
+        assert result is TriviaAnswerCheckResult.INCORRECT
+
+        assert triviaSettingsRepository.levenshteinThresholdGrowthRateReads == 1
+
     @pytest.mark.asyncio
     async def test_checkAnswer_withParentheticalQuestionAnswerQuestion(self):
         answer = '(Kurt) Vonnegut (Jr.)'
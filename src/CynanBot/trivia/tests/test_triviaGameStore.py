@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -340,3 +340,149 @@ class TriviaGameStoreTests():
     def test_sanity(self):
         assert self.triviaGameStore is not None
         assert isinstance(self.triviaGameStore, TriviaGameStoreInterface)
+
+
+class TestTriviaGameStoreEndTimes():
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    question: AbsTriviaQuestion = TrueFalseTriviaQuestion(
+        correctAnswer = True,
+        category = None,
+        categoryId = None,
+        question = 'Is this a question?',
+        triviaId = 'abc123',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.J_SERVICE
+    )
+
+    def __createNormalGame(self, endTime: datetime, twitchChannelId: str, userId: str) -> TriviaGameState:
+        return TriviaGameState(
+            triviaQuestion = self.question,
+            endTime = endTime,
+            basePointsForWinning = 5,
+            pointsForWinning = 5,
+            secondsToLive = 60,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            gameId = f'{twitchChannelId}{userId}{endTime.timestamp()}',
+            twitchChannel = f'channel{twitchChannelId}',
+            twitchChannelId = twitchChannelId,
+            userId = userId,
+            userName = f'user{userId}'
+        )
+
+    def __createSuperGame(self, endTime: datetime, twitchChannelId: str) -> SuperTriviaGameState:
+        return SuperTriviaGameState(
+            triviaQuestion = self.question,
+            endTime = endTime,
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = 60,
+            toxicTriviaPunishmentMultiplier = 2,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            gameId = f'{twitchChannelId}{endTime.timestamp()}',
+            twitchChannel = f'channel{twitchChannelId}',
+            twitchChannelId = twitchChannelId
+        )
+
+    @pytest.mark.asyncio
+    async def test_getExpiredGames(self):
+        triviaGameStore = TriviaGameStore()
+        now = datetime.now(self.timeZoneRepository.getDefault())
+        expiredNormalGame = self.__createNormalGame(now - timedelta(seconds = 5), 'c', 'e')
+        activeNormalGame = self.__createNormalGame(now + timedelta(seconds = 5), 'c', 's')
+        expiredSuperGame = self.__createSuperGame(now - timedelta(seconds = 1), 'c')
+        await triviaGameStore.add(activeNormalGame)
+        await triviaGameStore.add(expiredSuperGame)
+        await triviaGameStore.add(expiredNormalGame)
+
+        games = await triviaGameStore.getExpiredGames(now)
+        assert games == [ expiredNormalGame, expiredSuperGame ]
+
+        # expired games keep being returned until they're removed
+        games = await triviaGameStore.getExpiredGames(now)
+        assert games == [ expiredNormalGame, expiredSuperGame ]
+
+        await triviaGameStore.removeNormalGame('c', 'e')
+        await triviaGameStore.removeSuperGame('c')
+
+        games = await triviaGameStore.getExpiredGames(now)
+        assert len(games) == 0
+
+        games = await triviaGameStore.getExpiredGames(now + timedelta(seconds = 10))
+        assert games == [ activeNormalGame ]
+
+    @pytest.mark.asyncio
+    async def test_getExpiredGames_withReplacedGame_ignoresOldEndTime(self):
+        triviaGameStore = TriviaGameStore()
+        now = datetime.now(self.timeZoneRepository.getDefault())
+        oldGame = self.__createNormalGame(now - timedelta(seconds = 5), 'c', 'e')
+        newGame = self.__createNormalGame(now + timedelta(seconds = 5), 'c', 'e')
+        await triviaGameStore.add(oldGame)
+        await triviaGameStore.removeNormalGame('c', 'e')
+        await triviaGameStore.add(newGame)
+
+        games = await triviaGameStore.getExpiredGames(now)
+        assert len(games) == 0
+        assert await triviaGameStore.getNextEndTime() == newGame.getEndTime()
+        assert await triviaGameStore.getNormalGame('c', 'e') is newGame
+
+    @pytest.mark.asyncio
+    async def test_getExpiredGames_withEmptyTriviaGameStore_returnsEmptyList(self):
+        triviaGameStore = TriviaGameStore()
+        games = await triviaGameStore.getExpiredGames(datetime.now(self.timeZoneRepository.getDefault()))
+        assert len(games) == 0
+
+    @pytest.mark.asyncio
+    async def test_getNextEndTime(self):
+        triviaGameStore = TriviaGameStore()
+        now = datetime.now(self.timeZoneRepository.getDefault())
+        game1 = self.__createNormalGame(now + timedelta(seconds = 30), 'c', 'e')
+        game2 = self.__createSuperGame(now + timedelta(seconds = 10), 'i')
+        await triviaGameStore.add(game1)
+        await triviaGameStore.add(game2)
+        assert await triviaGameStore.getNextEndTime() == game2.getEndTime()
+
+        await triviaGameStore.removeSuperGame('i')
+        assert await triviaGameStore.getNextEndTime() == game1.getEndTime()
+
+        await triviaGameStore.removeNormalGame('c', 'e')
+        assert await triviaGameStore.getNextEndTime() is None
+
+    @pytest.mark.asyncio
+    async def test_getNormalGame_withManyChannelsAndUsers(self):
+        triviaGameStore = TriviaGameStore()
+        endTime = datetime.now(self.timeZoneRepository.getDefault()) + timedelta(seconds = 60)
+
+        for twitchChannelId in [ 'a', 'b', 'c' ]:
+            for userId in [ 'x', 'y', 'z' ]:
+                await triviaGameStore.add(self.__createNormalGame(endTime, twitchChannelId, userId))
+
+        game = await triviaGameStore.getNormalGame('b', 'y')
+        assert game is not None
+        assert game.getTwitchChannelId() == 'b'
+        assert game.getUserId() == 'y'
+        assert len(await triviaGameStore.getNormalGames()) == 9
+
+        assert await triviaGameStore.removeNormalGame('b', 'y') is True
+        assert await triviaGameStore.getNormalGame('b', 'y') is None
+        assert await triviaGameStore.removeNormalGame('b', 'y') is False
+        assert len(await triviaGameStore.getNormalGames()) == 8
+
+    @pytest.mark.asyncio
+    async def test_getTwitchChannelIdsWithActiveSuperGames(self):
+        triviaGameStore = TriviaGameStore()
+        endTime = datetime.now(self.timeZoneRepository.getDefault()) + timedelta(seconds = 60)
+        await triviaGameStore.add(self.__createSuperGame(endTime, 'c'))
+        await triviaGameStore.add(self.__createSuperGame(endTime, 'i'))
+        await triviaGameStore.add(self.__createNormalGame(endTime, 's', 'e'))
+
+        twitchChannelIds = await triviaGameStore.getTwitchChannelIdsWithActiveSuperGames()
+        assert set(twitchChannelIds) == { 'c', 'i' }
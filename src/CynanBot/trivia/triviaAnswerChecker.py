@@ -2,6 +2,7 @@ import math
 import re
 import traceback
 from typing import Any, Generator, Pattern
+from weakref import WeakKeyDictionary
 
 import polyleven
 
@@ -20,6 +21,7 @@ from CynanBot.trivia.questions.trueFalseTriviaQuestion import \
 from CynanBot.trivia.triviaAnswerCheckerInterface import \
     TriviaAnswerCheckerInterface
 from CynanBot.trivia.triviaAnswerCheckResult import TriviaAnswerCheckResult
+from CynanBot.trivia.triviaAnswerMatcher import TriviaAnswerMatcher
 from CynanBot.trivia.triviaExceptions import (BadTriviaAnswerException,
                                               UnsupportedTriviaTypeException)
 from CynanBot.trivia.triviaSettingsRepositoryInterface import \
@@ -45,6 +47,8 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         self.__triviaAnswerCompiler: TriviaAnswerCompilerInterface = triviaAnswerCompiler
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
 
+        # a question's matcher is built on its first guess, and lives for as long as the question itself does
+        self.__answerMatchers: WeakKeyDictionary[QuestionAnswerTriviaQuestion, TriviaAnswerMatcher] = WeakKeyDictionary()
         self.__whitespacePattern: Pattern = re.compile(r'\s\s+', re.IGNORECASE)
 
         self.__irregularNouns: dict[str, set[str]] = {
@@ -151,41 +155,38 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         elif triviaQuestion.triviaType is not TriviaQuestionType.QUESTION_ANSWER:
             raise ValueError(f'TriviaType is not {TriviaQuestionType.QUESTION_ANSWER}: \"{triviaQuestion.triviaType}\"')
 
+        answerMatcher = await self.__getAnswerMatcher(triviaQuestion)
+
         # prevent potential for insane answer lengths
-        maxPhraseGuessLength = await self.__triviaSettingsRepository.getMaxPhraseGuessLength()
-        if utils.isValidStr(answer) and len(answer) > maxPhraseGuessLength:
-            answer = answer[0:maxPhraseGuessLength]
+        if utils.isValidStr(answer) and len(answer) > answerMatcher.maxPhraseGuessLength:
+            answer = answer[0:answerMatcher.maxPhraseGuessLength]
 
         cleanedAnswers = await self.__triviaAnswerCompiler.compileTextAnswersList([ answer ], False)
         if not all(utils.isValidStr(cleanedAnswer) for cleanedAnswer in cleanedAnswers):
             return TriviaAnswerCheckResult.INCORRECT
 
-        cleanedCorrectAnswers = triviaQuestion.cleanedCorrectAnswers
+        cleanedCorrectAnswers = answerMatcher.cleanedCorrectAnswers
         self.__timber.log('TriviaAnswerChecker', f'In depth question/answer debug information — ({answer=}) ({cleanedAnswers=}) ({triviaQuestion.correctAnswers=}) ({cleanedCorrectAnswers=}) ({extras=})')
 
-        for cleanedCorrectAnswer in cleanedCorrectAnswers:
-            for cleanedAnswer in cleanedAnswers:
-                expandedGuesses = await self.__triviaAnswerCompiler.expandNumerals(cleanedAnswer)
+        for cleanedAnswer in cleanedAnswers:
+            expandedGuesses = await self.__triviaAnswerCompiler.expandNumerals(cleanedAnswer)
 
-                for guess in expandedGuesses:
-                    if guess == cleanedCorrectAnswer:
-                        return TriviaAnswerCheckResult.CORRECT
+            for guess in expandedGuesses:
+                if guess in cleanedCorrectAnswers:
+                    return TriviaAnswerCheckResult.CORRECT
+
+                guessWords = self.__splitWords(guess)
+                guessWordVariants: dict[tuple[int, int], list[str]] = dict()
 
-                    guessWords = self.__whitespacePattern.sub(' ', guess).split(' ')
-                    answerWords = self.__whitespacePattern.sub(' ', cleanedCorrectAnswer).split(' ')
-                    minWords = min(len(guessWords), len(answerWords))
-
-                    for gWords in self.__mergeWords(guessWords, minWords):
-                        for aWords in self.__mergeWords(answerWords, minWords):
-                            # This expansion of all() is required because you can't perform list comprehension on async
-                            #   generators yet. :(
-                            valid = True
-                            for i in range(len(gWords)):
-                                if not await self.__compareWords(gWords[i], aWords[i]):
-                                    valid = False
-                                    break
-                            if valid:
-                                return TriviaAnswerCheckResult.CORRECT
+                for index, answerWords in enumerate(answerMatcher.correctAnswerWords):
+                    if self.__matchesAnswerWords(
+                        guessWords = guessWords,
+                        guessWordVariants = guessWordVariants,
+                        answerWordCount = len(answerWords),
+                        answerWordVariants = answerMatcher.correctAnswerWordVariants[index],
+                        thresholdGrowthRate = answerMatcher.levenshteinThresholdGrowthRate
+                    ):
+                        return TriviaAnswerCheckResult.CORRECT
 
         return TriviaAnswerCheckResult.INCORRECT
 
@@ -212,29 +213,15 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         else:
             return TriviaAnswerCheckResult.INCORRECT
 
-    # generates all possible groupings of the given words such that the resulting word count is target_length
-    # example: words = ["a", "b", "c", "d"], target_length = 2
-    #          generates ["abc", "d"], ["ab", "cd"], ["a", "bcd"]
-    def __mergeWords(
-        self,
-        wordList: list[str],
-        target_length: int
-    ) -> Generator[list[str], None, None]:
-        if target_length == 1:
-            yield [''.join(wordList)]
-        elif len(wordList) <= target_length:
-            yield wordList
-        else:
-            for i in range(len(wordList) - target_length + 1):
-                for w in self.__mergeWords(wordList[i + 1:], target_length - 1):
-                    yield [''.join(wordList[0:i + 1])] + w
-
     # compare two individual words, returns true if any valid variants match between the two words
-    async def __compareWords(self, word1: str, word2: str) -> bool:
-        thresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate()
-
-        for w1 in self.__genVariantPossibilities(word1):
-            for w2 in self.__genVariantPossibilities(word2):
+    def __compareWords(
+        self,
+        variants1: list[str],
+        variants2: list[str],
+        thresholdGrowthRate: int
+    ) -> bool:
+        for w1 in variants1:
+            for w2 in variants2:
                 # calculate threshold based on shorter word length
                 threshold = math.floor(min(len(w1), len(w2)) / thresholdGrowthRate)
                 dist = polyleven.levenshtein(w1, w2, threshold + 1)
@@ -243,6 +230,29 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
 
         return False
 
+    async def __compileAnswerMatcher(self, triviaQuestion: QuestionAnswerTriviaQuestion) -> TriviaAnswerMatcher:
+        correctAnswerWords: list[list[str]] = list()
+        correctAnswerWordVariants: list[dict[tuple[int, int], list[str]]] = list()
+
+        for cleanedCorrectAnswer in triviaQuestion.cleanedCorrectAnswers:
+            answerWords = self.__splitWords(cleanedCorrectAnswer)
+            answerWordVariants: dict[tuple[int, int], list[str]] = dict()
+
+            for start in range(len(answerWords)):
+                for end in range(start + 1, len(answerWords) + 1):
+                    self.__getWordVariants(answerWords, start, end, answerWordVariants)
+
+            correctAnswerWords.append(answerWords)
+            correctAnswerWordVariants.append(answerWordVariants)
+
+        return TriviaAnswerMatcher(
+            cleanedCorrectAnswers = utils.copyList(triviaQuestion.cleanedCorrectAnswers),
+            correctAnswerWords = correctAnswerWords,
+            correctAnswerWordVariants = correctAnswerWordVariants,
+            levenshteinThresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate(),
+            maxPhraseGuessLength = await self.__triviaSettingsRepository.getMaxPhraseGuessLength()
+        )
+
     def __genVariantPossibilities(self, word: str) -> Generator[str, None, None]:
         yield word
 
@@ -1076,3 +1086,94 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
             yield 'world war 2'
         if word == 'xmas':
             yield 'christmas'
+
+    async def __getAnswerMatcher(self, triviaQuestion: QuestionAnswerTriviaQuestion) -> TriviaAnswerMatcher:
+        answerMatcher = self.__answerMatchers.get(triviaQuestion)
+
+        if answerMatcher is None:
+            answerMatcher = await self.__compileAnswerMatcher(triviaQuestion)
+            self.__answerMatchers[triviaQuestion] = answerMatcher
+
+        return answerMatcher
+
+    def __getWordVariants(
+        self,
+        words: list[str],
+        start: int,
+        end: int,
+        wordVariants: dict[tuple[int, int], list[str]]
+    ) -> list[str]:
+        variants = wordVariants.get((start, end))
+
+        if variants is None:
+            word = ''.join(words[start:end])
+
+            if len(word) == 0:
+                variants = [ word ]
+            else:
+                variants = list(dict.fromkeys(self.__genVariantPossibilities(word)))
+
+            wordVariants[(start, end)] = variants
+
+        return variants
+
+    def __matchesAnswerWords(
+        self,
+        guessWords: list[str],
+        guessWordVariants: dict[tuple[int, int], list[str]],
+        answerWordCount: int,
+        answerWordVariants: dict[tuple[int, int], list[str]],
+        thresholdGrowthRate: int
+    ) -> bool:
+        minWords = min(len(guessWords), answerWordCount)
+
+        # the same pair of word runs shows up in many different groupings, so each pair is only compared once
+        comparisons: dict[tuple[int, int, int, int], bool] = dict()
+
+        for gRuns in self.__mergeWords(len(guessWords), minWords):
+            for aRuns in self.__mergeWords(answerWordCount, minWords):
+                valid = True
+
+                for (gStart, gEnd), (aStart, aEnd) in zip(gRuns, aRuns):
+                    key = (gStart, gEnd, aStart, aEnd)
+                    isMatch = comparisons.get(key)
+
+                    if isMatch is None:
+                        isMatch = self.__compareWords(
+                            variants1 = self.__getWordVariants(guessWords, gStart, gEnd, guessWordVariants),
+                            variants2 = answerWordVariants[(aStart, aEnd)],
+                            thresholdGrowthRate = thresholdGrowthRate
+                        )
+
+                        comparisons[key] = isMatch
+
+                    if not isMatch:
+                        valid = False
+                        break
+
+                if valid:
+                    return True
+
+        return False
+
+    # generates all possible groupings of the given words such that the resulting word count is targetLength,
+    # with each group given as the (start, end) index range of the words within it
+    # example: wordCount = 4 (["a", "b", "c", "d"]), targetLength = 2
+    #          generates [(0, 3), (3, 4)], [(0, 2), (2, 4)], [(0, 1), (1, 4)] (["abc", "d"], ["ab", "cd"], ["a", "bcd"])
+    def __mergeWords(
+        self,
+        wordCount: int,
+        targetLength: int,
+        start: int = 0
+    ) -> Generator[list[tuple[int, int]], None, None]:
+        if targetLength == 1:
+            yield [ (start, wordCount) ]
+        elif wordCount - start <= targetLength:
+            yield [ (index, index + 1) for index in range(start, wordCount) ]
+        else:
+            for end in range(start + 1, wordCount - targetLength + 2):
+                for runs in self.__mergeWords(wordCount, targetLength - 1, end):
+                    yield [ (start, end) ] + runs
+
+    def __splitWords(self, phrase: str) -> list[str]:
+        return self.__whitespacePattern.sub(' ', phrase).split(' ')
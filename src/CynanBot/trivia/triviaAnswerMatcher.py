@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class TriviaAnswerMatcher():
+    cleanedCorrectAnswers: list[str]
+    correctAnswerWords: list[list[str]]
+    # for each correct answer, the variants of every run of its words merged together, keyed by (start, end) word index
+    correctAnswerWordVariants: list[dict[tuple[int, int], list[str]]]
+    levenshteinThresholdGrowthRate: int
+    maxPhraseGuessLength: int
@@ -1,17 +1,18 @@
 import asyncio
-import queue
 import traceback
+from collections import defaultdict
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Any
 
 import CynanBot.misc.utils as utils
+from CynanBot.cuteness.cutenessIncrement import CutenessIncrement
 from CynanBot.cuteness.cutenessRepositoryInterface import \
     CutenessRepositoryInterface
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.misc.backgroundTaskHelperInterface import \
     BackgroundTaskHelperInterface
+from CynanBot.misc.eventBus import EventBus
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.actions.absTriviaAction import AbsTriviaAction
 from CynanBot.trivia.actions.checkAnswerTriviaAction import \
@@ -97,6 +98,7 @@ from CynanBot.trivia.triviaSettingsRepositoryInterface import \
     TriviaSettingsRepositoryInterface
 from CynanBot.twitch.twitchTokensRepositoryInterface import \
     TwitchTokensRepositoryInterface
+from CynanBot.users.exceptions import NoSuchUserException
 from CynanBot.users.userIdsRepositoryInterface import \
     UserIdsRepositoryInterface
 
@@ -123,7 +125,8 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
         sleepTimeSeconds: float = 0.5,
-        queueTimeoutSeconds: int = 3
+        queueTimeoutSeconds: int = 3,
+        channelQueueSize: int = 256
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -167,6 +170,10 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
         elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
             raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(channelQueueSize):
+            raise TypeError(f'channelQueueSize argument is malformed: \"{channelQueueSize}\"')
+        elif channelQueueSize < 1 or channelQueueSize > 1024:
+            raise ValueError(f'channelQueueSize argument is out of bounds: {channelQueueSize}')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__cutenessRepository: CutenessRepositoryInterface = cutenessRepository
@@ -186,12 +193,21 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__sleepTimeSeconds: float = sleepTimeSeconds
-        self.__queueTimeoutSeconds: int = queueTimeoutSeconds
 
         self.__isStarted: bool = False
         self.__eventListener: TriviaEventListener | None = None
-        self.__actionQueue: SimpleQueue[AbsTriviaAction] = SimpleQueue()
-        self.__eventQueue: SimpleQueue[AbsTriviaEvent] = SimpleQueue()
+        self.__queueTimeoutSeconds: int = queueTimeoutSeconds
+        self.__channelQueueSize: int = channelQueueSize
+
+        self.__channelLocks: dict[str, asyncio.Lock] = defaultdict(lambda: asyncio.Lock())
+        self.__channelActionEventBuses: dict[str, EventBus[AbsTriviaAction]] = dict()
+
+        self.__triviaEventBus: EventBus[AbsTriviaEvent] = EventBus(
+            backgroundTaskHelper = backgroundTaskHelper,
+            timber = timber,
+            name = 'TriviaGameMachine event',
+            publishTimeoutSeconds = queueTimeoutSeconds
+        )
 
     async def __applyToxicSuperTriviaPunishment(
         self,
@@ -217,32 +233,45 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             del answeredUserIds[action.getUserId()]
 
         twitchAccessToken = await self.__twitchTokensRepository.getAccessTokenById(state.getTwitchChannelId())
-        toxicTriviaPunishments: list[ToxicTriviaPunishment] = list()
+
+        userNames = await self.__userIdsRepository.fetchUserNames(
+            userIds = list(answeredUserIds.keys()),
+            twitchAccessToken = twitchAccessToken
+        )
+
+        cutenessIncrements: list[CutenessIncrement] = list()
         totalPointsStolen = 0
 
         for userId, answerCount in answeredUserIds.items():
             punishedByPoints = -1 * answerCount * toxicTriviaPunishmentMultiplier * state.getRegularTriviaPointsForWinning()
             totalPointsStolen = totalPointsStolen + abs(punishedByPoints)
 
-            userName = await self.__userIdsRepository.requireUserName(
-                userId = userId,
-                twitchAccessToken = twitchAccessToken
-            )
+            userName = userNames.get(userId, None)
+
+            if not utils.isValidStr(userName):
+                raise NoSuchUserException(f'Unable to fetch Twitch user name for user ID \"{userId}\" ({twitchAccessToken=})')
 
-            cutenessResult = await self.__cutenessRepository.fetchCutenessIncrementedBy(
+            cutenessIncrements.append(CutenessIncrement(
                 incrementAmount = punishedByPoints,
-                twitchChannel = state.getTwitchChannel(),
-                twitchChannelId = state.getTwitchChannelId(),
                 userId = userId,
                 userName = userName
-            )
+            ))
+
+        cutenessResults = await self.__cutenessRepository.fetchCutenessesIncrementedBy(
+            increments = cutenessIncrements,
+            twitchChannel = state.getTwitchChannel(),
+            twitchChannelId = state.getTwitchChannelId()
+        )
 
+        toxicTriviaPunishments: list[ToxicTriviaPunishment] = list()
+
+        for cutenessIncrement, cutenessResult in zip(cutenessIncrements, cutenessResults):
             toxicTriviaPunishments.append(ToxicTriviaPunishment(
                 cutenessResult = cutenessResult,
-                numberOfPunishments = answerCount,
-                punishedByPoints = punishedByPoints,
-                userId = userId,
-                userName = userName
+                numberOfPunishments = answeredUserIds[cutenessIncrement.userId],
+                punishedByPoints = cutenessIncrement.incrementAmount,
+                userId = cutenessIncrement.userId,
+                userName = cutenessIncrement.userName
             ))
 
         self.__timber.log('TriviaGameMachine', f'Applied toxic trivia punishments to {len(toxicTriviaPunishments)} user(s) in \"{state.getTwitchChannel()}\" for a total punishment of {totalPointsStolen} point(s)')
@@ -272,7 +301,9 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             )
 
             self.__timber.log('TriviaGameMachine', f'Starting new queued super trivia game for \"{queuedSuperGame.getTwitchChannel()}\", with {remainingQueueSize} game(s) remaining in their queue ({queuedSuperGame.actionId=})')
-            await self.__handleActionStartNewSuperTriviaGame(queuedSuperGame)
+
+            async with self.__channelLocks[queuedSuperGame.getTwitchChannelId()]:
+                await self.__handleActionStartNewSuperTriviaGame(queuedSuperGame)
 
     async def __checkAnswer(
         self,
@@ -289,6 +320,39 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             extras = extras
         )
 
+    def __getChannelActionEventBus(self, twitchChannelId: str) -> EventBus[AbsTriviaAction]:
+        channelActionEventBus = self.__channelActionEventBuses.get(twitchChannelId, None)
+
+        if channelActionEventBus is not None:
+            return channelActionEventBus
+
+        # each channel gets its own action queue and worker, so that a slow action in one channel doesn't hold up any others
+        channelActionEventBus = EventBus(
+            backgroundTaskHelper = self.__backgroundTaskHelper,
+            timber = self.__timber,
+            name = f'TriviaGameMachine action ({twitchChannelId})',
+            publishTimeoutSeconds = self.__queueTimeoutSeconds,
+            maxSize = self.__channelQueueSize
+        )
+
+        self.__channelActionEventBuses[twitchChannelId] = channelActionEventBus
+
+        if self.__isStarted:
+            channelActionEventBus.start(self.__onAction)
+
+        return channelActionEventBus
+
+    async def __getRefreshSleepTimeSeconds(self) -> float:
+        # wake up exactly when the next game runs out of time, rather than on whichever tick comes after it
+        nextEndTime = await self.__triviaGameStore.getNextEndTime()
+
+        if nextEndTime is None:
+            return self.__sleepTimeSeconds
+
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+        secondsUntilNextEndTime = (nextEndTime - now).total_seconds()
+        return max(0, min(self.__sleepTimeSeconds, secondsUntilNextEndTime))
+
     async def __handleActionCheckAnswer(self, action: CheckAnswerTriviaAction):
         if not isinstance(action, CheckAnswerTriviaAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
@@ -683,7 +747,11 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             # was created too recently. We don't want super trivia questions to start instantaneously, as
             # it could mean that some people in chat are not ready to answer at first. So this minor delay
             # helps prevent such a situation.
-            self.submitAction(action)
+            self.__resubmitAction(
+                action = action,
+                delaySeconds = (action.getCreationTime() + superTriviaFirstQuestionDelay - now).total_seconds()
+            )
+
             return
 
         state = await self.__triviaGameStore.getSuperGame(
@@ -718,7 +786,11 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             # channel is on cooldown. This situation occurs if this Twitch channel just finished answering
             # a super trivia question, and prevents us from just immediately jumping into the next super
             # trivia question.
-            self.submitAction(action)
+            self.__resubmitAction(
+                action = action,
+                delaySeconds = self.__sleepTimeSeconds
+            )
+
             return
 
         emote = await self.__triviaEmoteGenerator.getNextEmoteFor(
@@ -791,26 +863,63 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             twitchChannelId = action.getTwitchChannelId()
         ))
 
+    async def __isTriviaGameStillActive(self, state: AbsTriviaGameState) -> bool:
+        currentState: AbsTriviaGameState | None = None
+
+        if isinstance(state, TriviaGameState):
+            currentState = await self.__triviaGameStore.getNormalGame(
+                twitchChannelId = state.getTwitchChannelId(),
+                userId = state.getUserId()
+            )
+        elif isinstance(state, SuperTriviaGameState):
+            currentState = await self.__triviaGameStore.getSuperGame(state.getTwitchChannelId())
+
+        return currentState is not None and currentState.getGameId() == state.getGameId()
+
+    async def __onAction(self, action: AbsTriviaAction):
+        # a channel's actions and the refresh loop both modify that channel's game state, so they take turns rather than interleaving
+        async with self.__channelLocks[action.getTwitchChannelId()]:
+            if isinstance(action, CheckAnswerTriviaAction):
+                await self.__handleActionCheckAnswer(action)
+            elif isinstance(action, CheckSuperAnswerTriviaAction):
+                await self.__handleActionCheckSuperAnswer(action)
+            elif isinstance(action, ClearSuperTriviaQueueTriviaAction):
+                await self.__handleActionClearSuperTriviaQueue(action)
+            elif isinstance(action, StartNewTriviaGameAction):
+                await self.__handleActionStartNewTriviaGame(action)
+            elif isinstance(action, StartNewSuperTriviaGameAction):
+                await self.__handleActionStartNewSuperTriviaGame(action)
+            else:
+                raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{type(action)=}\"')
+
+    async def __onEvent(self, event: AbsTriviaEvent):
+        eventListener = self.__eventListener
+
+        if eventListener is None:
+            self.__timber.log('TriviaGameMachine', f'Dropping event as there is no event listener ({event=})')
+            return
+
+        await eventListener.onNewTriviaEvent(event)
+
     async def __refreshStatusOfTriviaGames(self):
         await self.__removeDeadTriviaGames()
         await self.__beginQueuedTriviaGames()
 
     async def __removeDeadTriviaGames(self):
         now = datetime.now(self.__timeZoneRepository.getDefault())
-        gameStates = await self.__triviaGameStore.getAll()
-        gameStatesToRemove: list[AbsTriviaGameState] = list()
-
-        for state in gameStates:
-            if state.getEndTime() < now:
-                gameStatesToRemove.append(state)
+        gameStatesToRemove = await self.__triviaGameStore.getExpiredGames(now)
 
         for state in gameStatesToRemove:
-            if isinstance(state, TriviaGameState):
-                await self.__removeDeadNormalTriviaGame(state)
-            elif isinstance(state, SuperTriviaGameState):
-                await self.__removeDeadSuperTriviaGame(state)
-            else:
-                raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType ({state.getGameId()=}) ({state.getTwitchChannel()=}) ({state.actionId=}): \"{state.getTriviaGameType()}\"')
+            async with self.__channelLocks[state.getTwitchChannelId()]:
+                if not await self.__isTriviaGameStillActive(state):
+                    # this game was answered while waiting for its channel's lock
+                    continue
+                elif isinstance(state, TriviaGameState):
+                    await self.__removeDeadNormalTriviaGame(state)
+                elif isinstance(state, SuperTriviaGameState):
+                    await self.__removeDeadSuperTriviaGame(state)
+                else:
+                    raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType ({state.getGameId()=}) ({state.getTwitchChannel()=}) ({state.actionId=}): \"{state.getTriviaGameType()}\"')
 
     async def __removeDeadNormalTriviaGame(self, state: TriviaGameState):
         if not isinstance(state, TriviaGameState):
@@ -898,67 +1007,33 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         await self.__triviaGameStore.removeSuperGame(twitchChannelId)
         await self.__superTriviaCooldownHelper.update(twitchChannelId)
 
+    def __resubmitAction(self, action: AbsTriviaAction, delaySeconds: float):
+        # this runs on the channel's own worker, which would just pick a re-queued action straight back
+        # up again (and never wait on anything while doing so), so the action sits out its delay elsewhere
+        self.__backgroundTaskHelper.createTask(self.__resubmitActionAfterDelay(action, delaySeconds))
+
+    async def __resubmitActionAfterDelay(self, action: AbsTriviaAction, delaySeconds: float):
+        await asyncio.sleep(max(0, delaySeconds))
+        channelActionEventBus = self.__getChannelActionEventBus(action.getTwitchChannelId())
+        await channelActionEventBus.publish(action)
+
     def setEventListener(self, listener: TriviaEventListener | None):
         if listener is not None and not isinstance(listener, TriviaEventListener):
             raise TypeError(f'listener argument is malformed: \"{listener}\"')
 
         self.__eventListener = listener
 
-    async def __startActionLoop(self):
+    async def __startRefreshLoop(self):
         while True:
-            actions: list[AbsTriviaAction] = list()
-
-            try:
-                while not self.__actionQueue.empty():
-                    actions.append(self.__actionQueue.get_nowait())
-            except queue.Empty as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up actions list (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e)
-
-            try:
-                for action in actions:
-
-                    if isinstance(action, CheckAnswerTriviaAction):
-                        await self.__handleActionCheckAnswer(action)
-                    elif isinstance(action, CheckSuperAnswerTriviaAction):
-                        await self.__handleActionCheckSuperAnswer(action)
-                    elif isinstance(action, ClearSuperTriviaQueueTriviaAction):
-                        await self.__handleActionClearSuperTriviaQueue(action)
-                    elif isinstance(action, StartNewTriviaGameAction):
-                        await self.__handleActionStartNewTriviaGame(action)
-                    elif isinstance(action, StartNewSuperTriviaGameAction):
-                        await self.__handleActionStartNewSuperTriviaGame(action)
-                    else:
-                        raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{type(action)=}\"')
-            except Exception as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through actions (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e, traceback.format_exc())
+            sleepTimeSeconds = self.__sleepTimeSeconds
 
             try:
                 await self.__refreshStatusOfTriviaGames()
+                sleepTimeSeconds = await self.__getRefreshSleepTimeSeconds()
             except Exception as e:
                 self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games: {e}', e, traceback.format_exc())
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
-
-    async def __startEventLoop(self):
-        while True:
-            eventListener = self.__eventListener
-
-            if eventListener is not None:
-                events: list[AbsTriviaEvent] = list()
-
-                try:
-                    while not self.__eventQueue.empty():
-                        events.append(self.__eventQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up events list (queue size: {self.__eventQueue.qsize()}) (events size: {len(events)}): {e}', e, traceback.format_exc())
-
-                for event in events:
-                    try:
-                        await eventListener.onNewTriviaEvent(event)
-                    except Exception as e:
-                        self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) (event: {event}): {e}', e, traceback.format_exc())
-
-            await asyncio.sleep(self.__sleepTimeSeconds)
+            await asyncio.sleep(sleepTimeSeconds)
 
     def startMachine(self):
         if self.__isStarted:
@@ -967,23 +1042,23 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         self.__isStarted = True
         self.__timber.log('TriviaGameMachine', 'Starting TriviaGameMachine...')
-        self.__backgroundTaskHelper.createTask(self.__startActionLoop())
-        self.__backgroundTaskHelper.createTask(self.__startEventLoop())
 
-    def submitAction(self, action: AbsTriviaAction):
+        for channelActionEventBus in self.__channelActionEventBuses.values():
+            channelActionEventBus.start(self.__onAction)
+
+        self.__triviaEventBus.start(self.__onEvent)
+        self.__backgroundTaskHelper.createTask(self.__startRefreshLoop())
+
+    async def submitAction(self, action: AbsTriviaAction):
         if not isinstance(action, AbsTriviaAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
 
-        try:
-            self.__actionQueue.put(action, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new action ({action}) into the action queue (queue size: {self.__actionQueue.qsize()}): {e}', e, traceback.format_exc())
+        # waits for room rather than dropping, so that a burst of answers slows chat down instead of losing any
+        channelActionEventBus = self.__getChannelActionEventBus(action.getTwitchChannelId())
+        await channelActionEventBus.publish(action)
 
     async def __submitEvent(self, event: AbsTriviaEvent):
         if not isinstance(event, AbsTriviaEvent):
             raise TypeError(f'event argument is malformed: \"{event}\"')
 
-        try:
-            self.__eventQueue.put(event, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+        await self.__triviaEventBus.publish(event)
@@ -15,5 +15,5 @@ class TriviaGameMachineInterface(ABC):
         pass
 
     @abstractmethod
-    def submitAction(self, action: AbsTriviaAction):
+    async def submitAction(self, action: AbsTriviaAction):
         pass
@@ -4,8 +4,7 @@ import CynanBot.misc.utils as utils
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.content.triviaContentCode import TriviaContentCode
 from CynanBot.trivia.questions.absTriviaQuestion import AbsTriviaQuestion
@@ -42,11 +41,7 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
 
-        self.__isDatabaseReady: bool = False
-
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def getMostRecentTriviaQuestionDetails(
         self,
@@ -61,7 +56,7 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT emote, triviaid, triviasource, triviatype FROM triviahistory
@@ -86,15 +81,10 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
             triviaType = TriviaQuestionType.fromStr(record[3])
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'triviahistory',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviahistory (
                         datetime text NOT NULL,
@@ -106,9 +96,8 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
                         PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS triviahistory (
                         datetime TEXT NOT NULL,
@@ -120,11 +109,8 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
                         PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
 
     async def verify(
         self,
@@ -146,7 +132,7 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         if question.originalTriviaSource is not None:
             workingTriviaSource = question.originalTriviaSource
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT datetime FROM triviahistory
@@ -660,23 +660,21 @@ class GlacialTriviaQuestionRepository(
         elif question.triviaType is not TriviaQuestionType.MULTIPLE_CHOICE:
             raise ValueError(f'question class and TriviaQuestionType do not match ({question=}) ({question.triviaType=})')
 
-        for correctAnswer in question.correctAnswers:
-            await connection.execute_insert(
-                '''
-                    INSERT INTO glacialAnswers (answer, originalTriviaSource, triviaId)
-                    VALUES ($1, $2, $3)
-                ''',
-                (correctAnswer, question.triviaSource.toStr(), question.triviaId, )
-            )
+        await connection.executemany(
+            '''
+                INSERT INTO glacialAnswers (answer, originalTriviaSource, triviaId)
+                VALUES ($1, $2, $3)
+            ''',
+            [ (correctAnswer, question.triviaSource.toStr(), question.triviaId, ) for correctAnswer in question.correctAnswers ]
+        )
 
-        for response in question.responses:
-            await connection.execute_insert(
-                '''
-                    INSERT INTO glacialResponses (response, originalTriviaSource, triviaId)
-                    VALUES ($1, $2, $3)
-                ''',
-                (response, question.triviaSource.toStr(), question.triviaId, )
-            )
+        await connection.executemany(
+            '''
+                INSERT INTO glacialResponses (response, originalTriviaSource, triviaId)
+                VALUES ($1, $2, $3)
+            ''',
+            [ (response, question.triviaSource.toStr(), question.triviaId, ) for response in question.responses ]
+        )
 
     async def __storeQuestionAnswerTriviaQuestion(
         self,
@@ -690,14 +688,13 @@ class GlacialTriviaQuestionRepository(
         elif question.triviaType is not TriviaQuestionType.QUESTION_ANSWER:
             raise ValueError(f'question class and TriviaQuestionType do not match ({question=}) ({question.triviaType=})')
 
-        for answer in question.originalCorrectAnswers:
-            await connection.execute_insert(
-                '''
-                    INSERT INTO glacialAnswers (answer, originalTriviaSource, triviaId)
-                    VALUES ($1, $2, $3)
-                ''',
-                (answer, question.triviaSource.toStr(), question.triviaId, )
-            )
+        await connection.executemany(
+            '''
+                INSERT INTO glacialAnswers (answer, originalTriviaSource, triviaId)
+                VALUES ($1, $2, $3)
+            ''',
+            [ (answer, question.triviaSource.toStr(), question.triviaId, ) for answer in question.originalCorrectAnswers ]
+        )
 
     async def __storeTrueFalseTriviaQuestion(
         self,
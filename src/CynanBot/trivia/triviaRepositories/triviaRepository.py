@@ -257,6 +257,7 @@ class TriviaRepository(TriviaRepositoryInterface):
         attemptedTriviaSources: list[TriviaSource] = list()
 
         while retryCount < maxRetryCount:
+            triviaSource: TriviaSource | None = None
             question = await self.__retrieveSpooledTriviaQuestion(triviaFetchOptions)
 
             if question is None:
@@ -293,7 +294,10 @@ class TriviaRepository(TriviaRepositoryInterface):
 
             question = None
             retryCount = retryCount + 1
-            await asyncio.sleep(self.__triviaRetrySleepTimeSeconds * float(retryCount))
+
+            # there's no point in waiting for a source that is known to be down, the next attempt will pick a different one
+            if triviaSource is None or not self.__triviaSourceInstabilityHelper.isCircuitOpen(triviaSource):
+                await asyncio.sleep(self.__triviaRetrySleepTimeSeconds * float(retryCount))
 
         raise TooManyTriviaFetchAttemptsException(f'Unable to fetch trivia from {attemptedTriviaSources} after {retryCount} attempts (max attempts is {maxRetryCount})')
 
@@ -340,7 +344,9 @@ class TriviaRepository(TriviaRepositoryInterface):
         unstableTriviaSources: set[TriviaSource] = set()
 
         for triviaSource in TriviaSource:
-            if self.__triviaSourceInstabilityHelper[triviaSource] >= instabilityThreshold:
+            if self.__triviaSourceInstabilityHelper.isCircuitOpen(triviaSource):
+                unstableTriviaSources.add(triviaSource)
+            elif self.__triviaSourceInstabilityHelper[triviaSource] >= instabilityThreshold:
                 unstableTriviaSources.add(triviaSource)
 
         return unstableTriviaSources
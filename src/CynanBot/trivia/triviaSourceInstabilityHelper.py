@@ -1,13 +1,17 @@
 from collections import defaultdict
 from datetime import datetime, timedelta
 
+import CynanBot.misc.utils as utils
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
+from CynanBot.network.circuitBreakerEventListener import \
+    CircuitBreakerEventListener
+from CynanBot.network.circuitBreakerState import CircuitBreakerState
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.trivia.questions.triviaSource import TriviaSource
 
 
-class TriviaSourceInstabilityHelper():
+class TriviaSourceInstabilityHelper(CircuitBreakerEventListener):
 
     def __init__(
         self,
@@ -26,6 +30,7 @@ class TriviaSourceInstabilityHelper():
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__fallOffTimeDelta: timedelta = fallOffTimeDelta
 
+        self.__openCircuitTriviaSources: dict[TriviaSource, datetime] = dict()
         self.__times: dict[TriviaSource, datetime | None] = dict()
         self.__values: dict[TriviaSource, int] = defaultdict(lambda: 0)
 
@@ -42,6 +47,17 @@ class TriviaSourceInstabilityHelper():
         self.__values[key] = 0
         return 0
 
+    def __getTriviaSourceForHost(self, host: str) -> TriviaSource | None:
+        match host:
+            case 'beta-trivia.bongo.best': return TriviaSource.BONGO
+            case 'funtoon.party': return TriviaSource.FUNTOON
+            case 'jservice.io': return TriviaSource.J_SERVICE
+            case 'opentdb.com': return TriviaSource.OPEN_TRIVIA_DATABASE
+            case 'pokeapi.co': return TriviaSource.POKE_API
+            case 'quizapi.io': return TriviaSource.QUIZ_API
+            case 'the-trivia-api.com': return TriviaSource.WILL_FRY_TRIVIA
+            case _: return None
+
     def incrementErrorCount(self, key: TriviaSource) -> int:
         if not isinstance(key, TriviaSource):
             raise TypeError(f'key argument is malformed: \"{key}\"')
@@ -60,3 +76,43 @@ class TriviaSourceInstabilityHelper():
 
         self.__timber.log('TriviaSourceInstabilityHelper', f'Incremented error count ({key=}) ({newErrorCount=})')
         return newErrorCount
+
+    def isCircuitOpen(self, key: TriviaSource) -> bool:
+        if not isinstance(key, TriviaSource):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+
+        openUntil = self.__openCircuitTriviaSources.get(key, None)
+
+        if openUntil is None:
+            return False
+        elif datetime.now(self.__timeZoneRepository.getDefault()) < openUntil:
+            return True
+
+        # the circuit breaker only goes half open once a request reaches it, so this source
+        # has to stop being excluded in order for that trial request to ever happen
+        del self.__openCircuitTriviaSources[key]
+        return False
+
+    async def onCircuitBreakerStateChanged(
+        self,
+        host: str,
+        state: CircuitBreakerState,
+        openUntil: datetime | None
+    ):
+        if not utils.isValidStr(host):
+            raise TypeError(f'host argument is malformed: \"{host}\"')
+        elif not isinstance(state, CircuitBreakerState):
+            raise TypeError(f'state argument is malformed: \"{state}\"')
+        elif openUntil is not None and not isinstance(openUntil, datetime):
+            raise TypeError(f'openUntil argument is malformed: \"{openUntil}\"')
+
+        triviaSource = self.__getTriviaSourceForHost(host)
+
+        if triviaSource is None:
+            return
+        elif state is CircuitBreakerState.OPEN and openUntil is not None:
+            # the failure that opened this circuit breaker is counted by whoever made the request
+            self.__openCircuitTriviaSources[triviaSource] = openUntil
+        else:
+            # a half open circuit breaker needs a trial request to get through, so stop excluding this source
+            self.__openCircuitTriviaSources.pop(triviaSource, None)
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from CynanBot.twitch.api.websocket.twitchWebsocketDataBundle import \
+    TwitchWebsocketDataBundle
+from CynanBot.users.userInterface import UserInterface
+
+
+class AbsTwitchModerationHandler(ABC):
+
+    @abstractmethod
+    async def onNewModerationEvent(
+        self,
+        userId: str,
+        user: UserInterface,
+        dataBundle: TwitchWebsocketDataBundle
+    ):
+        pass
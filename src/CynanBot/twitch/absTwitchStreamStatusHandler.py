@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from CynanBot.twitch.api.websocket.twitchWebsocketDataBundle import \
+    TwitchWebsocketDataBundle
+from CynanBot.users.userInterface import UserInterface
+
+
+class AbsTwitchStreamStatusHandler(ABC):
+
+    @abstractmethod
+    async def onNewStreamStatus(
+        self,
+        userId: str,
+        user: UserInterface,
+        dataBundle: TwitchWebsocketDataBundle
+    ):
+        pass
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.network.tests.fakeNetworkResponse import FakeNetworkResponse
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchApiRequestPriority import \
+    TwitchApiRequestPriority
+from CynanBot.twitch.api.twitchApiRequestScheduler import \
+    TwitchApiRequestScheduler
+from CynanBot.twitch.api.twitchApiScheduledNetworkHandle import \
+    TwitchApiScheduledNetworkHandle
+
+
+class RateLimitedNetworkHandle(NetworkHandle):
+
+    def __init__(self, statusCodes: list[int]):
+        self.statusCodes: list[int] = statusCodes
+        self.requestCount: int = 0
+
+    async def delete(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        return await self.get(url, headers)
+
+    async def get(self, url: str, headers: dict[str, Any] | None = None) -> NetworkResponse:
+        statusCode = self.statusCodes[min(self.requestCount, len(self.statusCodes) - 1)]
+        self.requestCount = self.requestCount + 1
+
+        responseHeaders = {
+            'ratelimit-limit': '800',
+            'ratelimit-remaining': '0' if statusCode == 429 else '799',
+            'ratelimit-reset': str(int(time.time()))
+        }
+
+        return FakeNetworkResponse(b'', responseHeaders, statusCode, url)
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return NetworkClientType.AIOHTTP
+
+    async def post(self, url: str, headers: dict[str, Any] | None = None, json: dict[str, Any] | None = None) -> NetworkResponse:
+        return await self.get(url, headers)
+
+
+class TestTwitchApiRequestScheduler():
+
+    def __createScheduler(self) -> TwitchApiRequestScheduler:
+        return TwitchApiRequestScheduler(
+            timber = TimberStub(),
+            minSleepTimeSeconds = 0.01
+        )
+
+    @pytest.mark.asyncio
+    async def test_acquire_withUnknownBucket(self):
+        scheduler = self.__createScheduler()
+        await asyncio.wait_for(scheduler.acquire('token', TwitchApiRequestPriority.LOW), timeout = 1)
+
+    @pytest.mark.asyncio
+    async def test_acquire_withExhaustedBucket_prefersHighPriority(self):
+        scheduler = self.__createScheduler()
+
+        scheduler.update('token', {
+            'ratelimit-limit': '10',
+            'ratelimit-remaining': '0',
+            'ratelimit-reset': str(int(time.time()) + 1)
+        }, 200)
+
+        order: list[TwitchApiRequestPriority] = list()
+
+        async def acquire(priority: TwitchApiRequestPriority):
+            await scheduler.acquire('token', priority)
+            order.append(priority)
+
+        await asyncio.wait_for(asyncio.gather(
+            acquire(TwitchApiRequestPriority.LOW),
+            acquire(TwitchApiRequestPriority.HIGH)
+        ), timeout = 5)
+
+        assert order == [ TwitchApiRequestPriority.HIGH, TwitchApiRequestPriority.LOW ]
+
+    @pytest.mark.asyncio
+    async def test_acquire_withLowPriorityReserve(self):
+        scheduler = self.__createScheduler()
+
+        scheduler.update('token', {
+            'ratelimit-limit': '10',
+            'ratelimit-remaining': '1',
+            'ratelimit-reset': str(int(time.time()) + 30)
+        }, 200)
+
+        await asyncio.wait_for(scheduler.acquire('token', TwitchApiRequestPriority.HIGH), timeout = 1)
+
+        scheduler.update('token', { 'ratelimit-remaining': '1' }, 200)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scheduler.acquire('token', TwitchApiRequestPriority.LOW), timeout = 0.1)
+
+        await asyncio.wait_for(scheduler.acquire('other', TwitchApiRequestPriority.LOW), timeout = 1)
+
+    @pytest.mark.asyncio
+    async def test_acquire_withRefilledBucket_wakesWaiter(self):
+        scheduler = self.__createScheduler()
+
+        scheduler.update('token', {
+            'ratelimit-limit': '10',
+            'ratelimit-remaining': '0',
+            'ratelimit-reset': str(int(time.time()) + 30)
+        }, 200)
+
+        lowTask = asyncio.create_task(scheduler.acquire('token', TwitchApiRequestPriority.LOW))
+        mediumTask = asyncio.create_task(scheduler.acquire('token', TwitchApiRequestPriority.MEDIUM))
+        await asyncio.sleep(0.05)
+        assert not lowTask.done()
+        assert not mediumTask.done()
+
+        mediumTask.cancel()
+        scheduler.update('token', { 'ratelimit-remaining': '5' }, 200)
+        await asyncio.wait_for(lowTask, timeout = 1)
+
+    @pytest.mark.asyncio
+    async def test_get_retriesRateLimitedRequest(self):
+        rateLimitedNetworkHandle = RateLimitedNetworkHandle([ 429, 200 ])
+
+        networkHandle = TwitchApiScheduledNetworkHandle(
+            networkHandle = rateLimitedNetworkHandle,
+            timber = TimberStub(),
+            priority = TwitchApiRequestPriority.HIGH,
+            twitchApiRequestScheduler = self.__createScheduler()
+        )
+
+        response = await asyncio.wait_for(networkHandle.get(
+            url = 'https://api.twitch.tv/helix/moderation/bans',
+            headers = { 'Authorization': 'Bearer token' }
+        ), timeout = 5)
+
+        assert response.getStatusCode() == 200
+        assert rateLimitedNetworkHandle.requestCount == 2
+
+    @pytest.mark.asyncio
+    async def test_get_withoutHelix(self):
+        rateLimitedNetworkHandle = RateLimitedNetworkHandle([ 429, 200 ])
+
+        networkHandle = TwitchApiScheduledNetworkHandle(
+            networkHandle = rateLimitedNetworkHandle,
+            timber = TimberStub(),
+            priority = TwitchApiRequestPriority.MEDIUM,
+            twitchApiRequestScheduler = self.__createScheduler()
+        )
+
+        response = await networkHandle.get(
+            url = 'https://id.twitch.tv/oauth2/validate',
+            headers = { 'Authorization': 'OAuth token' }
+        )
+
+        assert response.getStatusCode() == 429
+        assert rateLimitedNetworkHandle.requestCount == 1
+
+    def test_isHigherThan(self):
+        assert TwitchApiRequestPriority.HIGH.isHigherThan(TwitchApiRequestPriority.LOW)
+        assert TwitchApiRequestPriority.MEDIUM.isHigherThan(TwitchApiRequestPriority.LOW)
+        assert not TwitchApiRequestPriority.LOW.isHigherThan(TwitchApiRequestPriority.HIGH)
+        assert not TwitchApiRequestPriority.HIGH.isHigherThan(TwitchApiRequestPriority.HIGH)
@@ -0,0 +1,126 @@
+import asyncio
+import math
+from collections import deque
+
+import CynanBot.misc.utils as utils
+from CynanBot.twitch.api.twitchApiRequestPriority import \
+    TwitchApiRequestPriority
+
+
+class TwitchApiRateLimitBucket():
+
+    def __init__(self, lowPriorityReserveFraction: float):
+        if not utils.isValidNum(lowPriorityReserveFraction):
+            raise TypeError(f'lowPriorityReserveFraction argument is malformed: \"{lowPriorityReserveFraction}\"')
+        elif lowPriorityReserveFraction < 0 or lowPriorityReserveFraction >= 1:
+            raise ValueError(f'lowPriorityReserveFraction argument is out of bounds: {lowPriorityReserveFraction}')
+
+        self.__lowPriorityReserveFraction: float = lowPriorityReserveFraction
+
+        self.__limit: int | None = None
+        self.__remaining: int | None = None
+        self.__resetTime: float | None = None
+        self.__waiters: dict[TwitchApiRequestPriority, deque[asyncio.Future[None]]] = dict()
+
+        # highest priority first, which is the order that waiters are let through in
+        for priority in sorted(TwitchApiRequestPriority, key = lambda priority: priority.value):
+            self.__waiters[priority] = deque()
+
+    def addWaiter(self, priority: TwitchApiRequestPriority, waiter: asyncio.Future[None]):
+        self.__waiters[priority].append(waiter)
+
+    def __consume(self):
+        remaining = self.__remaining
+
+        if remaining is not None:
+            self.__remaining = max(0, remaining - 1)
+
+    def __getLowPriorityReserve(self) -> int:
+        limit = self.__limit
+
+        if limit is None:
+            return 0
+
+        return math.ceil(limit * self.__lowPriorityReserveFraction)
+
+    def getSecondsUntilReset(self, now: float) -> float | None:
+        resetTime = self.__resetTime
+
+        if resetTime is None:
+            return None
+
+        return max(0, resetTime - now)
+
+    def __hasRoom(self, priority: TwitchApiRequestPriority, now: float) -> bool:
+        self.__refillIfReset(now)
+        remaining = self.__remaining
+
+        if remaining is None:
+            # nothing is known about this bucket until Twitch has answered at least once
+            return True
+        elif priority is TwitchApiRequestPriority.LOW:
+            # lookups leave some of the bucket untouched, so that moderation actions can still get through during a burst
+            return remaining > self.__getLowPriorityReserve()
+        else:
+            return remaining >= 1
+
+    def hasWaiters(self) -> bool:
+        for waiters in self.__waiters.values():
+            if len(waiters) >= 1:
+                return True
+
+        return False
+
+    def isIdle(self, now: float) -> bool:
+        if self.hasWaiters():
+            return False
+
+        resetTime = self.__resetTime
+        return resetTime is None or now >= resetTime
+
+    def __refillIfReset(self, now: float):
+        resetTime = self.__resetTime
+
+        if resetTime is not None and now >= resetTime:
+            self.__remaining = self.__limit
+            self.__resetTime = None
+
+    def removeWaiter(self, priority: TwitchApiRequestPriority, waiter: asyncio.Future[None]):
+        waiters = self.__waiters[priority]
+
+        if waiter in waiters:
+            waiters.remove(waiter)
+
+    def trySend(self, priority: TwitchApiRequestPriority, now: float) -> bool:
+        # requests of the same priority go in the order that they arrived in
+        for waitingPriority, waiters in self.__waiters.items():
+            if len(waiters) >= 1 and not priority.isHigherThan(waitingPriority):
+                return False
+
+        if not self.__hasRoom(priority, now):
+            return False
+
+        self.__consume()
+        return True
+
+    def update(self, limit: int | None, remaining: int | None, resetTime: float | None):
+        if limit is not None:
+            self.__limit = limit
+
+        if remaining is not None:
+            self.__remaining = remaining
+
+        if resetTime is not None:
+            self.__resetTime = resetTime
+
+    def wakeWaiters(self, now: float):
+        for priority, waiters in self.__waiters.items():
+            while len(waiters) >= 1:
+                if waiters[0].done():
+                    waiters.popleft()
+                elif self.__hasRoom(priority, now):
+                    self.__consume()
+                    waiters.popleft().set_result(None)
+                else:
+                    # lower priority requests have to keep waiting behind this one
+                    return
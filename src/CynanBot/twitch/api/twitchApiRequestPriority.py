@@ -0,0 +1,16 @@
+from enum import auto
+
+from CynanBot.misc.enumWithToFromStr import EnumWithToFromStr
+
+
+class TwitchApiRequestPriority(EnumWithToFromStr):
+
+    HIGH = auto()
+    MEDIUM = auto()
+    LOW = auto()
+
+    def isHigherThan(self, other: 'TwitchApiRequestPriority') -> bool:
+        if not isinstance(other, TwitchApiRequestPriority):
+            raise TypeError(f'other argument is malformed: \"{other}\"')
+
+        return self.value < other.value
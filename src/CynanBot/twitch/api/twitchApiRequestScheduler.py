@@ -0,0 +1,143 @@
+import asyncio
+import time
+
+import CynanBot.misc.utils as utils
+from CynanBot.timber.timberInterface import TimberInterface
+from CynanBot.twitch.api.twitchApiRateLimitBucket import \
+    TwitchApiRateLimitBucket
+from CynanBot.twitch.api.twitchApiRequestPriority import \
+    TwitchApiRequestPriority
+from CynanBot.twitch.api.twitchApiRequestSchedulerInterface import \
+    TwitchApiRequestSchedulerInterface
+
+
+class TwitchApiRequestScheduler(TwitchApiRequestSchedulerInterface):
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        lowPriorityReserveFraction: float = 0.1,
+        maxSleepTimeSeconds: float = 60,
+        minSleepTimeSeconds: float = 0.05
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidNum(lowPriorityReserveFraction):
+            raise TypeError(f'lowPriorityReserveFraction argument is malformed: \"{lowPriorityReserveFraction}\"')
+        elif lowPriorityReserveFraction < 0 or lowPriorityReserveFraction >= 1:
+            raise ValueError(f'lowPriorityReserveFraction argument is out of bounds: {lowPriorityReserveFraction}')
+        elif not utils.isValidNum(maxSleepTimeSeconds):
+            raise TypeError(f'maxSleepTimeSeconds argument is malformed: \"{maxSleepTimeSeconds}\"')
+        elif not utils.isValidNum(minSleepTimeSeconds):
+            raise TypeError(f'minSleepTimeSeconds argument is malformed: \"{minSleepTimeSeconds}\"')
+        elif minSleepTimeSeconds <= 0 or minSleepTimeSeconds > maxSleepTimeSeconds:
+            raise ValueError(f'minSleepTimeSeconds argument is out of bounds: {minSleepTimeSeconds}')
+
+        self.__timber: TimberInterface = timber
+        self.__lowPriorityReserveFraction: float = lowPriorityReserveFraction
+        self.__maxSleepTimeSeconds: float = maxSleepTimeSeconds
+        self.__minSleepTimeSeconds: float = minSleepTimeSeconds
+
+        self.__buckets: dict[str, TwitchApiRateLimitBucket] = dict()
+        self.__wakeUpHandles: dict[str, asyncio.TimerHandle] = dict()
+
+    async def acquire(self, bucketKey: str, priority: TwitchApiRequestPriority):
+        if not utils.isValidStr(bucketKey):
+            raise TypeError(f'bucketKey argument is malformed: \"{bucketKey}\"')
+        elif not isinstance(priority, TwitchApiRequestPriority):
+            raise TypeError(f'priority argument is malformed: \"{priority}\"')
+
+        bucket = self.__getBucket(bucketKey)
+
+        if bucket.trySend(priority, time.time()):
+            return
+
+        self.__timber.log('TwitchApiRequestScheduler', f'Delaying Twitch API request until its rate limit bucket has room ({priority=})')
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        bucket.addWaiter(priority, waiter)
+        self.__wakeUp(bucketKey)
+
+        try:
+            await waiter
+        finally:
+            if waiter.cancelled():
+                # lower priority requests may have been waiting behind this one
+                bucket.removeWaiter(priority, waiter)
+                self.__wakeUp(bucketKey)
+
+    def __evictIdleBuckets(self, now: float):
+        # access tokens get refreshed every few hours, so a bucket otherwise outlives the token that it belongs to
+        idleBucketKeys = [ bucketKey for bucketKey, bucket in self.__buckets.items() if bucket.isIdle(now) ]
+
+        for bucketKey in idleBucketKeys:
+            del self.__buckets[bucketKey]
+
+    def __getBucket(self, bucketKey: str) -> TwitchApiRateLimitBucket:
+        bucket = self.__buckets.get(bucketKey, None)
+
+        if bucket is None:
+            self.__evictIdleBuckets(time.time())
+
+            bucket = TwitchApiRateLimitBucket(
+                lowPriorityReserveFraction = self.__lowPriorityReserveFraction
+            )
+
+            self.__buckets[bucketKey] = bucket
+
+        return bucket
+
+    def update(self, bucketKey: str, headers: dict[str, str], statusCode: int):
+        if not utils.isValidStr(bucketKey):
+            raise TypeError(f'bucketKey argument is malformed: \"{bucketKey}\"')
+        elif not isinstance(headers, dict):
+            raise TypeError(f'headers argument is malformed: \"{headers}\"')
+        elif not utils.isValidInt(statusCode):
+            raise TypeError(f'statusCode argument is malformed: \"{statusCode}\"')
+
+        limit = utils.safeStrToInt(headers.get('ratelimit-limit', None))
+        remaining = utils.safeStrToInt(headers.get('ratelimit-remaining', None))
+        resetTime = utils.safeStrToInt(headers.get('ratelimit-reset', None))
+
+        if statusCode == 429:
+            self.__timber.log('TwitchApiRequestScheduler', f'Twitch API rate limit bucket was exhausted ({limit=}) ({remaining=}) ({resetTime=})')
+            remaining = 0
+
+            if resetTime is None:
+                resetTime = int(time.time()) + 1
+
+        if limit is None and remaining is None and resetTime is None:
+            return
+
+        self.__getBucket(bucketKey).update(
+            limit = limit,
+            remaining = remaining,
+            resetTime = None if resetTime is None else float(resetTime)
+        )
+
+        self.__wakeUp(bucketKey)
+
+    def __wakeUp(self, bucketKey: str):
+        wakeUpHandle = self.__wakeUpHandles.pop(bucketKey, None)
+
+        if wakeUpHandle is not None:
+            wakeUpHandle.cancel()
+
+        bucket = self.__buckets.get(bucketKey, None)
+
+        if bucket is None:
+            return
+
+        bucket.wakeWaiters(time.time())
+
+        if not bucket.hasWaiters():
+            return
+
+        secondsUntilReset = bucket.getSecondsUntilReset(time.time())
+
+        if secondsUntilReset is None:
+            # without a reset time, only another response from Twitch can say when this bucket has room again
+            sleepTimeSeconds = self.__maxSleepTimeSeconds
+        else:
+            sleepTimeSeconds = min(max(secondsUntilReset, self.__minSleepTimeSeconds), self.__maxSleepTimeSeconds)
+
+        self.__wakeUpHandles[bucketKey] = asyncio.get_running_loop().call_later(sleepTimeSeconds, self.__wakeUp, bucketKey)
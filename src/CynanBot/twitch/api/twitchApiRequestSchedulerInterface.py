@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from CynanBot.twitch.api.twitchApiRequestPriority import \
+    TwitchApiRequestPriority
+
+
+class TwitchApiRequestSchedulerInterface(ABC):
+
+    @abstractmethod
+    async def acquire(self, bucketKey: str, priority: TwitchApiRequestPriority):
+        pass
+
+    @abstractmethod
+    def update(self, bucketKey: str, headers: dict[str, str], statusCode: int):
+        pass
@@ -0,0 +1,119 @@
+import hashlib
+from typing import Any, Awaitable, Callable
+
+import CynanBot.misc.utils as utils
+from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkHandle import NetworkHandle
+from CynanBot.network.networkResponse import NetworkResponse
+from CynanBot.timber.timberInterface import TimberInterface
+from CynanBot.twitch.api.twitchApiRequestPriority import \
+    TwitchApiRequestPriority
+from CynanBot.twitch.api.twitchApiRequestSchedulerInterface import \
+    TwitchApiRequestSchedulerInterface
+
+
+class TwitchApiScheduledNetworkHandle(NetworkHandle):
+
+    def __init__(
+        self,
+        networkHandle: NetworkHandle,
+        timber: TimberInterface,
+        priority: TwitchApiRequestPriority,
+        twitchApiRequestScheduler: TwitchApiRequestSchedulerInterface,
+        maxRetryCount: int = 2
+    ):
+        if not isinstance(networkHandle, NetworkHandle):
+            raise TypeError(f'networkHandle argument is malformed: \"{networkHandle}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(priority, TwitchApiRequestPriority):
+            raise TypeError(f'priority argument is malformed: \"{priority}\"')
+        elif not isinstance(twitchApiRequestScheduler, TwitchApiRequestSchedulerInterface):
+            raise TypeError(f'twitchApiRequestScheduler argument is malformed: \"{twitchApiRequestScheduler}\"')
+        elif not utils.isValidInt(maxRetryCount):
+            raise TypeError(f'maxRetryCount argument is malformed: \"{maxRetryCount}\"')
+        elif maxRetryCount < 0 or maxRetryCount > 5:
+            raise ValueError(f'maxRetryCount argument is out of bounds: {maxRetryCount}')
+
+        self.__networkHandle: NetworkHandle = networkHandle
+        self.__timber: TimberInterface = timber
+        self.__priority: TwitchApiRequestPriority = priority
+        self.__twitchApiRequestScheduler: TwitchApiRequestSchedulerInterface = twitchApiRequestScheduler
+        self.__maxRetryCount: int = maxRetryCount
+
+    async def delete(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            url = url,
+            headers = headers,
+            function = lambda: self.__networkHandle.delete(url, headers)
+        )
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            url = url,
+            headers = headers,
+            function = lambda: self.__networkHandle.get(url, headers)
+        )
+
+    def __getBucketKey(self, url: str, headers: dict[str, Any] | None) -> str | None:
+        # only Helix reports rate limits, and it does so per access token (which is hashed, so that it isn't held onto)
+        if '/helix/' not in url or headers is None:
+            return None
+
+        authorization = headers.get('Authorization', None)
+
+        if not utils.isValidStr(authorization):
+            return None
+
+        accessToken = authorization.split(' ')[-1]
+        return hashlib.sha256(accessToken.encode('utf-8')).hexdigest()
+
+    def getNetworkClientType(self) -> NetworkClientType:
+        return self.__networkHandle.getNetworkClientType()
+
+    async def post(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None
+    ) -> NetworkResponse:
+        return await self.__request(
+            url = url,
+            headers = headers,
+            function = lambda: self.__networkHandle.post(url, headers, json)
+        )
+
+    async def __request(
+        self,
+        url: str,
+        headers: dict[str, Any] | None,
+        function: Callable[[], Awaitable[NetworkResponse]]
+    ) -> NetworkResponse:
+        bucketKey = self.__getBucketKey(url, headers)
+
+        if bucketKey is None:
+            return await function()
+
+        retryCount = 0
+
+        while True:
+            await self.__twitchApiRequestScheduler.acquire(bucketKey, self.__priority)
+            response = await function()
+            statusCode = response.getStatusCode()
+            self.__twitchApiRequestScheduler.update(bucketKey, response.getHeaders(), statusCode)
+
+            if statusCode != 429 or retryCount >= self.__maxRetryCount:
+                return response
+
+            # Twitch doesn't act on a request that it rate limited, so it's safe to queue it up again
+            await response.close()
+            retryCount = retryCount + 1
+            self.__timber.log('TwitchApiScheduledNetworkHandle', f'Retrying rate limited Twitch API request ({self.__priority=}) ({retryCount=})')
@@ -11,6 +11,14 @@ from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.network.networkHandle import NetworkHandle
 from CynanBot.network.networkResponse import NetworkResponse
 from CynanBot.timber.timberInterface import TimberInterface
+from CynanBot.twitch.api.twitchApiRequestPriority import \
+    TwitchApiRequestPriority
+from CynanBot.twitch.api.twitchApiRequestScheduler import \
+    TwitchApiRequestScheduler
+from CynanBot.twitch.api.twitchApiRequestSchedulerInterface import \
+    TwitchApiRequestSchedulerInterface
+from CynanBot.twitch.api.twitchApiScheduledNetworkHandle import \
+    TwitchApiScheduledNetworkHandle
 from CynanBot.twitch.api.twitchApiServiceInterface import \
     TwitchApiServiceInterface
 from CynanBot.twitch.api.twitchBannedUser import TwitchBannedUser
@@ -80,7 +88,8 @@ class TwitchApiService(TwitchApiServiceInterface):
         timeZoneRepository: TimeZoneRepositoryInterface,
         twitchCredentialsProvider: TwitchCredentialsProviderInterface,
         twitchJsonMapper: TwitchJsonMapperInterface,
-        twitchWebsocketJsonMapper: TwitchWebsocketJsonMapperInterface
+        twitchWebsocketJsonMapper: TwitchWebsocketJsonMapperInterface,
+        twitchApiRequestScheduler: TwitchApiRequestSchedulerInterface | None = None
     ):
         if not isinstance(networkClientProvider, NetworkClientProvider):
             raise TypeError(f'networkClientProvider argument is malformed: \"{networkClientProvider}\"')
@@ -94,6 +103,8 @@ class TwitchApiService(TwitchApiServiceInterface):
             raise TypeError(f'twitchJsonMapper argument is malformed: \"{twitchJsonMapper}\"')
         elif not isinstance(twitchWebsocketJsonMapper, TwitchWebsocketJsonMapperInterface):
             raise TypeError(f'twitchWebsocketJsonMapper argument is malformed: \"{twitchWebsocketJsonMapper}\"')
+        elif twitchApiRequestScheduler is not None and not isinstance(twitchApiRequestScheduler, TwitchApiRequestSchedulerInterface):
+            raise TypeError(f'twitchApiRequestScheduler argument is malformed: \"{twitchApiRequestScheduler}\"')
 
         self.__networkClientProvider: NetworkClientProvider = networkClientProvider
         self.__timber: TimberInterface = timber
@@ -102,6 +113,13 @@ class TwitchApiService(TwitchApiServiceInterface):
         self.__twitchJsonMapper: TwitchJsonMapperInterface = twitchJsonMapper
         self.__twitchWebsocketJsonMapper: TwitchWebsocketJsonMapperInterface = twitchWebsocketJsonMapper
 
+        if twitchApiRequestScheduler is None:
+            twitchApiRequestScheduler = TwitchApiRequestScheduler(
+                timber = timber
+            )
+
+        self.__twitchApiRequestScheduler: TwitchApiRequestSchedulerInterface = twitchApiRequestScheduler
+
     async def addModerator(
         self,
         broadcasterId: str,
@@ -116,7 +134,7 @@ class TwitchApiService(TwitchApiServiceInterface):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
 
         self.__timber.log('TwitchApiService', f'Adding moderator... ({broadcasterId=}) ({twitchAccessToken=}) ({userId=})')
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.HIGH)
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
 
         try:
@@ -155,7 +173,7 @@ class TwitchApiService(TwitchApiServiceInterface):
             raise TypeError(f'banRequest argument is malformed: \"{banRequest}\"')
 
         self.__timber.log('TwitchApiService', f'Banning user... ({twitchAccessToken=}) ({banRequest=})')
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.HIGH)
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
 
         try:
@@ -226,7 +244,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         self.__timber.log('TwitchApiService', f'Creating EventSub subscription... ({twitchAccessToken=}) ({eventSubRequest=})')
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.MEDIUM)
 
         try:
             response = await clientSession.post(
@@ -322,7 +340,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         self.__timber.log('TwitchApiService', f'Fetching banned users... {bannedUserRequest=}')
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         firstFetch = True
         currentPagination: TwitchPaginationResponse | None = None
@@ -387,7 +405,7 @@ class TwitchApiService(TwitchApiServiceInterface):
             url = f'{url}&user_id={bannedUserRequest.requestedUserId}'
 
         if currentPagination is not None:
-            url = f'{url}&first={currentPagination.cursor}'
+            url = f'{url}&after={currentPagination.cursor}'
 
         try:
             response = await clientSession.get(
@@ -472,7 +490,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         self.__timber.log('TwitchApiService', f'Fetching emote details... ({broadcasterId=})')
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         try:
             response = await clientSession.get(
@@ -547,7 +565,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         self.__timber.log('TwitchApiService', f'Fetching follower... ({broadcasterId=}) ({twitchAccessToken=}) ({userId=})')
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         try:
             response = await clientSession.get(
@@ -609,7 +627,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         userIdsStr = '&user_id='.join(twitchChannelIds)
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         try:
             response = await clientSession.get(
@@ -676,7 +694,7 @@ class TwitchApiService(TwitchApiServiceInterface):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
 
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         try:
             response = await clientSession.get(
@@ -714,6 +732,77 @@ class TwitchApiService(TwitchApiServiceInterface):
             userName = utils.getStrFromDict(data[0], 'user_name')
         )
 
+    async def fetchModerators(
+        self,
+        broadcasterId: str,
+        twitchAccessToken: str
+    ) -> list[TwitchModUser]:
+        if not utils.isValidStr(broadcasterId):
+            raise ValueError(f'broadcasterId argument is malformed: \"{broadcasterId}\"')
+        elif not utils.isValidStr(twitchAccessToken):
+            raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+
+        self.__timber.log('TwitchApiService', f'Fetching moderators... ({broadcasterId=})')
+        twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
+
+        moderators: list[TwitchModUser] = list()
+        currentPagination: TwitchPaginationResponse | None = None
+
+        while True:
+            url = f'https://api.twitch.tv/helix/moderation/moderators?first=100&broadcaster_id={broadcasterId}'
+
+            if currentPagination is not None:
+                url = f'{url}&after={currentPagination.cursor}'
+
+            try:
+                response = await clientSession.get(
+                    url = url,
+                    headers = {
+                        'Authorization': f'Bearer {twitchAccessToken}',
+                        'Client-Id': twitchClientId
+                    }
+                )
+            except GenericNetworkException as e:
+                self.__timber.log('TwitchApiService', f'Encountered network error when fetching moderators ({broadcasterId=}): {e}', e, traceback.format_exc())
+                raise GenericNetworkException(f'TwitchApiService encountered network error when fetching moderators ({broadcasterId=}): {e}')
+
+            responseStatusCode = response.getStatusCode()
+            jsonResponse: dict[str, Any] | Any | None = await response.json()
+            await response.close()
+
+            if not (isinstance(jsonResponse, dict) and utils.hasItems(jsonResponse)):
+                self.__timber.log('TwitchApiService', f'Received a null/empty/invalid JSON response when fetching moderators ({broadcasterId=}): {jsonResponse}')
+                raise TwitchJsonException(f'TwitchApiService received a null/empty JSON response when fetching moderators ({broadcasterId=}): {jsonResponse}')
+            elif responseStatusCode == 401 or ('error' in jsonResponse and len(jsonResponse['error']) >= 1):
+                self.__timber.log('TwitchApiService', f'Received an error ({responseStatusCode}) when fetching moderators ({broadcasterId=}): {jsonResponse}')
+                raise TwitchTokenIsExpiredException(f'TwitchApiService received an error ({responseStatusCode}) when fetching moderators ({broadcasterId=}): {jsonResponse}')
+            elif responseStatusCode != 200:
+                self.__timber.log('TwitchApiService', f'Encountered non-200 HTTP status code when fetching moderators ({broadcasterId=}): {responseStatusCode}')
+                raise GenericNetworkException(f'TwitchApiService encountered non-200 HTTP status code when fetching moderators ({broadcasterId=}): {responseStatusCode}')
+
+            data: list[dict[str, Any]] | None = jsonResponse.get('data')
+
+            if utils.hasItems(data):
+                for dataEntry in data:
+                    moderators.append(TwitchModUser(
+                        userId = utils.getStrFromDict(dataEntry, 'user_id'),
+                        userLogin = utils.getStrFromDict(dataEntry, 'user_login'),
+                        userName = utils.getStrFromDict(dataEntry, 'user_name')
+                    ))
+
+            paginationJson: dict[str, Any] | None = jsonResponse.get('pagination')
+
+            if utils.hasItems(data) and isinstance(paginationJson, dict) and utils.isValidStr(paginationJson.get('cursor')):
+                currentPagination = TwitchPaginationResponse(
+                    cursor = utils.getStrFromDict(paginationJson, 'cursor')
+                )
+            else:
+                break
+
+        moderators.sort(key = lambda moderator: moderator.userLogin.casefold())
+        return moderators
+
     async def fetchTokens(self, code: str) -> TwitchTokensDetails:
         if not utils.isValidStr(code):
             raise ValueError(f'code argument is malformed: \"{code}\"')
@@ -722,7 +811,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
         twitchClientSecret = await self.__twitchCredentialsProvider.getTwitchClientSecret()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.MEDIUM)
 
         try:
             response = await clientSession.post(
@@ -779,7 +868,7 @@ class TwitchApiService(TwitchApiServiceInterface):
         self.__timber.log('TwitchApiService', f'Fetching user details... ({userId=})')
 
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         try:
             response = await clientSession.get(
@@ -846,7 +935,7 @@ class TwitchApiService(TwitchApiServiceInterface):
         self.__timber.log('TwitchApiService', f'Fetching user details... ({userName=})')
 
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         try:
             response = await clientSession.get(
@@ -899,6 +988,97 @@ class TwitchApiService(TwitchApiServiceInterface):
             userType = TwitchUserType.fromStr(utils.getStrFromDict(entry, 'type'))
         )
 
+    async def fetchUserDetailsWithUserIds(
+        self,
+        twitchAccessToken: str,
+        userIds: list[str]
+    ) -> list[TwitchUserDetails]:
+        if not utils.isValidStr(twitchAccessToken):
+            raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+        elif not isinstance(userIds, list) or not utils.areValidStrs(userIds):
+            raise TypeError(f'userIds argument is malformed: \"{userIds}\"')
+        elif len(userIds) > 100:
+            raise ValueError(f'userIds argument has too many values (len is {len(userIds)}, max is 100): \"{userIds}\"')
+
+        return await self.__fetchUsersDetails(
+            twitchAccessToken = twitchAccessToken,
+            queryKey = 'id',
+            queryValues = userIds
+        )
+
+    async def fetchUserDetailsWithUserNames(
+        self,
+        twitchAccessToken: str,
+        userNames: list[str]
+    ) -> list[TwitchUserDetails]:
+        if not utils.isValidStr(twitchAccessToken):
+            raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+        elif not isinstance(userNames, list) or not utils.areValidStrs(userNames):
+            raise TypeError(f'userNames argument is malformed: \"{userNames}\"')
+        elif len(userNames) > 100:
+            raise ValueError(f'userNames argument has too many values (len is {len(userNames)}, max is 100): \"{userNames}\"')
+
+        return await self.__fetchUsersDetails(
+            twitchAccessToken = twitchAccessToken,
+            queryKey = 'login',
+            queryValues = [ userName.lower() for userName in userNames ]
+        )
+
+    async def __fetchUsersDetails(
+        self,
+        twitchAccessToken: str,
+        queryKey: str,
+        queryValues: list[str]
+    ) -> list[TwitchUserDetails]:
+        self.__timber.log('TwitchApiService', f'Fetching details for {len(queryValues)} user(s)... ({queryKey=})')
+
+        queryStr = '&'.join(f'{queryKey}={queryValue}' for queryValue in queryValues)
+        twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
+
+        try:
+            response = await clientSession.get(
+                url = f'https://api.twitch.tv/helix/users?{queryStr}',
+                headers = {
+                    'Authorization': f'Bearer {twitchAccessToken}',
+                    'Client-Id': twitchClientId
+                }
+            )
+        except GenericNetworkException as e:
+            self.__timber.log('TwitchApiService', f'Encountered network error when fetching details for {len(queryValues)} user(s) ({queryKey=}): {e}', e, traceback.format_exc())
+            raise GenericNetworkException(f'TwitchApiService encountered network error when fetching details for {len(queryValues)} user(s) ({queryKey=}): {e}')
+
+        if response.getStatusCode() != 200:
+            self.__timber.log('TwitchApiService', f'Encountered non-200 HTTP status code when fetching details for {len(queryValues)} user(s) ({queryKey=}): {response.getStatusCode()}')
+            raise GenericNetworkException(f'TwitchApiService encountered non-200 HTTP status code when fetching details for {len(queryValues)} user(s) ({queryKey=}): {response.getStatusCode()}')
+
+        jsonResponse: dict[str, Any] | Any | None = await response.json()
+        await response.close()
+
+        if not (isinstance(jsonResponse, dict) and utils.hasItems(jsonResponse)):
+            self.__timber.log('TwitchApiService', f'Received a null/empty/invalid JSON response when fetching details for {len(queryValues)} user(s) ({queryKey=}): {jsonResponse}')
+            raise TwitchJsonException(f'TwitchApiService received a null/empty JSON response when fetching details for {len(queryValues)} user(s) ({queryKey=}): {jsonResponse}')
+        elif 'error' in jsonResponse and len(jsonResponse['error']) >= 1:
+            self.__timber.log('TwitchApiService', f'Received an error of some kind when fetching details for {len(queryValues)} user(s) ({queryKey=}): {jsonResponse}')
+            raise TwitchErrorException(f'TwitchApiService received an error of some kind when fetching details for {len(queryValues)} user(s) ({queryKey=}): {jsonResponse}')
+
+        data: list[dict[str, Any]] | None = jsonResponse.get('data')
+        usersDetails: list[TwitchUserDetails] = list()
+
+        if not utils.hasItems(data):
+            return usersDetails
+
+        for entry in data:
+            usersDetails.append(TwitchUserDetails(
+                displayName = utils.getStrFromDict(entry, 'display_name'),
+                login = utils.getStrFromDict(entry, 'login'),
+                userId = utils.getStrFromDict(entry, 'id'),
+                broadcasterType = TwitchBroadcasterType.fromStr(utils.getStrFromDict(entry, 'broadcaster_type')),
+                userType = TwitchUserType.fromStr(utils.getStrFromDict(entry, 'type'))
+            ))
+
+        return usersDetails
+
     async def fetchUserSubscriptionDetails(
         self,
         broadcasterId: str,
@@ -915,7 +1095,7 @@ class TwitchApiService(TwitchApiServiceInterface):
         self.__timber.log('TwitchApiService', f'Fetching user subscription details... (broadcasterId=\"{broadcasterId}\") (userId=\"{userId}\")')
 
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.LOW)
 
         try:
             response = await clientSession.get(
@@ -969,6 +1149,14 @@ class TwitchApiService(TwitchApiServiceInterface):
             subscriberTier = subscriberTier
         )
 
+    async def __getNetworkHandle(self, priority: TwitchApiRequestPriority) -> NetworkHandle:
+        return TwitchApiScheduledNetworkHandle(
+            networkHandle = await self.__networkClientProvider.get(),
+            timber = self.__timber,
+            priority = priority,
+            twitchApiRequestScheduler = self.__twitchApiRequestScheduler
+        )
+
     async def refreshTokens(self, twitchRefreshToken: str) -> TwitchTokensDetails:
         if not utils.isValidStr(twitchRefreshToken):
             raise TypeError(f'twitchRefreshToken argument is malformed: \"{twitchRefreshToken}\"')
@@ -977,7 +1165,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
         twitchClientSecret = await self.__twitchCredentialsProvider.getTwitchClientSecret()
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.MEDIUM)
 
         try:
             response = await clientSession.post(
@@ -1040,7 +1228,7 @@ class TwitchApiService(TwitchApiServiceInterface):
         elif not isinstance(chatRequest, TwitchSendChatMessageRequest):
             raise TypeError(f'chatRequest argument is malformed: \"{chatRequest}\"')
 
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.MEDIUM)
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
 
         try:
@@ -1111,7 +1299,7 @@ class TwitchApiService(TwitchApiServiceInterface):
 
         self.__timber.log('TwitchApiService', f'Unbanning user... ({twitchAccessToken=}) ({unbanRequest=})')
 
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.HIGH)
         twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
         response: NetworkResponse | None = None
 
@@ -1149,7 +1337,7 @@ class TwitchApiService(TwitchApiServiceInterface):
             raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
         self.__timber.log('TwitchApiService', f'Validating token... ({twitchAccessToken=})')
-        clientSession = await self.__networkClientProvider.get()
+        clientSession = await self.__getNetworkHandle(TwitchApiRequestPriority.MEDIUM)
 
         try:
             response = await clientSession.get(
@@ -93,6 +93,14 @@ class TwitchApiServiceInterface(ABC):
     ) -> TwitchModUser | None:
         pass
 
+    @abstractmethod
+    async def fetchModerators(
+        self,
+        broadcasterId: str,
+        twitchAccessToken: str
+    ) -> list[TwitchModUser]:
+        pass
+
     @abstractmethod
     async def fetchTokens(self, code: str) -> TwitchTokensDetails:
         pass
@@ -113,6 +121,22 @@ class TwitchApiServiceInterface(ABC):
     ) -> TwitchUserDetails | None:
         pass
 
+    @abstractmethod
+    async def fetchUserDetailsWithUserIds(
+        self,
+        twitchAccessToken: str,
+        userIds: list[str]
+    ) -> list[TwitchUserDetails]:
+        pass
+
+    @abstractmethod
+    async def fetchUserDetailsWithUserNames(
+        self,
+        twitchAccessToken: str,
+        userNames: list[str]
+    ) -> list[TwitchUserDetails]:
+        pass
+
     @abstractmethod
     async def fetchUserSubscriptionDetails(
         self,
@@ -5,6 +5,9 @@ import CynanBot.misc.utils as utils
 
 class TwitchWebsocketSubscriptionType(Enum):
 
+    CHANNEL_BAN = auto()
+    CHANNEL_MODERATOR_ADD = auto()
+    CHANNEL_MODERATOR_REMOVE = auto()
     CHANNEL_POINTS_REDEMPTION = auto()
     CHANNEL_POLL_BEGIN = auto()
     CHANNEL_POLL_END = auto()
@@ -13,10 +16,13 @@ class TwitchWebsocketSubscriptionType(Enum):
     CHANNEL_PREDICTION_END = auto()
     CHANNEL_PREDICTION_LOCK = auto()
     CHANNEL_PREDICTION_PROGRESS = auto()
+    CHANNEL_UNBAN = auto()
     CHANNEL_UPDATE = auto()
     CHEER = auto()
     FOLLOW = auto()
     RAID = auto()
+    STREAM_OFFLINE = auto()
+    STREAM_ONLINE = auto()
     SUBSCRIBE = auto()
     SUBSCRIPTION_GIFT = auto()
     SUBSCRIPTION_MESSAGE = auto()
@@ -29,6 +35,12 @@ class TwitchWebsocketSubscriptionType(Enum):
         text = text.lower()
 
         match text:
+            case 'channel.ban':
+                return TwitchWebsocketSubscriptionType.CHANNEL_BAN
+            case 'channel.moderator.add':
+                return TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD
+            case 'channel.moderator.remove':
+                return TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE
             case 'channel.channel_points_custom_reward_redemption.add':
                 return TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION
             case 'channel.poll.begin':
@@ -45,6 +57,8 @@ class TwitchWebsocketSubscriptionType(Enum):
                 return TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_LOCK
             case 'channel.prediction.progress':
                 return TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_PROGRESS
+            case 'channel.unban':
+                return TwitchWebsocketSubscriptionType.CHANNEL_UNBAN
             case 'channel.update':
                 return TwitchWebsocketSubscriptionType.CHANNEL_UPDATE
             case 'channel.cheer':
@@ -53,6 +67,10 @@ class TwitchWebsocketSubscriptionType(Enum):
                 return TwitchWebsocketSubscriptionType.FOLLOW
             case 'channel.raid':
                 return TwitchWebsocketSubscriptionType.RAID
+            case 'stream.offline':
+                return TwitchWebsocketSubscriptionType.STREAM_OFFLINE
+            case 'stream.online':
+                return TwitchWebsocketSubscriptionType.STREAM_ONLINE
             case 'channel.subscribe':
                 return TwitchWebsocketSubscriptionType.SUBSCRIBE
             case 'channel.subscription.gift':
@@ -64,6 +82,9 @@ class TwitchWebsocketSubscriptionType(Enum):
 
     def getVersion(self) -> str:
         match self:
+            case TwitchWebsocketSubscriptionType.CHANNEL_BAN: return '1'
+            case TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD: return '1'
+            case TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE: return '1'
             case TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION: return '1'
             case TwitchWebsocketSubscriptionType.CHANNEL_POLL_BEGIN: return '1'
             case TwitchWebsocketSubscriptionType.CHANNEL_POLL_END: return '1'
@@ -72,10 +93,13 @@ class TwitchWebsocketSubscriptionType(Enum):
             case TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_END: return '1'
             case TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_LOCK: return '1'
             case TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_PROGRESS: return '1'
+            case TwitchWebsocketSubscriptionType.CHANNEL_UNBAN: return '1'
             case TwitchWebsocketSubscriptionType.CHANNEL_UPDATE: return '2'
             case TwitchWebsocketSubscriptionType.CHEER: return '1'
             case TwitchWebsocketSubscriptionType.FOLLOW: return '2'
             case TwitchWebsocketSubscriptionType.RAID: return '1'
+            case TwitchWebsocketSubscriptionType.STREAM_OFFLINE: return '1'
+            case TwitchWebsocketSubscriptionType.STREAM_ONLINE: return '1'
             case TwitchWebsocketSubscriptionType.SUBSCRIBE: return '1'
             case TwitchWebsocketSubscriptionType.SUBSCRIPTION_GIFT: return '1'
             case TwitchWebsocketSubscriptionType.SUBSCRIPTION_MESSAGE: return '1'
@@ -83,6 +107,12 @@ class TwitchWebsocketSubscriptionType(Enum):
 
     def toStr(self) -> str:
         match self:
+            case TwitchWebsocketSubscriptionType.CHANNEL_BAN:
+                return 'channel.ban'
+            case TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD:
+                return 'channel.moderator.add'
+            case TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE:
+                return 'channel.moderator.remove'
             case TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION:
                 return 'channel.channel_points_custom_reward_redemption.add'
             case TwitchWebsocketSubscriptionType.CHANNEL_POLL_BEGIN:
@@ -99,6 +129,8 @@ class TwitchWebsocketSubscriptionType(Enum):
                 return 'channel.prediction.lock'
             case TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_PROGRESS:
                 return 'channel.prediction.progress'
+            case TwitchWebsocketSubscriptionType.CHANNEL_UNBAN:
+                return 'channel.unban'
             case TwitchWebsocketSubscriptionType.CHANNEL_UPDATE:
                 return 'channel.update'
             case TwitchWebsocketSubscriptionType.CHEER:
@@ -107,6 +139,10 @@ class TwitchWebsocketSubscriptionType(Enum):
                 return 'channel.follow'
             case TwitchWebsocketSubscriptionType.RAID:
                 return 'channel.raid'
+            case TwitchWebsocketSubscriptionType.STREAM_OFFLINE:
+                return 'stream.offline'
+            case TwitchWebsocketSubscriptionType.STREAM_ONLINE:
+                return 'stream.online'
             case TwitchWebsocketSubscriptionType.SUBSCRIBE:
                 return 'channel.subscribe'
             case TwitchWebsocketSubscriptionType.SUBSCRIPTION_GIFT:
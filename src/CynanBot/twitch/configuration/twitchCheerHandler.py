@@ -193,7 +193,7 @@ class TwitchCheerHandler(AbsTwitchCheerHandler):
         )
 
         if action is not None:
-            triviaGameMachine.submitAction(action)
+            await triviaGameMachine.submitAction(action)
 
     async def __processTtsEvent(
         self,
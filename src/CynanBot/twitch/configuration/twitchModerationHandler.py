@@ -0,0 +1,83 @@
+import CynanBot.misc.utils as utils
+from CynanBot.timber.timberInterface import TimberInterface
+from CynanBot.twitch.absTwitchModerationHandler import \
+    AbsTwitchModerationHandler
+from CynanBot.twitch.api.websocket.twitchWebsocketDataBundle import \
+    TwitchWebsocketDataBundle
+from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
+    TwitchWebsocketSubscriptionType
+from CynanBot.twitch.timeout.twitchModerationRosterRepositoryInterface import \
+    TwitchModerationRosterRepositoryInterface
+from CynanBot.users.userInterface import UserInterface
+
+
+class TwitchModerationHandler(AbsTwitchModerationHandler):
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface | None
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif twitchModerationRosterRepository is not None and not isinstance(twitchModerationRosterRepository, TwitchModerationRosterRepositoryInterface):
+            raise TypeError(f'twitchModerationRosterRepository argument is malformed: \"{twitchModerationRosterRepository}\"')
+
+        self.__timber: TimberInterface = timber
+        self.__twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface | None = twitchModerationRosterRepository
+
+    async def onNewModerationEvent(
+        self,
+        userId: str,
+        user: UserInterface,
+        dataBundle: TwitchWebsocketDataBundle
+    ):
+        if not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+        elif not isinstance(user, UserInterface):
+            raise TypeError(f'user argument is malformed: \"{user}\"')
+        elif not isinstance(dataBundle, TwitchWebsocketDataBundle):
+            raise TypeError(f'dataBundle argument is malformed: \"{dataBundle}\"')
+
+        twitchModerationRosterRepository = self.__twitchModerationRosterRepository
+
+        if twitchModerationRosterRepository is None:
+            return
+
+        event = dataBundle.requirePayload().event
+
+        if event is None:
+            self.__timber.log('TwitchModerationHandler', f'Received a data bundle that has no event (channel=\"{user.getHandle()}\") ({dataBundle=})')
+            return
+
+        moderatedUserId = event.userId
+
+        if not utils.isValidStr(moderatedUserId):
+            self.__timber.log('TwitchModerationHandler', f'Received a data bundle that has no user ID (channel=\"{user.getHandle()}\") ({dataBundle=})')
+            return
+
+        subscriptionType = dataBundle.metadata.subscriptionType
+
+        if subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_BAN:
+            await twitchModerationRosterRepository.onUserBanned(
+                twitchChannelId = userId,
+                userId = moderatedUserId,
+                expiresAt = event.endsAt
+            )
+        elif subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD:
+            await twitchModerationRosterRepository.onModeratorAdded(
+                twitchChannelId = userId,
+                userId = moderatedUserId
+            )
+        elif subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE:
+            await twitchModerationRosterRepository.onModeratorRemoved(
+                twitchChannelId = userId,
+                userId = moderatedUserId
+            )
+        elif subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_UNBAN:
+            await twitchModerationRosterRepository.onUserUnbanned(
+                twitchChannelId = userId,
+                userId = moderatedUserId
+            )
+        else:
+            self.__timber.log('TwitchModerationHandler', f'Received a data bundle that is not a moderation event (channel=\"{user.getHandle()}\") ({subscriptionType=}) ({dataBundle=})')
@@ -0,0 +1,60 @@
+import CynanBot.misc.utils as utils
+from CynanBot.timber.timberInterface import TimberInterface
+from CynanBot.twitch.absTwitchStreamStatusHandler import \
+    AbsTwitchStreamStatusHandler
+from CynanBot.twitch.api.websocket.twitchWebsocketDataBundle import \
+    TwitchWebsocketDataBundle
+from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
+    TwitchWebsocketSubscriptionType
+from CynanBot.twitch.isLiveOnTwitchRepositoryInterface import \
+    IsLiveOnTwitchRepositoryInterface
+from CynanBot.users.userInterface import UserInterface
+
+
+class TwitchStreamStatusHandler(AbsTwitchStreamStatusHandler):
+
+    def __init__(
+        self,
+        isLiveOnTwitchRepository: IsLiveOnTwitchRepositoryInterface | None,
+        timber: TimberInterface
+    ):
+        if isLiveOnTwitchRepository is not None and not isinstance(isLiveOnTwitchRepository, IsLiveOnTwitchRepositoryInterface):
+            raise TypeError(f'isLiveOnTwitchRepository argument is malformed: \"{isLiveOnTwitchRepository}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+
+        self.__isLiveOnTwitchRepository: IsLiveOnTwitchRepositoryInterface | None = isLiveOnTwitchRepository
+        self.__timber: TimberInterface = timber
+
+    async def onNewStreamStatus(
+        self,
+        userId: str,
+        user: UserInterface,
+        dataBundle: TwitchWebsocketDataBundle
+    ):
+        if not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+        elif not isinstance(user, UserInterface):
+            raise TypeError(f'user argument is malformed: \"{user}\"')
+        elif not isinstance(dataBundle, TwitchWebsocketDataBundle):
+            raise TypeError(f'dataBundle argument is malformed: \"{dataBundle}\"')
+
+        isLiveOnTwitchRepository = self.__isLiveOnTwitchRepository
+
+        if isLiveOnTwitchRepository is None:
+            return
+
+        subscriptionType = dataBundle.metadata.subscriptionType
+
+        if subscriptionType is TwitchWebsocketSubscriptionType.STREAM_ONLINE:
+            isLive = True
+        elif subscriptionType is TwitchWebsocketSubscriptionType.STREAM_OFFLINE:
+            isLive = False
+        else:
+            self.__timber.log('TwitchStreamStatusHandler', f'Received a data bundle that is not a stream status change (channel=\"{user.getHandle()}\") ({subscriptionType=}) ({dataBundle=})')
+            return
+
+        await isLiveOnTwitchRepository.setLiveStatus(
+            twitchChannelId = userId,
+            isLive = isLive
+        )
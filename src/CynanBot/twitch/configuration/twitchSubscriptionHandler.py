@@ -203,7 +203,7 @@ class TwitchSubscriptionHandler(AbsTwitchSubscriptionHandler):
         )
 
         if action is not None:
-            triviaGameMachine.submitAction(action)
+            await triviaGameMachine.submitAction(action)
 
     async def __processTtsEvent(
         self,
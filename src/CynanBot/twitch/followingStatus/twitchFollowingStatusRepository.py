@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import traceback
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from lru import LRU
 
 import CynanBot.misc.utils as utils
+from CynanBot.misc.singleFlight import SingleFlight
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.twitch.api.twitchApiServiceInterface import \
     TwitchApiServiceInterface
@@ -31,7 +31,9 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         timber: TimberInterface,
         twitchApiService: TwitchApiServiceInterface,
         userIdsRepository: UserIdsRepositoryInterface,
-        cacheSize: int = 32
+        cacheSize: int = 128,
+        notFollowingCacheSize: int = 1024,
+        notFollowingTimeToLive: timedelta = timedelta(minutes = 15)
     ):
         if not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
@@ -45,17 +47,28 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
             raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
         elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
             raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
+        elif not utils.isValidInt(notFollowingCacheSize):
+            raise TypeError(f'notFollowingCacheSize argument is malformed: \"{notFollowingCacheSize}\"')
+        elif notFollowingCacheSize < 1 or notFollowingCacheSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'notFollowingCacheSize argument is out of bounds: {notFollowingCacheSize}')
+        elif not isinstance(notFollowingTimeToLive, timedelta):
+            raise TypeError(f'notFollowingTimeToLive argument is malformed: \"{notFollowingTimeToLive}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
+        self.__notFollowingTimeToLive: timedelta = notFollowingTimeToLive
 
-        self.__isDatabaseReady: bool = False
         self.__caches: dict[str, LRU[str, TwitchFollowingStatus | None]] = defaultdict(lambda: LRU(cacheSize))
+        self.__notFollowingCache: LRU[str, datetime] = LRU(notFollowingCacheSize)
+        self.__fetchSingleFlight: SingleFlight[TwitchFollowingStatus | None] = SingleFlight()
+
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def clearCaches(self):
         self.__caches.clear()
+        self.__notFollowingCache.clear()
         self.__timber.log('TwitchFollowerRepository', 'Caches cleared')
 
     async def fetchFollowingStatus(
@@ -76,6 +89,30 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         if followingStatus is not None:
             return followingStatus
 
+        notFollowingKey = self.__getNotFollowingKey(twitchChannelId, userId)
+        notFollowingExpirationTime = self.__notFollowingCache.get(notFollowingKey, None)
+
+        if notFollowingExpirationTime is not None:
+            if datetime.now(timezone.utc) < notFollowingExpirationTime:
+                return None
+
+            del self.__notFollowingCache[notFollowingKey]
+
+        return await self.__fetchSingleFlight.run(
+            key = notFollowingKey,
+            function = lambda: self.__fetchFollowingStatus(
+                twitchAccessToken = twitchAccessToken,
+                twitchChannelId = twitchChannelId,
+                userId = userId
+            )
+        )
+
+    async def __fetchFollowingStatus(
+        self,
+        twitchAccessToken: str,
+        twitchChannelId: str,
+        userId: str
+    ) -> TwitchFollowingStatus | None:
         followingStatus = await self.__fetchFromDatabase(
             twitchAccessToken = twitchAccessToken,
             twitchChannelId = twitchChannelId,
@@ -93,7 +130,6 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         )
 
         if followingStatus is None:
-            self.__timber.log('TwitchFollowingStatusRepository', f'Failed to fetch Twitch following status ({followingStatus=}) ({twitchChannelId=}) ({userId=})')
             return None
 
         await self.persistFollowingStatus(
@@ -111,12 +147,11 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         twitchChannelId: str,
         userId: str
     ) -> TwitchFollowingStatus | None:
-        connection = await self.__getDatabaseConnection()
-        record = await connection.execute(
+        connection = await self.__backingDatabase.getConnection()
+        record = await connection.fetchRow(
             '''
-                SELECT twitchfollowingstatus.datetime, userids.username FROM twitchfollowingstatus
-                INNER JOIN userids ON twitchfollowingstatus.twitchchannelid = userids.userid
-                WHERE twitchfollowingstatus.twitchchannelid = $1 AND twitchfollowingstatus.userid = $2
+                SELECT datetime FROM twitchfollowingstatus
+                WHERE twitchchannelid = $1 AND userid = $2
                 LIMIT 1
             ''',
             twitchChannelId, userId
@@ -127,6 +162,11 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         if record is None or len(record) == 0:
             return None
 
+        twitchChannel = await self.__userIdsRepository.requireUserName(
+            userId = twitchChannelId,
+            twitchAccessToken = twitchAccessToken
+        )
+
         userName = await self.__userIdsRepository.requireUserName(
             userId = userId,
             twitchAccessToken = twitchAccessToken
@@ -134,7 +174,7 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
 
         return TwitchFollowingStatus(
             followedAt = datetime.fromisoformat(record[0]),
-            twitchChannel = record[1],
+            twitchChannel = twitchChannel,
             twitchChannelId = twitchChannelId,
             userId = userId,
             userName = userName
@@ -146,16 +186,6 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         twitchChannelId: str,
         userId: str
     ) -> TwitchFollowingStatus | None:
-        twitchChannel = await self.__userIdsRepository.requireUserName(
-            userId = twitchChannelId,
-            twitchAccessToken = twitchAccessToken
-        )
-
-        userName = await self.__userIdsRepository.requireUserName(
-            userId = userId,
-            twitchAccessToken = twitchAccessToken
-        )
-
         twitchFollower: TwitchFollower | None = None
         exception: GenericNetworkException | None =  None
 
@@ -168,10 +198,24 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         except GenericNetworkException as e:
             exception = e
 
-        if twitchFollower is None or exception is not None:
-            self.__timber.log('TwitchFollowerRepository', f'Failed to fetch Twitch follower from Twitch API ({twitchFollower=}) ({twitchAccessToken=}) ({twitchChannel=}) ({twitchChannelId=}) ({userId=}): {exception}', exception, traceback.format_exc())
+        if twitchFollower is None and exception is None:
+            # channel.follow events clear this out early, otherwise it is re-checked once it expires
+            self.__notFollowingCache[self.__getNotFollowingKey(twitchChannelId, userId)] = datetime.now(timezone.utc) + self.__notFollowingTimeToLive
+            return None
+        elif twitchFollower is None or exception is not None:
+            self.__timber.log('TwitchFollowerRepository', f'Failed to fetch Twitch follower from Twitch API ({twitchFollower=}) ({twitchAccessToken=}) ({twitchChannelId=}) ({userId=}): {exception}', exception, traceback.format_exc())
             return None
 
+        twitchChannel = await self.__userIdsRepository.requireUserName(
+            userId = twitchChannelId,
+            twitchAccessToken = twitchAccessToken
+        )
+
+        userName = await self.__userIdsRepository.requireUserName(
+            userId = userId,
+            twitchAccessToken = twitchAccessToken
+        )
+
         return TwitchFollowingStatus(
             followedAt = twitchFollower.followedAt,
             twitchChannel = twitchChannel,
@@ -180,46 +224,33 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
             userName = userName
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.getDatabaseType():
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
-                            datetime text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
-                            datetime TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'twitchfollowingstatus',
+            psqlStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
+                        datetime text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                '''
+            ],
+            sqliteStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
+                        datetime TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                '''
+            ]
+        )
 
-        await connection.close()
+    def __getNotFollowingKey(self, twitchChannelId: str, userId: str) -> str:
+        return f'{twitchChannelId}:{userId}'
 
     async def persistFollowingStatus(
         self,
@@ -234,7 +265,7 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO twitchfollowingstatus (datetime, twitchchannelid, userid)
@@ -245,3 +276,7 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         )
 
         await connection.close()
+
+        # the next lookup re-reads this follow from the database, rather than trusting an outdated cached answer
+        self.__caches[twitchChannelId].pop(userId, None)
+        self.__notFollowingCache.pop(self.__getNotFollowingKey(twitchChannelId, userId), None)
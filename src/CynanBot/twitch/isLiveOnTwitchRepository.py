@@ -8,6 +8,8 @@ from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.twitch.api.twitchApiServiceInterface import \
     TwitchApiServiceInterface
 from CynanBot.twitch.api.twitchStreamType import TwitchStreamType
+from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
+    TwitchWebsocketSubscriptionType
 from CynanBot.twitch.isLiveOnTwitchRepositoryInterface import \
     IsLiveOnTwitchRepositoryInterface
 from CynanBot.twitch.twitchTokensRepositoryInterface import \
@@ -41,6 +43,8 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
 
         self.__cache: TimedDict[bool] = TimedDict(cacheTimeDelta)
+        self.__pushedLiveStatuses: dict[str, bool] = dict()
+        self.__websocketTwitchChannelIds: set[str] = set()
 
     async def areLive(self, twitchChannelIds: set[str]) -> dict[str, bool]:
         if not isinstance(twitchChannelIds, set):
@@ -51,6 +55,11 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         if len(twitchChannelIds) == 0:
             return twitchChannelIdToLiveStatus
 
+        await self.__populateFromPushedLiveStatuses(
+            twitchChannelIds = twitchChannelIds,
+            twitchChannelIdToLiveStatus = twitchChannelIdToLiveStatus
+        )
+
         await self.__populateFromCache(
             twitchChannelIds = twitchChannelIds,
             twitchChannelIdToLiveStatus = twitchChannelIdToLiveStatus
@@ -65,6 +74,7 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
 
     async def clearCaches(self):
         self.__cache.clear()
+        self.__pushedLiveStatuses.clear()
         self.__timber.log('IsLiveOnTwitchRepository', 'Caches cleared')
 
     async def __fetchLiveUserDetails(
@@ -94,12 +104,12 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         for liveUserDetail in liveUserDetails:
             isLive = liveUserDetail.streamType is TwitchStreamType.LIVE
             twitchChannelIdToLiveStatus[liveUserDetail.userId] = isLive
-            self.__cache[liveUserDetail.userId] = isLive
+            self.__saveFetchedLiveStatus(liveUserDetail.userId, isLive)
 
         for twitchChannelId in twitchChannelIds:
             if twitchChannelId not in twitchChannelIdToLiveStatus:
                 twitchChannelIdToLiveStatus[twitchChannelId] = False
-                self.__cache[twitchChannelId] = False
+                self.__saveFetchedLiveStatus(twitchChannelId, False)
 
     async def isLive(self, twitchChannelId: str) -> bool:
         if not utils.isValidStr(twitchChannelId):
@@ -111,6 +121,26 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         twitchChannelIdsToLiveStatus = await self.areLive(twitchChannelIds)
         return twitchChannelIdsToLiveStatus.get(twitchChannelId, False) is True
 
+    async def onWebsocketSubscriptionsChanged(
+        self,
+        twitchChannelId: str,
+        subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType]
+    ):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not isinstance(subscriptionTypes, frozenset):
+            raise TypeError(f'subscriptionTypes argument is malformed: \"{subscriptionTypes}\"')
+
+        if TwitchWebsocketSubscriptionType.STREAM_OFFLINE in subscriptionTypes and TwitchWebsocketSubscriptionType.STREAM_ONLINE in subscriptionTypes:
+            if twitchChannelId not in self.__websocketTwitchChannelIds:
+                self.__websocketTwitchChannelIds.add(twitchChannelId)
+                self.__timber.log('IsLiveOnTwitchRepository', f'Live status for \"{twitchChannelId}\" is now being pushed over websocket')
+        elif twitchChannelId in self.__websocketTwitchChannelIds:
+            # events may have been missed, so this channel's live status goes back to being polled until it's covered again
+            self.__websocketTwitchChannelIds.discard(twitchChannelId)
+            self.__pushedLiveStatuses.pop(twitchChannelId, None)
+            self.__timber.log('IsLiveOnTwitchRepository', f'Live status for \"{twitchChannelId}\" is no longer being pushed over websocket')
+
     async def __populateFromCache(
         self,
         twitchChannelIds: set[str],
@@ -121,3 +151,35 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
 
             if utils.isValidBool(isLive):
                 twitchChannelIdToLiveStatus[twitchChannelId] = isLive
+
+    async def __populateFromPushedLiveStatuses(
+        self,
+        twitchChannelIds: set[str],
+        twitchChannelIdToLiveStatus: dict[str, bool]
+    ):
+        for twitchChannelId in twitchChannelIds:
+            isLive = self.__pushedLiveStatuses.get(twitchChannelId, None)
+
+            if isLive is not None:
+                twitchChannelIdToLiveStatus[twitchChannelId] = isLive
+
+    def __saveFetchedLiveStatus(self, twitchChannelId: str, isLive: bool):
+        if twitchChannelId in self.__websocketTwitchChannelIds:
+            # a covered channel is only ever fetched once, after which the websocket keeps it up to date,
+            # so a stream.online or stream.offline event that arrived while fetching takes precedence
+            self.__pushedLiveStatuses.setdefault(twitchChannelId, isLive)
+        else:
+            self.__cache[twitchChannelId] = isLive
+
+    async def setLiveStatus(self, twitchChannelId: str, isLive: bool):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidBool(isLive):
+            raise TypeError(f'isLive argument is malformed: \"{isLive}\"')
+
+        self.__cache[twitchChannelId] = isLive
+
+        if twitchChannelId in self.__websocketTwitchChannelIds:
+            self.__pushedLiveStatuses[twitchChannelId] = isLive
+
+        self.__timber.log('IsLiveOnTwitchRepository', f'Live status for \"{twitchChannelId}\" has been pushed ({isLive=})')
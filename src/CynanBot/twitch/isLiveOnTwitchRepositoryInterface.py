@@ -1,9 +1,11 @@
 from abc import abstractmethod
 
 from CynanBot.misc.clearable import Clearable
+from CynanBot.twitch.websocket.twitchWebsocketSubscriptionsListener import \
+    TwitchWebsocketSubscriptionsListener
 
 
-class IsLiveOnTwitchRepositoryInterface(Clearable):
+class IsLiveOnTwitchRepositoryInterface(Clearable, TwitchWebsocketSubscriptionsListener):
 
     @abstractmethod
     async def areLive(self, twitchChannelIds: set[str]) -> dict[str, bool]:
@@ -12,3 +14,7 @@ class IsLiveOnTwitchRepositoryInterface(Clearable):
     @abstractmethod
     async def isLive(self, twitchChannelId: str) -> bool:
         pass
+
+    @abstractmethod
+    async def setLiveStatus(self, twitchChannelId: str, isLive: bool):
+        pass
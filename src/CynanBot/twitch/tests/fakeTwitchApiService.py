@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from CynanBot.authRepository import AuthRepository
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.network.aioHttpClientProvider import AioHttpClientProvider
+from CynanBot.storage.jsonStaticReader import JsonStaticReader
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchApiService import TwitchApiService
+from CynanBot.twitch.api.twitchJsonMapper import TwitchJsonMapper
+from CynanBot.twitch.api.twitchTokensDetails import TwitchTokensDetails
+from CynanBot.twitch.api.twitchValidationResponse import \
+    TwitchValidationResponse
+from CynanBot.twitch.websocket.twitchWebsocketJsonMapper import \
+    TwitchWebsocketJsonMapper
+
+
+class FakeTwitchApiService(TwitchApiService):
+
+    def __init__(self, expiresIn: timedelta):
+        eventLoop = asyncio.get_event_loop()
+        timber = TimberStub()
+        timeZoneRepository = TimeZoneRepository()
+        twitchJsonMapper = TwitchJsonMapper(
+            timber = timber,
+            timeZoneRepository = timeZoneRepository
+        )
+
+        super().__init__(
+            networkClientProvider = AioHttpClientProvider(
+                eventLoop = eventLoop,
+                timber = timber
+            ),
+            timber = timber,
+            timeZoneRepository = timeZoneRepository,
+            twitchCredentialsProvider = AuthRepository(
+                authJsonReader = JsonStaticReader(dict())
+            ),
+            twitchJsonMapper = twitchJsonMapper,
+            twitchWebsocketJsonMapper = TwitchWebsocketJsonMapper(
+                timber = timber,
+                twitchJsonMapper = twitchJsonMapper
+            )
+        )
+
+        self.expiresIn: timedelta = expiresIn
+        self.refreshCount: int = 0
+        self.validateCount: int = 0
+
+    async def refreshTokens(self, twitchRefreshToken: str) -> TwitchTokensDetails:
+        self.refreshCount = self.refreshCount + 1
+        await asyncio.sleep(0.01)
+
+        return TwitchTokensDetails(
+            expirationTime = datetime.now(TimeZoneRepository().getDefault()) + timedelta(hours = 4),
+            accessToken = f'access{self.refreshCount}',
+            refreshToken = f'refresh{self.refreshCount}'
+        )
+
+    async def validate(self, twitchAccessToken: str) -> TwitchValidationResponse:
+        self.validateCount = self.validateCount + 1
+        await asyncio.sleep(0.01)
+
+        return TwitchValidationResponse(
+            expiresAt = datetime.now(TimeZoneRepository().getDefault()) + self.expiresIn,
+            expiresInSeconds = int(self.expiresIn.total_seconds()),
+            scopes = set(),
+            clientId = 'client',
+            login = 'alice',
+            userId = '1'
+        )
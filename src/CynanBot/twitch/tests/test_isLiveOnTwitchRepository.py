@@ -0,0 +1,152 @@
+from datetime import timedelta
+
+import pytest
+
+from CynanBot.administratorProviderInterface import \
+    AdministratorProviderInterface
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchLiveUserDetails import TwitchLiveUserDetails
+from CynanBot.twitch.api.twitchStreamType import TwitchStreamType
+from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
+    TwitchWebsocketSubscriptionType
+from CynanBot.twitch.isLiveOnTwitchRepository import IsLiveOnTwitchRepository
+from CynanBot.twitch.tests.fakeTwitchApiService import FakeTwitchApiService
+from CynanBot.twitch.twitchTokensRepositoryInterface import \
+    TwitchTokensRepositoryInterface
+
+
+class StubAdministratorProvider(AdministratorProviderInterface):
+
+    async def clearCaches(self):
+        pass
+
+    async def getAdministratorUserId(self) -> str:
+        return '0'
+
+    async def getAdministratorUserName(self) -> str:
+        return 'admin'
+
+
+class StubTwitchTokensRepository(TwitchTokensRepositoryInterface):
+
+    async def addUser(self, code: str, twitchChannel: str, twitchChannelId: str):
+        pass
+
+    async def clearCaches(self):
+        pass
+
+    async def getAccessToken(self, twitchChannel: str) -> str | None:
+        return 'access'
+
+    async def getAccessTokenById(self, twitchChannelId: str) -> str | None:
+        return 'access'
+
+    async def hasAccessToken(self, twitchChannel: str) -> bool:
+        return True
+
+    async def hasAccessTokenById(self, twitchChannelId: str) -> bool:
+        return True
+
+    async def removeUser(self, twitchChannel: str):
+        pass
+
+    async def removeUserById(self, twitchChannelId: str):
+        pass
+
+    async def requireAccessToken(self, twitchChannel: str) -> str:
+        return 'access'
+
+    async def requireAccessTokenById(self, twitchChannelId: str) -> str:
+        return 'access'
+
+    def start(self):
+        pass
+
+
+class LiveTwitchApiService(FakeTwitchApiService):
+
+    def __init__(self, liveTwitchChannelIds: set[str]):
+        super().__init__(expiresIn = timedelta(hours = 4))
+        self.liveTwitchChannelIds: set[str] = liveTwitchChannelIds
+        self.fetchCount: int = 0
+
+    async def fetchLiveUserDetails(
+        self,
+        twitchAccessToken: str,
+        twitchChannelIds: list[str]
+    ) -> list[TwitchLiveUserDetails]:
+        self.fetchCount = self.fetchCount + 1
+        liveUserDetails: list[TwitchLiveUserDetails] = list()
+
+        for twitchChannelId in twitchChannelIds:
+            if twitchChannelId in self.liveTwitchChannelIds:
+                liveUserDetails.append(TwitchLiveUserDetails(
+                    isMature = False,
+                    viewerCount = 1,
+                    streamId = f'stream{twitchChannelId}',
+                    userId = twitchChannelId,
+                    userLogin = f'user{twitchChannelId}',
+                    userName = f'user{twitchChannelId}',
+                    streamType = TwitchStreamType.LIVE
+                ))
+
+        return liveUserDetails
+
+
+class TestIsLiveOnTwitchRepository():
+
+    streamSubscriptionTypes: frozenset[TwitchWebsocketSubscriptionType] = frozenset({
+        TwitchWebsocketSubscriptionType.STREAM_OFFLINE,
+        TwitchWebsocketSubscriptionType.STREAM_ONLINE
+    })
+
+    def __createRepository(self, twitchApiService: LiveTwitchApiService) -> IsLiveOnTwitchRepository:
+        return IsLiveOnTwitchRepository(
+            administratorProvider = StubAdministratorProvider(),
+            timber = TimberStub(),
+            twitchApiService = twitchApiService,
+            twitchTokensRepository = StubTwitchTokensRepository()
+        )
+
+    @pytest.mark.asyncio
+    async def test_areLive_withWebsocketCoverage_fetchesOnceThenUsesPushedStatus(self):
+        twitchApiService = LiveTwitchApiService({ '1' })
+        repository = self.__createRepository(twitchApiService)
+        await repository.onWebsocketSubscriptionsChanged('1', self.streamSubscriptionTypes)
+        await repository.onWebsocketSubscriptionsChanged('2', self.streamSubscriptionTypes)
+
+        result = await repository.areLive({ '1', '2' })
+        assert result == { '1': True, '2': False }
+        assert twitchApiService.fetchCount == 1
+
+        await repository.setLiveStatus('1', False)
+        await repository.setLiveStatus('2', True)
+
+        result = await repository.areLive({ '1', '2' })
+        assert result == { '1': False, '2': True }
+        assert twitchApiService.fetchCount == 1
+
+    @pytest.mark.asyncio
+    async def test_areLive_withLostWebsocketCoverage_fetchesAgain(self):
+        twitchApiService = LiveTwitchApiService({ '1' })
+        repository = self.__createRepository(twitchApiService)
+        await repository.onWebsocketSubscriptionsChanged('1', self.streamSubscriptionTypes)
+
+        assert await repository.isLive('1')
+        assert twitchApiService.fetchCount == 1
+
+        await repository.onWebsocketSubscriptionsChanged('1', frozenset())
+        twitchApiService.liveTwitchChannelIds.clear()
+
+        assert not await repository.isLive('1')
+        assert twitchApiService.fetchCount == 2
+
+    @pytest.mark.asyncio
+    async def test_areLive_withoutWebsocketCoverage_usesCache(self):
+        twitchApiService = LiveTwitchApiService({ '1' })
+        repository = self.__createRepository(twitchApiService)
+        await repository.onWebsocketSubscriptionsChanged('1', frozenset({ TwitchWebsocketSubscriptionType.STREAM_ONLINE }))
+
+        assert await repository.isLive('1')
+        assert await repository.isLive('1')
+        assert twitchApiService.fetchCount == 1
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchFollower import TwitchFollower
+from CynanBot.twitch.followingStatus.twitchFollowingStatusRepository import \
+    TwitchFollowingStatusRepository
+from CynanBot.twitch.tests.fakeTwitchApiService import FakeTwitchApiService
+from CynanBot.twitch.twitchAnonymousUserIdProvider import \
+    TwitchAnonymousUserIdProvider
+from CynanBot.users.userIdsRepository import UserIdsRepository
+
+
+class FollowerTwitchApiService(FakeTwitchApiService):
+
+    def __init__(self, followerUserIds: set[str]):
+        super().__init__(expiresIn = timedelta(hours = 4))
+        self.followerUserIds: set[str] = followerUserIds
+        self.fetchCount: int = 0
+
+    async def fetchFollower(
+        self,
+        broadcasterId: str,
+        twitchAccessToken: str,
+        userId: str
+    ) -> TwitchFollower | None:
+        self.fetchCount = self.fetchCount + 1
+        await asyncio.sleep(0.01)
+
+        if userId not in self.followerUserIds:
+            return None
+
+        return TwitchFollower(
+            followedAt = datetime.now(TimeZoneRepository().getDefault()) - timedelta(days = 30),
+            userId = userId,
+            userLogin = f'user{userId}',
+            userName = f'user{userId}'
+        )
+
+
+class TestTwitchFollowingStatusRepository():
+
+    async def __createRepository(
+        self,
+        backingDatabase: BackingDatabase,
+        twitchApiService: FollowerTwitchApiService,
+        notFollowingTimeToLive: timedelta = timedelta(minutes = 15)
+    ) -> TwitchFollowingStatusRepository:
+        timber = TimberStub()
+
+        userIdsRepository = UserIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = timber,
+            timeZoneRepository = TimeZoneRepository(),
+            twitchAnonymousUserIdProvider = TwitchAnonymousUserIdProvider(),
+            twitchApiService = twitchApiService
+        )
+
+        for userId in [ '1', '2', '3' ]:
+            await userIdsRepository.setUser(userId, f'user{userId}')
+
+        return TwitchFollowingStatusRepository(
+            backingDatabase = backingDatabase,
+            timber = timber,
+            twitchApiService = twitchApiService,
+            userIdsRepository = userIdsRepository,
+            notFollowingTimeToLive = notFollowingTimeToLive
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetchFollowingStatus_afterClearCaches_usesDatabase(self, tmp_path: Path):
+        twitchApiService = FollowerTwitchApiService({ '2' })
+
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = await self.__createRepository(backingDatabase, twitchApiService)
+
+        results = await asyncio.gather(*[repository.fetchFollowingStatus('access', '1', '2') for _ in range(10)])
+        assert all(result is not None and result.twitchChannel == 'user1' for result in results)
+        assert twitchApiService.fetchCount == 1
+
+        await repository.clearCaches()
+        followingStatus = await repository.fetchFollowingStatus('access', '1', '2')
+        assert followingStatus is not None
+        assert followingStatus.userName == 'user2'
+        assert twitchApiService.fetchCount == 1
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchFollowingStatus_withNonFollower_isCachedUntilFollowed(self, tmp_path: Path):
+        twitchApiService = FollowerTwitchApiService(set())
+
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = await self.__createRepository(backingDatabase, twitchApiService)
+
+        assert await repository.fetchFollowingStatus('access', '1', '3') is None
+        assert await repository.fetchFollowingStatus('access', '1', '3') is None
+        assert twitchApiService.fetchCount == 1
+
+        followedAt = datetime.now(TimeZoneRepository().getDefault())
+        await repository.persistFollowingStatus(followedAt, '1', '3')
+
+        followingStatus = await repository.fetchFollowingStatus('access', '1', '3')
+        assert followingStatus is not None
+        assert followingStatus.followedAt == followedAt
+        assert twitchApiService.fetchCount == 1
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchFollowingStatus_withExpiredNonFollower_isFetchedAgain(self, tmp_path: Path):
+        twitchApiService = FollowerTwitchApiService(set())
+
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = await self.__createRepository(backingDatabase, twitchApiService, timedelta(milliseconds = 50))
+
+        assert await repository.fetchFollowingStatus('access', '1', '3') is None
+        assert twitchApiService.fetchCount == 1
+
+        await asyncio.sleep(0.1)
+        twitchApiService.followerUserIds.add('3')
+
+        followingStatus = await repository.fetchFollowingStatus('access', '1', '3')
+        assert followingStatus is not None
+        assert followingStatus.userId == '3'
+        assert twitchApiService.fetchCount == 2
+
+        await backingDatabase.close()
@@ -0,0 +1,224 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.network.exceptions import GenericNetworkException
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchBannedUser import TwitchBannedUser
+from CynanBot.twitch.api.twitchBannedUserRequest import TwitchBannedUserRequest
+from CynanBot.twitch.api.twitchBannedUsersResponse import \
+    TwitchBannedUsersResponse
+from CynanBot.twitch.api.twitchModUser import TwitchModUser
+from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
+    TwitchWebsocketSubscriptionType
+from CynanBot.twitch.tests.fakeTwitchApiService import FakeTwitchApiService
+from CynanBot.twitch.timeout.twitchModerationRosterRepository import \
+    TwitchModerationRosterRepository
+
+
+class RosterTwitchApiService(FakeTwitchApiService):
+
+    def __init__(self):
+        super().__init__(expiresIn = timedelta(hours = 4))
+        self.isRosterFailing: bool = False
+        self.rosterFetchStarted: asyncio.Event = asyncio.Event()
+        self.bannedUsersFetchCount: int = 0
+        self.moderatorFetchCount: int = 0
+        self.moderatorsFetchCount: int = 0
+
+    async def fetchBannedUsers(
+        self,
+        twitchAccessToken: str,
+        bannedUserRequest: TwitchBannedUserRequest
+    ) -> TwitchBannedUsersResponse:
+        self.bannedUsersFetchCount = self.bannedUsersFetchCount + 1
+
+        if bannedUserRequest.requestedUserId is None:
+            self.rosterFetchStarted.set()
+
+            if self.isRosterFailing:
+                raise GenericNetworkException('roster is failing')
+
+        await asyncio.sleep(0.01)
+        now = datetime.now(TimeZoneRepository().getDefault())
+
+        return TwitchBannedUsersResponse(
+            users = [
+                TwitchBannedUser(
+                    createdAt = now,
+                    expiresAt = None,
+                    moderatorId = '1',
+                    moderatorLogin = 'alice',
+                    moderatorName = 'alice',
+                    reason = None,
+                    userId = '2',
+                    userLogin = 'bob',
+                    userName = 'bob'
+                ),
+                TwitchBannedUser(
+                    createdAt = now,
+                    expiresAt = now - timedelta(seconds = 1),
+                    moderatorId = '1',
+                    moderatorLogin = 'alice',
+                    moderatorName = 'alice',
+                    reason = None,
+                    userId = '3',
+                    userLogin = 'carol',
+                    userName = 'carol'
+                )
+            ],
+            broadcasterId = bannedUserRequest.broadcasterId,
+            requestedUserId = bannedUserRequest.requestedUserId
+        )
+
+    async def fetchModerator(
+        self,
+        broadcasterId: str,
+        twitchAccessToken: str,
+        userId: str
+    ) -> TwitchModUser | None:
+        self.moderatorFetchCount = self.moderatorFetchCount + 1
+
+        for moderator in await self.fetchModerators(broadcasterId, twitchAccessToken):
+            if moderator.userId == userId:
+                return moderator
+
+        return None
+
+    async def fetchModerators(
+        self,
+        broadcasterId: str,
+        twitchAccessToken: str
+    ) -> list[TwitchModUser]:
+        self.moderatorsFetchCount = self.moderatorsFetchCount + 1
+        await asyncio.sleep(0.01)
+
+        return [
+            TwitchModUser(
+                userId = '4',
+                userLogin = 'dave',
+                userName = 'dave'
+            )
+        ]
+
+
+class TestTwitchModerationRosterRepository():
+
+    async def __createRepository(
+        self,
+        twitchApiService: RosterTwitchApiService,
+        subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType] = frozenset({
+            TwitchWebsocketSubscriptionType.CHANNEL_BAN,
+            TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD,
+            TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE,
+            TwitchWebsocketSubscriptionType.CHANNEL_UNBAN
+        })
+    ) -> TwitchModerationRosterRepository:
+        repository = TwitchModerationRosterRepository(
+            timber = TimberStub(),
+            timeZoneRepository = TimeZoneRepository(),
+            twitchApiService = twitchApiService
+        )
+
+        await repository.onWebsocketSubscriptionsChanged('1', subscriptionTypes)
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_isBannedOrTimedOut_concurrently_fetchesRosterOnce(self):
+        twitchApiService = RosterTwitchApiService()
+        repository = await self.__createRepository(twitchApiService)
+
+        results = await asyncio.gather(*[repository.isBannedOrTimedOut('access', '1', '2') for _ in range(10)])
+        assert all(results)
+        assert await repository.isModerator('access', '1', '4')
+        assert twitchApiService.bannedUsersFetchCount == 1
+        assert twitchApiService.moderatorsFetchCount == 1
+
+    @pytest.mark.asyncio
+    async def test_isBannedOrTimedOut_withExpiredTimeout(self):
+        twitchApiService = RosterTwitchApiService()
+        repository = await self.__createRepository(twitchApiService)
+        assert not await repository.isBannedOrTimedOut('access', '1', '3')
+
+    @pytest.mark.asyncio
+    async def test_isBannedOrTimedOut_withFailingRoster_backsOff(self):
+        twitchApiService = RosterTwitchApiService()
+        twitchApiService.isRosterFailing = True
+        repository = await self.__createRepository(twitchApiService)
+
+        assert await repository.isBannedOrTimedOut('access', '1', '2')
+        assert not await repository.isBannedOrTimedOut('access', '1', '3')
+        assert await repository.isModerator('access', '1', '4')
+
+        # one failed roster fetch, then one per user check for each of the three lookups
+        assert twitchApiService.bannedUsersFetchCount == 3
+        assert twitchApiService.moderatorFetchCount == 1
+
+    @pytest.mark.asyncio
+    async def test_isBannedOrTimedOut_withEventsDuringRosterFetch(self):
+        twitchApiService = RosterTwitchApiService()
+        repository = await self.__createRepository(twitchApiService)
+
+        task = asyncio.create_task(repository.isBannedOrTimedOut('access', '1', '2'))
+        await twitchApiService.rosterFetchStarted.wait()
+
+        await repository.onUserUnbanned('1', '2')
+        await repository.onUserBanned('1', '5', None)
+        await repository.onModeratorAdded('1', '6')
+
+        assert not await task
+        assert await repository.isBannedOrTimedOut('access', '1', '5')
+        assert await repository.isModerator('access', '1', '6')
+        assert twitchApiService.bannedUsersFetchCount == 1
+
+    @pytest.mark.asyncio
+    async def test_onModeratorAdded_andOnModeratorRemoved(self):
+        twitchApiService = RosterTwitchApiService()
+        repository = await self.__createRepository(twitchApiService)
+        assert not await repository.isModerator('access', '1', '5')
+
+        await repository.onModeratorAdded('1', '5')
+        assert await repository.isModerator('access', '1', '5')
+
+        await repository.onModeratorRemoved('1', '5')
+        assert not await repository.isModerator('access', '1', '5')
+        assert twitchApiService.moderatorsFetchCount == 1
+
+    @pytest.mark.asyncio
+    async def test_onUserBanned_andOnUserUnbanned(self):
+        twitchApiService = RosterTwitchApiService()
+        repository = await self.__createRepository(twitchApiService)
+        assert await repository.isModerator('access', '1', '4')
+
+        await repository.onUserBanned('1', '4', datetime.now(TimeZoneRepository().getDefault()) + timedelta(minutes = 5))
+        assert await repository.isBannedOrTimedOut('access', '1', '4')
+        assert not await repository.isModerator('access', '1', '4')
+
+        await repository.onUserUnbanned('1', '2')
+        assert not await repository.isBannedOrTimedOut('access', '1', '2')
+        assert twitchApiService.bannedUsersFetchCount == 1
+
+    @pytest.mark.asyncio
+    async def test_withoutEventCoverage_checksEachUser(self):
+        twitchApiService = RosterTwitchApiService()
+        repository = await self.__createRepository(twitchApiService, frozenset({ TwitchWebsocketSubscriptionType.CHANNEL_BAN }))
+
+        assert await repository.isBannedOrTimedOut('access', '1', '2')
+        assert not await repository.isBannedOrTimedOut('access', '1', '3')
+        assert await repository.isModerator('access', '1', '4')
+        assert not await repository.isModerator('access', '1', '5')
+        assert twitchApiService.bannedUsersFetchCount == 2
+        assert twitchApiService.moderatorFetchCount == 2
+
+        await repository.onWebsocketSubscriptionsChanged('1', frozenset(TwitchWebsocketSubscriptionType))
+        assert await repository.isBannedOrTimedOut('access', '1', '2')
+        assert await repository.isModerator('access', '1', '4')
+        assert twitchApiService.bannedUsersFetchCount == 3
+        assert twitchApiService.moderatorFetchCount == 2
+
+        # losing coverage again means that the cached roster can't be trusted anymore
+        await repository.onWebsocketSubscriptionsChanged('1', frozenset())
+        assert await repository.isModerator('access', '1', '4')
+        assert twitchApiService.moderatorFetchCount == 3
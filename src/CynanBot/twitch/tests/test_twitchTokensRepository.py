@@ -0,0 +1,108 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.misc.backgroundTaskHelper import BackgroundTaskHelper
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchApiService import TwitchApiService
+from CynanBot.twitch.tests.fakeTwitchApiService import FakeTwitchApiService
+from CynanBot.twitch.twitchAnonymousUserIdProvider import \
+    TwitchAnonymousUserIdProvider
+from CynanBot.twitch.twitchTokensRepository import TwitchTokensRepository
+from CynanBot.users.userIdsRepository import UserIdsRepository
+
+
+class TestTwitchTokensRepository():
+
+    async def __createRepository(
+        self,
+        backingDatabase: BackingDatabase,
+        twitchApiService: TwitchApiService
+    ) -> TwitchTokensRepository:
+        backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_event_loop())
+        timber = TimberStub()
+        timeZoneRepository = TimeZoneRepository()
+
+        repository = TwitchTokensRepository(
+            backgroundTaskHelper = backgroundTaskHelper,
+            backingDatabase = backingDatabase,
+            timber = timber,
+            timeZoneRepository = timeZoneRepository,
+            twitchApiService = twitchApiService,
+            userIdsRepository = UserIdsRepository(
+                backingDatabase = backingDatabase,
+                timber = timber,
+                timeZoneRepository = timeZoneRepository,
+                twitchAnonymousUserIdProvider = TwitchAnonymousUserIdProvider(),
+                twitchApiService = twitchApiService
+            )
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute(
+            '''
+                INSERT INTO twitchtokens (expirationtime, accesstoken, refreshtoken, twitchchannelid)
+                VALUES ($1, $2, $3, $4)
+            ''',
+            (datetime.now(timeZoneRepository.getDefault()) + timedelta(hours = 4)).isoformat(), 'access0', 'refresh0', '1'
+        )
+
+        await connection.close()
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_getTokensDetailsById_concurrently_refreshesOnce(self, tmp_path: Path):
+        twitchApiService = FakeTwitchApiService(expiresIn = timedelta(minutes = 1))
+
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = await self.__createRepository(
+            backingDatabase = backingDatabase,
+            twitchApiService = twitchApiService
+        )
+
+        results = await asyncio.gather(*[repository.getTokensDetailsById('1') for _ in range(10)])
+        assert all(result is not None and result.accessToken == 'access1' for result in results)
+        assert twitchApiService.validateCount == 1
+        assert twitchApiService.refreshCount == 1
+
+        tokensDetails = await repository.getTokensDetailsById('1')
+        assert tokensDetails is not None
+        assert tokensDetails.accessToken == 'access1'
+        assert twitchApiService.validateCount == 1
+        assert twitchApiService.refreshCount == 1
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_getTokensDetailsById_concurrently_validatesOnce(self, tmp_path: Path):
+        twitchApiService = FakeTwitchApiService(expiresIn = timedelta(hours = 4))
+
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = await self.__createRepository(
+            backingDatabase = backingDatabase,
+            twitchApiService = twitchApiService
+        )
+
+        results = await asyncio.gather(*[repository.getTokensDetailsById('1') for _ in range(10)])
+        assert all(result is not None and result.accessToken == 'access0' for result in results)
+
+        tokensDetails = await repository.getTokensDetailsById('1')
+        assert tokensDetails is not None
+        assert tokensDetails.accessToken == 'access0'
+        assert twitchApiService.validateCount == 1
+        assert twitchApiService.refreshCount == 0
+
+        await backingDatabase.close()
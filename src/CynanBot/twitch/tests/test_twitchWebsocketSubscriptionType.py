@@ -4,6 +4,22 @@ from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
 
 class TestTwitchWebsocketSubscriptionType():
 
+    def test_fromStr_withChannelBanString(self):
+        result = TwitchWebsocketSubscriptionType.fromStr('channel.ban')
+        assert result is TwitchWebsocketSubscriptionType.CHANNEL_BAN
+
+    def test_fromStr_withChannelModeratorAddString(self):
+        result = TwitchWebsocketSubscriptionType.fromStr('channel.moderator.add')
+        assert result is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD
+
+    def test_fromStr_withChannelModeratorRemoveString(self):
+        result = TwitchWebsocketSubscriptionType.fromStr('channel.moderator.remove')
+        assert result is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE
+
+    def test_fromStr_withChannelUnbanString(self):
+        result = TwitchWebsocketSubscriptionType.fromStr('channel.unban')
+        assert result is TwitchWebsocketSubscriptionType.CHANNEL_UNBAN
+
     def test_fromStr_withChannelChannelPointsCustomRewardRedemptionString(self):
         result = TwitchWebsocketSubscriptionType.fromStr('channel.channel_points_custom_reward_redemption.add')
         assert result is TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION
@@ -48,6 +64,14 @@ class TestTwitchWebsocketSubscriptionType():
         result = TwitchWebsocketSubscriptionType.fromStr('channel.raid')
         assert result is TwitchWebsocketSubscriptionType.RAID
 
+    def test_fromStr_withStreamOfflineString(self):
+        result = TwitchWebsocketSubscriptionType.fromStr('stream.offline')
+        assert result is TwitchWebsocketSubscriptionType.STREAM_OFFLINE
+
+    def test_fromStr_withStreamOnlineString(self):
+        result = TwitchWebsocketSubscriptionType.fromStr('stream.online')
+        assert result is TwitchWebsocketSubscriptionType.STREAM_ONLINE
+
     def test_fromStr_withChannelSubscribeString(self):
         result = TwitchWebsocketSubscriptionType.fromStr('channel.subscribe')
         assert result is TwitchWebsocketSubscriptionType.SUBSCRIBE
@@ -124,6 +148,14 @@ class TestTwitchWebsocketSubscriptionType():
         version = TwitchWebsocketSubscriptionType.RAID.getVersion()
         assert version == '1'
 
+    def test_getVersion_withStreamOffline(self):
+        version = TwitchWebsocketSubscriptionType.STREAM_OFFLINE.getVersion()
+        assert version == '1'
+
+    def test_getVersion_withStreamOnline(self):
+        version = TwitchWebsocketSubscriptionType.STREAM_ONLINE.getVersion()
+        assert version == '1'
+
     def test_getVersion_withSubscribe(self):
         version = TwitchWebsocketSubscriptionType.SUBSCRIBE.getVersion()
         assert version == '1'
@@ -180,6 +212,14 @@ class TestTwitchWebsocketSubscriptionType():
         string = TwitchWebsocketSubscriptionType.RAID.toStr()
         assert string == 'channel.raid'
 
+    def test_toStr_withStreamOffline(self):
+        string = TwitchWebsocketSubscriptionType.STREAM_OFFLINE.toStr()
+        assert string == 'stream.offline'
+
+    def test_toStr_withStreamOnline(self):
+        string = TwitchWebsocketSubscriptionType.STREAM_ONLINE.toStr()
+        assert string == 'stream.online'
+
     def  test_toStr_withSubscribe(self):
         string = TwitchWebsocketSubscriptionType.SUBSCRIBE.toStr()
         assert string == 'channel.subscribe'
@@ -0,0 +1,313 @@
+import traceback
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+import CynanBot.misc.utils as utils
+from CynanBot.location.timeZoneRepositoryInterface import \
+    TimeZoneRepositoryInterface
+from CynanBot.misc.singleFlight import SingleFlight
+from CynanBot.timber.timberInterface import TimberInterface
+from CynanBot.twitch.api.twitchApiServiceInterface import \
+    TwitchApiServiceInterface
+from CynanBot.twitch.api.twitchBannedUserRequest import TwitchBannedUserRequest
+from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
+    TwitchWebsocketSubscriptionType
+from CynanBot.twitch.timeout.twitchModerationRosterRepositoryInterface import \
+    TwitchModerationRosterRepositoryInterface
+
+
+class TwitchModerationRosterRepository(TwitchModerationRosterRepositoryInterface):
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        timeZoneRepository: TimeZoneRepositoryInterface,
+        twitchApiService: TwitchApiServiceInterface,
+        rosterFailureBackoff: timedelta = timedelta(minutes = 5),
+        rosterTimeToLive: timedelta = timedelta(hours = 1)
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
+            raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+        elif not isinstance(twitchApiService, TwitchApiServiceInterface):
+            raise TypeError(f'twitchApiService argument is malformed: \"{twitchApiService}\"')
+        elif not isinstance(rosterFailureBackoff, timedelta):
+            raise TypeError(f'rosterFailureBackoff argument is malformed: \"{rosterFailureBackoff}\"')
+        elif not isinstance(rosterTimeToLive, timedelta):
+            raise TypeError(f'rosterTimeToLive argument is malformed: \"{rosterTimeToLive}\"')
+
+        self.__timber: TimberInterface = timber
+        self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
+        self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
+        self.__rosterFailureBackoff: timedelta = rosterFailureBackoff
+        self.__rosterTimeToLive: timedelta = rosterTimeToLive
+
+        self.__rosterSingleFlight: SingleFlight[bool] = SingleFlight()
+        self.__bannedUsers: dict[str, dict[str, datetime | None]] = dict()
+        self.__moderators: dict[str, set[str]] = dict()
+        self.__pendingModerationEvents: dict[str, list[Callable[[], Awaitable[None]]]] = dict()
+        self.__rosterExpirationTimes: dict[str, datetime] = dict()
+        self.__rosterFailureTimes: dict[str, datetime] = dict()
+        self.__banEventTwitchChannelIds: set[str] = set()
+        self.__moderatorEventTwitchChannelIds: set[str] = set()
+
+    def __addPendingModerationEvent(self, twitchChannelId: str, event: Callable[[], Awaitable[None]]):
+        pendingModerationEvents = self.__pendingModerationEvents.get(twitchChannelId, None)
+
+        if pendingModerationEvents is not None:
+            pendingModerationEvents.append(event)
+
+    async def clearCaches(self):
+        self.__bannedUsers.clear()
+        self.__moderators.clear()
+        self.__rosterExpirationTimes.clear()
+        self.__rosterFailureTimes.clear()
+        self.__timber.log('TwitchModerationRosterRepository', 'Caches cleared')
+
+    async def __ensureRoster(self, twitchAccessToken: str, twitchChannelId: str) -> bool:
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+        rosterExpirationTime = self.__rosterExpirationTimes.get(twitchChannelId, None)
+
+        if rosterExpirationTime is not None and now < rosterExpirationTime:
+            return True
+
+        rosterFailureTime = self.__rosterFailureTimes.get(twitchChannelId, None)
+
+        if rosterFailureTime is not None and now < rosterFailureTime + self.__rosterFailureBackoff:
+            # re-fetching the entire roster for every check would only pile more requests onto a failing Twitch API
+            return False
+
+        return await self.__rosterSingleFlight.run(
+            key = twitchChannelId,
+            function = lambda: self.__fetchRoster(twitchAccessToken, twitchChannelId)
+        )
+
+    async def __fetchIsBannedOrTimedOut(
+        self,
+        twitchAccessToken: str,
+        twitchChannelId: str,
+        userId: str
+    ) -> bool:
+        try:
+            bannedUsersResponse = await self.__twitchApiService.fetchBannedUsers(
+                twitchAccessToken = twitchAccessToken,
+                bannedUserRequest = TwitchBannedUserRequest(
+                    broadcasterId = twitchChannelId,
+                    requestedUserId = userId
+                )
+            )
+        except Exception as e:
+            self.__timber.log('TwitchModerationRosterRepository', f'Failed to fetch banned user info ({twitchChannelId=}) ({userId=}): {e}', e, traceback.format_exc())
+            return False
+
+        if bannedUsersResponse.users is None:
+            return False
+
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+
+        for bannedUser in bannedUsersResponse.users:
+            if bannedUser.userId == userId and (bannedUser.expiresAt is None or now < bannedUser.expiresAt):
+                return True
+
+        return False
+
+    async def __fetchIsModerator(
+        self,
+        twitchAccessToken: str,
+        twitchChannelId: str,
+        userId: str
+    ) -> bool:
+        try:
+            moderator = await self.__twitchApiService.fetchModerator(
+                broadcasterId = twitchChannelId,
+                twitchAccessToken = twitchAccessToken,
+                userId = userId
+            )
+        except Exception as e:
+            self.__timber.log('TwitchModerationRosterRepository', f'Failed to fetch moderator info ({twitchChannelId=}) ({userId=}): {e}', e, traceback.format_exc())
+            return False
+
+        return moderator is not None
+
+    async def __fetchRoster(self, twitchAccessToken: str, twitchChannelId: str) -> bool:
+        # the fetched roster may not include moderation events that arrive while it's being fetched
+        self.__pendingModerationEvents[twitchChannelId] = list()
+
+        try:
+            bannedUsersResponse = await self.__twitchApiService.fetchBannedUsers(
+                twitchAccessToken = twitchAccessToken,
+                bannedUserRequest = TwitchBannedUserRequest(
+                    broadcasterId = twitchChannelId,
+                    requestedUserId = None
+                )
+            )
+
+            moderators = await self.__twitchApiService.fetchModerators(
+                broadcasterId = twitchChannelId,
+                twitchAccessToken = twitchAccessToken
+            )
+        except Exception as e:
+            self.__pendingModerationEvents.pop(twitchChannelId, None)
+            self.__rosterFailureTimes[twitchChannelId] = datetime.now(self.__timeZoneRepository.getDefault())
+            self.__timber.log('TwitchModerationRosterRepository', f'Failed to fetch moderation roster ({twitchChannelId=}): {e}', e, traceback.format_exc())
+            return False
+
+        bannedUsers: dict[str, datetime | None] = dict()
+
+        if bannedUsersResponse.users is not None:
+            for bannedUser in bannedUsersResponse.users:
+                bannedUsers[bannedUser.userId] = bannedUser.expiresAt
+
+        self.__bannedUsers[twitchChannelId] = bannedUsers
+        self.__moderators[twitchChannelId] = { moderator.userId for moderator in moderators }
+        self.__rosterExpirationTimes[twitchChannelId] = datetime.now(self.__timeZoneRepository.getDefault()) + self.__rosterTimeToLive
+        self.__rosterFailureTimes.pop(twitchChannelId, None)
+
+        pendingModerationEvents = self.__pendingModerationEvents.pop(twitchChannelId, list())
+
+        for pendingModerationEvent in pendingModerationEvents:
+            await pendingModerationEvent()
+
+        self.__timber.log('TwitchModerationRosterRepository', f'Fetched moderation roster ({twitchChannelId=}) ({len(bannedUsers)} banned or timed out user(s)) ({len(moderators)} moderator(s)) ({len(pendingModerationEvents)} pending moderation event(s))')
+        return True
+
+    async def isBannedOrTimedOut(
+        self,
+        twitchAccessToken: str,
+        twitchChannelId: str,
+        userId: str
+    ) -> bool:
+        if not utils.isValidStr(twitchAccessToken):
+            raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+
+        if twitchChannelId not in self.__banEventTwitchChannelIds:
+            # without ban events, a cached roster would go stale, so ask Twitch about this one user instead
+            return await self.__fetchIsBannedOrTimedOut(twitchAccessToken, twitchChannelId, userId)
+        elif not await self.__ensureRoster(twitchAccessToken, twitchChannelId):
+            return await self.__fetchIsBannedOrTimedOut(twitchAccessToken, twitchChannelId, userId)
+
+        bannedUsers = self.__bannedUsers.get(twitchChannelId, None)
+
+        if bannedUsers is None or userId not in bannedUsers:
+            return False
+
+        expiresAt = bannedUsers[userId]
+
+        if expiresAt is None or datetime.now(self.__timeZoneRepository.getDefault()) < expiresAt:
+            return True
+
+        # this user's timeout has since run out on its own
+        del bannedUsers[userId]
+        return False
+
+    async def isModerator(
+        self,
+        twitchAccessToken: str,
+        twitchChannelId: str,
+        userId: str
+    ) -> bool:
+        if not utils.isValidStr(twitchAccessToken):
+            raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+
+        if twitchChannelId not in self.__moderatorEventTwitchChannelIds:
+            return await self.__fetchIsModerator(twitchAccessToken, twitchChannelId, userId)
+        elif not await self.__ensureRoster(twitchAccessToken, twitchChannelId):
+            return await self.__fetchIsModerator(twitchAccessToken, twitchChannelId, userId)
+
+        moderators = self.__moderators.get(twitchChannelId, None)
+        return moderators is not None and userId in moderators
+
+    async def onModeratorAdded(self, twitchChannelId: str, userId: str):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+
+        self.__addPendingModerationEvent(twitchChannelId, lambda: self.onModeratorAdded(twitchChannelId, userId))
+        moderators = self.__moderators.get(twitchChannelId, None)
+
+        if moderators is not None:
+            moderators.add(userId)
+
+    async def onModeratorRemoved(self, twitchChannelId: str, userId: str):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+
+        self.__addPendingModerationEvent(twitchChannelId, lambda: self.onModeratorRemoved(twitchChannelId, userId))
+        moderators = self.__moderators.get(twitchChannelId, None)
+
+        if moderators is not None:
+            moderators.discard(userId)
+
+    async def onWebsocketSubscriptionsChanged(
+        self,
+        twitchChannelId: str,
+        subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType]
+    ):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not isinstance(subscriptionTypes, frozenset):
+            raise TypeError(f'subscriptionTypes argument is malformed: \"{subscriptionTypes}\"')
+
+        hasBanEvents = TwitchWebsocketSubscriptionType.CHANNEL_BAN in subscriptionTypes and TwitchWebsocketSubscriptionType.CHANNEL_UNBAN in subscriptionTypes
+        hasModeratorEvents = TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD in subscriptionTypes and TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE in subscriptionTypes
+
+        if hasBanEvents:
+            self.__banEventTwitchChannelIds.add(twitchChannelId)
+        else:
+            self.__banEventTwitchChannelIds.discard(twitchChannelId)
+
+        if hasModeratorEvents:
+            self.__moderatorEventTwitchChannelIds.add(twitchChannelId)
+        else:
+            self.__moderatorEventTwitchChannelIds.discard(twitchChannelId)
+
+        if not hasBanEvents or not hasModeratorEvents:
+            # events may have been missed, so this channel's roster has to be fetched again once it's covered again
+            self.__bannedUsers.pop(twitchChannelId, None)
+            self.__moderators.pop(twitchChannelId, None)
+            self.__rosterExpirationTimes.pop(twitchChannelId, None)
+
+        self.__timber.log('TwitchModerationRosterRepository', f'Moderation event coverage changed ({twitchChannelId=}) ({hasBanEvents=}) ({hasModeratorEvents=})')
+
+    async def onUserBanned(self, twitchChannelId: str, userId: str, expiresAt: datetime | None):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+        elif expiresAt is not None and not isinstance(expiresAt, datetime):
+            raise TypeError(f'expiresAt argument is malformed: \"{expiresAt}\"')
+
+        self.__addPendingModerationEvent(twitchChannelId, lambda: self.onUserBanned(twitchChannelId, userId, expiresAt))
+
+        # a channel whose roster hasn't been fetched yet will pick this up once it is
+        bannedUsers = self.__bannedUsers.get(twitchChannelId, None)
+
+        if bannedUsers is not None:
+            bannedUsers[userId] = expiresAt
+
+        # Twitch removes moderator status from anyone that gets banned or timed out
+        await self.onModeratorRemoved(twitchChannelId, userId)
+
+    async def onUserUnbanned(self, twitchChannelId: str, userId: str):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+
+        self.__addPendingModerationEvent(twitchChannelId, lambda: self.onUserUnbanned(twitchChannelId, userId))
+        bannedUsers = self.__bannedUsers.get(twitchChannelId, None)
+
+        if bannedUsers is not None:
+            bannedUsers.pop(userId, None)
@@ -0,0 +1,43 @@
+from abc import abstractmethod
+from datetime import datetime
+
+from CynanBot.misc.clearable import Clearable
+from CynanBot.twitch.websocket.twitchWebsocketSubscriptionsListener import \
+    TwitchWebsocketSubscriptionsListener
+
+
+class TwitchModerationRosterRepositoryInterface(Clearable, TwitchWebsocketSubscriptionsListener):
+
+    @abstractmethod
+    async def isBannedOrTimedOut(
+        self,
+        twitchAccessToken: str,
+        twitchChannelId: str,
+        userId: str
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def isModerator(
+        self,
+        twitchAccessToken: str,
+        twitchChannelId: str,
+        userId: str
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def onModeratorAdded(self, twitchChannelId: str, userId: str):
+        pass
+
+    @abstractmethod
+    async def onModeratorRemoved(self, twitchChannelId: str, userId: str):
+        pass
+
+    @abstractmethod
+    async def onUserBanned(self, twitchChannelId: str, userId: str, expiresAt: datetime | None):
+        pass
+
+    @abstractmethod
+    async def onUserUnbanned(self, twitchChannelId: str, userId: str):
+        pass
@@ -7,13 +7,11 @@ from CynanBot.location.timeZoneRepositoryInterface import \
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.twitch.api.twitchApiServiceInterface import \
     TwitchApiServiceInterface
-from CynanBot.twitch.api.twitchBannedUserRequest import TwitchBannedUserRequest
-from CynanBot.twitch.api.twitchBannedUsersResponse import \
-    TwitchBannedUsersResponse
 from CynanBot.twitch.api.twitchBanRequest import TwitchBanRequest
-from CynanBot.twitch.api.twitchModUser import TwitchModUser
 from CynanBot.twitch.timeout.timeoutImmuneUserIdsRepositoryInterface import \
     TimeoutImmuneUserIdsRepositoryInterface
+from CynanBot.twitch.timeout.twitchModerationRosterRepositoryInterface import \
+    TwitchModerationRosterRepositoryInterface
 from CynanBot.twitch.timeout.twitchTimeoutHelperInterface import \
     TwitchTimeoutHelperInterface
 from CynanBot.twitch.timeout.twitchTimeoutRemodData import \
@@ -39,6 +37,7 @@ class TwitchTimeoutHelper(TwitchTimeoutHelperInterface):
         twitchApiService: TwitchApiServiceInterface,
         twitchConstants: TwitchConstantsInterface,
         twitchHandleProvider: TwitchHandleProviderInterface,
+        twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface,
         twitchTimeoutRemodHelper: TwitchTimeoutRemodHelperInterface,
         userIdsRepository: UserIdsRepositoryInterface
     ):
@@ -54,6 +53,8 @@ class TwitchTimeoutHelper(TwitchTimeoutHelperInterface):
             raise TypeError(f'twitchConstants argument is malformed: \"{twitchConstants}\"')
         elif not isinstance(twitchHandleProvider, TwitchHandleProviderInterface):
             raise TypeError(f'twitchHandleProvider argument is malformed: \"{twitchHandleProvider}\"')
+        elif not isinstance(twitchModerationRosterRepository, TwitchModerationRosterRepositoryInterface):
+            raise TypeError(f'twitchModerationRosterRepository argument is malformed: \"{twitchModerationRosterRepository}\"')
         elif not isinstance(twitchTimeoutRemodHelper, TwitchTimeoutRemodHelperInterface):
             raise TypeError(f'twitchTimeoutRemodHelper argument is malformed: \"{twitchTimeoutRemodHelper}\"')
         elif not isinstance(userIdsRepository, UserIdsRepositoryInterface):
@@ -65,82 +66,10 @@ class TwitchTimeoutHelper(TwitchTimeoutHelperInterface):
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
         self.__twitchConstants: TwitchConstantsInterface = twitchConstants
         self.__twitchHandleProvider: TwitchHandleProviderInterface = twitchHandleProvider
+        self.__twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface = twitchModerationRosterRepository
         self.__twitchTimeoutRemodHelper: TwitchTimeoutRemodHelperInterface = twitchTimeoutRemodHelper
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-    async def __isAlreadyCurrentlyBannedOrTimedOut(
-        self,
-        twitchChannelAccessToken: str,
-        twitchChannelId: str,
-        userIdToTimeout: str
-    ) -> bool:
-        if not utils.isValidStr(twitchChannelAccessToken):
-            raise TypeError(f'twitchChannelAccessToken argument is malformed: \"{twitchChannelAccessToken}\"')
-        elif not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userIdToTimeout):
-            raise TypeError(f'userIdToTimeout argument is malformed: \"{userIdToTimeout}\"')
-
-        bannedUsersResponse: TwitchBannedUsersResponse | None = None
-
-        try:
-            bannedUsersResponse = await self.__twitchApiService.fetchBannedUsers(
-                twitchAccessToken = twitchChannelAccessToken,
-                bannedUserRequest = TwitchBannedUserRequest(
-                    broadcasterId = twitchChannelId,
-                    requestedUserId = userIdToTimeout
-                )
-            )
-        except Exception as e:
-            self.__timber.log('TwitchTimeoutHelper', f'Failed to verify if the given user ID can be timed out ({twitchChannelId=}) ({userIdToTimeout=}): {e}', e, traceback.format_exc())
-            return False
-
-        if bannedUsersResponse is None:
-            return False
-
-        bannedUsers = bannedUsersResponse.users
-
-        if bannedUsers is None or len(bannedUsers) == 0:
-            return False
-
-        for bannedUser in bannedUsers:
-            if bannedUser.userId == userIdToTimeout:
-                if bannedUser.expiresAt is None:
-                    self.__timber.log('TwitchTimeoutHelper', f'The given user ID will not be timed out as this user is banned: ({bannedUser=}) ({twitchChannelId=}) ({userIdToTimeout=})')
-                else:
-                    self.__timber.log('TwitchTimeoutHelper', f'The given user ID will not be timed out as this user is already timed out: ({bannedUser=}) ({twitchChannelId=}) ({userIdToTimeout=})')
-
-                return True
-
-        return False
-
-    async def __isMod(
-        self,
-        twitchChannelAccessToken: str,
-        twitchChannelId: str,
-        userIdToTimeout: str
-    ) -> bool:
-        if not utils.isValidStr(twitchChannelAccessToken):
-            raise TypeError(f'twitchChannelAccessToken argument is malformed: \"{twitchChannelAccessToken}\"')
-        elif not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userIdToTimeout):
-            raise TypeError(f'userIdToTimeout argument is malformed: \"{userIdToTimeout}\"')
-
-        moderatorInfo: TwitchModUser | None = None
-
-        try:
-            moderatorInfo = await self.__twitchApiService.fetchModerator(
-                broadcasterId = twitchChannelId,
-                twitchAccessToken = twitchChannelAccessToken,
-                userId = userIdToTimeout
-            )
-        except Exception as e:
-            self.__timber.log('TwitchTimeoutHelper', f'Failed to fetch Twitch moderator info for the given user ID ({twitchChannelId=}) ({userIdToTimeout=}): {e}', e, traceback.format_exc())
-            return False
-
-        return moderatorInfo is not None
-
     async def timeout(
         self,
         durationSeconds: int,
@@ -182,10 +111,10 @@ class TwitchTimeoutHelper(TwitchTimeoutHelperInterface):
         elif await self.__timeoutImmuneUserIdsRepository.isImmune(userIdToTimeout):
             self.__timber.log('TwitchTimeoutHelper', f'Abandoning timeout attempt, as we were going to timeout an immune user ({twitchChannelId=}) ({userIdToTimeout=}) ({userNameToTimeout=}) ({user=})')
             return TwitchTimeoutResult.IMMUNE_USER
-        elif await self.__isAlreadyCurrentlyBannedOrTimedOut(
-            twitchChannelAccessToken = twitchChannelAccessToken,
+        elif await self.__twitchModerationRosterRepository.isBannedOrTimedOut(
+            twitchAccessToken = twitchChannelAccessToken,
             twitchChannelId = twitchChannelId,
-            userIdToTimeout = userIdToTimeout
+            userId = userIdToTimeout
         ):
             self.__timber.log('TwitchTimeoutHelper', f'Abandoning timeout attempt, as this user is already either banned or timed out ({twitchChannelId=}) ({userIdToTimeout=}) ({userNameToTimeout=}) ({user=})')
             return TwitchTimeoutResult.ALREADY_BANNED_OR_TIMED_OUT
@@ -195,10 +124,10 @@ class TwitchTimeoutHelper(TwitchTimeoutHelperInterface):
             twitchAccessToken = twitchAccessToken
         )
 
-        mustRemod = await self.__isMod(
-            twitchChannelAccessToken = twitchChannelAccessToken,
+        mustRemod = await self.__twitchModerationRosterRepository.isModerator(
+            twitchAccessToken = twitchChannelAccessToken,
             twitchChannelId = twitchChannelId,
-            userIdToTimeout = userIdToTimeout
+            userId = userIdToTimeout
         )
 
         if not await self.__timeout(
@@ -214,11 +143,17 @@ class TwitchTimeoutHelper(TwitchTimeoutHelperInterface):
             self.__timber.log('TwitchTimeoutHelper', f'Abandoning timeout attempt, as the Twitch API call failed ({twitchChannelId=}) ({userIdToTimeout=}) ({userNameToTimeout=}) ({user=})')
             return TwitchTimeoutResult.API_CALL_FAILED
 
-        if mustRemod:
-            remodDateTime = datetime.now(self.__timeZoneRepository.getDefault()) + timedelta(seconds = durationSeconds)
+        timeoutExpirationTime = datetime.now(self.__timeZoneRepository.getDefault()) + timedelta(seconds = durationSeconds)
+
+        await self.__twitchModerationRosterRepository.onUserBanned(
+            twitchChannelId = twitchChannelId,
+            userId = userIdToTimeout,
+            expiresAt = timeoutExpirationTime
+        )
 
+        if mustRemod:
             await self.__twitchTimeoutRemodHelper.submitRemodData(TwitchTimeoutRemodData(
-                remodDateTime = remodDateTime,
+                remodDateTime = timeoutExpirationTime,
                 broadcasterUserId = twitchChannelId,
                 broadcasterUserName = user.getHandle(),
                 userId = userIdToTimeout
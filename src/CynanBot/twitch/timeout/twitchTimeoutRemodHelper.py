@@ -6,6 +6,8 @@ from CynanBot.misc.backgroundTaskHelperInterface import \
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.twitch.api.twitchApiServiceInterface import \
     TwitchApiServiceInterface
+from CynanBot.twitch.timeout.twitchModerationRosterRepositoryInterface import \
+    TwitchModerationRosterRepositoryInterface
 from CynanBot.twitch.timeout.twitchTimeoutRemodData import \
     TwitchTimeoutRemodData
 from CynanBot.twitch.timeout.twitchTimeoutRemodHelperInterface import \
@@ -25,6 +27,7 @@ class TwitchTimeoutRemodHelper(TwitchTimeoutRemodHelperInterface):
         backgroundTaskHelper: BackgroundTaskHelperInterface,
         timber: TimberInterface,
         twitchApiService: TwitchApiServiceInterface,
+        twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface,
         twitchTimeoutRemodRepository: TwitchTimeoutRemodRepositoryInterface,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
@@ -36,6 +39,8 @@ class TwitchTimeoutRemodHelper(TwitchTimeoutRemodHelperInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(twitchApiService, TwitchApiServiceInterface):
             raise TypeError(f'twitchApiService argument is malformed: \"{twitchApiService}\"')
+        elif not isinstance(twitchModerationRosterRepository, TwitchModerationRosterRepositoryInterface):
+            raise TypeError(f'twitchModerationRosterRepository argument is malformed: \"{twitchModerationRosterRepository}\"')
         elif not isinstance(twitchTimeoutRemodRepository, TwitchTimeoutRemodRepositoryInterface):
             raise TypeError(f'twitchTimeoutRemodRepository argument is malformed: \"{twitchTimeoutRemodRepository}\"')
         elif not isinstance(twitchTokensRepository, TwitchTokensRepositoryInterface):
@@ -50,6 +55,7 @@ class TwitchTimeoutRemodHelper(TwitchTimeoutRemodHelperInterface):
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__timber: TimberInterface = timber
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
+        self.__twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface = twitchModerationRosterRepository
         self.__twitchTimeoutRemodRepository: TwitchTimeoutRemodRepositoryInterface = twitchTimeoutRemodRepository
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
@@ -113,6 +119,7 @@ class TwitchTimeoutRemodHelper(TwitchTimeoutRemodHelperInterface):
                 userId = remodAction.userId
             ):
                 self.__timber.log('TwitchTimeoutRemodHelper', f'Successfully re-modded user ({remodAction=}) ({userName=})')
+                await self.__twitchModerationRosterRepository.onModeratorAdded(remodAction.broadcasterUserId, remodAction.userId)
                 await self.__deleteFromRepository(remodAction)
             else:
                 self.__timber.log('TwitchTimeoutRemodHelper', f'Failed to re-mod user ({remodAction=}) ({userName=})')
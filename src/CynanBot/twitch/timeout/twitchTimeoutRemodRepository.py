@@ -4,8 +4,7 @@ import CynanBot.misc.utils as utils
 from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.twitch.timeout.twitchTimeoutRemodData import \
     TwitchTimeoutRemodData
@@ -36,13 +35,13 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__remodTimeBuffer: timedelta = remodTimeBuffer
 
-        self.__isDatabaseReady: bool = False
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def add(self, data: TwitchTimeoutRemodData):
         if not isinstance(data, TwitchTimeoutRemodData):
             raise TypeError(f'data argument is malformed: \"{data}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 INSERT INTO twitchtimeoutremodactions (broadcasteruserid, remoddatetime, userid)
@@ -61,7 +60,7 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         await connection.execute(
             '''
                 DELETE FROM twitchtimeoutremodactions
@@ -74,7 +73,7 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
         self.__timber.log('CheerActionRemodRepository', f'Deleted remod action ({broadcasterUserId=}) ({userId=})')
 
     async def getAll(self) -> list[TwitchTimeoutRemodData]:
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         records = await connection.fetchRows(
             '''
                 SELECT twitchtimeoutremodactions.broadcasteruserid, twitchtimeoutremodactions.remoddatetime, twitchtimeoutremodactions.userid, userids.username FROM twitchtimeoutremodactions
@@ -103,19 +102,10 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
 
         return data
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'twitchtimeoutremodactions',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
                         broadcasteruserid text NOT NULL,
@@ -124,9 +114,8 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
                         PRIMARY KEY (broadcasteruserid, userid)
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
                         broadcasteruserid TEXT NOT NULL,
@@ -135,8 +124,5 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
                         PRIMARY KEY (broadcasteruserid, userid)
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
-
-        await connection.close()
+            ]
+        )
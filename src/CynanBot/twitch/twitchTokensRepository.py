@@ -8,10 +8,11 @@ from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.misc.backgroundTaskHelperInterface import \
     BackgroundTaskHelperInterface
+from CynanBot.misc.singleFlight import SingleFlight
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.storage.backingDatabase import BackingDatabase
 from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.storage.jsonReaderInterface import JsonReaderInterface
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.twitch.api.twitchApiServiceInterface import \
@@ -39,9 +40,11 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         twitchApiService: TwitchApiServiceInterface,
         userIdsRepository: UserIdsRepositoryInterface,
         seedFileReader: JsonReaderInterface | None = None,
+        maxConcurrentValidations: int = 4,
         sleepTimeSeconds: float = 3300,
         tokensExpirationBuffer: timedelta = timedelta(minutes = 10),
-        validationExpirationBuffer: timedelta = timedelta(minutes = 10)
+        validationExpirationBuffer: timedelta = timedelta(minutes = 10),
+        validationTimeDelta: timedelta = timedelta(hours = 1)
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -57,6 +60,10 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             raise TypeError(f'userIdsRepository argument is malformed: \"{userIdsRepository}\"')
         elif seedFileReader is not None and not isinstance(seedFileReader, JsonReaderInterface):
             raise TypeError(f'seedFileReader argument is malformed: \"{seedFileReader}\"')
+        elif not utils.isValidInt(maxConcurrentValidations):
+            raise TypeError(f'maxConcurrentValidations argument is malformed: \"{maxConcurrentValidations}\"')
+        elif maxConcurrentValidations < 1 or maxConcurrentValidations > 32:
+            raise ValueError(f'maxConcurrentValidations argument is out of bounds: {maxConcurrentValidations}')
         elif not utils.isValidNum(sleepTimeSeconds):
             raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
         elif sleepTimeSeconds < 300 or sleepTimeSeconds > 3600:
@@ -65,6 +72,10 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             raise TypeError(f'tokensExpirationBuffer argument is malformed: \"{tokensExpirationBuffer}\"')
         elif not isinstance(validationExpirationBuffer, timedelta):
             raise TypeError(f'validationExpirationBuffer argument is malformed: \"{validationExpirationBuffer}\"')
+        elif not isinstance(validationTimeDelta, timedelta):
+            raise TypeError(f'validationTimeDelta argument is malformed: \"{validationTimeDelta}\"')
+        elif validationTimeDelta <= validationExpirationBuffer:
+            raise ValueError(f'validationTimeDelta argument is out of bounds: {validationTimeDelta}')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__backingDatabase: BackingDatabase = backingDatabase
@@ -76,11 +87,16 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__tokensExpirationBuffer: timedelta = tokensExpirationBuffer
         self.__validationExpirationBuffer: timedelta = validationExpirationBuffer
+        self.__validationTimeDelta: timedelta = validationTimeDelta
 
-        self.__isDatabaseReady: bool = False
         self.__isStarted: bool = False
+        self.__validationSemaphore: asyncio.Semaphore = asyncio.Semaphore(maxConcurrentValidations)
         self.__cache: dict[str, TwitchTokensDetails | None] = dict()
-        self.__twitchChannelIdToValidationTime: dict[str, datetime | None] = dict()
+        self.__tokensDetailsSingleFlight: SingleFlight[TwitchTokensDetails | None] = SingleFlight()
+        self.__twitchChannelIdToExpirationTime: dict[str, datetime] = dict()
+        self.__twitchChannelIdToValidationExpirationTime: dict[str, datetime] = dict()
+
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
 
     async def addUser(
         self,
@@ -127,23 +143,20 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         if now + self.__tokensExpirationBuffer > tokensDetails.expirationTime:
             return False
 
-        validationTime = self.__twitchChannelIdToValidationTime.get(twitchChannelId, None)
-        if validationTime is None:
+        validationExpirationTime = self.__twitchChannelIdToValidationExpirationTime.get(twitchChannelId, None)
+        if validationExpirationTime is None:
             return False
 
-        return now + self.__validationExpirationBuffer <= validationTime
+        return now + self.__validationExpirationBuffer <= validationExpirationTime
 
     async def __checkAndValidateTokensAsNecessary(self):
         self.__timber.log('TwitchTokensRepository', f'Checking if any Twitch tokens require validation...')
 
         now = datetime.now(self.__timeZoneRepository.getDefault())
-        twitchChannelIds = set(self.__twitchChannelIdToValidationTime.keys())
         twitchChannelIdsToValidate: set[str] = set()
 
-        for twitchChannelId in twitchChannelIds:
-            validationTime = self.__twitchChannelIdToValidationTime.get(twitchChannelId, None)
-
-            if validationTime is None or now + self.__validationExpirationBuffer > validationTime:
+        for twitchChannelId in list(self.__twitchChannelIdToExpirationTime.keys()):
+            if now >= self.__getNextValidationTime(twitchChannelId):
                 twitchChannelIdsToValidate.add(twitchChannelId)
 
         if len(twitchChannelIdsToValidate) == 0:
@@ -151,17 +164,9 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
 
         self.__timber.log('TwitchTokensRepository', f'Discovered {len(twitchChannelIdsToValidate)} Twitch token(s) that require validation...')
 
-        for twitchChannelId in twitchChannelIds:
-            tokensDetails = await self.getTokensDetailsById(twitchChannelId)
-
-            if tokensDetails is None:
-                self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannelId}\" require validation, but unable to find any existing tokens details')
-                continue
-
-            await self.__validateAndRefreshAccessToken(
-                twitchChannelId = twitchChannelId,
-                tokensDetails = tokensDetails
-            )
+        await asyncio.gather(*[
+            self.__validateTokensInBackground(twitchChannelId) for twitchChannelId in twitchChannelIdsToValidate
+        ])
 
         self.__timber.log('TwitchTokensRepository', f'Finished validation of {len(twitchChannelIdsToValidate)} Twitch token(s)')
 
@@ -276,10 +281,6 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
 
         return tokensDetails.accessToken
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def getTokensDetails(self, twitchChannel: str) -> TwitchTokensDetails | None:
         if not utils.isValidStr(twitchChannel):
             raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
@@ -295,6 +296,20 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
+        cachedTokensDetails = self.__cache.get(twitchChannelId, None)
+
+        if await self.__areTokensDetailsCurrentlyValid(
+            twitchChannelId = twitchChannelId,
+            tokensDetails = cachedTokensDetails
+        ):
+            return cachedTokensDetails
+
+        return await self.__tokensDetailsSingleFlight.run(
+            key = twitchChannelId,
+            function = lambda: self.__getTokensDetailsById(twitchChannelId)
+        )
+
+    async def __getTokensDetailsById(self, twitchChannelId: str) -> TwitchTokensDetails | None:
         tokensDetails: TwitchTokensDetails | None = None
 
         if twitchChannelId in self.__cache:
@@ -306,6 +321,8 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             self.__cache[twitchChannelId] = None
             return None
 
+        self.__twitchChannelIdToExpirationTime[twitchChannelId] = tokensDetails.expirationTime
+
         tokensDetails = await self.__validateAndRefreshAccessToken(
             twitchChannelId = twitchChannelId,
             tokensDetails = tokensDetails
@@ -332,15 +349,15 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         accessToken = await self.getAccessTokenById(twitchChannelId)
         return utils.isValidStr(accessToken)
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    async def __getDatabaseConnection(self) -> DatabaseConnection:
+        # the seed file is consumed lazily, the first time that the database is actually needed
+        await self.__consumeSeedFile()
+        return await self.__backingDatabase.getConnection()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'twitchtokens',
+            psqlStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS twitchtokens (
                         expirationtime text DEFAULT NULL,
@@ -349,9 +366,8 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
                         twitchchannelid text NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+            ],
+            sqliteStatements = [
                 '''
                     CREATE TABLE IF NOT EXISTS twitchtokens (
                         expirationtime TEXT DEFAULT NULL,
@@ -360,12 +376,28 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
                         twitchchannelid TEXT NOT NULL PRIMARY KEY
                     )
                 '''
-            )
-        else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            ]
+        )
 
-        await connection.close()
-        await self.__consumeSeedFile()
+    def __getNextValidationTime(self, twitchChannelId: str) -> datetime:
+        # tokens are refreshed a little ahead of their known expiration time, rather than waiting for a caller to find them expired
+        nextValidationTime = self.__twitchChannelIdToExpirationTime[twitchChannelId] - self.__tokensExpirationBuffer
+        validationExpirationTime = self.__twitchChannelIdToValidationExpirationTime.get(twitchChannelId, None)
+
+        if validationExpirationTime is None:
+            return datetime.now(self.__timeZoneRepository.getDefault())
+
+        return min(nextValidationTime, validationExpirationTime - self.__validationExpirationBuffer)
+
+    def __getSleepTimeSeconds(self) -> float:
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+        sleepTimeSeconds = self.__sleepTimeSeconds
+
+        for twitchChannelId in self.__twitchChannelIdToExpirationTime.keys():
+            secondsUntilValidation = (self.__getNextValidationTime(twitchChannelId) - now).total_seconds()
+            sleepTimeSeconds = min(sleepTimeSeconds, secondsUntilValidation)
+
+        return max(30, sleepTimeSeconds)
 
     async def removeUser(self, twitchChannel: str):
         if not utils.isValidStr(twitchChannel):
@@ -391,6 +423,8 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
 
         await connection.close()
         self.__cache.pop(twitchChannelId, None)
+        self.__twitchChannelIdToExpirationTime.pop(twitchChannelId, None)
+        self.__twitchChannelIdToValidationExpirationTime.pop(twitchChannelId, None)
 
     async def requireAccessToken(self, twitchChannel: str) -> str:
         if not utils.isValidStr(twitchChannel):
@@ -436,6 +470,7 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
 
         await connection.close()
         self.__cache.pop(twitchChannelId, None)
+        self.__twitchChannelIdToExpirationTime[twitchChannelId] = expirationTime
 
     async def __setTokensDetails(
         self,
@@ -459,6 +494,8 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             )
 
             self.__cache.pop(twitchChannelId, None)
+            self.__twitchChannelIdToExpirationTime.pop(twitchChannelId, None)
+            self.__twitchChannelIdToValidationExpirationTime.pop(twitchChannelId, None)
             self.__timber.log('TwitchTokensRepository', f'Twitch tokens details have been deleted ({twitchChannelId=}) ({tokensDetails=})')
         else:
             expirationTime = tokensDetails.expirationTime
@@ -473,6 +510,7 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             )
 
             self.__cache[twitchChannelId] = tokensDetails
+            self.__twitchChannelIdToExpirationTime[twitchChannelId] = expirationTime
             self.__timber.log('TwitchTokensRepository', f'Twitch tokens details have been updated ({twitchChannelId=}) ({tokensDetails=})')
 
         await connection.close()
@@ -489,7 +527,7 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
     async def __startValidationLoop(self):
         while True:
             await self.__checkAndValidateTokensAsNecessary()
-            await asyncio.sleep(self.__sleepTimeSeconds)
+            await asyncio.sleep(self.__getSleepTimeSeconds())
 
     async def __validateAndRefreshAccessToken(
         self,
@@ -510,7 +548,7 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             return tokensDetails
 
         self.__timber.log('TwitchTokensRepository', f'Validating Twitch tokens for \"{twitchChannelId}\"...')
-        self.__twitchChannelIdToValidationTime.pop(twitchChannelId, None)
+        self.__twitchChannelIdToValidationExpirationTime.pop(twitchChannelId, None)
         now = datetime.now(self.__timeZoneRepository.getDefault())
         validationResponse: TwitchValidationResponse | None = None
 
@@ -526,9 +564,9 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             pass
 
         if validationResponse is not None:
-            self.__twitchChannelIdToValidationTime[twitchChannelId] = now
+            self.__twitchChannelIdToValidationExpirationTime[twitchChannelId] = now + self.__validationTimeDelta
 
-        if validationResponse is None or validationResponse.expiresAt + self.__tokensExpirationBuffer > nowDateTime:
+        if validationResponse is None or nowDateTime + self.__tokensExpirationBuffer > validationResponse.expiresAt:
             try:
                 newTokensDetails = await self.__twitchApiService.refreshTokens(
                     twitchRefreshToken = tokensDetails.refreshToken
@@ -546,6 +584,8 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
                 tokensDetails = newTokensDetails
             )
 
+            # freshly issued tokens don't need to be validated again right away
+            self.__twitchChannelIdToValidationExpirationTime[twitchChannelId] = now + self.__validationTimeDelta
             return newTokensDetails
 
         await self.__setExpirationTime(
@@ -558,3 +598,16 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             accessToken = tokensDetails.accessToken,
             refreshToken = tokensDetails.refreshToken
         )
+
+    async def __validateTokensInBackground(self, twitchChannelId: str):
+        async with self.__validationSemaphore:
+            try:
+                # this goes through the same single-flight as every other caller, so a refresh that is already underway is shared
+                tokensDetails = await self.getTokensDetailsById(twitchChannelId)
+            except Exception as e:
+                self.__timber.log('TwitchTokensRepository', f'Encountered exception when trying to validate Twitch tokens in the background ({twitchChannelId=}): {e}', e, traceback.format_exc())
+                return
+
+        if tokensDetails is None:
+            self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannelId}\" require validation, but unable to find any existing tokens details')
+            self.__twitchChannelIdToExpirationTime.pop(twitchChannelId, None)
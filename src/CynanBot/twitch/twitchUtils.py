@@ -1,8 +1,6 @@
 import asyncio
-import queue
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 
 import CynanBot.misc.utils as utils
 from CynanBot.generalSettingsRepository import GeneralSettingsRepository
@@ -10,6 +8,7 @@ from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.misc.backgroundTaskHelperInterface import \
     BackgroundTaskHelperInterface
+from CynanBot.misc.eventBus import EventBus
 from CynanBot.sentMessageLogger.messageMethod import MessageMethod
 from CynanBot.sentMessageLogger.sentMessageLoggerInterface import \
     SentMessageLoggerInterface
@@ -46,7 +45,6 @@ class TwitchUtils(TwitchUtilsInterface):
         userIdsRepository: UserIdsRepositoryInterface,
         queueTimeoutSeconds: float = 3,
         sleepBeforeRetryTimeSeconds: float = 1,
-        sleepTimeSeconds: float = 0.5,
         maxRetries: int = 3
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
@@ -75,10 +73,6 @@ class TwitchUtils(TwitchUtilsInterface):
             raise TypeError(f'sleepBeforeRetryTimeSeconds argument is malformed: \"{sleepBeforeRetryTimeSeconds}\"')
         elif sleepBeforeRetryTimeSeconds < 0.25 or sleepBeforeRetryTimeSeconds > 3:
             raise ValueError(f'sleepBeforeRetryTimeSeconds argument is out of bounds: {sleepBeforeRetryTimeSeconds}')
-        elif not utils.isValidNum(sleepTimeSeconds):
-            raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
-        elif sleepTimeSeconds < 0.25 or sleepTimeSeconds > 3:
-            raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
         elif not utils.isValidInt(maxRetries):
             raise TypeError(f'maxRetries argument is malformed: \"{maxRetries}\"')
         elif maxRetries < 0 or maxRetries > utils.getIntMaxSafeSize():
@@ -93,13 +87,16 @@ class TwitchUtils(TwitchUtilsInterface):
         self.__twitchHandleProvider: TwitchHandleProviderInterface = twitchHandleProvider
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
-        self.__queueTimeoutSeconds: float = queueTimeoutSeconds
         self.__sleepBeforeRetryTimeSeconds: float = sleepBeforeRetryTimeSeconds
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__maxRetries: int = maxRetries
 
         self.__isStarted: bool = False
-        self.__messageQueue: SimpleQueue[OutboundMessage] = SimpleQueue()
+        self.__outboundMessageEventBus: EventBus[OutboundMessage] = EventBus(
+            backgroundTaskHelper = backgroundTaskHelper,
+            timber = timber,
+            name = 'TwitchUtils outbound message',
+            publishTimeoutSeconds = queueTimeoutSeconds
+        )
         self.__senderId: str | None = None
 
     def getMaxMessageSize(self) -> int:
@@ -130,6 +127,12 @@ class TwitchUtils(TwitchUtilsInterface):
         twitchChannel = await self.__twitchHandleProvider.getTwitchHandle()
         return await self.__twitchTokensRepository.requireAccessToken(twitchChannel)
 
+    async def __onOutboundMessage(self, outboundMessage: OutboundMessage):
+        await self.safeSend(
+            messageable = outboundMessage.messageable,
+            message = outboundMessage.message
+        )
+
     async def safeSend(
         self,
         messageable: TwitchMessageable,
@@ -284,10 +287,17 @@ class TwitchUtils(TwitchUtilsInterface):
         if not isinstance(outboundMessage, OutboundMessage):
             raise TypeError(f'outboundMessage argument is malformed: \"{outboundMessage}\"')
 
-        try:
-            self.__messageQueue.put(outboundMessage, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TwitchUtils', f'Encountered queue.Full when submitting a new outbound message ({outboundMessage}) into the outbound message queue (queue size: {self.__messageQueue.qsize()}): {e}', e)
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+
+        if now >= outboundMessage.delayUntilTime:
+            await self.__outboundMessageEventBus.publish(outboundMessage)
+        else:
+            self.__backgroundTaskHelper.createTask(self.__sendOutboundMessageWhenDue(outboundMessage))
+
+    async def __sendOutboundMessageWhenDue(self, outboundMessage: OutboundMessage):
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+        await asyncio.sleep((outboundMessage.delayUntilTime - now).total_seconds())
+        await self.__outboundMessageEventBus.publish(outboundMessage)
 
     def start(self):
         if self.__isStarted:
@@ -296,30 +306,7 @@ class TwitchUtils(TwitchUtilsInterface):
 
         self.__isStarted = True
         self.__timber.log('TwitchUtils', 'Starting TwitchUtils...')
-        self.__backgroundTaskHelper.createTask(self.__startOutboundMessageLoop())
-
-    async def __startOutboundMessageLoop(self):
-        while True:
-            outboundMessages: list[OutboundMessage] = list()
-
-            try:
-                while not self.__messageQueue.empty():
-                    outboundMessages.append(self.__messageQueue.get_nowait())
-            except queue.Empty as e:
-                self.__timber.log('TwitchUtils', f'Encountered queue.Empty when building up Twitch messages list (queue size: {self.__messageQueue.qsize()}) (actions size: {len(outboundMessages)}): {e}', e)
-
-            now = datetime.now(self.__timeZoneRepository.getDefault())
-
-            for outboundMessage in outboundMessages:
-                if now >= outboundMessage.delayUntilTime:
-                    await self.safeSend(
-                        messageable = outboundMessage.messageable,
-                        message = outboundMessage.message
-                    )
-                else:
-                    await self.__sendOutboundMessage(outboundMessage)
-
-            await asyncio.sleep(self.__sleepTimeSeconds)
+        self.__outboundMessageEventBus.start(self.__onOutboundMessage)
 
     async def waitThenSend(
         self,
@@ -4,10 +4,14 @@ from CynanBot.twitch.absTwitchChannelPointRedemptionHandler import \
     AbsTwitchChannelPointRedemptionHandler
 from CynanBot.twitch.absTwitchCheerHandler import AbsTwitchCheerHandler
 from CynanBot.twitch.absTwitchFollowHandler import AbsTwitchFollowHandler
+from CynanBot.twitch.absTwitchModerationHandler import \
+    AbsTwitchModerationHandler
 from CynanBot.twitch.absTwitchPollHandler import AbsTwitchPollHandler
 from CynanBot.twitch.absTwitchPredictionHandler import \
     AbsTwitchPredictionHandler
 from CynanBot.twitch.absTwitchRaidHandler import AbsTwitchRaidHandler
+from CynanBot.twitch.absTwitchStreamStatusHandler import \
+    AbsTwitchStreamStatusHandler
 from CynanBot.twitch.absTwitchSubscriptionHandler import \
     AbsTwitchSubscriptionHandler
 from CynanBot.twitch.api.websocket.twitchWebsocketDataBundle import \
@@ -30,9 +34,11 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
         channelPointRedemptionHandler: AbsTwitchChannelPointRedemptionHandler | None,
         cheerHandler: AbsTwitchCheerHandler | None,
         followHandler: AbsTwitchFollowHandler | None,
+        moderationHandler: AbsTwitchModerationHandler | None,
         pollHandler: AbsTwitchPollHandler | None,
         predictionHandler: AbsTwitchPredictionHandler | None,
         raidHandler: AbsTwitchRaidHandler | None,
+        streamStatusHandler: AbsTwitchStreamStatusHandler | None,
         subscriptionHandler: AbsTwitchSubscriptionHandler | None,
         timber: TimberInterface,
         userIdsRepository: UserIdsRepositoryInterface,
@@ -44,12 +50,16 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
             raise TypeError(f'cheerHandler argument is malformed: \"{cheerHandler}\"')
         elif followHandler is not None and not isinstance(followHandler, AbsTwitchFollowHandler):
             raise TypeError(f'followHandler argument is malformed: \"{followHandler}\"')
+        elif moderationHandler is not None and not isinstance(moderationHandler, AbsTwitchModerationHandler):
+            raise TypeError(f'moderationHandler argument is malformed: \"{moderationHandler}\"')
         elif pollHandler is not None and not isinstance(pollHandler, AbsTwitchPollHandler):
             raise TypeError(f'pollHandler argument is malformed: \"{pollHandler}\"')
         elif predictionHandler is not None and not isinstance(predictionHandler, AbsTwitchPredictionHandler):
             raise TypeError(f'predictionHandler argument is malformed: \"{predictionHandler}\"')
         elif raidHandler is not None and not isinstance(raidHandler, AbsTwitchRaidHandler):
             raise TypeError(f'raidHandler argument is malformed: \"{raidHandler}\"')
+        elif streamStatusHandler is not None and not isinstance(streamStatusHandler, AbsTwitchStreamStatusHandler):
+            raise TypeError(f'streamStatusHandler argument is malformed: \"{streamStatusHandler}\"')
         elif subscriptionHandler is not None and not isinstance(subscriptionHandler, AbsTwitchSubscriptionHandler):
             raise TypeError(f'subscriptionHandler argument is malformed: \"{subscriptionHandler}\"')
         elif not isinstance(timber, TimberInterface):
@@ -62,9 +72,11 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
         self.__channelPointRedemptionHandler: AbsTwitchChannelPointRedemptionHandler | None = channelPointRedemptionHandler
         self.__cheerHandler: AbsTwitchCheerHandler | None = cheerHandler
         self.__followHandler: AbsTwitchFollowHandler | None = followHandler
+        self.__moderationHandler: AbsTwitchModerationHandler | None = moderationHandler
         self.__pollHandler: AbsTwitchPollHandler | None = pollHandler
         self.__predictionHandler: AbsTwitchPredictionHandler | None = predictionHandler
         self.__raidHandler: AbsTwitchRaidHandler | None = raidHandler
+        self.__streamStatusHandler: AbsTwitchStreamStatusHandler | None = streamStatusHandler
         self.__subscriptionHandler: AbsTwitchSubscriptionHandler | None = subscriptionHandler
         self.__timber: TimberInterface = timber
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
@@ -88,6 +100,15 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
     ) -> bool:
         return subscriptionType is TwitchWebsocketSubscriptionType.FOLLOW
 
+    async def __isModerationType(
+        self,
+        subscriptionType: TwitchWebsocketSubscriptionType | None
+    ) -> bool:
+        return subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_BAN \
+            or subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD \
+            or subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE \
+            or subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_UNBAN
+
     async def __isPollType(
         self,
         subscriptionType: TwitchWebsocketSubscriptionType | None
@@ -111,6 +132,13 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
     ) -> bool:
         return subscriptionType is TwitchWebsocketSubscriptionType.RAID
 
+    async def __isStreamStatusType(
+        self,
+        subscriptionType: TwitchWebsocketSubscriptionType | None
+    ) -> bool:
+        return subscriptionType is TwitchWebsocketSubscriptionType.STREAM_OFFLINE \
+            or subscriptionType is TwitchWebsocketSubscriptionType.STREAM_ONLINE
+
     async def __isSubscriptionType(
         self,
         subscriptionType: TwitchWebsocketSubscriptionType | None
@@ -181,6 +209,15 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
                     user = user,
                     dataBundle = dataBundle
                 )
+        elif await self.__isModerationType(subscriptionType):
+            moderationHandler = self.__moderationHandler
+
+            if moderationHandler is not None:
+                await moderationHandler.onNewModerationEvent(
+                    userId = userId,
+                    user = user,
+                    dataBundle = dataBundle
+                )
         elif await self.__isPollType(subscriptionType):
             pollHandler = self.__pollHandler
 
@@ -208,6 +245,15 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
                     user = user,
                     dataBundle = dataBundle
                 )
+        elif await self.__isStreamStatusType(subscriptionType):
+            streamStatusHandler = self.__streamStatusHandler
+
+            if streamStatusHandler is not None:
+                await streamStatusHandler.onNewStreamStatus(
+                    userId = userId,
+                    user = user,
+                    dataBundle = dataBundle
+                )
         elif await self.__isSubscriptionType(subscriptionType):
             subscriptionHandler = self.__subscriptionHandler
 
@@ -1,9 +1,7 @@
 import asyncio
-import queue
 import traceback
 from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Any
 
 import websockets
@@ -13,6 +11,7 @@ from CynanBot.location.timeZoneRepositoryInterface import \
     TimeZoneRepositoryInterface
 from CynanBot.misc.backgroundTaskHelperInterface import \
     BackgroundTaskHelperInterface
+from CynanBot.misc.eventBus import EventBus
 from CynanBot.misc.incrementalJsonBuilder import IncrementalJsonBuilder
 from CynanBot.misc.lruCache import LruCache
 from CynanBot.timber.timberInterface import TimberInterface
@@ -40,6 +39,8 @@ from CynanBot.twitch.websocket.twitchWebsocketDataBundleListener import \
     TwitchWebsocketDataBundleListener
 from CynanBot.twitch.websocket.twitchWebsocketJsonMapperInterface import \
     TwitchWebsocketJsonMapperInterface
+from CynanBot.twitch.websocket.twitchWebsocketSubscriptionsListener import \
+    TwitchWebsocketSubscriptionsListener
 from CynanBot.twitch.websocket.twitchWebsocketUser import TwitchWebsocketUser
 
 
@@ -54,11 +55,13 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         twitchWebsocketAllowedUsersRepository: TwitchWebsocketAllowedUsersRepositoryInterface,
         twitchWebsocketJsonMapper: TwitchWebsocketJsonMapperInterface,
-        queueSleepTimeSeconds: float = 1,
         queueTimeoutSeconds: float = 3,
         websocketCreationDelayTimeSeconds: float = 0.25,
         websocketSleepTimeSeconds: float = 3,
         subscriptionTypes: set[TwitchWebsocketSubscriptionType] = {
+            TwitchWebsocketSubscriptionType.CHANNEL_BAN,
+            TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD,
+            TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE,
             TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION,
             TwitchWebsocketSubscriptionType.CHANNEL_POLL_BEGIN,
             TwitchWebsocketSubscriptionType.CHANNEL_POLL_END,
@@ -67,9 +70,12 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
             TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_END,
             TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_LOCK,
             TwitchWebsocketSubscriptionType.CHANNEL_PREDICTION_PROGRESS,
+            TwitchWebsocketSubscriptionType.CHANNEL_UNBAN,
             TwitchWebsocketSubscriptionType.CHEER,
             TwitchWebsocketSubscriptionType.FOLLOW,
             TwitchWebsocketSubscriptionType.RAID,
+            TwitchWebsocketSubscriptionType.STREAM_OFFLINE,
+            TwitchWebsocketSubscriptionType.STREAM_ONLINE,
             TwitchWebsocketSubscriptionType.SUBSCRIBE,
             TwitchWebsocketSubscriptionType.SUBSCRIPTION_GIFT,
             TwitchWebsocketSubscriptionType.SUBSCRIPTION_MESSAGE
@@ -91,10 +97,6 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
             raise TypeError(f'twitchWebsocketAllowedUsersRepository argument is malformed: \"{twitchWebsocketAllowedUsersRepository}\"')
         elif not isinstance(twitchWebsocketJsonMapper, TwitchWebsocketJsonMapperInterface):
             raise TypeError(f'twitchWebsocketJsonMapper argument is malformed: \"{twitchWebsocketJsonMapper}\"')
-        elif not utils.isValidNum(queueSleepTimeSeconds):
-            raise TypeError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
-        elif queueSleepTimeSeconds < 1 or queueSleepTimeSeconds > 15:
-            raise ValueError(f'queueSleepTimeSeconds argument is out of bounds: {queueSleepTimeSeconds}')
         elif not utils.isValidNum(queueTimeoutSeconds):
             raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
         elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
@@ -121,8 +123,6 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__twitchWebsocketAllowedUsersRepository: TwitchWebsocketAllowedUsersRepositoryInterface = twitchWebsocketAllowedUsersRepository
         self.__twitchWebsocketJsonMapper: TwitchWebsocketJsonMapperInterface = twitchWebsocketJsonMapper
-        self.__queueSleepTimeSeconds: float = queueSleepTimeSeconds
-        self.__queueTimeoutSeconds: float = queueTimeoutSeconds
         self.__websocketCreationDelayTimeSeconds: float = websocketCreationDelayTimeSeconds
         self.__websocketSleepTimeSeconds: float = websocketSleepTimeSeconds
         self.__subscriptionTypes: set[TwitchWebsocketSubscriptionType] = subscriptionTypes
@@ -134,8 +134,20 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         self.__sessionIdFor: dict[TwitchWebsocketUser, str | None] = defaultdict(lambda: '')
         self.__twitchWebsocketUrlFor: dict[TwitchWebsocketUser, str] = defaultdict(lambda: twitchWebsocketUrl)
         self.__messageIdCache: LruCache = LruCache(128)
-        self.__dataBundleQueue: SimpleQueue[TwitchWebsocketDataBundle] = SimpleQueue()
+        self.__dataBundleEventBus: EventBus[TwitchWebsocketDataBundle] = EventBus(
+            backgroundTaskHelper = backgroundTaskHelper,
+            timber = timber,
+            name = 'TwitchWebsocketClient dataBundle',
+            publishTimeoutSeconds = queueTimeoutSeconds
+        )
         self.__dataBundleListener: TwitchWebsocketDataBundleListener | None = None
+        self.__subscriptionsListeners: list[TwitchWebsocketSubscriptionsListener] = list()
+
+    def addSubscriptionsListener(self, listener: TwitchWebsocketSubscriptionsListener):
+        if not isinstance(listener, TwitchWebsocketSubscriptionsListener):
+            raise TypeError(f'listener argument is malformed: \"{listener}\"')
+
+        self.__subscriptionsListeners.append(listener)
 
     async def __createEventSubSubscription(self, sessionId: str, user: TwitchWebsocketUser):
         if not utils.isValidStr(sessionId):
@@ -185,6 +197,9 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
 
         self.__timber.log('TwitchWebsocketClient', f'Finished creating EventSub subscription(s) for {user}: {results}')
 
+        subscriptionTypes = frozenset(subscriptionType for subscriptionType in results.keys() if subscriptionType not in self.__badSubscriptionTypesFor[user])
+        await self.__notifySubscriptionsListeners(user, subscriptionTypes)
+
     async def __createWebsocketCondition(
         self,
         user: TwitchWebsocketUser,
@@ -195,7 +210,17 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         elif not isinstance(subscriptionType, TwitchWebsocketSubscriptionType):
             raise TypeError(f'subscriptionType argument is malformed: \"{subscriptionType}\"')
 
-        if subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION:
+        if subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_BAN or \
+                subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_UNBAN:
+            return TwitchWebsocketCondition(
+                broadcasterUserId = user.userId
+            )
+        elif subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_ADD or \
+                subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_MODERATOR_REMOVE:
+            return TwitchWebsocketCondition(
+                broadcasterUserId = user.userId
+            )
+        elif subscriptionType is TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION:
             return TwitchWebsocketCondition(
                 broadcasterUserId = user.userId
             )
@@ -229,6 +254,11 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
             return TwitchWebsocketCondition(
                 toBroadcasterUserId = user.userId
             )
+        elif subscriptionType is TwitchWebsocketSubscriptionType.STREAM_OFFLINE or \
+                subscriptionType is TwitchWebsocketSubscriptionType.STREAM_ONLINE:
+            return TwitchWebsocketCondition(
+                broadcasterUserId = user.userId
+            )
         elif subscriptionType is TwitchWebsocketSubscriptionType.SUBSCRIBE or \
                 subscriptionType is TwitchWebsocketSubscriptionType.SUBSCRIPTION_GIFT or \
                 subscriptionType is TwitchWebsocketSubscriptionType.SUBSCRIPTION_MESSAGE:
@@ -336,6 +366,28 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
 
         return True
 
+    async def __notifySubscriptionsListeners(
+        self,
+        user: TwitchWebsocketUser,
+        subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType]
+    ):
+        for subscriptionsListener in self.__subscriptionsListeners:
+            try:
+                await subscriptionsListener.onWebsocketSubscriptionsChanged(user.userId, subscriptionTypes)
+            except Exception as e:
+                self.__timber.log('TwitchWebsocketClient', f'Encountered unknown Exception when notifying subscriptions listener ({user=}) ({subscriptionTypes=}): {e}', e, traceback.format_exc())
+
+    async def __onDataBundle(self, dataBundle: TwitchWebsocketDataBundle):
+        dataBundleListener = self.__dataBundleListener
+
+        if dataBundleListener is None:
+            self.__timber.log('TwitchWebsocketClient', f'Dropping dataBundle as there is no dataBundle listener ({dataBundle=})')
+            return
+        elif not await self.__isValidMessage(dataBundle):
+            return
+
+        await dataBundleListener.onNewWebsocketDataBundle(dataBundle)
+
     async def __parseMessageToDataBundlesFor(
         self,
         message: Any | None,
@@ -396,31 +448,7 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         self.__isStarted = True
         self.__timber.log('TwitchWebsocketClient', 'Starting TwitchWebsocketClient...')
         self.__backgroundTaskHelper.createTask(self.__startWebsocketConnections())
-        self.__backgroundTaskHelper.createTask(self.__startDataBundleLoop())
-
-    async def __startDataBundleLoop(self):
-        while True:
-            dataBundleListener = self.__dataBundleListener
-
-            if dataBundleListener is not None:
-                dataBundles: list[TwitchWebsocketDataBundle] = list()
-
-                try:
-                    while not self.__dataBundleQueue.empty():
-                        dataBundles.append(self.__dataBundleQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Empty when building up dataBundles list (queue size: {self.__dataBundleQueue.qsize()}) (dataBundles size: {len(dataBundles)}): {e}', e, traceback.format_exc())
-
-                for dataBundle in dataBundles:
-                    if not await self.__isValidMessage(dataBundle):
-                        continue
-
-                    try:
-                        await dataBundleListener.onNewWebsocketDataBundle(dataBundle)
-                    except Exception as e:
-                        self.__timber.log('RecurringActionsMachine', f'Encountered unknown Exception when looping through dataBundles (queue size: {self.__dataBundleQueue.qsize()}) ({dataBundle=}): {e}', e, traceback.format_exc())
-
-            await asyncio.sleep(self.__queueSleepTimeSeconds)
+        self.__dataBundleEventBus.start(self.__onDataBundle)
 
     async def __startWebsocketConnectionFor(self, user: TwitchWebsocketUser):
         if not isinstance(user, TwitchWebsocketUser):
@@ -445,6 +473,9 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
                 self.__timber.log('TwitchWebsocketClient', f'Encountered websocket exception for \"{user}\" when connected to \"{twitchWebsocketUrl}\": {e}', e, traceback.format_exc())
                 self.__sessionIdFor[user] = ''
 
+                # any events sent while reconnecting are lost, so this user's subscriptions can't be relied upon until they're recreated
+                await self.__notifySubscriptionsListeners(user, frozenset())
+
             await asyncio.sleep(self.__websocketSleepTimeSeconds)
 
     async def __startWebsocketConnections(self):
@@ -461,7 +492,4 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         if not isinstance(dataBundle, TwitchWebsocketDataBundle):
             raise TypeError(f'dataBundle argument is malformed: \"{dataBundle}\"')
 
-        try:
-            self.__dataBundleQueue.put(dataBundle, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Full when submitting a new dataBundle ({dataBundle}) into the dataBundle queue (queue size: {self.__dataBundleQueue.qsize()}): {e}', e, traceback.format_exc())
+        await self.__dataBundleEventBus.publish(dataBundle)
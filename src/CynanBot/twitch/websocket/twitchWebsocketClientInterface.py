@@ -2,10 +2,16 @@ from abc import ABC, abstractmethod
 
 from CynanBot.twitch.websocket.twitchWebsocketDataBundleListener import \
     TwitchWebsocketDataBundleListener
+from CynanBot.twitch.websocket.twitchWebsocketSubscriptionsListener import \
+    TwitchWebsocketSubscriptionsListener
 
 
 class TwitchWebsocketClientInterface(ABC):
 
+    @abstractmethod
+    def addSubscriptionsListener(self, listener: TwitchWebsocketSubscriptionsListener):
+        pass
+
     @abstractmethod
     def setDataBundleListener(self, listener: TwitchWebsocketDataBundleListener | None):
         pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from CynanBot.twitch.api.websocket.twitchWebsocketSubscriptionType import \
+    TwitchWebsocketSubscriptionType
+
+
+class TwitchWebsocketSubscriptionsListener(ABC):
+
+    @abstractmethod
+    async def onWebsocketSubscriptionsChanged(
+        self,
+        twitchChannelId: str,
+        subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType]
+    ):
+        pass
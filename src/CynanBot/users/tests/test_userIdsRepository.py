@@ -0,0 +1,182 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from CynanBot.authRepository import AuthRepository
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
+from CynanBot.network.aioHttpClientProvider import AioHttpClientProvider
+from CynanBot.storage.backingDatabase import BackingDatabase
+from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.storage.jsonStaticReader import JsonStaticReader
+from CynanBot.timber.timberStub import TimberStub
+from CynanBot.twitch.api.twitchApiService import TwitchApiService
+from CynanBot.twitch.api.twitchJsonMapper import TwitchJsonMapper
+from CynanBot.twitch.twitchAnonymousUserIdProvider import \
+    TwitchAnonymousUserIdProvider
+from CynanBot.twitch.websocket.twitchWebsocketJsonMapper import \
+    TwitchWebsocketJsonMapper
+from CynanBot.users.userIdsRepository import UserIdsRepository
+
+
+class TestUserIdsRepository():
+
+    def __createRepository(self, backingDatabase: BackingDatabase) -> UserIdsRepository:
+        eventLoop = asyncio.get_event_loop()
+        timber = TimberStub()
+        timeZoneRepository = TimeZoneRepository()
+        twitchJsonMapper = TwitchJsonMapper(
+            timber = timber,
+            timeZoneRepository = timeZoneRepository
+        )
+
+        return UserIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = timber,
+            timeZoneRepository = timeZoneRepository,
+            twitchAnonymousUserIdProvider = TwitchAnonymousUserIdProvider(),
+            twitchApiService = TwitchApiService(
+                networkClientProvider = AioHttpClientProvider(
+                    eventLoop = eventLoop,
+                    timber = timber
+                ),
+                timber = timber,
+                timeZoneRepository = timeZoneRepository,
+                twitchCredentialsProvider = AuthRepository(
+                    authJsonReader = JsonStaticReader(dict())
+                ),
+                twitchJsonMapper = twitchJsonMapper,
+                twitchWebsocketJsonMapper = TwitchWebsocketJsonMapper(
+                    timber = timber,
+                    twitchJsonMapper = twitchJsonMapper
+                )
+            )
+        )
+
+    async def __fetchAllUsers(self, backingDatabase: BackingDatabase) -> list[list[str]] | None:
+        connection = await backingDatabase.getConnection()
+        records = await connection.fetchRows('SELECT userid, username FROM userids ORDER BY userid ASC')
+        await connection.close()
+        return records
+
+    @pytest.mark.asyncio
+    async def test_setUser_isWrittenImmediately(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+
+        for _ in range(10):
+            await repository.setUser(userId = '1', userName = 'alice')
+
+        await repository.setUser(userId = '2', userName = 'bob')
+        assert await self.__fetchAllUsers(backingDatabase) == [ [ '1', 'alice' ], [ '2', 'bob' ] ]
+
+        await repository.setUser(userId = '2', userName = 'bobby')
+        assert await self.__fetchAllUsers(backingDatabase) == [ [ '1', 'alice' ], [ '2', 'bobby' ] ]
+
+        reloadedRepository = self.__createRepository(backingDatabase)
+        assert await reloadedRepository.fetchUserId('BOBBY') == '2'
+        assert await reloadedRepository.fetchUserName('1') == 'alice'
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_setUser_withCachedName_skipsWrite(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+        await repository.setUser(userId = '1', userName = 'alice')
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('DELETE FROM userids')
+        await connection.close()
+
+        await repository.setUser(userId = '1', userName = 'alice')
+        assert await self.__fetchAllUsers(backingDatabase) == list()
+
+        await repository.clearCaches()
+        await repository.setUser(userId = '1', userName = 'alice')
+        assert await self.__fetchAllUsers(backingDatabase) == [ [ '1', 'alice' ] ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_setUsers(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+        await repository.setUsers(dict())
+        await repository.setUsers({ '1': 'alice', '2': 'bob' })
+        await repository.setUsers({ '2': 'bob', '3': 'carol' })
+        assert await self.__fetchAllUsers(backingDatabase) == [ [ '1', 'alice' ], [ '2', 'bob' ], [ '3', 'carol' ] ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_prefetchUserIds(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+        await repository.setUser(userId = '1', userName = 'alice')
+        await repository.setUser(userId = '2', userName = 'bob')
+
+        reloadedRepository = self.__createRepository(backingDatabase)
+        await reloadedRepository.prefetchUserIds([ 'Alice', 'bob', 'carol' ])
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('DELETE FROM userids')
+        await connection.close()
+
+        assert await reloadedRepository.fetchUserId('alice') == '1'
+        assert await reloadedRepository.fetchUserName('2') == 'bob'
+        assert await reloadedRepository.fetchUserId('carol') is None
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_setUser_withRename(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+        await repository.setUser(userId = '1', userName = 'alice')
+        await repository.setUser(userId = '1', userName = 'alicia')
+
+        assert await repository.fetchUserId('alicia') == '1'
+        assert await repository.fetchUserName('1') == 'alicia'
+        assert await repository.fetchUserId('alice') is None
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchUserNames_withoutTwitchAccessToken(self, tmp_path: Path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_event_loop(),
+            backingDatabaseFile = str(tmp_path / 'test.sqlite')
+        )
+
+        repository = self.__createRepository(backingDatabase)
+        await repository.setUser(userId = '1', userName = 'alice')
+        await repository.setUser(userId = '2', userName = 'bob')
+
+        reloadedRepository = self.__createRepository(backingDatabase)
+        await reloadedRepository.setUser(userId = '3', userName = 'carol')
+
+        userNames = await reloadedRepository.fetchUserNames([ '1', '2', '3', '4', '1' ])
+        assert userNames == { '1': 'alice', '2': 'bob', '3': 'carol' }
+
+        await backingDatabase.close()
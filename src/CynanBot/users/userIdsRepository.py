@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import traceback
+from datetime import datetime, timedelta
 
 from lru import LRU
 
 import CynanBot.misc.utils as utils
+from CynanBot.location.timeZoneRepositoryInterface import \
+    TimeZoneRepositoryInterface
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.storage.backingDatabase import BackingDatabase
-from CynanBot.storage.databaseConnection import DatabaseConnection
-from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.databaseSchema import DatabaseSchema
 from CynanBot.timber.timberInterface import TimberInterface
 from CynanBot.twitch.api.twitchApiServiceInterface import \
     TwitchApiServiceInterface
@@ -26,14 +28,18 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         self,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
+        timeZoneRepository: TimeZoneRepositoryInterface,
         twitchAnonymousUserIdProvider: TwitchAnonymousUserIdProviderInterface,
         twitchApiService: TwitchApiServiceInterface,
-        cacheSize: int = 256
+        cacheSize: int = 256,
+        unknownUserNameTimeToLive: timedelta = timedelta(minutes = 10)
     ):
         if not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
+            raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
         elif not isinstance(twitchAnonymousUserIdProvider, TwitchAnonymousUserIdProviderInterface):
             raise TypeError(f'twitchAnonymousUserIdProvider argument is malformed: \"{twitchAnonymousUserIdProvider}\"')
         elif not isinstance(twitchApiService, TwitchApiServiceInterface):
@@ -42,17 +48,41 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
         elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
             raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
+        elif not isinstance(unknownUserNameTimeToLive, timedelta):
+            raise TypeError(f'unknownUserNameTimeToLive argument is malformed: \"{unknownUserNameTimeToLive}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
+        self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__twitchAnonymousUserIdProvider: TwitchAnonymousUserIdProviderInterface = twitchAnonymousUserIdProvider
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
+        self.__unknownUserNameTimeToLive: timedelta = unknownUserNameTimeToLive
+        self.__maxHelixUsersPerRequest: int = 100
 
-        self.__isDatabaseReady: bool = False
-        self.__cache: LRU[str, str | None] = LRU(cacheSize)
+        self.__userIdCache: LRU[str, str] = LRU(cacheSize)
+        self.__userNameCache: LRU[str, str] = LRU(cacheSize)
+        self.__unknownUserNames: LRU[str, datetime] = LRU(cacheSize)
+
+        backingDatabase.registerSchema(self.__getDatabaseSchema())
+
+    def __cacheUser(self, userId: str, userName: str):
+        oldUserName = self.__userNameCache.get(userId, None)
+
+        # a user who renamed themselves no longer owns their old name
+        if oldUserName is not None and oldUserName.lower() != userName.lower():
+            if self.__userIdCache.get(oldUserName.lower(), None) == userId:
+                del self.__userIdCache[oldUserName.lower()]
+
+        self.__userIdCache[userName.lower()] = userId
+        self.__userNameCache[userId] = userName
+
+        if userName.lower() in self.__unknownUserNames:
+            del self.__unknownUserNames[userName.lower()]
 
     async def clearCaches(self):
-        self.__cache.clear()
+        self.__userIdCache.clear()
+        self.__userNameCache.clear()
+        self.__unknownUserNames.clear()
         self.__timber.log('UserIdsRepository', 'Caches cleared')
 
     async def fetchAnonymousUserId(self) -> str:
@@ -79,24 +109,30 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
             raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
-        connection = await self.__getDatabaseConnection()
+        lowerUserName = userName.lower()
+        userId = self.__userIdCache.get(lowerUserName, None)
+
+        if utils.isValidStr(userId):
+            return userId
+
+        if self.__isUnknownUserName(lowerUserName):
+            return None
+
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
-                SELECT userid FROM userids
+                SELECT userid, username FROM userids
                 WHERE username = $1
                 LIMIT 1
             ''',
             userName
         )
 
-        userId: str | None = None
-        if record is not None and len(record) >= 1:
-            userId = record[0]
-
         await connection.close()
 
-        if utils.isValidStr(userId):
-            return userId
+        if record is not None and len(record) >= 2 and utils.isValidStr(record[0]):
+            self.__cacheUser(userId = record[0], userName = record[1])
+            return record[0]
         elif not utils.isValidStr(twitchAccessToken):
             self.__timber.log('UserIdsRepository', f'Can\'t lookup Twitch user ID for \"{userName}\" as no Twitch access token was specified')
             return None
@@ -115,6 +151,7 @@ class UserIdsRepository(UserIdsRepositoryInterface):
 
         if userDetails is None:
             self.__timber.log('UserIdsRepository', f'Unable to retrieve Twitch user ID for username \"{userName}\" ({twitchAccessToken=})')
+            self.__unknownUserNames[lowerUserName] = datetime.now(self.__timeZoneRepository.getDefault())
             return None
 
         await self.setUser(
@@ -158,15 +195,12 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
             raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
-        userName: str | None = None
-
-        if userId in self.__cache:
-            userName = self.__cache[userId]
+        userName = self.__userNameCache.get(userId, None)
 
-            if utils.isValidStr(userName):
-                return userName
+        if utils.isValidStr(userName):
+            return userName
 
-        connection = await self.__getDatabaseConnection()
+        connection = await self.__backingDatabase.getConnection()
         record = await connection.fetchRow(
             '''
                 SELECT username FROM userids
@@ -182,7 +216,7 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         await connection.close()
 
         if utils.isValidStr(userName):
-            self.__cache[userId] = userName
+            self.__cacheUser(userId = userId, userName = userName)
             return userName
         elif not utils.isValidStr(twitchAccessToken):
             self.__timber.log('UserIdsRepository', f'Can\'t lookup Twitch username for \"{userId}\" as no Twitch access token was specified')
@@ -204,8 +238,6 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             self.__timber.log('UserIdsRepository', f'Unable to retrieve Twitch username for user ID \"{userId}\" ({twitchAccessToken=})')
             return None
 
-        self.__cache[userId] = userDetails.login
-
         await self.setUser(
             userId = userId,
             userName = userDetails.login
@@ -213,47 +245,156 @@ class UserIdsRepository(UserIdsRepositoryInterface):
 
         return userDetails.login
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+    async def fetchUserNames(
+        self,
+        userIds: list[str],
+        twitchAccessToken: str | None = None
+    ) -> dict[str, str]:
+        if not isinstance(userIds, list):
+            raise TypeError(f'userIds argument is malformed: \"{userIds}\"')
+        elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
+            raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+
+        userNames: dict[str, str] = dict()
+        missingUserIds: list[str] = list()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
+        for userId in userIds:
+            if not utils.isValidStr(userId):
+                raise TypeError(f'userIds argument contains a malformed entry: \"{userId}\"')
+
+            userName = self.__userNameCache.get(userId, None)
+
+            if utils.isValidStr(userName):
+                userNames[userId] = userName
+            elif userId not in missingUserIds:
+                missingUserIds.append(userId)
+
+        if len(missingUserIds) == 0:
+            return userNames
+
+        placeholders = ', '.join(f'${index + 1}' for index in range(len(missingUserIds)))
 
-        self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
+        records = await connection.fetchRows(
+            f'''
+                SELECT userid, username FROM userids
+                WHERE userid IN ({placeholders})
+            ''',
+            *missingUserIds
+        )
 
-        match connection.getDatabaseType():
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS userids (
-                            userid text NOT NULL PRIMARY KEY,
-                            username public.citext NOT NULL
-                        )
-                    '''
-                )
+        await connection.close()
+
+        if records is not None:
+            for record in records:
+                self.__cacheUser(userId = record[0], userName = record[1])
+                userNames[record[0]] = record[1]
 
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS userids (
-                            userid TEXT NOT NULL PRIMARY KEY,
-                            username TEXT NOT NULL COLLATE NOCASE
-                        )
-                    '''
+        missingUserIds = [ userId for userId in missingUserIds if userId not in userNames ]
+
+        if len(missingUserIds) == 0:
+            return userNames
+        elif not utils.isValidStr(twitchAccessToken):
+            self.__timber.log('UserIdsRepository', f'Can\'t lookup Twitch usernames for {len(missingUserIds)} user ID(s) as no Twitch access token was specified')
+            return userNames
+
+        self.__timber.log('UserIdsRepository', f'Usernames for {len(missingUserIds)} user ID(s) weren\'t found locally, so performing network call(s) to fetch instead ({twitchAccessToken=})...')
+
+        for index in range(0, len(missingUserIds), self.__maxHelixUsersPerRequest):
+            userIdsChunk = missingUserIds[index:index + self.__maxHelixUsersPerRequest]
+
+            try:
+                usersDetails = await self.__twitchApiService.fetchUserDetailsWithUserIds(
+                    twitchAccessToken = twitchAccessToken,
+                    userIds = userIdsChunk
                 )
+            except GenericNetworkException as e:
+                self.__timber.log('UserIdsRepository', f'Received a network error when fetching Twitch usernames for {len(userIdsChunk)} user ID(s) ({twitchAccessToken=}): {e}', e, traceback.format_exc())
+                continue
+
+            fetchedUserNames: dict[str, str] = dict()
+
+            for userDetails in usersDetails:
+                if userDetails.userId in userIdsChunk:
+                    fetchedUserNames[userDetails.userId] = userDetails.login
+
+            await self.setUsers(fetchedUserNames)
+            userNames.update(fetchedUserNames)
+
+        return userNames
+
+    def __getDatabaseSchema(self) -> DatabaseSchema:
+        return DatabaseSchema(
+            name = 'userids',
+            psqlStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS userids (
+                        userid text NOT NULL PRIMARY KEY,
+                        username public.citext NOT NULL
+                    )
+                '''
+            ],
+            sqliteStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS userids (
+                        userid TEXT NOT NULL PRIMARY KEY,
+                        username TEXT NOT NULL COLLATE NOCASE
+                    )
+                '''
+            ]
+        )
 
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+    def __isUnknownUserName(self, lowerUserName: str) -> bool:
+        unknownTime = self.__unknownUserNames.get(lowerUserName, None)
 
-        await connection.close()
+        if unknownTime is None:
+            return False
+        elif unknownTime + self.__unknownUserNameTimeToLive >= datetime.now(self.__timeZoneRepository.getDefault()):
+            return True
+
+        del self.__unknownUserNames[lowerUserName]
+        return False
 
     async def optionallySetUser(self, userId: str | None, userName: str | None):
         if utils.isValidStr(userId) and utils.isValidStr(userName):
             await self.setUser(userId = userId, userName = userName)
 
+    async def prefetchUserIds(self, userNames: list[str]):
+        if not isinstance(userNames, list):
+            raise TypeError(f'userNames argument is malformed: \"{userNames}\"')
+
+        missingUserNames: list[str] = list()
+
+        for userName in userNames:
+            if not utils.isValidStr(userName):
+                raise TypeError(f'userNames argument contains a malformed entry: \"{userName}\"')
+            elif userName.lower() not in self.__userIdCache:
+                missingUserNames.append(userName)
+
+        if len(missingUserNames) == 0:
+            return
+
+        placeholders = ', '.join(f'${index + 1}' for index in range(len(missingUserNames)))
+
+        connection = await self.__backingDatabase.getConnection()
+        records = await connection.fetchRows(
+            f'''
+                SELECT userid, username FROM userids
+                WHERE username IN ({placeholders})
+            ''',
+            *missingUserNames
+        )
+
+        await connection.close()
+        prefetchedCount = 0
+
+        if records is not None:
+            for record in records:
+                self.__cacheUser(userId = record[0], userName = record[1])
+                prefetchedCount = prefetchedCount + 1
+
+        self.__timber.log('UserIdsRepository', f'Prefetched {prefetchedCount} of {len(missingUserNames)} user ID(s)')
+
     async def requireAnonymousUserId(self) -> str:
         anonymousUserId = await self.fetchAnonymousUserId()
 
@@ -339,15 +480,41 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif not utils.isValidStr(userName):
             raise TypeError(f'userName argument is malformed: \"{userName}\"')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO userids (userid, username)
-                VALUES ($1, $2)
-                ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
-            ''',
-            userId, userName
-        )
+        await self.setUsers({ userId: userName })
 
-        await connection.close()
-        self.__cache[userId] = userName
+    async def setUsers(self, users: dict[str, str]):
+        if not isinstance(users, dict):
+            raise TypeError(f'users argument is malformed: \"{users}\"')
+
+        records: list[tuple[str, str]] = list()
+
+        for userId, userName in users.items():
+            if not utils.isValidStr(userId):
+                raise TypeError(f'users argument contains a malformed userId: \"{userId}\"')
+            elif not utils.isValidStr(userName):
+                raise TypeError(f'users argument contains a malformed userName: \"{userName}\"')
+
+            # only a user we've already stored under this exact name can skip the write, as plenty
+            # of other tables join against userids and would otherwise miss new or renamed users
+            if self.__userNameCache.get(userId, None) != userName:
+                records.append((userId, userName))
+
+        if len(records) == 0:
+            return
+
+        connection = await self.__backingDatabase.getConnection()
+
+        try:
+            await connection.executeMany(
+                '''
+                    INSERT INTO userids (userid, username)
+                    VALUES ($1, $2)
+                    ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
+                ''',
+                records
+            )
+        finally:
+            await connection.close()
+
+        for userId, userName in records:
+            self.__cacheUser(userId = userId, userName = userName)
@@ -37,6 +37,14 @@ class UserIdsRepositoryInterface(Clearable):
     ) -> str | None:
         pass
 
+    @abstractmethod
+    async def fetchUserNames(
+        self,
+        userIds: list[str],
+        twitchAccessToken: str | None = None
+    ) -> dict[str, str]:
+        pass
+
     @abstractmethod
     async def optionallySetUser(
         self,
@@ -45,6 +53,10 @@ class UserIdsRepositoryInterface(Clearable):
     ):
         pass
 
+    @abstractmethod
+    async def prefetchUserIds(self, userNames: list[str]):
+        pass
+
     @abstractmethod
     async def requireAnonymousUserId(self) -> str:
         pass
@@ -80,3 +92,7 @@ class UserIdsRepositoryInterface(Clearable):
     @abstractmethod
     async def setUser(self, userId: str, userName: str):
         pass
+
+    @abstractmethod
+    async def setUsers(self, users: dict[str, str]):
+        pass
@@ -3,6 +3,7 @@ from datetime import timedelta
 
 import CynanBot.misc.utils as utils
 from CynanBot.location.location import Location
+from CynanBot.misc.singleFlight import SingleFlight
 from CynanBot.misc.timedDict import TimedDict
 from CynanBot.network.exceptions import GenericNetworkException
 from CynanBot.openWeather.exceptions import \
@@ -42,6 +43,7 @@ class WeatherRepository(WeatherRepositoryInterface):
         self.__timber: TimberInterface = timber
 
         self.__cache: TimedDict[WeatherReport] = TimedDict(cacheTimeDelta)
+        self.__singleFlight: SingleFlight[WeatherReport] = SingleFlight()
 
     async def clearCaches(self):
         self.__cache.clear()
@@ -55,6 +57,12 @@ class WeatherRepository(WeatherRepositoryInterface):
         if weatherReport is not None:
             return weatherReport
 
+        return await self.__singleFlight.run(
+            key = location.locationId,
+            function = lambda: self.__fetchAndCacheWeather(location)
+        )
+
+    async def __fetchAndCacheWeather(self, location: Location) -> WeatherReport:
         weatherReport = await self.__fetchWeather(location)
         self.__cache[location.locationId] = weatherReport
 
@@ -0,0 +1,65 @@
+import asyncio
+import json
+import time
+from asyncio import AbstractEventLoop
+from typing import Any
+
+from CynanBot.misc.incrementalJsonBuilder import IncrementalJsonBuilder
+
+eventLoop: AbstractEventLoop = asyncio.get_event_loop()
+
+def createJsonString(megabytes: int, isSingleStructure: bool) -> str:
+    # roughly shaped like a channel.chat.message EventSub notification, including escapes and braces within strings
+    notification: dict[str, Any] = {
+        'metadata': {
+            'message_id': 'befa7b53-d79d-478f-86b9-120f112b044e',
+            'message_type': 'notification',
+            'message_timestamp': '2024-01-01T00:00:00.000000000Z'
+        },
+        'payload': {
+            'event': {
+                'broadcaster_user_id': '1971641',
+                'chatter_user_name': 'smCharles',
+                'message': {
+                    'text': 'hello \"world\" {not an object} \\\\ ' * 8
+                }
+            }
+        }
+    }
+
+    notificationString = json.dumps(notification)
+    count = max(1, (megabytes * 1024 * 1024) // len(notificationString))
+
+    if isSingleStructure:
+        return json.dumps({ 'notifications': [ notification ] * count })
+    else:
+        return notificationString * count
+
+async def benchmark(jsonString: str, fragmentSize: int):
+    builder = IncrementalJsonBuilder()
+    dictionaryCount = 0
+    start = time.perf_counter()
+
+    for index in range(0, len(jsonString), fragmentSize):
+        dictionaries = await builder.buildDictionariesOrAppendInternalJsonCache(jsonString[index:index + fragmentSize])
+
+        if dictionaries is not None:
+            dictionaryCount += len(dictionaries)
+
+    seconds = time.perf_counter() - start
+    megabytes = len(jsonString) / (1024 * 1024)
+    print(f'{megabytes:.1f}MB in {fragmentSize}-character fragments: {dictionaryCount} dictionaries in {seconds:.3f}s ({megabytes / seconds:.1f}MB/s)')
+
+async def main():
+    for isSingleStructure in [ False, True ]:
+        jsonString = createJsonString(
+            megabytes = 4,
+            isSingleStructure = isSingleStructure
+        )
+
+        print(f'({isSingleStructure=})')
+
+        for fragmentSize in [ 64, 1024, 16384, len(jsonString) ]:
+            await benchmark(jsonString, fragmentSize)
+
+eventLoop.run_until_complete(main())
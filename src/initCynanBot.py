@@ -134,8 +134,22 @@ from CynanBot.mostRecentChat.mostRecentChatsRepository import \
 from CynanBot.mostRecentChat.mostRecentChatsRepositoryInterface import \
     MostRecentChatsRepositoryInterface
 from CynanBot.network.aioHttpClientProvider import AioHttpClientProvider
+from CynanBot.network.cachingNetworkClientProvider import \
+    CachingNetworkClientProvider
+from CynanBot.network.circuitBreaker import CircuitBreaker
+from CynanBot.network.circuitBreakerInterface import CircuitBreakerInterface
+from CynanBot.network.circuitBreakerNetworkClientProvider import \
+    CircuitBreakerNetworkClientProvider
 from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkMetricsTracker import NetworkMetricsTracker
+from CynanBot.network.networkMetricsTrackerInterface import \
+    NetworkMetricsTrackerInterface
+from CynanBot.network.networkFixtureRepository import NetworkFixtureRepository
+from CynanBot.network.networkRecordReplayMode import NetworkRecordReplayMode
+from CynanBot.network.networkResponseCache import NetworkResponseCache
+from CynanBot.network.recordReplayNetworkClientProvider import \
+    RecordReplayNetworkClientProvider
 from CynanBot.network.requestsClientProvider import RequestsClientProvider
 from CynanBot.openWeather.openWeatherApiService import OpenWeatherApiService
 from CynanBot.openWeather.openWeatherApiServiceInterface import \
@@ -193,7 +207,12 @@ from CynanBot.starWars.starWarsQuotesRepository import StarWarsQuotesRepository
 from CynanBot.storage.backingDatabase import BackingDatabase
 from CynanBot.storage.backingPsqlDatabase import BackingPsqlDatabase
 from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.storage.databaseMetricsTracker import DatabaseMetricsTracker
+from CynanBot.storage.databaseMetricsTrackerInterface import \
+    DatabaseMetricsTrackerInterface
 from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.instrumentedBackingDatabase import \
+    InstrumentedBackingDatabase
 from CynanBot.storage.jsonFileReader import JsonFileReader
 from CynanBot.storage.linesFileReader import LinesFileReader
 from CynanBot.storage.psqlCredentialsProvider import PsqlCredentialsProvider
@@ -391,6 +410,10 @@ from CynanBot.twitch.timeout.timeoutImmuneUserIdsRepository import \
     TimeoutImmuneUserIdsRepository
 from CynanBot.twitch.timeout.timeoutImmuneUserIdsRepositoryInterface import \
     TimeoutImmuneUserIdsRepositoryInterface
+from CynanBot.twitch.timeout.twitchModerationRosterRepository import \
+    TwitchModerationRosterRepository
+from CynanBot.twitch.timeout.twitchModerationRosterRepositoryInterface import \
+    TwitchModerationRosterRepositoryInterface
 from CynanBot.twitch.timeout.twitchTimeoutHelper import TwitchTimeoutHelper
 from CynanBot.twitch.timeout.twitchTimeoutHelperInterface import \
     TwitchTimeoutHelperInterface
@@ -490,19 +513,87 @@ elif generalSettingsSnapshot.requireDatabaseType() is DatabaseType.SQLITE:
 else:
     raise RuntimeError(f'Unknown/misconfigured database type: \"{generalSettingsSnapshot.requireDatabaseType()}\"')
 
+if generalSettingsSnapshot.isDatabaseInstrumentationEnabled():
+    databaseMetricsTracker: DatabaseMetricsTrackerInterface = DatabaseMetricsTracker(
+        backgroundTaskHelper = backgroundTaskHelper,
+        timber = timber,
+        slowQueryThresholdSeconds = generalSettingsSnapshot.getDatabaseSlowQueryThresholdMillis() / 1000
+    )
+
+    backingDatabase = InstrumentedBackingDatabase(
+        backingDatabase = backingDatabase,
+        databaseMetricsTracker = databaseMetricsTracker,
+        tag = 'BackingDatabase'
+    )
+
+    databaseMetricsTracker.start()
+
+
+def tagBackingDatabase(tag: str) -> BackingDatabase:
+    if isinstance(backingDatabase, InstrumentedBackingDatabase):
+        return backingDatabase.withTag(tag)
+    else:
+        return backingDatabase
+
+
+networkMetricsTracker: NetworkMetricsTrackerInterface | None = None
+if generalSettingsSnapshot.isNetworkInstrumentationEnabled():
+    networkMetricsTracker = NetworkMetricsTracker(
+        backgroundTaskHelper = backgroundTaskHelper,
+        timber = timber
+    )
+
+    networkMetricsTracker.start()
+
 networkClientProvider: NetworkClientProvider
 if generalSettingsSnapshot.requireNetworkClientType() is NetworkClientType.AIOHTTP:
     networkClientProvider: NetworkClientProvider = AioHttpClientProvider(
         eventLoop = eventLoop,
-        timber = timber
+        timber = timber,
+        networkMetricsTracker = networkMetricsTracker
     )
 elif generalSettingsSnapshot.requireNetworkClientType() is NetworkClientType.REQUESTS:
     networkClientProvider: NetworkClientProvider = RequestsClientProvider(
-        timber = timber
+        timber = timber,
+        networkMetricsTracker = networkMetricsTracker
     )
 else:
     raise RuntimeError(f'Unknown/misconfigured network client type: \"{generalSettingsSnapshot.requireNetworkClientType()}\"')
 
+networkRecordReplayMode = generalSettingsSnapshot.getNetworkRecordReplayMode()
+if networkRecordReplayMode is not None:
+    networkClientProvider = RecordReplayNetworkClientProvider(
+        networkClientProvider = networkClientProvider if networkRecordReplayMode is NetworkRecordReplayMode.RECORD else None,
+        networkFixtureRepository = NetworkFixtureRepository(
+            timber = timber,
+            fixtureDirectory = generalSettingsSnapshot.getNetworkFixtureDirectory()
+        ),
+        networkRecordReplayMode = networkRecordReplayMode,
+        timber = timber
+    )
+
+circuitBreaker: CircuitBreakerInterface | None = None
+if generalSettingsSnapshot.isNetworkCircuitBreakerEnabled():
+    circuitBreaker = CircuitBreaker(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository
+    )
+
+    networkClientProvider = CircuitBreakerNetworkClientProvider(
+        circuitBreaker = circuitBreaker,
+        networkClientProvider = networkClientProvider,
+        timber = timber
+    )
+
+if generalSettingsSnapshot.isNetworkResponseCacheEnabled():
+    networkClientProvider = CachingNetworkClientProvider(
+        networkClientProvider = networkClientProvider,
+        networkResponseCache = NetworkResponseCache(
+            timber = timber
+        ),
+        timber = timber
+    )
+
 authRepository = AuthRepository(
     authJsonReader = JsonFileReader('authRepository.json')
 )
@@ -529,15 +620,16 @@ twitchApiService: TwitchApiServiceInterface = TwitchApiService(
 twitchAnonymousUserIdProvider: TwitchAnonymousUserIdProviderInterface = TwitchAnonymousUserIdProvider()
 
 userIdsRepository: UserIdsRepositoryInterface = UserIdsRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('UserIdsRepository'),
     timber = timber,
+    timeZoneRepository = timeZoneRepository,
     twitchAnonymousUserIdProvider = twitchAnonymousUserIdProvider,
     twitchApiService = twitchApiService
 )
 
 twitchTokensRepository: TwitchTokensRepositoryInterface = TwitchTokensRepository(
     backgroundTaskHelper = backgroundTaskHelper,
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TwitchTokensRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository,
     twitchApiService = twitchApiService,
@@ -567,7 +659,7 @@ twitchTokensUtils: TwitchTokensUtilsInterface = TwitchTokensUtils(
 )
 
 twitchFollowingStatusRepository: TwitchFollowingStatusRepositoryInterface = TwitchFollowingStatusRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TwitchFollowingStatusRepository'),
     timber = timber,
     twitchApiService = twitchApiService,
     userIdsRepository = userIdsRepository
@@ -602,7 +694,7 @@ chatLogger: ChatLoggerInterface = ChatLogger(
 )
 
 cutenessRepository: CutenessRepositoryInterface = CutenessRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('CutenessRepository'),
     userIdsRepository = userIdsRepository
 )
 emojiRepository: EmojiRepositoryInterface = EmojiRepository(
@@ -614,7 +706,7 @@ emojiHelper: EmojiHelperInterface = EmojiHelper(
 )
 
 funtoonTokensRepository: FuntoonTokensRepositoryInterface = FuntoonTokensRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('FuntoonTokensRepository'),
     timber = timber,
     userIdsRepository = userIdsRepository,
     seedFileReader = JsonFileReader('funtoonTokensRepositorySeedFile.json')
@@ -643,11 +735,14 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
-    backingDatabase = backingDatabase,
+    backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = tagBackingDatabase('MostRecentChatsRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
 
+mostRecentChatsRepository.start()
+
 pokepediaJsonMapper: PokepediaJsonMapperInterface = PokepediaJsonMapper(
     timber = timber
 )
@@ -676,15 +771,22 @@ sentMessageLogger: SentMessageLoggerInterface = SentMessageLogger(
 )
 
 twitchTimeoutRemodRepository: TwitchTimeoutRemodRepositoryInterface = TwitchTimeoutRemodRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TwitchTimeoutRemodRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
 
+twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface = TwitchModerationRosterRepository(
+    timber = timber,
+    timeZoneRepository = timeZoneRepository,
+    twitchApiService = twitchApiService
+)
+
 twitchTimeoutRemodHelper: TwitchTimeoutRemodHelperInterface = TwitchTimeoutRemodHelper(
     backgroundTaskHelper = backgroundTaskHelper,
     timber = timber,
     twitchApiService = twitchApiService,
+    twitchModerationRosterRepository = twitchModerationRosterRepository,
     twitchTimeoutRemodRepository = twitchTimeoutRemodRepository,
     twitchTokensRepository = twitchTokensRepository,
     userIdsRepository = userIdsRepository
@@ -714,6 +816,7 @@ twitchTimeoutHelper: TwitchTimeoutHelperInterface = TwitchTimeoutHelper(
     twitchApiService = twitchApiService,
     twitchConstants = twitchUtils,
     twitchHandleProvider = authRepository,
+    twitchModerationRosterRepository = twitchModerationRosterRepository,
     twitchTimeoutRemodHelper = twitchTimeoutRemodHelper,
     userIdsRepository = userIdsRepository
 )
@@ -837,11 +940,11 @@ weatherRepository: WeatherRepositoryInterface = WeatherRepository(
 ###################################
 
 shinyTriviaOccurencesRepository: ShinyTriviaOccurencesRepositoryInterface = ShinyTriviaOccurencesRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('ShinyTriviaOccurencesRepository'),
     timeZoneRepository = timeZoneRepository
 )
 toxicTriviaOccurencesRepository: ToxicTriviaOccurencesRepositoryInterface = ToxicTriviaOccurencesRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('ToxicTriviaOccurencesRepository'),
     timeZoneRepository = timeZoneRepository
 )
 triviaAnswerCompiler: TriviaAnswerCompilerInterface = TriviaAnswerCompiler(
@@ -858,8 +961,12 @@ triviaSourceInstabilityHelper: TriviaSourceInstabilityHelper = TriviaSourceInsta
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
+
+if circuitBreaker is not None:
+    circuitBreaker.setEventListener(triviaSourceInstabilityHelper)
+
 additionalTriviaAnswersRepository: AdditionalTriviaAnswersRepositoryInterface = AdditionalTriviaAnswersRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('AdditionalTriviaAnswersRepository'),
     timber = timber,
     triviaSettingsRepository = triviaSettingsRepository,
     twitchHandleProvider = authRepository,
@@ -867,7 +974,7 @@ additionalTriviaAnswersRepository: AdditionalTriviaAnswersRepositoryInterface =
     userIdsRepository = userIdsRepository
 )
 bannedTriviaIdsRepository: BannedTriviaIdsRepositoryInterface = BannedTriviaIdsRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('BannedTriviaIdsRepository'),
     timber = timber
 )
 shinyTriviaHelper = ShinyTriviaHelper(
@@ -889,7 +996,7 @@ triviaContentScanner: TriviaContentScannerInterface = TriviaContentScanner(
     triviaSettingsRepository = triviaSettingsRepository
 )
 triviaEmoteRepository: TriviaEmoteRepositoryInterface = TriviaEmoteRepository(
-    backingDatabase = backingDatabase
+    backingDatabase = tagBackingDatabase('TriviaEmoteRepository')
 )
 triviaEmoteGenerator: TriviaEmoteGeneratorInterface = TriviaEmoteGenerator(
     timber = timber,
@@ -902,32 +1009,32 @@ triviaGameBuilder: TriviaGameBuilderInterface = TriviaGameBuilder(
 )
 bannedTriviaGameControllersRepository: BannedTriviaGameControllersRepositoryInterface = BannedTriviaGameControllersRepository(
     administratorProvider = administratorProvider,
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('BannedTriviaGameControllersRepository'),
     timber = timber,
     twitchTokensRepository = twitchTokensRepository,
     userIdsRepository = userIdsRepository
 )
 triviaGameControllersRepository: TriviaGameControllersRepositoryInterface = TriviaGameControllersRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TriviaGameControllersRepository'),
     timber = timber,
     twitchTokensRepository = twitchTokensRepository,
     userIdsRepository = userIdsRepository
 )
 triviaGameGlobalControllersRepository: TriviaGameGlobalControllersRepositoryInterface = TriviaGameGlobalControllersRepository(
     administratorProvider = administratorProvider,
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TriviaGameGlobalControllersRepository'),
     timber = timber,
     twitchTokensRepository = twitchTokensRepository,
     userIdsRepository = userIdsRepository
 )
 triviaHistoryRepository: TriviaHistoryRepositoryInterface = TriviaHistoryRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TriviaHistoryRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository,
     triviaSettingsRepository = triviaSettingsRepository
 )
 triviaScoreRepository: TriviaScoreRepositoryInterface = TriviaScoreRepository(
-    backingDatabase = backingDatabase
+    backingDatabase = tagBackingDatabase('TriviaScoreRepository')
 )
 
 triviaQuestionPresenter: TriviaQuestionPresenterInterface = TriviaQuestionPresenter()
@@ -955,7 +1062,7 @@ if authSnapshot.hasQuizApiKey():
     )
 
 openTriviaDatabaseTriviaQuestionRepository = OpenTriviaDatabaseTriviaQuestionRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('OpenTriviaDatabaseTriviaQuestionRepository'),
     networkClientProvider = networkClientProvider,
     timber = timber,
     triviaIdGenerator = triviaIdGenerator,
@@ -1113,7 +1220,7 @@ triviaGameMachine: TriviaGameMachineInterface = TriviaGameMachine(
 #################################
 
 anivCopyMessageTimeoutScoreRepository: AnivCopyMessageTimeoutScoreRepositoryInterface = AnivCopyMessageTimeoutScoreRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('AnivCopyMessageTimeoutScoreRepository'),
     timeZoneRepository = timeZoneRepository,
     userIdsRepository = userIdsRepository
 )
@@ -1130,7 +1237,7 @@ anivContentScanner: AnivContentScannerInterface = AnivContentScanner(
 anivUserIdProvider: AnivUserIdProviderInterface = AnivUserIdProvider()
 
 mostRecentAnivMessageRepository: MostRecentAnivMessageRepositoryInterface | None = MostRecentAnivMessageRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('MostRecentAnivMessageRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
@@ -1156,7 +1263,7 @@ if mostRecentAnivMessageRepository is not None:
 ##############################################
 
 recurringActionsRepository: RecurringActionsRepositoryInterface = RecurringActionsRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('RecurringActionsRepository'),
     recurringActionsJsonParser = RecurringActionsJsonParser(
         languagesRepository = languagesRepository,
         timber = timber
@@ -1165,7 +1272,7 @@ recurringActionsRepository: RecurringActionsRepositoryInterface = RecurringActio
 )
 
 mostRecentRecurringActionRepository: MostRecentRecurringActionRepositoryInterface = MostRecentRecurringActionRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('MostRecentRecurringActionRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
@@ -1317,7 +1424,7 @@ if mostRecentAnivMessageRepository is not None:
     )
 
 supStreamerRepository: SupStreamerRepositoryInterface = SupStreamerRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('SupStreamerRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
@@ -1380,7 +1487,7 @@ chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
 cheerActionIdGenerator: CheerActionIdGeneratorInterface = CheerActionIdGenerator()
 
 cheerActionsRepository: CheerActionsRepositoryInterface = CheerActionsRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('CheerActionsRepository'),
     cheerActionIdGenerator = cheerActionIdGenerator,
     timber = timber
 )
@@ -1438,6 +1545,7 @@ cynanBot = CynanBot(
     anivSettingsRepository = anivSettingsRepository,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = bannedTriviaGameControllersRepository,
     bannedWordsRepository = bannedWordsRepository,
     channelPointSoundHelper = channelPointSoundHelper,
@@ -1494,6 +1602,7 @@ cynanBot = CynanBot(
     twitchChannelJoinHelper = twitchChannelJoinHelper,
     twitchConfiguration = twitchConfiguration,
     twitchFollowingStatusRepository = twitchFollowingStatusRepository,
+    twitchModerationRosterRepository = twitchModerationRosterRepository,
     twitchPredictionWebsocketUtils = TwitchPredictionWebsocketUtils(),
     twitchTimeoutRemodHelper = twitchTimeoutRemodHelper,
     twitchTokensRepository = twitchTokensRepository,
@@ -1514,5 +1623,11 @@ cynanBot = CynanBot(
 ## Section for starting the actual bot ##
 #########################################
 
+timber.log('initCynanBot', 'Initializing database schemas...')
+eventLoop.run_until_complete(backingDatabase.initializeSchemas())
+
+timber.log('initCynanBot', 'Prefetching user IDs...')
+eventLoop.run_until_complete(userIdsRepository.prefetchUserIds([ user.getHandle() for user in usersRepository.getUsers() ]))
+
 timber.log('initCynanBot', 'Starting CynanBot...')
 cynanBot.run()
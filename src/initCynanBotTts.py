@@ -99,8 +99,22 @@ from CynanBot.mostRecentChat.mostRecentChatsRepository import \
 from CynanBot.mostRecentChat.mostRecentChatsRepositoryInterface import \
     MostRecentChatsRepositoryInterface
 from CynanBot.network.aioHttpClientProvider import AioHttpClientProvider
+from CynanBot.network.cachingNetworkClientProvider import \
+    CachingNetworkClientProvider
+from CynanBot.network.circuitBreaker import CircuitBreaker
+from CynanBot.network.circuitBreakerInterface import CircuitBreakerInterface
+from CynanBot.network.circuitBreakerNetworkClientProvider import \
+    CircuitBreakerNetworkClientProvider
 from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.network.networkClientType import NetworkClientType
+from CynanBot.network.networkMetricsTracker import NetworkMetricsTracker
+from CynanBot.network.networkMetricsTrackerInterface import \
+    NetworkMetricsTrackerInterface
+from CynanBot.network.networkFixtureRepository import NetworkFixtureRepository
+from CynanBot.network.networkRecordReplayMode import NetworkRecordReplayMode
+from CynanBot.network.networkResponseCache import NetworkResponseCache
+from CynanBot.network.recordReplayNetworkClientProvider import \
+    RecordReplayNetworkClientProvider
 from CynanBot.network.requestsClientProvider import RequestsClientProvider
 from CynanBot.sentMessageLogger.sentMessageLogger import SentMessageLogger
 from CynanBot.sentMessageLogger.sentMessageLoggerInterface import \
@@ -124,7 +138,12 @@ from CynanBot.soundPlayerManager.vlc.vlcSoundPlayerManager import \
 from CynanBot.storage.backingDatabase import BackingDatabase
 from CynanBot.storage.backingPsqlDatabase import BackingPsqlDatabase
 from CynanBot.storage.backingSqliteDatabase import BackingSqliteDatabase
+from CynanBot.storage.databaseMetricsTracker import DatabaseMetricsTracker
+from CynanBot.storage.databaseMetricsTrackerInterface import \
+    DatabaseMetricsTrackerInterface
 from CynanBot.storage.databaseType import DatabaseType
+from CynanBot.storage.instrumentedBackingDatabase import \
+    InstrumentedBackingDatabase
 from CynanBot.storage.jsonFileReader import JsonFileReader
 from CynanBot.storage.linesFileReader import LinesFileReader
 from CynanBot.storage.psqlCredentialsProvider import PsqlCredentialsProvider
@@ -199,6 +218,10 @@ from CynanBot.twitch.timeout.timeoutImmuneUserIdsRepository import \
     TimeoutImmuneUserIdsRepository
 from CynanBot.twitch.timeout.timeoutImmuneUserIdsRepositoryInterface import \
     TimeoutImmuneUserIdsRepositoryInterface
+from CynanBot.twitch.timeout.twitchModerationRosterRepository import \
+    TwitchModerationRosterRepository
+from CynanBot.twitch.timeout.twitchModerationRosterRepositoryInterface import \
+    TwitchModerationRosterRepositoryInterface
 from CynanBot.twitch.timeout.twitchTimeoutHelper import TwitchTimeoutHelper
 from CynanBot.twitch.timeout.twitchTimeoutHelperInterface import \
     TwitchTimeoutHelperInterface
@@ -296,19 +319,87 @@ elif generalSettingsSnapshot.requireDatabaseType() is DatabaseType.SQLITE:
 else:
     raise RuntimeError(f'Unknown/misconfigured database type: \"{generalSettingsSnapshot.requireDatabaseType()}\"')
 
+if generalSettingsSnapshot.isDatabaseInstrumentationEnabled():
+    databaseMetricsTracker: DatabaseMetricsTrackerInterface = DatabaseMetricsTracker(
+        backgroundTaskHelper = backgroundTaskHelper,
+        timber = timber,
+        slowQueryThresholdSeconds = generalSettingsSnapshot.getDatabaseSlowQueryThresholdMillis() / 1000
+    )
+
+    backingDatabase = InstrumentedBackingDatabase(
+        backingDatabase = backingDatabase,
+        databaseMetricsTracker = databaseMetricsTracker,
+        tag = 'BackingDatabase'
+    )
+
+    databaseMetricsTracker.start()
+
+
+def tagBackingDatabase(tag: str) -> BackingDatabase:
+    if isinstance(backingDatabase, InstrumentedBackingDatabase):
+        return backingDatabase.withTag(tag)
+    else:
+        return backingDatabase
+
+
+networkMetricsTracker: NetworkMetricsTrackerInterface | None = None
+if generalSettingsSnapshot.isNetworkInstrumentationEnabled():
+    networkMetricsTracker = NetworkMetricsTracker(
+        backgroundTaskHelper = backgroundTaskHelper,
+        timber = timber
+    )
+
+    networkMetricsTracker.start()
+
 networkClientProvider: NetworkClientProvider
 if generalSettingsSnapshot.requireNetworkClientType() is NetworkClientType.AIOHTTP:
     networkClientProvider: NetworkClientProvider = AioHttpClientProvider(
         eventLoop = eventLoop,
-        timber = timber
+        timber = timber,
+        networkMetricsTracker = networkMetricsTracker
     )
 elif generalSettingsSnapshot.requireNetworkClientType() is NetworkClientType.REQUESTS:
     networkClientProvider: NetworkClientProvider = RequestsClientProvider(
-        timber = timber
+        timber = timber,
+        networkMetricsTracker = networkMetricsTracker
     )
 else:
     raise RuntimeError(f'Unknown/misconfigured network client type: \"{generalSettingsSnapshot.requireNetworkClientType()}\"')
 
+networkRecordReplayMode = generalSettingsSnapshot.getNetworkRecordReplayMode()
+if networkRecordReplayMode is not None:
+    networkClientProvider = RecordReplayNetworkClientProvider(
+        networkClientProvider = networkClientProvider if networkRecordReplayMode is NetworkRecordReplayMode.RECORD else None,
+        networkFixtureRepository = NetworkFixtureRepository(
+            timber = timber,
+            fixtureDirectory = generalSettingsSnapshot.getNetworkFixtureDirectory()
+        ),
+        networkRecordReplayMode = networkRecordReplayMode,
+        timber = timber
+    )
+
+circuitBreaker: CircuitBreakerInterface | None = None
+if generalSettingsSnapshot.isNetworkCircuitBreakerEnabled():
+    circuitBreaker = CircuitBreaker(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository
+    )
+
+    networkClientProvider = CircuitBreakerNetworkClientProvider(
+        circuitBreaker = circuitBreaker,
+        networkClientProvider = networkClientProvider,
+        timber = timber
+    )
+
+if generalSettingsSnapshot.isNetworkResponseCacheEnabled():
+    networkClientProvider = CachingNetworkClientProvider(
+        networkClientProvider = networkClientProvider,
+        networkResponseCache = NetworkResponseCache(
+            timber = timber
+        ),
+        timber = timber
+    )
+
 authRepository = AuthRepository(
     authJsonReader = JsonFileReader('authRepository.json')
 )
@@ -335,15 +426,16 @@ twitchApiService: TwitchApiServiceInterface = TwitchApiService(
 twitchAnonymousUserIdProvider: TwitchAnonymousUserIdProviderInterface = TwitchAnonymousUserIdProvider()
 
 userIdsRepository: UserIdsRepositoryInterface = UserIdsRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('UserIdsRepository'),
     timber = timber,
+    timeZoneRepository = timeZoneRepository,
     twitchAnonymousUserIdProvider = twitchAnonymousUserIdProvider,
     twitchApiService = twitchApiService
 )
 
 twitchTokensRepository: TwitchTokensRepositoryInterface = TwitchTokensRepository(
     backgroundTaskHelper = backgroundTaskHelper,
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TwitchTokensRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository,
     twitchApiService = twitchApiService,
@@ -380,7 +472,7 @@ twitchTokensUtils: TwitchTokensUtilsInterface = TwitchTokensUtils(
 )
 
 twitchFollowingStatusRepository: TwitchFollowingStatusRepositoryInterface = TwitchFollowingStatusRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TwitchFollowingStatusRepository'),
     timber = timber,
     twitchApiService = twitchApiService,
     userIdsRepository = userIdsRepository
@@ -423,7 +515,7 @@ emojiHelper: EmojiHelperInterface = EmojiHelper(
 )
 
 funtoonTokensRepository: FuntoonTokensRepositoryInterface = FuntoonTokensRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('FuntoonTokensRepository'),
     timber = timber,
     userIdsRepository = userIdsRepository,
     seedFileReader = JsonFileReader('funtoonTokensRepositorySeedFile.json')
@@ -452,11 +544,14 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
-    backingDatabase = backingDatabase,
+    backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = tagBackingDatabase('MostRecentChatsRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
 
+mostRecentChatsRepository.start()
+
 systemCommandHelper: SystemCommandHelperInterface = SystemCommandHelper(
     timber = timber
 )
@@ -472,15 +567,22 @@ sentMessageLogger: SentMessageLoggerInterface = SentMessageLogger(
 )
 
 twitchTimeoutRemodRepository: TwitchTimeoutRemodRepositoryInterface = TwitchTimeoutRemodRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('TwitchTimeoutRemodRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
 
+twitchModerationRosterRepository: TwitchModerationRosterRepositoryInterface = TwitchModerationRosterRepository(
+    timber = timber,
+    timeZoneRepository = timeZoneRepository,
+    twitchApiService = twitchApiService
+)
+
 twitchTimeoutRemodHelper: TwitchTimeoutRemodHelperInterface = TwitchTimeoutRemodHelper(
     backgroundTaskHelper = backgroundTaskHelper,
     timber = timber,
     twitchApiService = twitchApiService,
+    twitchModerationRosterRepository = twitchModerationRosterRepository,
     twitchTimeoutRemodRepository = twitchTimeoutRemodRepository,
     twitchTokensRepository = twitchTokensRepository,
     userIdsRepository = userIdsRepository
@@ -510,6 +612,7 @@ twitchTimeoutHelper: TwitchTimeoutHelperInterface = TwitchTimeoutHelper(
     twitchApiService = twitchApiService,
     twitchConstants = twitchUtils,
     twitchHandleProvider = authRepository,
+    twitchModerationRosterRepository = twitchModerationRosterRepository,
     twitchTimeoutRemodHelper = twitchTimeoutRemodHelper,
     userIdsRepository = userIdsRepository
 )
@@ -654,7 +757,7 @@ ttsManager: TtsManagerInterface | None = TtsManager(
 #################################
 
 anivCopyMessageTimeoutScoreRepository: AnivCopyMessageTimeoutScoreRepositoryInterface = AnivCopyMessageTimeoutScoreRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('AnivCopyMessageTimeoutScoreRepository'),
     timeZoneRepository = timeZoneRepository,
     userIdsRepository = userIdsRepository
 )
@@ -671,7 +774,7 @@ anivContentScanner: AnivContentScannerInterface = AnivContentScanner(
 anivUserIdProvider: AnivUserIdProviderInterface = AnivUserIdProvider()
 
 mostRecentAnivMessageRepository: MostRecentAnivMessageRepositoryInterface | None = MostRecentAnivMessageRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('MostRecentAnivMessageRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
@@ -721,7 +824,7 @@ if mostRecentAnivMessageRepository is not None:
     )
 
 supStreamerRepository: SupStreamerRepositoryInterface = SupStreamerRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('SupStreamerRepository'),
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
@@ -765,7 +868,7 @@ chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
 cheerActionIdGenerator: CheerActionIdGeneratorInterface = CheerActionIdGenerator()
 
 cheerActionsRepository: CheerActionsRepositoryInterface = CheerActionsRepository(
-    backingDatabase = backingDatabase,
+    backingDatabase = tagBackingDatabase('CheerActionsRepository'),
     cheerActionIdGenerator = cheerActionIdGenerator,
     timber = timber
 )
@@ -802,6 +905,7 @@ cynanBot = CynanBot(
     anivSettingsRepository = anivSettingsRepository,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = None,
     bannedWordsRepository = bannedWordsRepository,
     channelPointSoundHelper = channelPointSoundHelper,
@@ -856,6 +960,7 @@ cynanBot = CynanBot(
     twitchChannelJoinHelper = twitchChannelJoinHelper,
     twitchConfiguration = twitchConfiguration,
     twitchFollowingStatusRepository = twitchFollowingStatusRepository,
+    twitchModerationRosterRepository = twitchModerationRosterRepository,
     twitchPredictionWebsocketUtils = TwitchPredictionWebsocketUtils(),
     twitchTimeoutRemodHelper = twitchTimeoutRemodHelper,
     twitchTokensRepository = twitchTokensRepository,
@@ -876,5 +981,11 @@ cynanBot = CynanBot(
 ## Section for starting the actual bot ##
 #########################################
 
+timber.log('initCynanBot', 'Initializing database schemas...')
+eventLoop.run_until_complete(backingDatabase.initializeSchemas())
+
+timber.log('initCynanBot', 'Prefetching user IDs...')
+eventLoop.run_until_complete(userIdsRepository.prefetchUserIds([ user.getHandle() for user in usersRepository.getUsers() ]))
+
 timber.log('initCynanBot', 'Starting CynanBot...')
 cynanBot.run()
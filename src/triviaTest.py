@@ -11,6 +11,7 @@ from CynanBot.funtoon.funtoonRepository import FuntoonRepository
 from CynanBot.funtoon.funtoonRepositoryInterface import FuntoonRepositoryInterface
 from CynanBot.funtoon.funtoonTokensRepository import FuntoonTokensRepository
 from CynanBot.funtoon.funtoonTokensRepositoryInterface import FuntoonTokensRepositoryInterface
+from CynanBot.location.timeZoneRepository import TimeZoneRepository
 from CynanBot.network.networkClientProvider import NetworkClientProvider
 from CynanBot.network.requestsClientProvider import RequestsClientProvider
 from CynanBot.pkmn.pokepediaRepository import PokepediaRepository
@@ -153,6 +154,7 @@ twitchAnonymousUserIdProvider: TwitchAnonymousUserIdProviderInterface = TwitchAn
 userIdsRepository: UserIdsRepositoryInterface = UserIdsRepository(
     backingDatabase = backingDatabase,
     timber = timber,
+    timeZoneRepository = TimeZoneRepository(),
     twitchAnonymousUserIdProvider = twitchAnonymousUserIdProvider,
     twitchApiService = twitchApiService
 )